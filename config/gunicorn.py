@@ -0,0 +1,27 @@
+"""Gunicorn config."""
+
+# Utilities
+import multiprocessing
+import os
+
+
+bind = '0.0.0.0:5000'
+chdir = '/app'
+
+# Each thread keeps its own persistent database connection (CONN_MAX_AGE),
+# size the database (or PgBouncer) connections for workers * threads
+worker_class = 'gthread'
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+keepalive = 5
+
+# Recycle the workers to bound the memory of the local caches
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 5000))
+max_requests_jitter = max_requests // 10
+
+
+def child_exit(server, worker):
+    """Remove the metrics files of a dead worker."""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
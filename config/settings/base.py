@@ -3,6 +3,8 @@
 import os
 import environ
 
+from celery.schedules import crontab
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = environ.Path(__file__) - 3
 APPS_DIR = BASE_DIR.path('gaman')
@@ -54,6 +56,9 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
+if env.bool('METRICS_ENABLED', default=True):
+    MIDDLEWARE.insert(0, 'gaman.utils.metrics.MetricsMiddleware')
+MIDDLEWARE.append('gaman.utils.routers.ReplicaMiddleware')
 
 ROOT_URLCONF = 'config.urls'
 
@@ -87,6 +92,31 @@ DATABASES = {
     'default': env.db('DATABASE_URL'),
 }
 DATABASES['default']['ATOMIC_REQUESTS'] = True
+DATABASES['default']['CONN_MAX_AGE'] = env.int('CONN_MAX_AGE', default=60)
+DATABASE_HEALTH_CHECKS = env.bool('DATABASE_HEALTH_CHECKS', default=True)
+
+# Read replicas (comma separated urls and weights)
+DATABASE_REPLICA_WEIGHTS = {}
+replicas = env.list('DATABASE_REPLICAS', default=[])
+weights = env.list('DATABASE_REPLICA_WEIGHTS', cast=int, default=[1] * len(replicas))
+for number, (url, weight) in enumerate(zip(replicas, weights), 1):
+    DATABASES[f'replica{number}'] = env.db_url_config(url)
+    DATABASES[f'replica{number}']['CONN_MAX_AGE'] = DATABASES['default']['CONN_MAX_AGE']
+    DATABASES[f'replica{number}']['TEST'] = {'MIRROR': 'default'}
+    DATABASE_REPLICA_WEIGHTS[f'replica{number}'] = weight
+DATABASE_ROUTERS = ['gaman.utils.routers.ReplicaRouter']
+DATABASE_REPLICA_PIN = env.float('DATABASE_REPLICA_PIN', default=5.0)  # seconds
+DATABASE_REPLICA_ACTIONS = [
+    'list', 'retrieve', 'followers', 'following', 'posts', 'sponsorships',
+    'suggestions', 'invitations', 'assistants', 'replies', 'reactions', 'reaction_summary',
+    'likes', 'loves', 'hahas', 'curious', 'sads', 'angry',
+]
+
+# PgBouncer in transaction pooling mode: the server connection changes
+# between transactions, so the cursors can't outlive them
+if env.bool('DATABASE_PGBOUNCER', default=False):
+    for database in DATABASES.values():
+        database['DISABLE_SERVER_SIDE_CURSORS'] = True
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -158,11 +188,17 @@ EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 # Django REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer', 
+        'gaman.utils.fastjson.FastJSONRenderer',
+    ],
+
+    'DEFAULT_PARSER_CLASSES': [
+        'gaman.utils.fastjson.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ],
 
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'gaman.utils.authentication.CachedTokenAuthentication',
         # 'oauth2_provider.contrib.rest_framework.OAuth2Authentication',
         # 'rest_framework_social_oauth2.authentication.SocialAuthentication'
     ],
@@ -186,6 +222,98 @@ CELERY_RESULT_BACKEND = CELERY_BROKER_URL
 API_MAPS_URL = 'https://geocode.search.hereapi.com/v1/geocode'
 API_MAPS_ID = env('API_MAPS_ID')
 API_MAPS_KEY = env('API_MAPS_KEY')
+API_MAPS_TIMEOUT = env.float('API_MAPS_TIMEOUT', default=5.0)
+
+# Geocoding
+GEOCODER_BACKEND = env('GEOCODER_BACKEND', default='gaman.utils.geocoding.HereGeocoder')
+GEOCODE_TTL = env.int('GEOCODE_TTL', default=60 * 60 * 24 * 90)
+GEOCODE_CACHE_SIZE = env.int('GEOCODE_CACHE_SIZE', default=100000)
+GEOCODE_WAIT = env.float('GEOCODE_WAIT', default=5.0)
 
 # Geogaman service
 GEOGAMAN_DOMAIN = env('GEOGAMAN_DOMAIN', default='http://localhost:8001/')
+GEOGAMAN_FALLBACK = env.bool('GEOGAMAN_FALLBACK', default=False)
+
+# Events spatial index
+EVENTS_INDEX_TTL = env.float('EVENTS_INDEX_TTL', default=5.0)
+EVENTS_NEARBY_RADIUS = env.float('EVENTS_NEARBY_RADIUS', default=10.0)  # km
+EVENTS_NEARBY_MAX_RADIUS = env.float('EVENTS_NEARBY_MAX_RADIUS', default=200.0)
+
+# Home timeline
+TIMELINE_FANOUT_LIMIT = env.int('TIMELINE_FANOUT_LIMIT', default=5000)
+TIMELINE_BACKFILL = env.int('TIMELINE_BACKFILL', default=50)
+TIMELINE_SIZE = env.int('TIMELINE_SIZE', default=800)
+TIMELINE_TRIM_EVERY = env.int('TIMELINE_TRIM_EVERY', default=50)
+
+# Token authentication
+AUTH_TOKEN_TTL = env.int('AUTH_TOKEN_TTL', default=0)  # seconds, 0 never expires
+AUTH_TOKEN_CACHE_TTL = env.int('AUTH_TOKEN_CACHE_TTL', default=60 * 15)
+
+# Serialized posts cache
+POST_CACHE_TTL = env.int('POST_CACHE_TTL', default=60 * 60 * 24)
+POST_CACHE_WAIT = env.float('POST_CACHE_WAIT', default=2.0)
+
+# Compiled serializers of the hot lists, see CompiledSerializerMixin
+COMPILED_SERIALIZERS = env.bool('COMPILED_SERIALIZERS', default=True)
+
+# Replies inlined in each comment of the comments lists
+COMMENT_INLINE_REPLIES = env.int('COMMENT_INLINE_REPLIES', default=3)
+
+# Counters
+COUNTERS_BUFFER = env.bool('COUNTERS_BUFFER', default=False)
+COUNTERS_BUFFERED = [
+    'posts.Post.reactions',
+    'posts.Post.comments',
+    'posts.Post.shares',
+]
+COUNTERS_REDIS_URL = env('COUNTERS_REDIS_URL', default=CELERY_BROKER_URL)
+
+# Follow suggestions
+SUGGESTIONS_SIZE = env.int('SUGGESTIONS_SIZE', default=20)
+SUGGESTIONS_BATCH = env.int('SUGGESTIONS_BATCH', default=5000)
+
+# Request metrics
+METRICS_TOKEN = env('METRICS_TOKEN', default='')
+METRICS_SLOW_REQUEST_MS = env.float('METRICS_SLOW_REQUEST_MS', default=500.0)
+METRICS_TRACE_SAMPLE_RATE = env.float('METRICS_TRACE_SAMPLE_RATE', default=0.1)
+
+# Partitioned tables (PostgreSQL), converted with the partition-tables command
+PARTITIONED_TABLES = env.list('PARTITIONED_TABLES', default=[])
+PARTITION_MONTHS_AHEAD = env.int('PARTITION_MONTHS_AHEAD', default=3)
+PARTITION_RETENTION_MONTHS = env.int('PARTITION_RETENTION_MONTHS', default=0)
+PARTITION_ARCHIVE_SCHEMA = env('PARTITION_ARCHIVE_SCHEMA', default='archive')
+
+# Celery beat
+CELERY_BEAT_SCHEDULE = {
+    'flush-counters': {
+        'task': 'taskapp.tasks.counters.flush_counters',
+        'schedule': env.float('COUNTERS_FLUSH_INTERVAL', default=10.0),
+    },
+    'refresh-suggestions': {
+        'task': 'taskapp.tasks.suggestions.refresh_suggestions',
+        'schedule': env.float('SUGGESTIONS_REFRESH_INTERVAL', default=300.0),
+    },
+    'evict-geocodes': {
+        'task': 'taskapp.tasks.events.evict_geocodes',
+        'schedule': crontab(hour=5, minute=0),
+    },
+    'rebuild-suggestions': {
+        'task': 'taskapp.tasks.suggestions.refresh_suggestions',
+        'schedule': crontab(hour=4, minute=0),
+        'kwargs': {'full': True},
+    },
+    'maintain-partitions': {
+        'task': 'taskapp.tasks.partitions.maintain_partitions',
+        'schedule': crontab(hour=3, minute=0),
+    },
+}
+
+# Cache
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': env('CACHE_URL', default=CELERY_BROKER_URL),
+    }
+}
+LOCAL_CACHE_TTL = env.float('LOCAL_CACHE_TTL', default=5.0)
+LOCAL_CACHE_SIZE = env.int('LOCAL_CACHE_SIZE', default=10000)
@@ -14,6 +14,11 @@ ALLOWED_HOSTS = [
     "127.0.0.1",
 ]
 
+# Database
+# The development server runs each request in a new thread
+for database in DATABASES.values():  # NOQA
+    database['CONN_MAX_AGE'] = env.int('CONN_MAX_AGE', default=0)
+
 # Cache
 CACHES = {
     'default': {
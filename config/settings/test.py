@@ -1,5 +1,8 @@
 """Testing settings."""
 
+# Utilities
+import tempfile
+
 from .base import *  # NOQA
 from .base import env
 
@@ -7,16 +10,26 @@ from .base import env
 DEBUG = False
 TEST = True
 SECRET_KEY = env("DJANGO_SECRET_KEY", default='9_bqs58ror+16_4p-05j5#t77s(c#wmh7(&z$xk3oua#l_#1h%')
-TEST_RUNNER = "django.test.runner.DiscoverRunner"
+TEST_RUNNER = "gaman.utils.testing.TestRunner"
+
+# Database
+# A stand-in of a read replica, the router tests enable it
+DATABASES['replica'] = {  # NOQA
+    **DATABASES['default'], 'ATOMIC_REQUESTS': False, 'TEST': {'MIRROR': 'default'}}  # NOQA
 
 # Cache
+# Test databases reuse primary keys between test cases, the test
+# runner clears the caches before each test.
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": ""
     }
 }
 
+# Media
+# Keep the uploads of the tests out of the repository
+MEDIA_ROOT = tempfile.mkdtemp(prefix='gaman-media-')
+
 # Passwords
 PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
 
@@ -6,9 +6,13 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 
+# Utils
+from gaman.utils.metrics import metrics
+
 urlpatterns = [
     
     path('admin/', admin.site.urls),
+    path('metrics', metrics, name='metrics'),
     path('', include(('gaman.users.urls', 'users'), namespace='users')),
     path('', include(('gaman.posts.urls', 'posts'), namespace='posts')),
     path('', include(('gaman.sponsorships.urls', 'sponsorships'), namespace='sponsorships')),
@@ -1,9 +1,14 @@
 """WSGI config for Gaman project."""
 
 import os
+from django.core.signals import request_started
 from django.core.wsgi import get_wsgi_application
 
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.local')
 
 application = get_wsgi_application()
+
+# Health checks of the persistent database connections
+from gaman.utils.db import check_connections  # NOQA
+request_started.connect(check_connections)
@@ -45,8 +45,9 @@ class CommentAdmin(admin.ModelAdmin):
     list_display = [
         'pk', 'author',
         'post', 'text',
-        'reactions', 'type',
-        'created', 'updated'
+        'reactions', 'parent',
+        'replies_count', 'created',
+        'updated'
     ]
 
     search_fields = [
@@ -54,7 +55,7 @@ class CommentAdmin(admin.ModelAdmin):
         'post__pk'
     ]
 
-    list_filter = ['type']
+    list_filter = ['depth']
     ordering = ['-created']
 
     def has_add_permission(self, request, obj=None) -> bool:
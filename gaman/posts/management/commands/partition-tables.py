@@ -0,0 +1,47 @@
+"""Partitioned tables commands."""
+
+# Utilities
+import json
+
+# Django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Utils
+from gaman.utils.partitions import PartitionError, PartitionedTable, maintain
+
+
+class Command(BaseCommand):
+    """Partitioned tables command."""
+
+    help = (
+        'Partition by month the PARTITIONED_TABLES (PostgreSQL), create the partitions '
+        'of the next months and archive the ones older than the retention')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--convert', action='store_true',
+            help='Convert the tables that are not partitioned yet, it locks them meanwhile.')
+        parser.add_argument(
+            '--tables', nargs='+', help='Tables to partition, PARTITIONED_TABLES by default.')
+        parser.add_argument(
+            '--months', type=int, default=settings.PARTITION_MONTHS_AHEAD,
+            help='Months ahead with a partition.')
+        parser.add_argument(
+            '--retention', type=int, default=settings.PARTITION_RETENTION_MONTHS,
+            help='Months of partitions kept, 0 keeps them all.')
+
+    def handle(self, *args, **options):
+        tables = options['tables'] or settings.PARTITIONED_TABLES
+        if not tables:
+            raise CommandError('There are no PARTITIONED_TABLES.')
+        try:
+            if options['convert']:
+                for table in map(PartitionedTable, tables):
+                    if not table.is_partitioned():
+                        table.convert(options['months'])
+                        self.stderr.write(f'{table.table} partitioned.')
+            result = maintain(tables, options['months'], options['retention'])
+        except PartitionError as error:
+            raise CommandError(error)
+        self.stdout.write(json.dumps(result, indent=2))
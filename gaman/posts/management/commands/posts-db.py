@@ -1,51 +1,55 @@
 """Posts commands."""
 
-# Utilities
-import pandas as pd
-
-# Django
-from django.core.management.base import BaseCommand
-
 # Models
 from gaman.posts.models import Picture, Post
 from gaman.users.models import User
 
+# Utils
+from gaman.utils.authors import fill_authors
+from gaman.utils.loaders import LoaderCommand, read_csv
 
-class Command(BaseCommand):
+
+class Command(LoaderCommand):
     """Post command"""
 
     help = 'Upload posts csv to database'
+    models = [Post, Post.pictures.through]
 
-    def handle(self, *args, **options):
-        posts_data = pd.DataFrame(
-            pd.read_csv('./data/posts.csv'),
-            columns=['about', 'privacy', 'location']
+    def load(self, loader, chunksize):
+        posts_data = read_csv(
+            self.path('posts.csv'),
+            columns=['about', 'privacy', 'location'],
+            chunksize=chunksize
         )
 
-        users = User.objects.filter(verified=True)
-        posts_data = [data for data in posts_data.itertuples()]
+        users = User.objects.filter(verified=True).order_by('pk').values_list('pk', flat=True)
+        users = users.iterator(chunk_size=chunksize)
         picture = Picture.objects.create(content='gaman/utils/media_test/profile_photo.jpg')
-        
-        posts_query = []
-        x = 0
-        for user in users:
-            parcial_posts_data = posts_data[x:x+5]
-            # Create posts
-            parcial_posts_query = [
-                Post(
-                    user=user,
+
+        # Each user gets 5 posts, in the csv order
+        x, user_id = 0, None
+        for posts_chunk in posts_data:
+            posts_query = []
+            for i in posts_chunk.itertuples():
+                if x % 5 == 0:
+                    user_id = next(users, None)
+                    if user_id is None:
+                        break
+                posts_query.append(Post(
+                    user_id=user_id,
                     about=i.about,
                     location=i.location,
                     privacy='Private' if bool(i.privacy) == True else 'Public'
-                ) for i in parcial_posts_data]
-            x += 5
-            posts_query += parcial_posts_query
+                ))
+                x += 1
 
-        posts = Post.objects.bulk_create(posts_query)
+            posts = loader.insert(posts_query)
 
-        # Add picture to the posts
-        for post in posts:
-            post.pictures.add(picture)
-            post.save()
+            # Add picture to the posts
+            loader.link(Post.pictures, ((post.pk, picture.pk) for post in posts))
+            if user_id is None:
+                break
 
-        self.stdout.write(self.style.SUCCESS('Posts created successfully.'))
+        # The loader skips save()
+        fill_authors(Post)
+        return 'Posts created successfully.'
@@ -0,0 +1,36 @@
+"""Timelines commands."""
+
+# Django
+from django.core.management.base import BaseCommand
+
+# Models
+from gaman.posts.models import Post, TimelineEntry
+
+# Utils
+from gaman.utils.timelines import HomeTimeline
+
+
+class Command(BaseCommand):
+    """Timelines command."""
+
+    help = 'Fan-out the posts not delivered yet and trim the home timelines'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--trim-only', action='store_true',
+            help='Only trim the timelines to TIMELINE_SIZE entries.')
+
+    def handle(self, *args, **options):
+        delivered = 0
+        if not options['trim_only']:
+            posts = Post.objects.filter(fanned_out=False).only(
+                'pk', 'user', 'brand', 'club').order_by('pk')
+            for post in posts.iterator(chunk_size=1000):
+                delivered += HomeTimeline.fan_out(post)
+
+        owners = TimelineEntry.objects.values_list(
+            'owner', flat=True).distinct().order_by()
+        trimmed = sum(HomeTimeline.trim(owner) for owner in owners.iterator())
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{delivered} timeline entries written, {trimmed} trimmed.'))
@@ -0,0 +1,57 @@
+"""Counters commands."""
+
+# Django
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import CharField, OuterRef, Value
+from django.db.models.functions import Cast, Concat
+
+# Models
+from gaman.posts.models import Comment, CommentReaction, Post, PostReaction
+from gaman.sponsorships.models import Brand
+from gaman.sports.models import Club, Member, SportEvent
+from gaman.users.models import FollowUp, Profile
+
+# Utils
+from gaman.utils.counters import count_of
+
+
+class Command(BaseCommand):
+    """Counters command."""
+
+    help = 'Recompute the denormalized counters from their rows'
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        posts = Post.objects.update(
+            reactions=count_of(PostReaction.objects.all(), 'post'),
+            comments=count_of(Comment.objects.all(), 'post'),
+            shares=count_of(Post.objects.all(), 'post'))
+
+        # The replies of a comment at any depth are under its thread path
+        threads = Comment.objects.filter(path__startswith=Concat(
+            OuterRef('path'), Cast(OuterRef('pk'), CharField()), Value('/')))
+        comments = Comment.objects.update(
+            reactions=count_of(CommentReaction.objects.all(), 'comment'),
+            replies_count=count_of(threads, 'post', outer='post'))
+
+        profiles = Profile.objects.update(
+            followers_count=count_of(FollowUp.objects.all(), 'user', outer='user'),
+            following_count=count_of(FollowUp.objects.all(), 'follower', outer='user'),
+            posts_count=count_of(Post.objects.all(), 'user', outer='user'))
+
+        brands = Brand.objects.update(
+            followers_count=count_of(FollowUp.objects.all(), 'brand'),
+            posts_count=count_of(Post.objects.all(), 'brand'))
+
+        clubs = Club.objects.update(
+            followers_count=count_of(FollowUp.objects.all(), 'club'),
+            members_count=count_of(Member.objects.all(), 'club'),
+            posts_count=count_of(Post.objects.all(), 'club'))
+
+        events = SportEvent.objects.update(
+            assistants_count=count_of(SportEvent.assistants.through.objects.all(), 'sportevent'))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Counters of {posts} posts, {comments} comments, {profiles} profiles, '
+            f'{brands} brands, {clubs} clubs and {events} events reconciled.'))
@@ -1 +1,2 @@
-from .comments import *
\ No newline at end of file
+from .comments import *
+from .reactions import *
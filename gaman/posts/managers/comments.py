@@ -1,12 +1,26 @@
 """Comment managers."""
 
 # Django
+from django.conf import settings
 from django.db import models
 
 
-class PrincipalCommentManager(models.Manager):
+class CommentQuerySet(models.QuerySet):
+    """Comment queryset."""
+
+    def inlined(self) -> 'CommentQuerySet':
+        """Filter the first replies of each comment, the ones inlined in the comments."""
+        return self.filter(position__lte=settings.COMMENT_INLINE_REPLIES)
+
+    def thread(self, comment) -> 'CommentQuerySet':
+        """Filter a comment and all its replies, at any depth."""
+        return self.filter(
+            models.Q(pk=comment.pk) | models.Q(path__startswith=comment.thread_path()))
+
+
+class PrincipalCommentManager(models.Manager.from_queryset(CommentQuerySet)):
     """Principal Comment manager."""
 
     def get_queryset(self):
         """Filter the query to Principal Comments."""
-        return super().get_queryset().filter(type='Principal-Comment')
+        return super().get_queryset().filter(parent__isnull=True)
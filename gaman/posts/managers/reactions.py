@@ -0,0 +1,53 @@
+"""Reaction managers."""
+
+# Django
+from django.db import models
+from django.db.models import Count
+
+# Utils
+from gaman.utils.models import Reaction
+
+
+REACTION_TYPES = [reaction for reaction, _ in Reaction.REACTIONS]
+
+
+def empty_summary() -> dict:
+    """Return a reaction summary without reactions."""
+    return {**dict.fromkeys(REACTION_TYPES, 0), 'total': 0}
+
+
+class ReactionQuerySet(models.QuerySet):
+    """Reaction queryset."""
+
+    def summary(self) -> dict:
+        """Return the count of each reaction type with a single grouped query."""
+        summary = empty_summary()
+        rows = self.order_by().values('reaction').annotate(count=Count('pk'))
+        for row in rows:
+            summary[row['reaction']] = row['count']
+            summary['total'] += row['count']
+        return summary
+
+    def of(self, field: str, obj) -> 'ReactionQuerySet':
+        """
+        Return the reactions of a post or comment (field). None is older
+        than it, so the bound prunes the older partitions of the table.
+        """
+        return self.filter(**{field: obj, 'created__gte': obj.created})
+
+    def summaries(self, field: str, pks: list, since=None) -> dict:
+        """
+        Return the reaction summaries of several objects
+        (posts or comments) with a single grouped query,
+        since the creation of the oldest of them.
+        """
+        summaries = {pk: empty_summary() for pk in pks}
+        rows = self.filter(**{f'{field}__in': pks})
+        if since:
+            rows = rows.filter(created__gte=since)
+        rows = rows.order_by().values(field, 'reaction').annotate(count=Count('pk'))
+        for row in rows:
+            summary = summaries[row[field]]
+            summary[row['reaction']] = row['count']
+            summary['total'] += row['count']
+        return summaries
@@ -0,0 +1,98 @@
+# Generated by Django 4.0.4 on 2026-10-18 10:58
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from gaman.utils.migrations import AddIndexConcurrently, delete_duplicates
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('sports', '0006_hot_query_indexes'),
+        ('sponsorships', '0003_counters'),
+        ('posts', '0003_timelines'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='comment',
+            index=models.Index(condition=models.Q(('type', 'Principal-Comment')), fields=['post', '-reactions', 'created'], name='comment_principal_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='commentreaction',
+            index=models.Index(fields=['comment', 'reaction', '-created'], name='commentreaction_comment_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='post',
+            index=models.Index(fields=['user', '-created'], name='post_user_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='post',
+            index=models.Index(fields=['user', 'privacy', '-created'], name='post_user_privacy_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='post',
+            index=models.Index(condition=models.Q(('brand__isnull', False)), fields=['brand', '-created'], name='post_brand_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='post',
+            index=models.Index(condition=models.Q(('club__isnull', False)), fields=['club', '-created'], name='post_club_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='postreaction',
+            index=models.Index(fields=['post', 'reaction', '-created'], name='postreaction_post_idx'),
+        ),
+        migrations.RunPython(
+            delete_duplicates('posts.PostReaction', ['user', 'post']),
+            migrations.RunPython.noop, atomic=True),
+        migrations.RunPython(
+            delete_duplicates('posts.CommentReaction', ['user', 'comment']),
+            migrations.RunPython.noop, atomic=True),
+        migrations.AddConstraint(
+            model_name='commentreaction',
+            constraint=models.UniqueConstraint(fields=('user', 'comment'), name='unique_comment_reaction'),
+        ),
+        migrations.AddConstraint(
+            model_name='postreaction',
+            constraint=models.UniqueConstraint(fields=('user', 'post'), name='unique_post_reaction'),
+        ),
+        migrations.AlterField(
+            model_name='commentreaction',
+            name='comment',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='posts.comment'),
+        ),
+        migrations.AlterField(
+            model_name='commentreaction',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='brand',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to='sponsorships.brand'),
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='club',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to='sports.club'),
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='user',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='postreaction',
+            name='post',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='posts.post'),
+        ),
+        migrations.AlterField(
+            model_name='postreaction',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,96 @@
+# Generated by Django 4.0.4 on 2026-10-18 11:29
+
+from django.db import migrations, models
+from django.db.models import CharField, Count, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Cast, Coalesce, Concat
+import django.db.models.deletion
+
+
+def thread_replies(apps, schema_editor):
+    """
+    Move the replies of the many to many to their parent. The replies
+    were only made to principal comments, a reply listed by several
+    comments keeps the first one.
+    """
+    Comment = apps.get_model('posts', 'Comment')
+    Replies = Comment._meta.get_field('replies').remote_field.through
+    first = Replies.objects.filter(
+        to_comment=OuterRef('pk')).order_by('from_comment').values('from_comment')[:1]
+    Comment.objects.update(parent=Subquery(first))
+
+    replies = Comment.objects.filter(parent__isnull=False)
+    earlier = Comment.objects.filter(
+        Q(created__lt=OuterRef('created')) | Q(created=OuterRef('created'), pk__lte=OuterRef('pk')),
+        parent=OuterRef('parent'))
+    replies.update(
+        path=Concat(Cast('parent', CharField()), Value('/')), depth=1,
+        position=Subquery(earlier.order_by().values('parent').annotate(
+            total=Count('pk')).values('total')))
+    replies_count = Comment.objects.filter(
+        parent=OuterRef('pk')).order_by().values('parent').annotate(total=Count('pk'))
+    Comment.objects.update(replies_count=Coalesce(Subquery(replies_count.values('total')), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0005_post_authors'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='depth',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='parent',
+            field=models.ForeignKey(blank=True, db_index=False, help_text='Comment replied.', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='posts.comment'),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='path',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='position',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='replies_count',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.RunPython(thread_replies, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='comment',
+            name='comment_principal_idx',
+        ),
+        migrations.RemoveField(
+            model_name='comment',
+            name='replies',
+        ),
+        migrations.RemoveField(
+            model_name='comment',
+            name='type',
+        ),
+        migrations.AlterField(
+            model_name='comment',
+            name='parent',
+            field=models.ForeignKey(blank=True, db_index=False, help_text='Comment replied.', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='replies', to='posts.comment'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(condition=models.Q(('parent__isnull', True)), fields=['post', '-reactions', 'created'], name='comment_principal_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['parent', 'position'], name='comment_replies_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['path'], name='comment_path_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.0.4 on 2026-10-18 12:58
+
+from django.conf import settings
+from django.db import migrations
+from django.db.models import Q
+
+
+def deliver_legacy_posts(apps, schema_editor):
+    """
+    Write the posts created before the home timelines in the timelines
+    of their author and followers, the newest TIMELINE_SIZE of each,
+    and mark them fanned out. The posts of the authors with more
+    followers than TIMELINE_FANOUT_LIMIT are still read from them.
+    """
+    Post = apps.get_model('posts', 'Post')
+    TimelineEntry = apps.get_model('posts', 'TimelineEntry')
+    FollowUp = apps.get_model('users', 'FollowUp')
+    User = apps.get_model('users', 'User')
+
+    limit = settings.TIMELINE_FANOUT_LIMIT
+    legacy = Post.objects.filter(fanned_out=False)
+    on_read = (
+        Q(user__profile__followers_count__gt=limit) |
+        Q(brand__followers_count__gt=limit) |
+        Q(club__followers_count__gt=limit))
+
+    owners = User.objects.order_by('pk').values_list('pk', flat=True)
+    for owner in owners.iterator(chunk_size=1000):
+        follows = FollowUp.objects.filter(follower_id=owner)
+        followed = (
+            Q(user__in=follows.values('user')) |
+            Q(brand__in=follows.values('brand')) |
+            Q(club__in=follows.values('club')))
+        posts = legacy.filter(Q(user_id=owner) | followed & ~on_read).order_by(
+            '-pk').values_list('pk', flat=True)[:settings.TIMELINE_SIZE]
+        TimelineEntry.objects.bulk_create(
+            [TimelineEntry(owner_id=owner, post_id=pk) for pk in posts],
+            batch_size=1000, ignore_conflicts=True)
+
+    legacy.exclude(on_read).update(fanned_out=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_counters'),
+        ('sponsorships', '0003_counters'),
+        ('sports', '0003_counters'),
+        ('posts', '0007_counter_flushes'),
+    ]
+
+    operations = [
+        migrations.RunPython(deliver_legacy_posts, migrations.RunPython.noop),
+    ]
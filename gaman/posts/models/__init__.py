@@ -1,4 +1,6 @@
 from .comments import *
+from .counters import *
 from .media import *
 from .posts import *
-from .reactions import *
\ No newline at end of file
+from .reactions import *
+from .timelines import *
@@ -1,23 +1,29 @@
 """Comment model."""
 
 # Django
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Max
 
 # Managers
-from gaman.posts.managers import PrincipalCommentManager
+from gaman.posts.managers import CommentQuerySet, PrincipalCommentManager
 
 # Utilities
+from gaman.utils.counters import apply_delta
 from gaman.utils.models import GamanModel
 
 
 class Comment(GamanModel):
-    """Comment model."""
-
-    # Type choices
-    TYPE = [
-        ('Principal-Comment', 'Principal-Comment'),
-        ('Reply', 'Reply')
-    ]
+    """
+    Comment model.
+    The comments are a tree, the principal comments have no parent.
+    path stores the primary keys of the ancestors (e.g. '12/40/'), so
+    a thread is read or deleted with a prefix filter. position is the
+    order of a reply among the replies of its parent and replies_count
+    the number of replies of the thread, at any depth.
+    """
+
+    # The path of MAX_DEPTH ancestors fits in 255 characters with any primary key
+    MAX_DEPTH = 12
 
     author = models.ForeignKey('users.User', on_delete=models.CASCADE)
     post = models.ForeignKey('posts.Post', on_delete=models.CASCADE)
@@ -25,11 +31,62 @@ class Comment(GamanModel):
     text = models.TextField(help_text='write a comment', max_length=250)
     reactions = models.PositiveBigIntegerField(default=0)
 
-    replies = models.ManyToManyField(
-        'posts.Comment',
-        help_text='Replies of the comment.', related_name='responses', blank=True)
-
-    type = models.CharField(max_length=17, choices=TYPE)
+    # Indexed by the replies index of Meta
+    parent = models.ForeignKey(
+        'self', help_text='Comment replied.', on_delete=models.CASCADE,
+        null=True, blank=True, related_name='replies', db_index=False)
+
+    path = models.CharField(max_length=255, blank=True, editable=False)
+    depth = models.PositiveSmallIntegerField(default=0, editable=False)
+    position = models.PositiveIntegerField(default=0, editable=False)
+    replies_count = models.PositiveBigIntegerField(default=0)
+
+    objects = CommentQuerySet.as_manager()
+
+    def thread_path(self) -> str:
+        """Return the path of the replies of the comment."""
+        return f'{self.path}{self.pk}/'
+
+    def ancestors(self) -> list:
+        """Return the primary keys of the ancestors, the principal comment first."""
+        return [int(pk) for pk in self.path.split('/') if pk]
+
+    def save(self, *args, **kwargs):
+        """
+        Place a new reply at the end of the replies of its parent. A reply
+        to a comment at MAX_DEPTH is placed after its siblings instead.
+        """
+        if not self._state.adding or self.parent_id is None:
+            return super().save(*args, **kwargs)
+        with transaction.atomic():
+            # The parent lock serializes the positions of its replies
+            parent = Comment.objects.select_for_update().only('path', 'depth', 'parent').get(
+                pk=self.parent_id)
+            if parent.depth >= self.MAX_DEPTH:
+                parent = Comment.objects.select_for_update().only('path', 'depth').get(
+                    pk=parent.parent_id)
+                self.parent = parent
+            last = parent.replies.aggregate(last=Max('position'))['last']
+            self.path = parent.thread_path()
+            self.depth = parent.depth + 1
+            self.position = (last or 0) + 1
+            super().save(*args, **kwargs)
+
+    def delete_thread(self) -> int:
+        """
+        Delete the comment and its replies, selected with one prefix filter
+        whatever their depth (the collector still selects their reactions).
+        Update the ancestors replies counters and the positions of the next
+        replies. Return the number of comments deleted.
+        """
+        with transaction.atomic():
+            deleted = Comment.objects.thread(self).delete()[1].get(Comment._meta.label, 0)
+            apply_delta(Comment, self.ancestors(), 'replies_count', -deleted)
+            if self.parent_id is not None:
+                Comment.objects.filter(
+                    parent=self.parent_id, position__gt=self.position
+                ).update(position=models.F('position') - 1)
+        return deleted
 
     def __str__(self):
         """Return username, post about and comment."""
@@ -38,6 +95,17 @@ class Comment(GamanModel):
     class Meta:
         """Meta options."""
         ordering = ['created']
+        indexes = [
+            # Principal comments of a post, the most reacted first
+            models.Index(
+                fields=['post', '-reactions', 'created'], name='comment_principal_idx',
+                condition=models.Q(parent__isnull=True)),
+            # Replies of a comment in order, the first ones are inlined
+            models.Index(fields=['parent', 'position'], name='comment_replies_idx'),
+            # Threads, the prefix filters need the pattern operators on PostgreSQL
+            models.Index(
+                fields=['path'], name='comment_path_idx', opclasses=['varchar_pattern_ops']),
+        ]
 
 
 class PrincipalComment(Comment):
@@ -0,0 +1,21 @@
+"""Counters models."""
+
+# Django
+from django.db import models
+
+# Utilities
+from gaman.utils.models import BaseGamanModel
+
+
+class CounterFlush(BaseGamanModel):
+    """
+    Counter Flush model.
+    Batch of buffered counter deltas applied to the database, it's
+    written in the same transaction so a batch is never applied twice.
+    """
+
+    batch = models.CharField(max_length=32, unique=True)
+
+    def __str__(self):
+        """Return batch."""
+        return self.batch
@@ -3,16 +3,11 @@
 # Django
 from django.db import models
 
-# Models
-from gaman.sponsorships.models import Brand
-from gaman.sports.models import Club
-from gaman.users.models import User
-
 # Utils
-from gaman.utils.models import GamanModel
+from gaman.utils.models import AuthoredModel, GamanModel
 
 
-class Post(GamanModel):
+class Post(GamanModel, AuthoredModel):
     """
     Post model.
     The author can be a user, brand or a club.
@@ -39,14 +34,15 @@ class Post(GamanModel):
         ('Curious', 'Curious'), ('Surprised', 'Surprised')
     ]
 
+    # Indexed by the author indexes of Meta
     user = models.ForeignKey(
-        'users.User', on_delete=models.SET_NULL, null=True)
+        'users.User', on_delete=models.SET_NULL, null=True, db_index=False)
 
     brand = models.ForeignKey(
-        'sponsorships.Brand', on_delete=models.SET_NULL, null=True)
+        'sponsorships.Brand', on_delete=models.SET_NULL, null=True, db_index=False)
 
     club = models.ForeignKey(
-        'sports.Club', on_delete=models.SET_NULL, null=True)
+        'sports.Club', on_delete=models.SET_NULL, null=True, db_index=False)
 
     about = models.TextField(help_text='Write something', blank=True)
 
@@ -73,23 +69,24 @@ class Post(GamanModel):
     comments = models.PositiveBigIntegerField(default=0)
     shares = models.PositiveBigIntegerField(default=0)
 
-    def specify_author(self) -> str:
-        """Specify if author is a user, brand or club."""
-        authors = [self.user, self.brand, self.club]
-        for author in authors:
-            if author:
-                return author
-
-    def normalize_author(self) -> User:
-        """Transform the author in user."""
-        author = self.specify_author()
-        author_type = type(author)
-        if author_type == Brand:
-            return author.sponsor
-        elif author_type == Club:
-            return author.trainer
-        return author  # user type
+    fanned_out = models.BooleanField(
+        help_text='Set to true when the post was delivered to the followers timelines.',
+        default=False)
 
     def __str__(self):
         """Return about and username."""
-        return f'{self.about} by @{self.specify_author()}'
+        return f'{self.about} by @{self.author_name}'
+
+    class Meta(GamanModel.Meta):
+        """Meta options."""
+        indexes = [
+            # Posts of an author, newest first
+            models.Index(fields=['user', '-created'], name='post_user_created_idx'),
+            models.Index(fields=['user', 'privacy', '-created'], name='post_user_privacy_idx'),
+            models.Index(
+                fields=['brand', '-created'], name='post_brand_created_idx',
+                condition=models.Q(brand__isnull=False)),
+            models.Index(
+                fields=['club', '-created'], name='post_club_created_idx',
+                condition=models.Q(club__isnull=False)),
+        ]
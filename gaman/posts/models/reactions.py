@@ -3,6 +3,9 @@
 # Django
 from django.db import models
 
+# Managers
+from gaman.posts.managers import ReactionQuerySet
+
 # Models
 from gaman.utils.models import Reaction
 
@@ -10,20 +13,46 @@ from gaman.utils.models import Reaction
 class PostReaction(Reaction):
     """Post Reaction model."""
 
-    user = models.ForeignKey('users.User', on_delete=models.CASCADE)
-    post = models.ForeignKey('posts.Post', on_delete=models.CASCADE)
+    # Indexed by the constraints and indexes of Meta
+    user = models.ForeignKey('users.User', on_delete=models.CASCADE, db_index=False)
+    post = models.ForeignKey('posts.Post', on_delete=models.CASCADE, db_index=False)
+
+    objects = ReactionQuerySet.as_manager()
 
     def __str__(self):
         """Return username."""
         return f'@{self.user} reacted to your post.'
 
+    class Meta(Reaction.Meta):
+        """Meta options."""
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'post'], name='unique_post_reaction')
+        ]
+        indexes = [
+            # Reaction summaries and lists of a post
+            models.Index(fields=['post', 'reaction', '-created'], name='postreaction_post_idx')
+        ]
+
 
 class CommentReaction(Reaction):
     """Comment Reaction model."""
 
-    user = models.ForeignKey('users.User', on_delete=models.CASCADE)
-    comment = models.ForeignKey('posts.Comment', on_delete=models.CASCADE)
+    # Indexed by the constraints and indexes of Meta
+    user = models.ForeignKey('users.User', on_delete=models.CASCADE, db_index=False)
+    comment = models.ForeignKey('posts.Comment', on_delete=models.CASCADE, db_index=False)
+
+    objects = ReactionQuerySet.as_manager()
 
     def __str__(self):
         """Return username."""
         return f'@{self.user} reacted to your comment.'
+
+    class Meta(Reaction.Meta):
+        """Meta options."""
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'comment'], name='unique_comment_reaction')
+        ]
+        indexes = [
+            # Reaction summaries and lists of a comment
+            models.Index(fields=['comment', 'reaction', '-created'], name='commentreaction_comment_idx')
+        ]
@@ -0,0 +1,32 @@
+"""Timeline models."""
+
+# Django
+from django.db import models
+
+# Utilities
+from gaman.utils.models import BaseGamanModel
+
+
+class TimelineEntry(BaseGamanModel):
+    """
+    Timeline Entry model.
+    Materialized home timeline row, it's written when a post
+    is delivered (fan-out on write) to the feed of a follower.
+    """
+
+    owner = models.ForeignKey(
+        'users.User', on_delete=models.CASCADE, related_name='timeline')
+
+    post = models.ForeignKey('posts.Post', on_delete=models.CASCADE)
+
+    def __str__(self):
+        """Return owner and post."""
+        return f'@{self.owner} <- {self.post_id}'
+
+    class Meta:
+        """Meta options."""
+        ordering = ['-post']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['owner', 'post'], name='unique_timeline_entry')
+        ]
@@ -1,13 +1,10 @@
 """Comment permissions."""
 
-# Django
-from django.db.models import Q
-
 # Django REST Framework
 from rest_framework.permissions import BasePermission
 
-# Models
-from gaman.users.models import FollowUp
+# Utils
+from gaman.utils.follows import FollowGraph
 
 
 class IsCommentOwner(BasePermission):
@@ -23,7 +20,7 @@ class IsCommentOrPostOwner(BasePermission):
 
     def has_object_permission(self, request, view, obj):
         """Check requesting user is comment owner or post owner."""
-        return request.user in (obj.post.normalize_author(), obj.author)
+        return request.user == obj.author or obj.post.authored_by(request.user)
 
 
 class IsFollower(BasePermission):
@@ -35,13 +32,11 @@ class IsFollower(BasePermission):
         post owner or if requesting user is the post owner.
         """
         post = view.object
-        post_owner = post.normalize_author()
-        
-        if post.privacy == 'Public' or request.user == post_owner:
+        if post.privacy == 'Public':
             return True
-        elif post.privacy == 'Private':
-            folloup = FollowUp.objects.filter(
-                Q(follower=request.user, user=post_owner ) |
-                Q(follower=request.user, brand=post.brand) |
-                Q(follower= request.user, club=post.club))
-            return folloup.exists()
\ No newline at end of file
+        if FollowGraph.follows_author(request.user, post):
+            return True
+        post_owner = post.normalize_author()
+        return (
+            request.user == post_owner or
+            FollowGraph.is_following(request.user, post_owner))
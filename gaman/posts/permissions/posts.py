@@ -1,13 +1,10 @@
 """Post permissions."""
 
-# Django
-from django.db.models import Q
-
 # Django REST Framework
 from rest_framework.permissions import BasePermission
 
-# Models
-from gaman.users.models import FollowUp
+# Utils
+from gaman.utils.follows import FollowGraph
 
 
 class IsPostOwner(BasePermission):
@@ -15,7 +12,7 @@ class IsPostOwner(BasePermission):
 
     def has_object_permission(self, request, view, obj):
         """Check requesting user and post owner are the same."""
-        return request.user == obj.normalize_author()
+        return obj.authored_by(request.user)
 
 
 class IsFollowerOrPostOwner(BasePermission):
@@ -31,12 +28,8 @@ class IsFollowerOrPostOwner(BasePermission):
         Check privacy post and if user is follower of the
         post owner or if requesting user is the post owner.
         """
-
-        if obj.privacy == 'Public' or request.user == obj.normalize_author():
+        if obj.privacy == 'Public':
+            return True
+        if FollowGraph.follows_author(request.user, obj):
             return True
-        elif obj.privacy == 'Private':
-            folloup = FollowUp.objects.filter(
-                Q(follower=request.user, user=obj.user ) |
-                Q(follower=request.user, brand=obj.brand) |
-                Q(follower= request.user, club=obj.club))
-            return folloup.exists()
\ No newline at end of file
+        return obj.authored_by(request.user)
@@ -3,11 +3,18 @@
 # Django REST Framework
 from rest_framework import serializers
 
+# Managers
+from gaman.posts.managers import CommentQuerySet
+
 # Models
 from gaman.posts.models import Comment
 
+# Utils
+from gaman.utils.counters import increment
+from gaman.utils.sparse import SparseModelSerializer
+
 
-class ReplyModelSerializer(serializers.ModelSerializer):
+class ReplyModelSerializer(SparseModelSerializer):
     """
     Reply model serializer.
     Handles the creation of reply type comment. 
@@ -28,30 +35,27 @@ class ReplyModelSerializer(serializers.ModelSerializer):
             'created'
         ]
 
+        compiled_sources = {'author': ['author__username']}
+
     def create(self, data):
         """Create a comment reply."""
         author = self.context['author']
         post = self.context['post']
         comment = self.context['comment']
 
-        # comment reply
-        reply = Comment.objects.create(
-            **data, author=author, post=post, type='Reply')
-
-        # Add reply to principal comment
-        comment.replies.add(reply)
-        comment.save()
+        # comment reply, placed after the other replies of the comment
+        reply = Comment.objects.create(**data, author=author, post=post, parent=comment)
 
         # Update Post
-        post.comments += 1
-        post.save()
+        increment(post, 'comments')
         return reply
 
 
-class CommentModelSerializer(serializers.ModelSerializer):
+class CommentModelSerializer(SparseModelSerializer):
     """
     Comment model serializer.
-    Handles the creation of principal comment.
+    Handles the creation of principal comment. The first
+    replies are inlined, replies_count counts all of them.
     """
 
     author = serializers.StringRelatedField(read_only=True)
@@ -65,22 +69,24 @@ class CommentModelSerializer(serializers.ModelSerializer):
         fields = [
             'author', 'text',
             'reactions', 'replies',
-            'created'
+            'replies_count', 'created'
         ]
 
         read_only_fields = [
             'author', 'reactions',
-            'replies', 'created'
+            'replies', 'replies_count',
+            'created'
         ]
 
+        compiled_sources = {'author': ['author__username']}
+        compiled_querysets = {'replies': CommentQuerySet.inlined}
+
     def create(self, data):
         """Create a comment."""
         author = self.context['author']
         post = self.context['post']
-        comment = Comment.objects.create(
-            **data, author=author, post=post, type='Principal-Comment')
+        comment = Comment.objects.create(**data, author=author, post=post)
 
         # Update Post
-        post.comments += 1
-        post.save()
+        increment(post, 'comments')
         return comment
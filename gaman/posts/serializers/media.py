@@ -6,8 +6,11 @@ from rest_framework import serializers
 # Models
 from gaman.posts.models import Picture, Video
 
+# Utils
+from gaman.utils.sparse import SparseModelSerializer
 
-class ImageModelSerializer(serializers.ModelSerializer):
+
+class ImageModelSerializer(SparseModelSerializer):
     """Image model serializer."""
 
     content = serializers.ImageField(max_length=1000)
@@ -18,7 +21,7 @@ class ImageModelSerializer(serializers.ModelSerializer):
         fields = ['content']
 
 
-class VideoModelSerializer(serializers.ModelSerializer):
+class VideoModelSerializer(SparseModelSerializer):
     """Video model serializer."""
 
     content = serializers.FileField(max_length=1000)
@@ -1,27 +1,36 @@
 """Posts serializers."""
 
+# Utilities
+import copy
+
+# Django
+from django.db.models import prefetch_related_objects
+
 # Django REST Framework
 from rest_framework import serializers
 
 # Models
-from gaman.posts.models import Picture, Post, Video
+from gaman.posts.models import Picture, Post, PostReaction, Video
 from gaman.users.models import User
 
 # Serializers
 from gaman.posts.serializers import ImageModelSerializer, VideoModelSerializer
 
 # Utils
+from gaman.utils.counters import increment
+from gaman.utils.post_cache import COUNTERS, post_cache
 from gaman.utils.posts import PostAuthorContext
+from gaman.utils.sparse import SparseModelSerializer, related_paths
 
 
-class PostSumaryModelSerializer(serializers.ModelSerializer):
+class PostSumaryModelSerializer(SparseModelSerializer):
     """
     Post Sumary model serializer.
     It's util for serialize post nested in other post (repost).
     """
 
-    author = serializers.StringRelatedField(
-        read_only=True, source='specify_author')
+    author = serializers.CharField(
+        read_only=True, source='author_name')
 
     pictures = ImageModelSerializer(read_only=True, many=True)
     videos = VideoModelSerializer(read_only=True, many=True)
@@ -42,13 +51,79 @@ class PostSumaryModelSerializer(serializers.ModelSerializer):
         ]
 
 
+class PostListSerializer(serializers.ListSerializer):
+    """
+    Post list serializer.
+    Reads the representations of the posts from the posts cache,
+    only the misses are serialized. Counters, media urls and the
+    reaction summaries (loaded with a single grouped query when
+    they are requested) are added to each cached representation.
+    """
+
+    def serialize(self, posts: dict, pks: list) -> dict:
+        """Return the (stamp, representation) of the posts without request."""
+        posts = [posts[pk] for pk in pks]
+        prefetch_related_objects(
+            posts, 'pictures', 'videos', 'tag_users',
+            'post__pictures', 'post__videos')
+        serializer = type(self.child)(context={})
+        return {
+            post.pk: (post_cache.stamp(post.updated), serializer.to_representation(post))
+            for post in posts
+        }
+
+    @staticmethod
+    def absolute_urls(data: dict, request) -> None:
+        """Build the absolute urls of the media, like the file fields do with request."""
+        if request is None:
+            return
+        for field in ['pictures', 'videos']:
+            for media in data.get(field) or []:
+                if media['content']:
+                    media['content'] = request.build_absolute_uri(media['content'])
+
+    @classmethod
+    def hydrate(cls, cached: dict, counters: dict, request) -> dict:
+        """Return a copy of the cached representation with the live counters and urls."""
+        data = copy.deepcopy(cached)
+        data.update(counters)
+        cls.absolute_urls(data, request)
+        if data.get('post'):
+            cls.absolute_urls(data['post'], request)
+        return data
+
+    def to_representation(self, data):
+        """Return the cached representations of the posts."""
+        data = list(data.all() if hasattr(data, 'all') else data)
+        if self.context.get('include_reaction_summary'):
+            self.context['reaction_summaries'] = PostReaction.objects.summaries(
+                'post', [post.pk for post in data],
+                since=min((post.created for post in data), default=None))
+        if self.child.get_sparse() is not None:
+            # The sparse fields are serialized, the cache has the full representations
+            prefetch_related_objects(data, *sorted(related_paths(self.child)))
+            return [self.child.to_representation(post) for post in data]
+        posts = {post.pk: post for post in data}
+        stamps = {post.pk: post_cache.stamp(post.updated) for post in data}
+        cached = post_cache.get_many(stamps, lambda pks: self.serialize(posts, pks))
+        request = self.context.get('request')
+        representations = []
+        for post in data:
+            counters = {field: getattr(post, field) for field in COUNTERS}
+            representation = self.hydrate(cached[post.pk], counters, request)
+            if self.context.get('include_reaction_summary'):
+                representation['reaction_summary'] = self.context['reaction_summaries'][post.pk]
+            representations.append(representation)
+        return representations
+
+
 class PostModelSerializer(PostSumaryModelSerializer):
     """
     Post model serializer.
     Handles the creation of user post.
     """
-    author = serializers.StringRelatedField(
-        read_only=True, source='specify_author')
+    author = serializers.CharField(
+        read_only=True, source='author_name')
 
     post = PostSumaryModelSerializer(read_only=True, required=False)
 
@@ -76,6 +151,54 @@ class PostModelSerializer(PostSumaryModelSerializer):
             'created'
         ]
 
+        sparse_related = {'tag_users': ['tag_users']}
+        compiled_sources = {'tag_users': ['tag_users__username']}
+        compiled_columns = ['updated']
+        list_serializer_class = PostListSerializer
+
+    @classmethod
+    def represent_compiled(cls, rows: list, represent, context: dict) -> list:
+        """Read the compiled representations from the posts cache, represent the misses."""
+        rows_by_pk = {row['pk']: row for row in rows}
+        stamps = {row['pk']: post_cache.stamp(row['updated']) for row in rows}
+
+        def serialize(pks: list) -> dict:
+            missing = [rows_by_pk[pk] for pk in pks]
+            return {
+                row['pk']: (stamps[row['pk']], data)
+                for row, data in zip(missing, represent(missing, {}))
+            }
+
+        cached = post_cache.get_many(stamps, serialize)
+        request = context.get('request')
+        return [
+            PostListSerializer.hydrate(
+                cached[row['pk']], {field: row[field] for field in COUNTERS}, request)
+            for row in rows
+        ]
+
+    @classmethod
+    def hydrate_compiled(cls, rows: list, data: list, context: dict) -> None:
+        """Add the reaction summaries to the compiled representations if they were requested."""
+        if not context.get('include_reaction_summary'):
+            return
+        summaries = PostReaction.objects.summaries(
+            'post', [row['pk'] for row in rows],
+            since=min((row['created'] for row in rows), default=None))
+        for row, post in zip(rows, data):
+            post['reaction_summary'] = summaries[row['pk']]
+
+    def to_representation(self, instance):
+        """Add the reaction summary if it was requested."""
+        data = super().to_representation(instance)
+        if self.context.get('include_reaction_summary'):
+            summaries = self.context.get('reaction_summaries', {})
+            summary = summaries.get(instance.pk)
+            if summary is None:
+                summary = PostReaction.objects.of('post', instance).summary()
+            data['reaction_summary'] = summary
+        return data
+
     def validate(self, data):
         """Verify tag friends."""
         tag_users = data.get('tag_users', None)
@@ -109,14 +232,14 @@ class PostModelSerializer(PostSumaryModelSerializer):
         return post
 
 
-class SharePostSerializer(serializers.ModelSerializer):
+class SharePostSerializer(SparseModelSerializer):
     """
     Share Post serializer.
     It's util when requesting user wants share a post.
     """
 
-    author = serializers.StringRelatedField(
-        read_only=True, source='specify_author')
+    author = serializers.CharField(
+        read_only=True, source='author_name')
     post = PostSumaryModelSerializer(read_only=True)
 
     class Meta:
@@ -138,6 +261,10 @@ class SharePostSerializer(serializers.ModelSerializer):
 
     def create(self, data):
         """Create a post."""
+        shared = self.context['post']
         post = Post.objects.create(
-            **data, user=self.context['author'], post=self.context['post'])
+            **data, user=self.context['author'], post=shared)
+
+        # Update shared post
+        increment(shared, 'shares')
         return post
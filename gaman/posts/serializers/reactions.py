@@ -1,13 +1,20 @@
 """Reactions serializers."""
 
+# Django
+from django.db import transaction
+
 # Django REST Framework
 from rest_framework import serializers
 
 # Models
 from gaman.posts.models import CommentReaction, PostReaction
 
+# Utils
+from gaman.utils.counters import increment
+from gaman.utils.sparse import SparseModelSerializer
+
 
-class PostReactionModelSerializer(serializers.ModelSerializer):
+class PostReactionModelSerializer(SparseModelSerializer):
     """
     Post Reaction model serializer.
     Handles the creation Post reaction.
@@ -21,32 +28,32 @@ class PostReactionModelSerializer(serializers.ModelSerializer):
         fields = ['user', 'reaction']
         read_only_fields = ['user']
 
-    def validate(self, data):
-        """verify that the user's reaction does not exist yet."""
+    def unreact(self) -> bool:
+        """Delete the user's reaction if it exists (toggle), return if it was deleted."""
         user = self.context['user']
         post = self.context['post']
-        reaction = PostReaction.objects.filter(user=user, post=post)
-        # If the user's reaction exists, this is deleted
-        if reaction.exists():
-            reaction.delete()
-            post.reactions -= 1
-            post.save()
-        else:
-            return data
+        # A concurrent toggle may have deleted it first, only the deleted rows count
+        deleted = PostReaction.objects.of('post', post).filter(
+            user=user).delete()[1].get(PostReaction._meta.label, 0)
+        increment(post, 'reactions', -deleted)
+        return bool(deleted)
 
     def create(self, data):
-        """Create a post reaction."""
+        """
+        Create a post reaction.
+        Raises IntegrityError if a concurrent request of the user reacted first.
+        """
         user = self.context['user']
         post = self.context['post']
-        reaction = PostReaction.objects.create(**data, user=user, post=post)
+        with transaction.atomic():
+            reaction = PostReaction.objects.create(**data, user=user, post=post)
 
         # Update Post
-        post.reactions += 1
-        post.save()
+        increment(post, 'reactions')
         return reaction
 
 
-class CommentReactionModelSerializer(serializers.ModelSerializer):
+class CommentReactionModelSerializer(SparseModelSerializer):
     """
     Comment reaction model serializer.
     Handle the creation Comment reaction.
@@ -60,27 +67,27 @@ class CommentReactionModelSerializer(serializers.ModelSerializer):
         fields = ['user', 'reaction']
         read_only_fields = ['user']
 
-    def validate(self, data):
-        """Verify that the user's reaction does not exist yet."""
+    def unreact(self) -> bool:
+        """Delete the user's reaction if it exists (toggle), return if it was deleted."""
         user = self.context['user']
         comment = self.context['comment']
-        reaction = CommentReaction.objects.filter(user=user, comment=comment)
-        # If the user's reaction exists, this is deleted
-        if reaction.exists():
-            reaction.delete()
-            comment.reactions -= 1
-            comment.save()
-        else:
-            return data
+        # A concurrent toggle may have deleted it first, only the deleted rows count
+        deleted = CommentReaction.objects.of('comment', comment).filter(
+            user=user).delete()[1].get(CommentReaction._meta.label, 0)
+        increment(comment, 'reactions', -deleted)
+        return bool(deleted)
 
     def create(self, data):
-        """Create a comment reaction."""
+        """
+        Create a comment reaction.
+        Raises IntegrityError if a concurrent request of the user reacted first.
+        """
         user = self.context['user']
         comment = self.context['comment']
-        reaction = CommentReaction.objects.create(
-            **data, user=user, comment=comment)
+        with transaction.atomic():
+            reaction = CommentReaction.objects.create(
+                **data, user=user, comment=comment)
 
         # Comment update
-        comment.reactions += 1
-        comment.save()
+        increment(comment, 'reactions')
         return reaction
@@ -0,0 +1,129 @@
+"""Posts signals."""
+
+# Django
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+# Models
+from gaman.posts.models import Comment, Post
+from gaman.sponsorships.models import Brand
+from gaman.sports.models import Club
+from gaman.users.models import FollowUp, Profile, User
+
+# Utils
+from gaman.utils.authors import release_author, rename_author, renamed
+from gaman.utils.counters import apply_delta
+from gaman.utils.post_cache import post_cache
+from gaman.utils.timelines import HomeTimeline
+
+
+@receiver(post_save, sender=Post)
+def fan_out_post(sender, instance, created, *args, **kwargs):
+    """Deliver the new post to the followers timelines."""
+    if created:
+        HomeTimeline.fan_out(instance)
+
+
+@receiver(post_save, sender=FollowUp)
+def backfill_timeline(sender, instance, created, *args, **kwargs):
+    """Add the followed latest posts to the follower timeline."""
+    if created:
+        HomeTimeline.backfill(instance)
+
+
+@receiver(post_delete, sender=FollowUp)
+def prune_timeline(sender, instance, *args, **kwargs):
+    """Remove the unfollowed posts from the follower timeline."""
+    HomeTimeline.prune(instance)
+
+
+def count_post(post: Post, delta: int) -> None:
+    """Apply a delta to the posts counter of the post author."""
+    if post.user_id:
+        apply_delta(Profile, [post.user_id], 'posts_count', delta, lookup='user')
+    elif post.brand_id:
+        apply_delta(Brand, [post.brand_id], 'posts_count', delta)
+    elif post.club_id:
+        apply_delta(Club, [post.club_id], 'posts_count', delta)
+
+
+@receiver(post_save, sender=Post)
+def count_new_post(sender, instance, created, *args, **kwargs):
+    """Increment the posts counter of the author."""
+    if created:
+        count_post(instance, 1)
+
+
+@receiver(post_delete, sender=Post)
+def count_deleted_post(sender, instance, *args, **kwargs):
+    """Decrement the posts counter of the author."""
+    count_post(instance, -1)
+
+
+@receiver(post_save, sender=Comment)
+def count_new_reply(sender, instance, created, *args, **kwargs):
+    """Increment the replies counters of the thread of the new reply."""
+    if created and instance.parent_id is not None:
+        apply_delta(Comment, instance.ancestors(), 'replies_count', 1)
+
+
+@receiver(post_save, sender=Post)
+def invalidate_post(sender, instance, created, *args, **kwargs):
+    """Remove the edited post and its reposts from the posts cache."""
+    if not created:
+        post_cache.invalidate([instance.pk])
+
+
+@receiver(pre_delete, sender=Post)
+def invalidate_deleted_post(sender, instance, *args, **kwargs):
+    """Remove the post and its reposts before they lose the reposted post."""
+    post_cache.invalidate([instance.pk])
+
+
+@receiver(m2m_changed, sender=Post.pictures.through)
+@receiver(m2m_changed, sender=Post.videos.through)
+@receiver(m2m_changed, sender=Post.tag_users.through)
+def invalidate_post_relations(sender, instance, action, reverse, pk_set, *args, **kwargs):
+    """Remove the posts whose pictures, videos or tagged users changed."""
+    if action not in ['post_add', 'post_remove', 'pre_clear']:
+        return
+    if not reverse:
+        post_cache.invalidate([instance.pk])
+    elif pk_set:
+        post_cache.invalidate(pk_set)
+    elif action == 'pre_clear':
+        field = next(f.name for f in Post._meta.many_to_many if f.remote_field.through is sender)
+        post_cache.invalidate_where(**{field: instance})
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=Brand)
+@receiver(post_save, sender=Club)
+def rename_posts_author(sender, instance, created, *args, **kwargs):
+    """Update the author name of the posts of a renamed user, brand or club."""
+    if not created and renamed(instance):
+        rename_author(Post, instance)
+
+
+@receiver(post_delete, sender=User)
+@receiver(post_delete, sender=Brand)
+@receiver(post_delete, sender=Club)
+def release_posts_author(sender, instance, *args, **kwargs):
+    """Update the author of the posts of a deleted user, brand or club."""
+    release_author(Post, instance)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_posts(sender, instance, created, *args, **kwargs):
+    """Remove the posts of a user, and the tagging it, when it's renamed."""
+    if not created and renamed(instance):
+        post_cache.invalidate_where(Q(user=instance) | Q(tag_users=instance))
+
+
+@receiver(post_save, sender=Brand)
+@receiver(post_save, sender=Club)
+def invalidate_author_posts(sender, instance, created, *args, **kwargs):
+    """Remove the posts of a brand or club when it's renamed."""
+    if not created and renamed(instance):
+        post_cache.invalidate_where(**{sender._meta.model_name: instance})
@@ -69,8 +69,7 @@ class CommentAPITestCase(APITestCase):
         self.comment = Comment.objects.create(
             author=self.user3,
             post=self.post,
-            text='Hi this comment is a test',
-            type='Principal-Comment'
+            text='Hi this comment is a test'
         )
     
     def test_comment_model(self):
@@ -231,7 +230,7 @@ class CommentAPITestCase(APITestCase):
             request_body
         )
         reply = Comment.objects.filter(
-            author=self.user3, post=self.post, type='Reply')
+            author=self.user3, post=self.post, parent=self.comment)
         self.assertEqual(self.post.comment_set.all().count(), 2)
         self.assertEqual(self.comment.replies.all().count(), 1)
         self.assertEqual(reply.exists(), True)
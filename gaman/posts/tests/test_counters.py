@@ -0,0 +1,204 @@
+"""Counters tests."""
+
+# Utilities
+from io import StringIO
+from unittest import mock, skipUnless
+import redis
+
+# Django
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+
+# Django REST Framework
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+# Models
+from gaman.posts.models import Comment, CommentReaction, Post, PostReaction
+from gaman.users.models import User
+
+# Serializers
+from gaman.posts.serializers import PostReactionModelSerializer
+
+# Utils
+from gaman.utils.counters import flush, increment
+
+
+COUNTERS_REDIS_URL = 'redis://localhost:6379/15'
+
+
+def redis_available() -> bool:
+    """Return if the redis of the buffered counters tests is reachable."""
+    try:
+        return redis.Redis.from_url(COUNTERS_REDIS_URL).ping()
+    except redis.ConnectionError:
+        return False
+
+
+class CountersAPITestCase(APITestCase):
+    """Posts and comments counters api test case."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+
+        self.user = User.objects.create(
+            email='test@gmail.com',
+            username='test00',
+            first_name='test00',
+            last_name='test00',
+            role='Athlete',
+            password='nKSAJBBCJW_',
+            verified=True
+        )
+
+        self.token = Token.objects.create(user=self.user).key
+        self.post = Post.objects.create(user=self.user, about='Counters test')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token}')
+
+    def test_react_counter(self):
+        """Check that react and unreact update the counter without touching updated."""
+        updated = self.post.updated
+        url = reverse('posts:posts-react', args=[self.post.pk])
+        self.client.post(url, {'reaction': 'Like'})
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.reactions, 1)
+        self.assertEqual(self.post.updated, updated)
+
+        self.client.post(url, {'reaction': 'Like'})
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.reactions, 0)
+
+    def test_concurrent_unreact(self):
+        """Check that an unreact decrements only the reactions it deleted."""
+        PostReaction.objects.create(user=self.user, post=self.post, reaction='Like')
+        Post.objects.filter(pk=self.post.pk).update(reactions=1)
+        context = {'user': self.user, 'post': Post.objects.get(pk=self.post.pk)}
+        # Two requests of the user toggle the reaction at the same time
+        first = PostReactionModelSerializer(data={'reaction': 'Like'}, context=context)
+        second = PostReactionModelSerializer(data={'reaction': 'Like'}, context=context)
+        self.assertTrue(first.unreact())
+        self.assertFalse(second.unreact())
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.reactions, PostReaction.objects.count())
+
+    def test_concurrent_react(self):
+        """Check that a reaction created by a concurrent request is a conflict."""
+        url = reverse('posts:posts-react', args=[self.post.pk])
+
+        def raced_unreact(serializer):
+            # Another request of the user reacts after this one looked for its reaction
+            PostReaction.objects.create(user=self.user, post=self.post, reaction='Love')
+            return False
+
+        with mock.patch.object(PostReactionModelSerializer, 'unreact', raced_unreact):
+            response = self.client.post(url, {'reaction': 'Like'})
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(
+            list(PostReaction.objects.values_list('reaction', flat=True)), ['Love'])
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.reactions, 0)
+
+    def test_share_counter(self):
+        """Check that share a post increments its shares."""
+        response = self.client.post(
+            reverse('posts:posts-share', args=[self.post.pk]), {'about': 'Shared'})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.shares, 1)
+
+    def test_comments_counter(self):
+        """Check that comment, reply and delete update the comments counter."""
+        url = reverse('posts:comments-list', args=[self.post.pk])
+        self.client.post(url, {'text': 'A comment'})
+        comment = Comment.objects.get(text='A comment')
+        self.client.post(
+            reverse('posts:comments-reply', args=[self.post.pk, comment.pk]),
+            {'text': 'A reply'})
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comments, 2)
+
+        self.client.delete(
+            reverse('posts:comments-detail', args=[self.post.pk, comment.pk]))
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comments, 0)
+
+    def test_counter_not_negative(self):
+        """Check that a decrement never leaves a counter below zero."""
+        PostReaction.objects.create(user=self.user, post=self.post, reaction='Like')
+        self.client.post(
+            reverse('posts:posts-react', args=[self.post.pk]), {'reaction': 'Like'})
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.reactions, 0)
+
+    def test_reconcile_counters(self):
+        """Check that reconcile counters recompute them from the rows."""
+        comment = Comment.objects.create(
+            author=self.user, post=self.post, text='A comment')
+        PostReaction.objects.create(user=self.user, post=self.post, reaction='Love')
+        CommentReaction.objects.create(user=self.user, comment=comment, reaction='Haha')
+        Post.objects.create(user=self.user, post=self.post)
+
+        call_command('reconcile-counters', stdout=StringIO())
+        self.post.refresh_from_db()
+        comment.refresh_from_db()
+        self.assertEqual(
+            (self.post.reactions, self.post.comments, self.post.shares), (1, 1, 1))
+        self.assertEqual(comment.reactions, 1)
+
+
+@skipUnless(redis_available(), 'The buffered counters need redis')
+@override_settings(COUNTERS_BUFFER=True, COUNTERS_REDIS_URL=COUNTERS_REDIS_URL)
+class BufferedCountersTestCase(APITestCase):
+    """Counters buffered in redis test case."""
+
+    label = 'posts.Post.reactions'
+
+    def setUp(self) -> None:
+        """Test case setup."""
+        self.redis = redis.Redis.from_url(COUNTERS_REDIS_URL)
+        self.addCleanup(self.redis.delete, *self.keys())
+        patcher = mock.patch('gaman.utils.counters._client', self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        user = User.objects.create(
+            email='test@gmail.com',
+            username='test00',
+            first_name='test00',
+            last_name='test00',
+            role='Athlete',
+            password='nKSAJBBCJW_',
+            verified=True
+        )
+        self.post = Post.objects.create(user=user, about='Buffered counters test')
+
+    def keys(self) -> list:
+        """Return the redis keys of the buffered reactions."""
+        key = f'counters:{self.label}'
+        return [key, f'{key}:flushing', f'{key}:flushing:batch']
+
+    def test_buffered_on_commit(self):
+        """Check that the deltas are buffered only when the transaction commits."""
+        with self.captureOnCommitCallbacks() as rolled_back:
+            increment(self.post, 'reactions', 2)
+        self.assertIsNone(self.redis.hget(self.keys()[0], self.post.pk))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            increment(self.post, 'reactions', 2)
+        self.assertEqual(len(rolled_back), 1)
+        self.assertEqual(int(self.redis.hget(self.keys()[0], self.post.pk)), 2)
+
+    def test_flush_once(self):
+        """Check that a flush interrupted after its commit doesn't apply the deltas again."""
+        with self.captureOnCommitCallbacks(execute=True):
+            increment(self.post, 'reactions', 2)
+
+        with mock.patch.object(self.redis, 'delete', side_effect=redis.ConnectionError):
+            with self.assertRaises(redis.ConnectionError):
+                flush(self.label)
+        self.assertEqual(flush(self.label), 0)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.reactions, 2)
+        self.assertEqual(self.redis.exists(*self.keys()), 0)
@@ -0,0 +1,119 @@
+"""Keyset pagination tests."""
+
+# Django
+from django.urls import reverse
+
+# Django REST Framework
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+# Models
+from gaman.posts.models import Comment, Post, PostReaction
+from gaman.users.models import Profile, User
+
+
+class KeysetPaginationAPITestCase(APITestCase):
+    """Keyset pagination api test case."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+
+        self.user = User.objects.create(
+            email='test@gmail.com',
+            username='test00',
+            first_name='test00',
+            last_name='test00',
+            role='Athlete',
+            password='nKSAJBBCJW_',
+            verified=True
+        )
+
+        self.token = Token.objects.create(user=self.user).key
+        self.posts = [
+            Post.objects.create(user=self.user, about=f'Post {i}') for i in range(5)]
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token}')
+
+    def test_feed_pages(self):
+        """Check that the feed is paginated newest first without repeated posts."""
+        url = reverse('posts:posts-list') + '?limit=2'
+        pks = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data['results']), 2)
+            pks += [post['pk'] for post in response.data['results']]
+            url = response.data['next']
+        self.assertEqual(pks, [post.pk for post in reversed(self.posts)])
+
+    def test_feed_page_is_stable_under_inserts(self):
+        """Check that new posts don't shift the next page."""
+        response = self.client.get(reverse('posts:posts-list') + '?limit=2')
+        Post.objects.create(user=self.user, about='New post')
+        response = self.client.get(response.data['next'])
+        pks = [post['pk'] for post in response.data['results']]
+        self.assertEqual(pks, [self.posts[2].pk, self.posts[1].pk])
+
+    def test_offset_pagination(self):
+        """Check that offset pagination is still available."""
+        response = self.client.get(reverse('posts:posts-list') + '?limit=2&offset=2')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 5)
+        self.assertEqual(response.data['results'][0]['pk'], self.posts[2].pk)
+
+    def test_invalid_cursor(self):
+        """Check that a invalid cursor is not found."""
+        response = self.client.get(reverse('posts:posts-list') + '?cursor=zzz')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_comments_pages(self):
+        """Check that the reactions while paging don't repeat or skip comments."""
+        post = self.posts[0]
+        comments = [
+            Comment.objects.create(
+                author=self.user, post=post, text=f'Comment {i}') for i in range(4)]
+        url = reverse('posts:comments-list', args=[post.pk]) + '?limit=2'
+        response = self.client.get(url)
+        texts = [comment['text'] for comment in response.data['results']]
+
+        # A comment of the next page is reacted while paging
+        Comment.objects.filter(pk=comments[3].pk).update(reactions=5)
+        response = self.client.get(response.data['next'])
+        texts += [comment['text'] for comment in response.data['results']]
+        self.assertIsNone(response.data['next'])
+        self.assertEqual(texts, ['Comment 0', 'Comment 1', 'Comment 2', 'Comment 3'])
+
+    def test_comments_most_reacted(self):
+        """Check that the offset pages of the comments are the most reacted first."""
+        post = self.posts[0]
+        comments = [
+            Comment.objects.create(
+                author=self.user, post=post, text=f'Comment {i}') for i in range(3)]
+        Comment.objects.filter(pk=comments[2].pk).update(reactions=3)
+        url = reverse('posts:comments-list', args=[post.pk]) + '?limit=2&offset=0'
+        response = self.client.get(url)
+        self.assertEqual(
+            [comment['text'] for comment in response.data['results']],
+            ['Comment 2', 'Comment 0'])
+
+    def test_list_contracts(self):
+        """Check that the paginated arrays and reaction lists keep their shape."""
+        follower = User.objects.create(
+            email='test01@gmail.com', username='test01', first_name='test01',
+            last_name='test01', role='Athlete', password='nKSAJBBCJW_', verified=True)
+        PostReaction.objects.create(user=follower, post=self.posts[0], reaction='Like')
+        Profile.objects.create(user=self.user)
+
+        url = reverse('users:profiles-posts', args=[self.user.username])
+        response = self.client.get(url + '?limit=2')
+        self.assertEqual(len(response.data), 2)
+        self.assertIn('rel="next"', response['Link'])
+        response = self.client.get(url + '?limit=2&offset=4')
+        self.assertEqual(len(response.data), 1)
+        self.assertNotIn('rel="next"', response['Link'])
+        self.assertIn('rel="prev"', response['Link'])
+
+        response = self.client.get(reverse('posts:posts-likes', args=[self.posts[0].pk]))
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(response.data['likes'][0]['reaction'], 'Like')
+        self.assertIsNone(response.data['next'])
@@ -0,0 +1,97 @@
+"""Partitioned tables tests."""
+
+# Utilities
+from datetime import datetime, timedelta, timezone
+from io import StringIO
+from unittest import skipUnless
+
+# Django
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase
+
+# Models
+from gaman.posts.models import Post, PostReaction
+from gaman.users.models import User
+
+# Utils
+from gaman.utils.partitions import PartitionError, PartitionedTable, add_months, bounds
+
+
+class PartitionsTestCase(TestCase):
+    """Partitioned tables test case."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+        self.user = User.objects.create(
+            email='test@gmail.com',
+            username='test00',
+            first_name='test00',
+            last_name='test00',
+            role='Athlete',
+            password='nKSAJBBCJW_',
+            verified=True
+        )
+        self.post = Post.objects.create(user=self.user, about='test')
+
+    def test_months(self):
+        """Verifies the month bounds of the partitions."""
+        date = datetime(2026, 12, 18, 10, tzinfo=timezone.utc)
+        self.assertEqual(add_months(date, 0), datetime(2026, 12, 1, tzinfo=timezone.utc))
+        self.assertEqual(add_months(date, 1), datetime(2027, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual(add_months(date, -12), datetime(2025, 12, 1, tzinfo=timezone.utc))
+        self.assertEqual(
+            bounds("FOR VALUES FROM (MINVALUE) TO ('2026-10-01 00:00:00+00')"),
+            (None, datetime(2026, 10, 1, tzinfo=timezone.utc)))
+
+    def test_reactions_bound(self):
+        """Verifies that the reactions of a post are bounded by its creation."""
+        PostReaction.objects.create(user=self.user, post=self.post, reaction='Like')
+        reactions = PostReaction.objects.of('post', self.post)
+        self.assertIn('created', str(reactions.query))
+        self.assertEqual(reactions.summary()['Like'], 1)
+        since = self.post.created - timedelta(days=1)
+        self.assertEqual(
+            PostReaction.objects.summaries('post', [self.post.pk], since)[self.post.pk]['total'], 1)
+
+    @skipUnless(connection.vendor != 'postgresql', 'The database supports partitions')
+    def test_postgresql_only(self):
+        """Verifies that the tables are only partitioned on PostgreSQL."""
+        with self.assertRaises(PartitionError):
+            PartitionedTable('posts_postreaction')
+        with self.assertRaises(CommandError):
+            call_command('partition-tables', stdout=StringIO())
+
+    @skipUnless(connection.vendor == 'postgresql', 'Partitions need PostgreSQL')
+    def test_partition_tables(self):
+        """Verifies the conversion, the partitions and the archive of a table."""
+        PostReaction.objects.create(user=self.user, post=self.post, reaction='Like')
+        with self.assertRaises(PartitionError):
+            PartitionedTable('posts_post').convert(3)
+
+        call_command(
+            'partition-tables', '--convert', '--tables', 'posts_postreaction', stdout=StringIO())
+        table = PartitionedTable('posts_postreaction')
+        self.assertTrue(table.is_partitioned())
+        self.assertEqual(len(table.partitions()), 5)
+
+        # The ORM works on the partitioned table and prunes the history
+        other = Post.objects.create(user=self.user, about='test')
+        reaction = PostReaction.objects.create(user=self.user, post=other, reaction='Love')
+        self.assertEqual(PostReaction.objects.count(), 2)
+        plan = PostReaction.objects.of('post', other).explain()
+        self.assertNotIn('posts_postreaction_history', plan)
+
+        # One reaction per user and post, across the partitions
+        for post in [self.post, other]:
+            with self.assertRaises(IntegrityError), transaction.atomic():
+                PostReaction.objects.create(user=self.user, post=post, reaction='Like')
+        reaction.delete()
+        PostReaction.objects.create(user=self.user, post=other, reaction='Like')
+
+        now = add_months(datetime.now(timezone.utc), 0)
+        self.assertEqual(table.archive(0, now), ['posts_postreaction_history'])
+        self.assertEqual(PostReaction.objects.count(), 1)
+        # The archived reactions release their keys
+        PostReaction.objects.create(user=self.user, post=self.post, reaction='Like')
+        self.post.delete()
@@ -0,0 +1,151 @@
+"""Serialized posts cache tests."""
+
+# Utilities
+import threading
+
+# Django
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+# Django REST Framework
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+# Models
+from gaman.posts.models import Picture, Post
+from gaman.users.models import FollowUp, User
+
+# Utils
+from gaman.utils.counters import increment
+from gaman.utils.post_cache import post_cache
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    LOCAL_CACHE_TTL=60)
+class PostCacheAPITestCase(APITestCase):
+    """Serialized posts cache api test case."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+        cache.clear()
+        post_cache.local.clear()
+
+        self.user1 = User.objects.create(
+            email='test@gmail.com',
+            username='test00',
+            first_name='test00',
+            last_name='test00',
+            role='Athlete',
+            password='nKSAJBBCJW_',
+            verified=True
+        )
+
+        self.user2 = User.objects.create(
+            email='test1@gmail.com',
+            username='test01',
+            first_name='test01',
+            last_name='test01',
+            role='Athlete',
+            password='nKSAJBBCJW_',
+            verified=True
+        )
+
+        self.token1 = Token.objects.create(user=self.user1).key
+        FollowUp.objects.create(follower=self.user1, user=self.user2)
+
+        self.post = Post.objects.create(user=self.user2, about='Cached post')
+        self.post.pictures.set([Picture.objects.create(content='pictures/post.jpg')])
+        self.repost = Post.objects.create(user=self.user1, post=self.post)
+
+    def list_feed(self) -> dict:
+        """Return the posts of the user1 home timeline by pk."""
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token1}')
+        response = self.client.get(reverse('posts:posts-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {post['pk']: post for post in response.data['results']}
+
+    def test_warm_feed(self):
+        """Verifies that the cached posts skip the media and tags queries."""
+        with CaptureQueriesContext(connection) as cold:
+            first = self.list_feed()
+        with CaptureQueriesContext(connection) as warm:
+            second = self.list_feed()
+        self.assertEqual(first, second)
+        self.assertLess(len(warm), len(cold))
+        self.assertTrue(
+            first[self.post.pk]['pictures'][0]['content'].startswith('http://testserver/'))
+        self.assertEqual(first[self.repost.pk]['post']['author'], 'test01')
+
+    def test_compiled_share_the_cache(self):
+        """Verifies that the compiled and the serialized lists read the same cached posts."""
+        with override_settings(COMPILED_SERIALIZERS=False):
+            serialized = self.list_feed()
+        with CaptureQueriesContext(connection) as queries:
+            compiled = self.list_feed()
+        self.assertEqual(serialized, compiled)
+        tables = ' '.join(query['sql'] for query in queries)
+        self.assertNotIn('posts_picture', tables)
+        self.assertNotIn('posts_post_tag_users', tables)
+
+    def test_counters_are_fresh(self):
+        """Verifies that the counters are read from the posts rows."""
+        self.list_feed()
+        increment(self.post, 'reactions', 3)
+        self.assertEqual(self.list_feed()[self.post.pk]['reactions'], 3)
+
+    def test_invalidation(self):
+        """Verifies that edits, media changes and renames invalidate the posts."""
+        self.list_feed()
+        self.post.about = 'Edited post'
+        self.post.save()
+        posts = self.list_feed()
+        self.assertEqual(posts[self.post.pk]['about'], 'Edited post')
+        self.assertEqual(posts[self.repost.pk]['post']['about'], 'Edited post')
+
+        self.post.pictures.clear()
+        self.assertEqual(self.list_feed()[self.post.pk]['pictures'], [])
+
+        self.repost.tag_users.add(self.user2)
+        self.assertEqual(self.list_feed()[self.repost.pk]['tag_users'], ['test01'])
+
+        self.user2.username = 'renamed'
+        self.user2.save()
+        posts = self.list_feed()
+        self.assertEqual(posts[self.post.pk]['author'], 'renamed')
+        self.assertEqual(posts[self.repost.pk]['post']['author'], 'renamed')
+        self.assertEqual(posts[self.repost.pk]['tag_users'], ['renamed'])
+
+    def test_invalidation_on_commit(self):
+        """Verifies that the posts cached before a change commits are removed when it commits."""
+        self.list_feed()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.repost.tag_users.add(self.user2)
+            # A reader of the uncommitted change caches the old rows again
+            post_cache.store({
+                self.repost.pk: (post_cache.stamp(self.repost.updated), {'tag_users': []})})
+        self.assertEqual(self.list_feed()[self.repost.pk]['tag_users'], ['test01'])
+
+    def test_save_without_rename(self):
+        """Verifies that a save that keeps the username skips the posts."""
+        self.user2.first_name = 'Renamed'
+        with CaptureQueriesContext(connection) as queries:
+            self.user2.save()
+        self.assertFalse(any('posts_post' in query['sql'] for query in queries))
+
+    @override_settings(LOCAL_CACHE_TTL=0, POST_CACHE_WAIT=5)
+    def test_stampede(self):
+        """Verifies that a miss being serialized by other process is awaited."""
+        post = Post.objects.get(pk=self.post.pk)
+        cache.add(post_cache.key(post.pk) + ':lock', 1)
+        body = {'pk': post.pk, 'about': 'From other process'}
+        threading.Timer(
+            0.1, post_cache.store, [{post.pk: (post_cache.stamp(post.updated), body)}]).start()
+
+        cached = post_cache.get_many(
+            {post.pk: post_cache.stamp(post.updated)}, lambda pks: self.fail('Serialized twice'))
+        self.assertEqual(cached[post.pk], body)
@@ -0,0 +1,91 @@
+"""Reaction summaries tests."""
+
+# Django
+from django.urls import reverse
+
+# Django REST Framework
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+# Models
+from gaman.posts.models import Comment, CommentReaction, Post, PostReaction
+from gaman.users.models import User
+
+
+class ReactionSummaryAPITestCase(APITestCase):
+    """Reaction summary api test case."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+
+        self.users = [
+            User.objects.create(
+                email=f'test{i}@gmail.com',
+                username=f'test0{i}',
+                first_name=f'test0{i}',
+                last_name=f'test0{i}',
+                role='Athlete',
+                password='nKSAJBBCJW_',
+                verified=True
+            ) for i in range(3)]
+
+        self.token = Token.objects.create(user=self.users[0]).key
+        self.post = Post.objects.create(user=self.users[0], about='Reactions test')
+        self.comment = Comment.objects.create(
+            author=self.users[0], post=self.post,
+            text='Reactions test')
+
+        for user, reaction in zip(self.users, ['Like', 'Like', 'Angry']):
+            PostReaction.objects.create(user=user, post=self.post, reaction=reaction)
+            CommentReaction.objects.create(
+                user=user, comment=self.comment, reaction=reaction)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token}')
+
+    def test_post_reaction_summary(self):
+        """Check the count of each reaction type of a post."""
+        response = self.client.get(
+            reverse('posts:posts-reaction-summary', args=[self.post.pk]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['Like'], 2)
+        self.assertEqual(response.data['Angry'], 1)
+        self.assertEqual(response.data['Love'], 0)
+        self.assertEqual(response.data['total'], 3)
+
+    def test_post_reactions_filtered_by_type(self):
+        """Check that post reactions can be filtered by type."""
+        response = self.client.get(
+            reverse('posts:posts-reactions', args=[self.post.pk]) + '?reaction=Like')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(
+            {reaction['reaction'] for reaction in response.data['reactions']}, {'Like'})
+
+    def test_invalid_reaction_type(self):
+        """Check that a invalid reaction type is rejected."""
+        response = self.client.get(
+            reverse('posts:posts-reactions', args=[self.post.pk]) + '?reaction=Meh')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_feed_with_reaction_summary(self):
+        """Check that the feed embeds the reaction summary when it is requested."""
+        url = reverse('posts:posts-list')
+        response = self.client.get(url)
+        self.assertNotIn('reaction_summary', response.data['results'][0])
+
+        response = self.client.get(url + '?include=reaction_summary')
+        self.assertEqual(response.data['results'][0]['reaction_summary']['Like'], 2)
+
+    def test_comment_reaction_summary(self):
+        """Check the reaction summary and filter of a comment."""
+        response = self.client.get(reverse(
+            'posts:comments-reaction-summary', args=[self.post.pk, self.comment.pk]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total'], 3)
+
+        response = self.client.get(reverse(
+            'posts:comments-reactions',
+            args=[self.post.pk, self.comment.pk]) + '?reaction=Angry')
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(len(response.data['reactions']), 1)
@@ -0,0 +1,108 @@
+"""Comment threads tests."""
+
+# Utilities
+from io import StringIO
+from unittest import mock
+
+# Django
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+
+# Django REST Framework
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+# Models
+from gaman.posts.models import Comment, Post
+from gaman.users.models import User
+
+
+class ThreadsTestCase(APITestCase):
+    """Comment threads test case."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+        self.user = User.objects.create(
+            email='test@gmail.com',
+            username='test00',
+            first_name='test00',
+            last_name='test00',
+            role='Athlete',
+            password='nKSAJBBCJW_',
+            verified=True
+        )
+        self.post = Post.objects.create(user=self.user, about='Threads test')
+        self.comment = Comment.objects.create(author=self.user, post=self.post, text='Comment')
+        self.replies = [
+            Comment.objects.create(
+                author=self.user, post=self.post, text=f'Reply {i}', parent=self.comment)
+            for i in range(4)]
+        self.nested = Comment.objects.create(
+            author=self.user, post=self.post, text='Nested', parent=self.replies[1])
+        self.client.force_authenticate(self.user)
+
+    def test_tree(self):
+        """Verifies the paths, positions and replies counters of the thread."""
+        self.assertEqual([reply.position for reply in self.replies], [1, 2, 3, 4])
+        self.assertEqual(self.nested.path, f'{self.comment.pk}/{self.replies[1].pk}/')
+        self.assertEqual(self.nested.depth, 2)
+        self.assertEqual(self.nested.ancestors(), [self.comment.pk, self.replies[1].pk])
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.replies_count, 5)
+        self.assertEqual(Comment.objects.thread(self.replies[1]).count(), 2)
+
+    def test_max_depth(self):
+        """Verifies that the replies past MAX_DEPTH are placed after their parent."""
+        path = Comment._meta.get_field('path')
+        self.assertLessEqual(len(f'{2 ** 63 - 1}/') * Comment.MAX_DEPTH, path.max_length)
+
+        with mock.patch.object(Comment, 'MAX_DEPTH', 2):
+            reply = Comment.objects.create(
+                author=self.user, post=self.post, text='Deep', parent=self.nested)
+        self.assertEqual(reply.parent, self.replies[1])
+        self.assertEqual((reply.path, reply.depth, reply.position), (self.nested.path, 2, 2))
+        self.replies[1].refresh_from_db()
+        self.assertEqual(self.replies[1].replies_count, 2)
+
+    def test_delete_thread(self):
+        """Verifies that a thread is deleted with its replies and the counters follow."""
+        # The thread is collected at once, whatever its depth
+        with self.assertNumQueries(8):
+            deleted = self.replies[1].delete_thread()
+        self.assertEqual(deleted, 2)
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.replies_count, 3)
+        self.assertEqual(
+            list(self.comment.replies.values_list('position', flat=True)), [1, 2, 3])
+
+        self.post.comments = 4
+        self.post.save()
+        response = self.client.delete(
+            reverse('posts:comments-detail', args=[self.post.pk, self.comment.pk]))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Comment.objects.exists())
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comments, 0)
+
+    @override_settings(COMPILED_SERIALIZERS=False, COMMENT_INLINE_REPLIES=2)
+    def test_inline_replies(self):
+        """Verifies that the comments inline their first replies."""
+        response = self.client.get(reverse('posts:comments-list', args=[self.post.pk]))
+        comment = response.data['results'][0]
+        self.assertEqual(
+            [reply['text'] for reply in comment['replies']], ['Reply 0', 'Reply 1'])
+        self.assertEqual(comment['replies_count'], 5)
+
+        response = self.client.get(
+            reverse('posts:comments-replies', args=[self.post.pk, self.comment.pk]))
+        self.assertEqual(len(response.data), 4)
+
+    def test_reconcile_replies(self):
+        """Verifies that reconcile counters recount the replies of the threads."""
+        Comment.objects.update(replies_count=0)
+        call_command('reconcile-counters', stdout=StringIO())
+        counts = dict(Comment.objects.values_list('pk', 'replies_count'))
+        self.assertEqual(counts[self.comment.pk], 5)
+        self.assertEqual(counts[self.replies[1].pk], 1)
+        self.assertEqual(counts[self.nested.pk], 0)
@@ -0,0 +1,121 @@
+"""Home timelines tests."""
+
+# Django
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+# Django REST Framework
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+# Models
+from gaman.posts.models import Post, TimelineEntry
+from gaman.sponsorships.models import Brand
+from gaman.users.models import FollowUp, User
+
+
+class HomeTimelineAPITestCase(APITestCase):
+    """Home timeline api test case."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+
+        self.user1 = User.objects.create(
+            email='test@gmail.com',
+            username='test00',
+            first_name='test00',
+            last_name='test00',
+            role='Athlete',
+            password='nKSAJBBCJW_',
+            verified=True
+        )
+
+        self.user2 = User.objects.create(
+            email='test1@gmail.com',
+            username='test01',
+            first_name='test01',
+            last_name='test01',
+            role='Sponsor',
+            password='nKSAJBBCJW_',
+            verified=True
+        )
+
+        self.token1 = Token.objects.create(user=self.user1).key
+        self.brand = Brand.objects.create(sponsor=self.user2, slugname='SpaceX')
+
+        # User1 follow to user2 and brand
+        FollowUp.objects.create(follower=self.user1, user=self.user2)
+        FollowUp.objects.create(follower=self.user1, brand=self.brand)
+
+    def list_feed(self):
+        """Return the posts pks of the user1 home timeline."""
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token1}')
+        response = self.client.get(reverse('posts:posts-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {post['pk'] for post in response.data['results']}
+
+    def test_post_fan_out(self):
+        """Check that a post is written in the followers timelines."""
+        post = Post.objects.create(user=self.user2, about='Fan-out test')
+        post.refresh_from_db()
+        self.assertTrue(post.fanned_out)
+        self.assertTrue(
+            TimelineEntry.objects.filter(owner=self.user1, post=post).exists())
+        self.assertIn(post.pk, self.list_feed())
+
+    def test_own_posts_in_timeline(self):
+        """Check that the own posts are in the home timeline."""
+        post = Post.objects.create(user=self.user1, about='My post')
+        self.assertIn(post.pk, self.list_feed())
+
+    def test_unfollowed_posts_not_in_timeline(self):
+        """Check that posts of the not followed are not in the home timeline."""
+        user3 = User.objects.create(
+            email='test3@gmail.com', username='test03', role='Athlete')
+        post = Post.objects.create(user=user3, about='Not followed')
+        self.assertNotIn(post.pk, self.list_feed())
+
+    @override_settings(TIMELINE_FANOUT_LIMIT=0)
+    def test_high_follower_author_fan_out_on_read(self):
+        """Check that the posts of high-follower authors are merged on read."""
+        post = Post.objects.create(brand=self.brand, about='Big brand post')
+        post.refresh_from_db()
+        self.assertFalse(post.fanned_out)
+        self.assertFalse(TimelineEntry.objects.filter(post=post).exists())
+        self.assertIn(post.pk, self.list_feed())
+
+    def test_entries_only_read(self):
+        """Check that without high-follower authors only the entries are read."""
+        Post.objects.create(user=self.user2, about='Fan-out test')
+        with CaptureQueriesContext(connection) as queries:
+            self.list_feed()
+        self.assertFalse(any('fanned_out' in query['sql'] for query in queries))
+
+    @override_settings(TIMELINE_SIZE=2, TIMELINE_TRIM_EVERY=1)
+    def test_timeline_capped_on_write(self):
+        """Check that the fan-out trims the timelines to TIMELINE_SIZE."""
+        posts = [Post.objects.create(user=self.user2, about=f'Post {n}') for n in range(3)]
+        entries = TimelineEntry.objects.filter(owner=self.user1).order_by('-post_id')
+        self.assertEqual(
+            list(entries.values_list('post', flat=True)), [posts[2].pk, posts[1].pk])
+
+    def test_unfollow_prunes_timeline(self):
+        """Check that unfollow removes the unfollowed posts of the timeline."""
+        post = Post.objects.create(user=self.user2, about='Pruned post')
+        FollowUp.objects.filter(follower=self.user1, user=self.user2).delete()
+        self.assertFalse(
+            TimelineEntry.objects.filter(owner=self.user1, post=post).exists())
+        self.assertNotIn(post.pk, self.list_feed())
+
+    def test_follow_backfills_timeline(self):
+        """Check that follow writes the followed latest posts in the timeline."""
+        user3 = User.objects.create(
+            email='test3@gmail.com', username='test03', role='Athlete')
+        post = Post.objects.create(user=user3, about='Backfilled post')
+        FollowUp.objects.create(follower=self.user1, user=user3)
+        self.assertTrue(
+            TimelineEntry.objects.filter(owner=self.user1, post=post).exists())
+        self.assertIn(post.pk, self.list_feed())
@@ -1,8 +1,13 @@
 """Comments views."""
 
+# Django
+from django.db import IntegrityError
+from django.db.models import Prefetch
+
 # Django REST framework
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 
@@ -12,6 +17,9 @@ from gaman.posts.permissions import (IsCommentOwner,
                                      IsCommentOrPostOwner,
                                      IsFollower)
 
+# Managers
+from gaman.posts.managers import REACTION_TYPES
+
 # Models
 from gaman.posts.models import (Comment,
                                 CommentReaction, Post,
@@ -22,8 +30,13 @@ from gaman.posts.serializers import (CommentModelSerializer,
                                      CommentReactionModelSerializer,
                                      ReplyModelSerializer)
 
+# Utils
+from gaman.utils.compiled import CompiledListModelMixin
+from gaman.utils.counters import increment
+from gaman.utils.pagination import ThreadPagination
 
-class CommentViewSet(viewsets.ModelViewSet):
+
+class CommentViewSet(CompiledListModelMixin, viewsets.ModelViewSet):
     """
     Comment view set.
     Handles list, create, detail, update, destroy, reply,
@@ -31,6 +44,8 @@ class CommentViewSet(viewsets.ModelViewSet):
     """
 
     serializer_class = CommentModelSerializer
+    pagination_class = ThreadPagination
+    compiled_actions = ('list',)
 
     def dispatch(self, request, *args, **kwargs):
         """Verify that the post exists."""
@@ -39,24 +54,24 @@ class CommentViewSet(viewsets.ModelViewSet):
 
     def perform_destroy(self, instance):
         """Delete a comment and its replies."""
-        self.object.comments -= instance.replies.all().count() + 1
-        self.object.save()
-        instance.replies.all().delete()
-        instance.delete()
+        increment(self.object, 'comments', -instance.delete_thread())
 
     def get_queryset(self):
-        """Return post's comments."""
-        if self.action in ['list', 'retrieve', 'reply', 'replies']:
+        """Return post's comments, with their first replies."""
+        if self.action in ['list', 'retrieve']:
+            replies = Comment.objects.inlined().select_related('author')
             return PrincipalComment.objects.filter(
                 post=self.object).select_related(
-                    'author').prefetch_related('replies')
+                    'author').prefetch_related(Prefetch('replies', queryset=replies))
+        if self.action in ['reply', 'replies']:
+            return PrincipalComment.objects.filter(post=self.object)
         return Comment.objects.filter(post=self.object).select_related('author')
 
     def get_permissions(self):
         """Assign permissions based on action."""
         if self.action in [
-            'create', 'retrieve', 'list',
-                'react', 'reactions', 'reply', 'replies']:
+            'create', 'retrieve', 'list', 'react',
+                'reactions', 'reaction_summary', 'reply', 'replies']:
             permissions = [IsAuthenticated, IsFollower]
         elif self.action in ['update', 'partial_update']:
             permissions = [IsAuthenticated, IsCommentOwner]
@@ -80,22 +95,43 @@ class CommentViewSet(viewsets.ModelViewSet):
         serializer = CommentReactionModelSerializer(
             data=request.data,
             context={'user': request.user, 'comment': comment})
-        try:
-            serializer.is_valid(raise_exception=True)
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        except AssertionError:
+        serializer.is_valid(raise_exception=True)
+        if serializer.unreact():
             data = {'message': "The comment's reaction has been delete."}
             return Response(data, status=status.HTTP_200_OK)
+        try:
+            serializer.save()
+        except IntegrityError:
+            # A concurrent request of the user reacted first
+            data = {'message': 'The reaction already exists.'}
+            return Response(data, status=status.HTTP_409_CONFLICT)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @action(detail=True)
+    def reaction_summary(self, request, *args, **kwargs):
+        """Count of each reaction type of the comment."""
+        comment = self.get_object()
+        data = CommentReaction.objects.of('comment', comment).summary()
+        return Response(data, status=status.HTTP_200_OK)
 
     @action(detail=True)
     def reactions(self, request, *args, **kwargs):
-        """List all comment's reactions."""
+        """List all comment's reactions, can be filtered by type (?reaction=Like)."""
         comment = self.get_object()
-        reactions = CommentReaction.objects.filter(
-            comment=comment).select_related('user')
-        serializer = CommentReactionModelSerializer(reactions, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        reaction = request.query_params.get('reaction')
+        if reaction and reaction not in REACTION_TYPES:
+            raise ValidationError({'reaction': f'Must be one of {REACTION_TYPES}.'})
+        reactions = CommentReaction.objects.of('comment', comment)
+        summary = reactions.summary()
+        if reaction:
+            reactions = reactions.filter(reaction=reaction)
+        paginator = ThreadPagination()
+        page = paginator.paginate_queryset(self.trim_queryset(
+            reactions.select_related('user'), CommentReactionModelSerializer), request, view=self)
+        serializer = CommentReactionModelSerializer(
+            page, many=True, context=self.get_serializer_context())
+        return paginator.get_paginated_response(
+            serializer.data, key='reactions', count=summary[reaction or 'total'])
 
     @action(detail=True, methods=['post'])
     def reply(self, request, *args, **kwargs):
@@ -113,5 +149,8 @@ class CommentViewSet(viewsets.ModelViewSet):
         """List all replies to a comment."""
         comment = self.get_object()
         replies = comment.replies.all().select_related('author')
-        data = ReplyModelSerializer(replies, many=True).data
-        return Response(data, status=status.HTTP_200_OK)
+        paginator = ThreadPagination()
+        page = paginator.paginate_queryset(
+            self.trim_queryset(replies, ReplyModelSerializer), request, view=self)
+        data = ReplyModelSerializer(page, many=True, context=self.get_serializer_context()).data
+        return paginator.get_list_response(data)
@@ -1,31 +1,36 @@
 """Posts views."""
 
 # Django
-from django.db.models import Q
+from django.db import IntegrityError
 
 # Django REST framework
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
 # Permissions
 from rest_framework.permissions import IsAuthenticated
 from gaman.posts.permissions import IsFollowerOrPostOwner, IsPostOwner
 
+# Managers
+from gaman.posts.managers import REACTION_TYPES
+
 # Models
 from gaman.posts.models import Post, PostReaction
-from gaman.sponsorships.models import Brand
-from gaman.sports.models import Club
-from gaman.users.models import FollowUp
-from gaman.users.models import User
 
 # Serializers
 from gaman.posts.serializers import (PostModelSerializer,
                                      PostReactionModelSerializer,
                                      SharePostSerializer)
 
+# Utils
+from gaman.utils.compiled import CompiledListModelMixin
+from gaman.utils.pagination import FeedPagination
+from gaman.utils.timelines import HomeTimeline
+
 
-class PostViewSet(viewsets.ModelViewSet):
+class PostViewSet(CompiledListModelMixin, viewsets.ModelViewSet):
     """
     Post viewset.
     Handles list, create, update, destroy, sharing,
@@ -33,29 +38,14 @@ class PostViewSet(viewsets.ModelViewSet):
     """
 
     serializer_class = PostModelSerializer
+    pagination_class = FeedPagination
+    compiled_actions = ('list',)
 
     def get_queryset(self):
-        """Restrict posts to only followed users."""
+        """Restrict posts to the home timeline of the requesting user."""
         if self.action == 'list':
-            followed_users = User.objects.filter(
-                pk__in=[FollowUp.objects.filter(
-                    follower=self.request.user).values('user__pk')])
-
-            followed_brands = Brand.objects.filter(
-                pk__in=[FollowUp.objects.filter(
-                    follower=self.request.user).values('brand__pk')])
-
-            followed_clubs = Club.objects.filter(
-                pk__in=[FollowUp.objects.filter(
-                    follower=self.request.user).values('club__pk')])
-
-            queryset = Post.objects.filter(
-                Q(user=self.request.user) |
-                Q(user__in=followed_users) |
-                Q(brand__in=followed_brands) |
-                Q(club__in=followed_clubs)).select_related(
-                    'user', 'brand', 'club', 'post'
-            ).prefetch_related('pictures', 'videos', 'tag_users')
+            # The media and tags of the misses are loaded by the posts cache
+            queryset = HomeTimeline.posts(self.request.user).select_related('post')
         else:
             queryset = Post.objects.all().select_related(
                 'user', 'brand', 'club', 'post'
@@ -65,8 +55,8 @@ class PostViewSet(viewsets.ModelViewSet):
     def get_permissions(self):
         """Assign permissions based on action."""
         if self.action in [
-            'retrieve', 'react', 'reactions', 'share', 'likes',
-                'loves', 'hahas', 'curious', 'sads', 'angry']:
+            'retrieve', 'react', 'reactions', 'reaction_summary', 'share',
+                'likes', 'loves', 'hahas', 'curious', 'sads', 'angry']:
             permissions = [IsAuthenticated, IsFollowerOrPostOwner]
         elif self.action in ['update', 'partial_update', 'destroy']:
             permissions = [IsAuthenticated, IsPostOwner]
@@ -82,19 +72,45 @@ class PostViewSet(viewsets.ModelViewSet):
         serializer.save()
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+    def get_serializer_context(self):
+        """Add the reaction summary flag (?include=reaction_summary) to serializer context."""
+        context = super(PostViewSet, self).get_serializer_context()
+        include = self.request.query_params.get('include', '').split(',')
+        context['include_reaction_summary'] = 'reaction_summary' in include
+        return context
+
+    def list_reactions(self, post, reaction=None, key: str = 'reactions'):
+        """Return a page of post's reactions of a type, in key, and the total of them."""
+        if reaction and reaction not in REACTION_TYPES:
+            raise ValidationError({'reaction': f'Must be one of {REACTION_TYPES}.'})
+        reactions = PostReaction.objects.of('post', post)
+        summary = reactions.summary()
+        if reaction:
+            reactions = reactions.filter(reaction=reaction)
+        page = self.paginate_queryset(self.trim_queryset(
+            reactions.select_related('user'), PostReactionModelSerializer))
+        data = PostReactionModelSerializer(
+            page, many=True, context=self.get_serializer_context()).data
+        return self.paginator.get_paginated_response(
+            data, key=key, count=summary[reaction or 'total'])
+
     @action(detail=True, methods=['post'])
     def react(self, request, *args, **kwargs):
         """Handles the creation or deletion of post's reaction."""
         post = self.get_object()
         serializer = PostReactionModelSerializer(
             data=request.data, context={'user': request.user, 'post': post})
-        try:
-            serializer.is_valid(raise_exception=True)
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        except AssertionError:
+        serializer.is_valid(raise_exception=True)
+        if serializer.unreact():
             data = {'message': 'The reaction has been delete.'}
             return Response(data, status=status.HTTP_200_OK)
+        try:
+            serializer.save()
+        except IntegrityError:
+            # A concurrent request of the user reacted first
+            data = {'message': 'The reaction already exists.'}
+            return Response(data, status=status.HTTP_409_CONFLICT)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     @action(detail=True, methods=['post'])
     def share(self, request, *args, **kwargs):
@@ -109,78 +125,44 @@ class PostViewSet(viewsets.ModelViewSet):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     @action(detail=True)
-    def reactions(self, request, *args, **kwargs):
-        """List all post's reactions."""
+    def reaction_summary(self, request, *args, **kwargs):
+        """Count of each reaction type of the post."""
         post = self.get_object()
-        reactions = PostReaction.objects.filter(
-            post=post).select_related('user')
-        data = {
-            'count': reactions.count(),
-            'reactions': PostReactionModelSerializer(reactions, many=True).data}
+        data = PostReaction.objects.of('post', post).summary()
         return Response(data, status=status.HTTP_200_OK)
 
+    @action(detail=True)
+    def reactions(self, request, *args, **kwargs):
+        """List all post's reactions, can be filtered by type (?reaction=Like)."""
+        post = self.get_object()
+        return self.list_reactions(post, request.query_params.get('reaction'))
+
     @action(detail=True)
     def likes(self, request, *args, **kwargs):
         """List of reactions filtered by like."""
-        post = self.get_object()
-        likes = post.postreaction_set.filter(
-            reaction='Like').select_related('user')
-        data = {
-            'count': likes.count(),
-            'likes': PostReactionModelSerializer(likes, many=True).data}
-        return Response(data, status=status.HTTP_200_OK)
+        return self.list_reactions(self.get_object(), 'Like', 'likes')
 
     @action(detail=True)
     def loves(self, request, *args, **kwargs):
         """List of reactions filtered by love."""
-        post = self.get_object()
-        loves = post.postreaction_set.filter(
-            reaction='Love').select_related('user')
-        data = {
-            'count': loves.count(),
-            'loves': PostReactionModelSerializer(loves, many=True).data}
-        return Response(data, status=status.HTTP_200_OK)
+        return self.list_reactions(self.get_object(), 'Love', 'loves')
 
     @action(detail=True)
     def hahas(self, request, *args, **kwargs):
         """List of reactions filtered by haha."""
-        post = self.get_object()
-        hahas = post.postreaction_set.filter(
-            reaction='Haha').select_related('user')
-        data = {
-            'count': hahas.count(),
-            'hahas': PostReactionModelSerializer(hahas, many=True).data}
-        return Response(data, status=status.HTTP_200_OK)
+        return self.list_reactions(self.get_object(), 'Haha', 'hahas')
 
     @action(detail=True)
     def curious(self, request, *args, **kwargs):
         """List of reactions filtered by curious."""
-        post = self.get_object()
-        curious = post.postreaction_set.filter(
-            reaction='Curious').select_related('user')
-        data = {
-            'count': curious.count(),
-            'curious': PostReactionModelSerializer(curious, many=True).data}
-        return Response(data, status=status.HTTP_200_OK)
+        return self.list_reactions(self.get_object(), 'Curious', 'curious')
 
     @action(detail=True)
     def sads(self, request, *args, **kwargs):
         """List of reactions filtered by sad."""
-        post = self.get_object()
-        sads = post.postreaction_set.filter(
-            reaction='Sad').select_related('user')
-        data = {
-            'count': sads.count(),
-            'sads': PostReactionModelSerializer(sads, many=True).data}
-        return Response(data, status=status.HTTP_200_OK)
+        return self.list_reactions(self.get_object(), 'Sad', 'sads')
 
     @action(detail=True)
     def angry(self, request, *args, **kwargs):
         """List of reactions filtered by angry."""
-        post = self.get_object()
-        angrys = post.postreaction_set.filter(
-            reaction='Angry').select_related('user')
-        data = {
-            'count': angrys.count(),
-            'angrys': PostReactionModelSerializer(angrys, many=True).data}
-        return Response(data, status=status.HTTP_200_OK)
+        return self.list_reactions(self.get_object(), 'Angry', 'angrys')
@@ -0,0 +1,23 @@
+# Generated by Django 4.0.4 on 2026-10-18 10:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sponsorships', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='brand',
+            name='followers_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='brand',
+            name='posts_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
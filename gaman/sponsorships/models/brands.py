@@ -22,6 +22,10 @@ class Brand(GamanModel, BaseDataModel):
 
     verified = models.BooleanField(default=False)
 
+    # Counters
+    followers_count = models.PositiveIntegerField(default=0)
+    posts_count = models.PositiveIntegerField(default=0)
+
     def __str__(self):
         """Return Brand's slugname."""
         return self.slugname
\ No newline at end of file
@@ -7,8 +7,11 @@ from rest_framework.validators import UniqueValidator
 # Models
 from gaman.sponsorships.models import Brand
 
+# Utils
+from gaman.utils.sparse import SparseModelSerializer
 
-class BrandModelSerializer(serializers.ModelSerializer):
+
+class BrandModelSerializer(SparseModelSerializer):
     """Brand model seriaizer."""
 
     sponsor = serializers.StringRelatedField(read_only=True)
@@ -20,12 +23,14 @@ class BrandModelSerializer(serializers.ModelSerializer):
             'slugname', 'about',
             'sponsor', 'photo',
             'cover_photo', 'verified',
-            'official_web', 'created'
+            'official_web', 'created',
+            'followers_count', 'posts_count'
         ]
 
         read_only_fields = [
             'slugname', 'sponsor',
-            'created', 'verified'
+            'created', 'verified',
+            'followers_count', 'posts_count'
         ]
 
 
@@ -9,8 +9,11 @@ from gaman.sponsorships.models import Rating
 # Serializer
 from .sponsorships import SponsorshipModelSerializer
 
+# Utils
+from gaman.utils.sparse import SparseModelSerializer
 
-class RatingSumaryModelserializer(serializers.ModelSerializer):
+
+class RatingSumaryModelserializer(SparseModelSerializer):
     """
     Rating sumary model serializer.
     It is used when list ratings of a sponsorship.
@@ -11,8 +11,11 @@ from gaman.sponsorships.models import Brand, Sponsorship
 from gaman.sports.models import Club
 from gaman.users.models import User
 
+# Utils
+from gaman.utils.sparse import SparseModelSerializer
 
-class SponsorshipModelSerializer(serializers.ModelSerializer):
+
+class SponsorshipModelSerializer(SparseModelSerializer):
     """Sponsorship model serializer."""
 
     sponsor = serializers.StringRelatedField(read_only=True)
@@ -35,6 +38,8 @@ class SponsorshipModelSerializer(serializers.ModelSerializer):
             'active'
         ]
 
+        sparse_related = {'sponsored': ['athlete', 'club']}
+
 
 class CreateSponsorshipSerializer(serializers.Serializer):
     """
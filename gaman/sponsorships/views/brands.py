@@ -29,8 +29,12 @@ from gaman.sponsorships.serializers import (BrandModelSerializer,
                                            
 from gaman.users.serializers import FollowerSerializer
 
+# Utils
+from gaman.utils.compiled import CompiledSerializerMixin
+from gaman.utils.pagination import FeedPagination
 
-class BrandViewSet(viewsets.ModelViewSet):
+
+class BrandViewSet(CompiledSerializerMixin, viewsets.ModelViewSet):
     """
     Brand viewset.
     Handle list, create, update, destroy
@@ -38,10 +42,11 @@ class BrandViewSet(viewsets.ModelViewSet):
     """
 
     queryset = Brand.objects.all()
+    compiled_actions = ('followers',)
     lookup_field = 'slugname'
     filter_backends = (SearchFilter, OrderingFilter, DjangoFilterBackend)
     search_fields = ('slugname',)
-    ordering_fields = ('slugname',)
+    ordering_fields = ('slugname', 'followers_count')
     ordering = ('slugname', 'created')
     filter_fields = ('verified',)
 
@@ -78,10 +83,15 @@ class BrandViewSet(viewsets.ModelViewSet):
     
     @action(detail=True, methods=['get'])
     def followers(self, request, *args, **kwargs):
+        """List brand's followers."""
         brand = self.get_object()
-        followers = FollowUp.objects.filter(brand=brand)
-        data = FollowerSerializer(followers, many=True).data
-        return Response(data, status=status.HTTP_200_OK)
+        followers = FollowUp.objects.filter(
+            brand=brand).select_related('follower')
+        paginator = FeedPagination()
+        page = paginator.paginate_queryset(
+            self.prepare_queryset(followers, FollowerSerializer, paginator), request, view=self)
+        data = self.serialize(page, FollowerSerializer)
+        return paginator.get_list_response(data)
 
     @action(detail=True, methods=['post'])
     def follow(self, request, *args, **kwarg):
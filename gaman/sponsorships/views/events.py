@@ -18,8 +18,11 @@ from gaman.sports.models import SportEvent
 from gaman.sports.serializers import (SportEventModelSerializer,
                                       CreateSportEventSerializer)
 
+# Utils
+from gaman.utils.compiled import CompiledListModelMixin
 
-class SportEventBrandViewSet(viewsets.ModelViewSet):
+
+class SportEventBrandViewSet(CompiledListModelMixin, viewsets.ModelViewSet):
     """
     Sport Event Brand viewset.
     Handle create, retrieve, list, update and destroy
@@ -27,6 +30,7 @@ class SportEventBrandViewSet(viewsets.ModelViewSet):
     """
 
     serializer_class = SportEventModelSerializer
+    compiled_actions = ('list',)
 
     def get_permissions(self):
         """Assign permissions based on action."""
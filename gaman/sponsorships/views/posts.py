@@ -14,13 +14,18 @@ from gaman.sponsorships.models import Brand
 # Serializers
 from gaman.posts.serializers import PostModelSerializer
 
+# Utils
+from gaman.utils.compiled import CompiledListModelMixin
 
-class BrandPostViewSet(mixins.CreateModelMixin,
+
+class BrandPostViewSet(CompiledListModelMixin,
+                       mixins.CreateModelMixin,
                        mixins.ListModelMixin,
                        viewsets.GenericViewSet):
     """Brand Post viewset."""
 
     serializer_class = PostModelSerializer
+    compiled_actions = ('list',)
 
     def get_permissions(self):
         """Asign permissions based on action."""
@@ -16,8 +16,12 @@ from gaman.sponsorships.serializers import (CreateRatingSerializer,
                                             RatingModelSerializer,
                                             RatingSumaryModelserializer)
 
+# Utils
+from gaman.utils.sparse import SparseFieldsMixin
 
-class RatingViewSet(mixins.CreateModelMixin,
+
+class RatingViewSet(SparseFieldsMixin,
+                    mixins.CreateModelMixin,
                     mixins.ListModelMixin,
                     mixins.UpdateModelMixin,
                     mixins.RetrieveModelMixin,
@@ -15,8 +15,12 @@ from gaman.sponsorships.models import Sponsorship
 from gaman.sponsorships.serializers import (CreateSponsorshipSerializer,
                                             SponsorshipModelSerializer)
 
+# Utils
+from gaman.utils.sparse import SparseFieldsMixin
 
-class SponsorshipViewSet(mixins.CreateModelMixin,
+
+class SponsorshipViewSet(SparseFieldsMixin,
+                         mixins.CreateModelMixin,
                          mixins.RetrieveModelMixin,
                          viewsets.GenericViewSet):
     """
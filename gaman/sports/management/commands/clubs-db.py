@@ -2,45 +2,47 @@
 
 # Utilities
 import random
-import pandas as pd
-
-# Django
-from django.core.management.base import BaseCommand
 
 # Models
 from gaman.sports.models import Club, League
 from gaman.users.models import User
 
+# Utils
+from gaman.utils.loaders import LoaderCommand, read_csv
+
 
-class Command(BaseCommand):
+class Command(LoaderCommand):
     """League command"""
 
     help = 'Upload league csv to database'
+    models = [Club]
 
-    def handle(self, *args, **options):
-        clubs_data = pd.DataFrame(
-            pd.read_csv('./data/clubs.csv'),
-            columns=['slugname', 'about', 'official_web']
+    def load(self, loader, chunksize):
+        clubs_data = read_csv(
+            self.path('clubs.csv'),
+            columns=['slugname', 'about', 'official_web'],
+            chunksize=chunksize
         )
 
-        users = User.objects.filter(role='Coach', verified=True)
-        leagues = League.objects.all()
-        
-        x, clubs_query = 0, []
-        limit = leagues.count() - 1
-        for club_data in clubs_data.itertuples():
-            club_query = Club(
-                trainer=users[x],
-                league=leagues[random.randint(0, limit)],
-                photo='gaman/utils/media_test/profile_photo.jpg',
-                cover_photo='gaman/utils/media_test/profile_photo.jpg',
-                about=club_data.about,
-                slugname=club_data.slugname,
-                official_web=club_data.official_web,
-            )
-            clubs_query.append(club_query)
-            x += 1
-
-        Club.objects.bulk_create(clubs_query)
-
-        self.stdout.write(self.style.SUCCESS('Clubs created successfully.'))
+        users = list(User.objects.filter(
+            role='Coach', verified=True).order_by('pk').values_list('pk', flat=True))
+        leagues = list(League.objects.values_list('pk', flat=True))
+
+        x = 0
+        for clubs_chunk in clubs_data:
+            clubs_query = []
+            for club_data in clubs_chunk.itertuples():
+                club_query = Club(
+                    trainer_id=users[x % len(users)],
+                    league_id=random.choice(leagues),
+                    photo='gaman/utils/media_test/profile_photo.jpg',
+                    cover_photo='gaman/utils/media_test/profile_photo.jpg',
+                    about=club_data.about,
+                    slugname=club_data.slugname,
+                    official_web=club_data.official_web,
+                )
+                clubs_query.append(club_query)
+                x += 1
+            loader.insert(clubs_query)
+
+        return 'Clubs created successfully.'
@@ -2,41 +2,57 @@
 
 # Utilities
 import random
-import pandas as pd
-
-# Django
-from django.core.management.base import BaseCommand
 
 # Models
 from gaman.sports.models import Club, SportEvent
 
+# Tasks
+from taskapp.tasks.events import geocode_events
+
+# Utils
+from gaman.utils.authors import fill_authors
+from gaman.utils.loaders import LoaderCommand, read_csv
 
-class Command(BaseCommand):
+
+class Command(LoaderCommand):
     """League command"""
 
     help = 'Upload sport events csv to database'
-
-    def handle(self, *args, **options):
-        events_data = pd.DataFrame(
-            pd.read_csv('./data/events.csv'),
-            columns=['title', 'description', 'start', 'finish', 'country']
+    models = [SportEvent]
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            '--geocode', action='store_true',
+            help='Queue the batch geocoding of the uploaded events.')
+
+    def load(self, loader, chunksize):
+        events_data = read_csv(
+            self.path('events.csv'),
+            columns=['title', 'description', 'start', 'finish', 'country'],
+            chunksize=chunksize
         )
 
-        clubs = Club.objects.all()
-        events_query = []
-        limit = clubs.count() - 1
-        for event_data in events_data.itertuples():
-            event_query = SportEvent(
-                club=clubs[random.randint(0, limit)],
-                title=event_data.title,
-                description=event_data.description,
-                photo='gaman/utils/media_test/profile_photo.jpg',
-                start=event_data.start,
-                finish=event_data.finish,
-                country=event_data.country
-            )
-            events_query.append(event_query)
-
-        SportEvent.objects.bulk_create(events_query)
-
-        self.stdout.write(self.style.SUCCESS('Sport events created successfully.'))
+        clubs = list(Club.objects.values_list('pk', flat=True))
+        for events_chunk in events_data:
+            events_query = []
+            for event_data in events_chunk.itertuples():
+                event_query = SportEvent(
+                    club_id=random.choice(clubs),
+                    title=event_data.title,
+                    description=event_data.description,
+                    photo='gaman/utils/media_test/profile_photo.jpg',
+                    start=event_data.start,
+                    finish=event_data.finish,
+                    country=event_data.country
+                )
+                events_query.append(event_query)
+            loader.insert(events_query)
+
+        # The loader skips save()
+        fill_authors(SportEvent)
+
+        if self.options['geocode']:
+            geocode_events.delay()
+
+        return 'Sport events created successfully.'
@@ -1,44 +1,44 @@
 """Leagues commands."""
 
-# Utilities
-import pandas as pd
-
-# Django
-from django.core.management.base import BaseCommand
-
 # Models
 from gaman.sports.models import League
 from gaman.users.models import User
 
+# Utils
+from gaman.utils.loaders import LoaderCommand, read_csv
+
 
-class Command(BaseCommand):
+class Command(LoaderCommand):
     """League command"""
 
     help = 'Upload league csv to database'
+    models = [League]
 
-    def handle(self, *args, **options):
-        leagues_data = pd.DataFrame(
-            pd.read_csv('./data/leagues.csv'),
-            columns=['slugname', 'about', 'official_web']
+    def load(self, loader, chunksize):
+        leagues_data = read_csv(
+            self.path('leagues.csv'),
+            columns=['slugname', 'about', 'official_web'],
+            chunksize=chunksize
         )
 
-        users = User.objects.filter(role='League president', verified=True)
-        countries = [user.profile.country for user in users]
-        
-        x, leagues_query = 0, []
-        for league_data in leagues_data.itertuples():
-            league_query = League(
-                photo='gaman/utils/media_test/profile_photo.jpg',
-                cover_photo='gaman/utils/media_test/profile_photo.jpg',
-                about=league_data.about,
-                slugname=league_data.slugname,
-                country=countries[x],
-                official_web=league_data.official_web,
-                sport=users[x].profile.sport
-            )
-            leagues_query.append(league_query)
-            x += 1
-
-        League.objects.bulk_create(leagues_query)
-
-        self.stdout.write(self.style.SUCCESS('Leagues created successfully.'))
\ No newline at end of file
+        presidents = User.objects.filter(
+            role='League president', verified=True
+        ).order_by('pk').values_list('profile__country', 'profile__sport')
+        presidents = presidents.iterator(chunk_size=chunksize)
+
+        for leagues_chunk in leagues_data:
+            leagues_query = []
+            for league_data, (country, sport) in zip(leagues_chunk.itertuples(), presidents):
+                league_query = League(
+                    photo='gaman/utils/media_test/profile_photo.jpg',
+                    cover_photo='gaman/utils/media_test/profile_photo.jpg',
+                    about=league_data.about,
+                    slugname=league_data.slugname,
+                    country=country,
+                    official_web=league_data.official_web,
+                    sport=sport
+                )
+                leagues_query.append(league_query)
+            loader.insert(leagues_query)
+
+        return 'Leagues created successfully.'
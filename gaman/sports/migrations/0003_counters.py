@@ -0,0 +1,33 @@
+# Generated by Django 4.0.4 on 2026-10-18 10:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sports', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='club',
+            name='followers_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='club',
+            name='members_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='club',
+            name='posts_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='sportevent',
+            name='assistants_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
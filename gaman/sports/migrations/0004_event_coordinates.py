@@ -0,0 +1,37 @@
+# Generated by Django 4.0.4 on 2026-10-18 10:19
+
+from django.db import migrations, models
+
+
+def parse_geolocations(apps, schema_editor):
+    """Fill the coordinates of the existing events from their geolocation."""
+    SportEvent = apps.get_model('sports', 'SportEvent')
+    events = []
+    for event in SportEvent.objects.only('pk', 'geolocation').iterator(chunk_size=2000):
+        try:
+            event.lat, event.lng = map(float, event.geolocation.split())
+        except ValueError:
+            continue
+        events.append(event)
+    SportEvent.objects.bulk_update(events, ['lat', 'lng'], batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sports', '0003_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sportevent',
+            name='lat',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='sportevent',
+            name='lng',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.RunPython(parse_geolocations, migrations.RunPython.noop),
+    ]
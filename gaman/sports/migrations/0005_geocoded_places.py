@@ -0,0 +1,33 @@
+# Generated by Django 4.0.4 on 2026-10-18 10:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sports', '0004_event_coordinates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GeocodedPlace',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True, help_text='Date time on which the was created.', verbose_name='created at')),
+                ('updated', models.DateTimeField(auto_now=True, help_text='Date time on which the was updated.', verbose_name='updated at')),
+                ('query', models.CharField(max_length=180, unique=True)),
+                ('place', models.CharField(max_length=180)),
+                ('country', models.CharField(max_length=70)),
+                ('state', models.CharField(max_length=90)),
+                ('city', models.CharField(max_length=90)),
+                ('geolocation', models.CharField(max_length=33)),
+                ('last_used', models.DateTimeField(db_index=True, help_text='last time it was read, for the LRU eviction')),
+            ],
+            options={
+                'ordering': ['-created', '-updated'],
+                'get_latest_by': 'created',
+                'abstract': False,
+            },
+        ),
+    ]
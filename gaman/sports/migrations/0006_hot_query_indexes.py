@@ -0,0 +1,20 @@
+# Generated by Django 4.0.4 on 2026-10-18 10:58
+
+from django.db import migrations, models
+from gaman.utils.migrations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('sports', '0005_geocoded_places'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='sportevent',
+            index=models.Index(fields=['country', 'state', 'city', 'start'], name='event_place_start_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.0.4 on 2026-10-18 11:23
+
+from django.db import migrations, models
+
+# Utils
+from gaman.utils.authors import fill_authors
+
+
+def denormalize_authors(apps, schema_editor):
+    """Fill the author type, primary key and name of the existing events."""
+    fill_authors(apps.get_model('sports', 'SportEvent'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sports', '0006_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sportevent',
+            name='author_name',
+            field=models.CharField(blank=True, max_length=150, null=True),
+        ),
+        migrations.AddField(
+            model_name='sportevent',
+            name='author_pk',
+            field=models.PositiveBigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='sportevent',
+            name='author_type',
+            field=models.CharField(blank=True, choices=[('user', 'user'), ('brand', 'brand'), ('club', 'club')], max_length=5),
+        ),
+        migrations.RunPython(denormalize_authors, migrations.RunPython.noop),
+    ]
@@ -3,3 +3,4 @@ from .events import *
 from .invitations import *
 from .leagues import *
 from .members import *
+from .places import *
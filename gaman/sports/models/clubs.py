@@ -30,6 +30,11 @@ class Club(GamanModel, BaseDataModel):
         'users.User', through='sports.Member',
         through_fields=('club', 'user'), related_name='members')
 
+    # Counters
+    followers_count = models.PositiveIntegerField(default=0)
+    members_count = models.PositiveIntegerField(default=0)
+    posts_count = models.PositiveIntegerField(default=0)
+
     def __str__(self):
         """Return Club's slugname."""
         return self.slugname
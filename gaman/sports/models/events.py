@@ -3,16 +3,11 @@
 # Django
 from django.db import models
 
-# Models
-from gaman.sponsorships.models import Brand
-from gaman.sports.models import Club
-from gaman.users.models import User
-
 # Utils
-from gaman.utils.models import GamanModel
+from gaman.utils.models import AuthoredModel, GamanModel
 
 
-class SportEvent(GamanModel):
+class SportEvent(GamanModel, AuthoredModel):
     """
     Sport Event model.
     This model stores sport events.
@@ -44,6 +39,8 @@ class SportEvent(GamanModel):
 
     # ubitacion
     geolocation = models.CharField(max_length=33)
+    lat = models.FloatField(null=True, blank=True)
+    lng = models.FloatField(null=True, blank=True)
     country = models.CharField(max_length=70)
     state = models.CharField(max_length=90)
     city = models.CharField(max_length=90)
@@ -52,23 +49,32 @@ class SportEvent(GamanModel):
     assistants = models.ManyToManyField(
         'users.User', blank=True, related_name='assistants')
 
-    def specify_author(self) -> str:
-        """Specify if author is a user, brand or club."""
-        authors = [self.user, self.brand, self.club]
-        for author in authors:
-            if author:
-                return author
-
-    def normalize_author(self) -> User:
-        """Transform the author in user."""
-        author = self.specify_author()
-        author_type = type(author)
-        if author_type == Brand:
-            return author.sponsor
-        elif author_type == Club:
-            return author.trainer
-        return author  # user type
+    assistants_count = models.PositiveIntegerField(default=0)
+
+    def coordinates(self) -> tuple:
+        """Return the latitude and longitude of the geolocation."""
+        try:
+            lat, lng = map(float, self.geolocation.split())
+        except (AttributeError, ValueError):
+            return None, None
+        return lat, lng
+
+    def save(self, *args, **kwargs):
+        """Keep the numeric coordinates in sync with the geolocation."""
+        self.lat, self.lng = self.coordinates()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'geolocation' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'lat', 'lng'}
+        return super().save(*args, **kwargs)
 
     def __str__(self):
         """Return Event title."""
         return self.title
+
+    class Meta(GamanModel.Meta):
+        """Meta options."""
+        indexes = [
+            # Events of a place, the nearest dates first
+            models.Index(
+                fields=['country', 'state', 'city', 'start'], name='event_place_start_idx'),
+        ]
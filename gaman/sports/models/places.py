@@ -0,0 +1,38 @@
+"""Geocoded Place models."""
+
+# Django
+from django.db import models
+
+# Utils
+from gaman.utils.models import GamanModel
+
+
+class GeocodedPlace(GamanModel):
+    """
+    Geocoded Place model.
+    Persistent cache of the geocoding api, a normalized
+    place name with its country, state, city and geolocation.
+    """
+
+    query = models.CharField(max_length=180, unique=True)
+
+    place = models.CharField(max_length=180)
+    country = models.CharField(max_length=70)
+    state = models.CharField(max_length=90)
+    city = models.CharField(max_length=90)
+    geolocation = models.CharField(max_length=33)
+
+    last_used = models.DateTimeField(
+        help_text='last time it was read, for the LRU eviction', db_index=True)
+
+    def ubication(self) -> dict:
+        """Return the ubication fields of a sport event."""
+        return {
+            'country': self.country, 'state': self.state,
+            'city': self.city, 'place': self.place,
+            'geolocation': self.geolocation
+        }
+
+    def __str__(self):
+        """Return query and geolocation."""
+        return f'{self.query} ({self.geolocation})'
@@ -9,4 +9,4 @@ class IsEventCreator(BasePermission):
     
     def has_object_permission(self, request, view, obj):
         """Check requesting user and event creator are the same."""
-        return request.user == obj.normalize_author()
+        return obj.authored_by(request.user)
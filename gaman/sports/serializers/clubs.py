@@ -7,8 +7,11 @@ from rest_framework.validators import UniqueValidator
 # Models
 from gaman.sports.models import Club, League
 
+# Utils
+from gaman.utils.sparse import SparseModelSerializer
 
-class ClubModelSerializer(serializers.ModelSerializer):
+
+class ClubModelSerializer(SparseModelSerializer):
     """Club model serializer."""
 
     league = serializers.StringRelatedField(read_only=True)
@@ -21,12 +24,15 @@ class ClubModelSerializer(serializers.ModelSerializer):
             'slugname', 'league',
             'about', 'photo',
             'cover_photo', 'city',
-            'trainer', 'official_web'
+            'trainer', 'official_web',
+            'followers_count', 'members_count',
+            'posts_count'
         ]
 
         read_only_fields = [
             'league', 'trainer',
-            'slugname'
+            'slugname', 'followers_count',
+            'members_count', 'posts_count'
         ]
 
 
@@ -3,6 +3,9 @@
 # Utilities
 from datetime import date
 
+# Django
+from django.conf import settings
+
 # Django REST Framework
 from rest_framework import serializers
 
@@ -14,14 +17,16 @@ from gaman.users.models.users import User
 from gaman.users.serializers import ProfileSumaryModelSerializer
 
 # Utils
+from gaman.utils.geo import event_index
 from gaman.utils.services import get_ubication
+from gaman.utils.sparse import SparseModelSerializer
 
 
-class SportEventModelSerializer(serializers.ModelSerializer):
+class SportEventModelSerializer(SparseModelSerializer):
     """SportEvent model serializer."""
 
-    author = serializers.StringRelatedField(
-        read_only=True, source='specify_author')
+    author = serializers.CharField(
+        read_only=True, source='author_name')
 
     start = serializers.DateField()
     finish = serializers.DateField()
@@ -35,12 +40,14 @@ class SportEventModelSerializer(serializers.ModelSerializer):
             'start', 'finish',
             'geolocation', 'country',
             'state', 'city', 'place',
+            'assistants_count',
             'created', 'updated'
         ]
 
         read_only_fields = [
             'pk', 'author', 'geolocation',
             'country', 'state', 'city',
+            'assistants_count',
             'created', 'updated'
         ]
 
@@ -82,11 +89,11 @@ class SportEventModelSerializer(serializers.ModelSerializer):
         return super().update(instance, data)
 
 
-class CreateSportEventSerializer(serializers.ModelSerializer):
+class CreateSportEventSerializer(SparseModelSerializer):
     """Create Sport Event serializer."""
 
-    author = serializers.StringRelatedField(
-        read_only=True, source='specify_author')
+    author = serializers.CharField(
+        read_only=True, source='author_name')
 
     start = serializers.DateField()
     finish = serializers.DateField()
@@ -133,7 +140,7 @@ class CreateSportEventSerializer(serializers.ModelSerializer):
         return event
 
 
-class AssistantModelSerializer(serializers.ModelSerializer):
+class AssistantModelSerializer(SparseModelSerializer):
     """Assitant model serializer."""
 
     name = serializers.CharField(source='get_full_name')
@@ -151,3 +158,50 @@ class AssistantModelSerializer(serializers.ModelSerializer):
             'username', 'name',
             'profile', 'role'
         ]
+
+
+class EventsNearbySerializer(serializers.Serializer):
+    """
+    Events nearby serializer.
+    Search the events around a point (lat, lng and radius in km)
+    or inside a bounding box, that overlap the start-finish dates.
+    """
+
+    lat = serializers.FloatField(min_value=-90, max_value=90, required=False)
+    lng = serializers.FloatField(min_value=-180, max_value=180, required=False)
+    radius = serializers.FloatField(
+        min_value=0, max_value=settings.EVENTS_NEARBY_MAX_RADIUS,
+        default=settings.EVENTS_NEARBY_RADIUS)
+
+    south = serializers.FloatField(min_value=-90, max_value=90, required=False)
+    west = serializers.FloatField(min_value=-180, max_value=180, required=False)
+    north = serializers.FloatField(min_value=-90, max_value=90, required=False)
+    east = serializers.FloatField(min_value=-180, max_value=180, required=False)
+
+    start = serializers.DateField(required=False)
+    finish = serializers.DateField(required=False)
+
+    def validate(self, data):
+        """Check that a point or a bounding box was sent."""
+        bbox = [data.get(field) for field in ('south', 'west', 'north', 'east')]
+        if None not in bbox:
+            if bbox[0] > bbox[2]:
+                raise serializers.ValidationError('South be must below north.')
+        elif data.get('lat') is None or data.get('lng') is None:
+            raise serializers.ValidationError(
+                'Send lat and lng or south, west, north and east.')
+
+        data.setdefault('start', date.today())
+        if data.get('finish') and data['start'] > data['finish']:
+            raise serializers.ValidationError(
+                'The start date be must before that finish date.')
+        return data
+
+    def search(self) -> list:
+        """Return the ids of the events found in the spatial index."""
+        data = self.validated_data
+        dates = {'start': data['start'], 'finish': data.get('finish')}
+        if 'south' in data:
+            return event_index.bbox(
+                data['south'], data['west'], data['north'], data['east'], **dates)
+        return event_index.radius(data['lat'], data['lng'], data['radius'], **dates)
@@ -8,8 +8,11 @@ from gaman.sports.models import Invitation
 from gaman.sports.models.members import Member
 from gaman.users.models import User
 
+# Utils
+from gaman.utils.sparse import SparseModelSerializer
 
-class InvitationModelSerializer(serializers.ModelSerializer):
+
+class InvitationModelSerializer(SparseModelSerializer):
     """Invitation model serializer."""
 
     issued_by = serializers.StringRelatedField(read_only=True)
@@ -1,13 +1,13 @@
 """League serializers."""
 
-# Django REST Framework
-from rest_framework import serializers
-
 # Models
 from gaman.sports.models import League
 
+# Utils
+from gaman.utils.sparse import SparseModelSerializer
+
 
-class LeagueModelSerializer(serializers.ModelSerializer):
+class LeagueModelSerializer(SparseModelSerializer):
     """League model serializer."""
 
     class Meta:
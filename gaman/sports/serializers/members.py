@@ -9,8 +9,11 @@ from gaman.sports.models import Member
 # Serializers
 from gaman.users.serializers import UserModelSerializer
 
+# Utils
+from gaman.utils.sparse import SparseModelSerializer
 
-class MemberModelSerializer(serializers.ModelSerializer):
+
+class MemberModelSerializer(SparseModelSerializer):
     """Member model serializer."""
 
     user = UserModelSerializer(read_only=True)
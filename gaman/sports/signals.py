@@ -1,16 +1,82 @@
 """Sports signals."""
 
 # Django
-from django.db.models.signals import pre_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
 # Models
-from gaman.sports.models import SportEvent
+from gaman.sponsorships.models import Brand
+from gaman.sports.models import Club, Member, SportEvent
+from gaman.users.models import User
 
 # Tasks
 from taskapp.tasks.events import delete_sport_event
 
+# Utils
+from gaman.utils.authors import release_author, rename_author, renamed
+from gaman.utils.counters import apply_delta, count_of
+from gaman.utils.geo import INDEXED_FIELDS, event_index
+
 
 @receiver(pre_delete, sender=SportEvent)
 def post_delete_event(sender, instance, *args, **kwargs):
     delete_sport_event.delay(pk=instance.pk, geolocation=instance.geolocation)
+
+
+@receiver(post_save, sender=SportEvent)
+@receiver(post_delete, sender=SportEvent)
+def update_event_index(sender, instance, update_fields=None, *args, **kwargs):
+    """Update the event in the spatial indexes when the transaction commits."""
+    if update_fields is None or INDEXED_FIELDS & set(update_fields):
+        event_index.changed([instance.pk])
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=Brand)
+@receiver(post_save, sender=Club)
+def rename_events_author(sender, instance, created, *args, **kwargs):
+    """Update the author name of the events of a renamed user, brand or club."""
+    if not created and renamed(instance):
+        rename_author(SportEvent, instance)
+
+
+@receiver(post_delete, sender=User)
+@receiver(post_delete, sender=Brand)
+@receiver(post_delete, sender=Club)
+def release_events_author(sender, instance, *args, **kwargs):
+    """Update the author of the events of a deleted user, brand or club."""
+    release_author(SportEvent, instance)
+
+
+@receiver(post_save, sender=Member)
+def count_new_member(sender, instance, created, *args, **kwargs):
+    """Increment the members counter of the club."""
+    if created:
+        apply_delta(Club, [instance.club_id], 'members_count', 1)
+
+
+@receiver(post_delete, sender=Member)
+def count_deleted_member(sender, instance, *args, **kwargs):
+    """Decrement the members counter of the club."""
+    apply_delta(Club, [instance.club_id], 'members_count', -1)
+
+
+@receiver(m2m_changed, sender=SportEvent.assistants.through)
+def count_assistants(sender, instance, action, reverse, pk_set, *args, **kwargs):
+    """Recount the assistants of the changed events."""
+    if action == 'pre_clear' and reverse:
+        # The events of a user are cleared, keep them to recount them
+        instance._cleared_events = list(
+            sender.objects.filter(user=instance).values_list('sportevent_id', flat=True))
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        pks = [instance.pk]
+    elif action == 'post_clear':
+        pks = instance.__dict__.pop('_cleared_events', [])
+    else:
+        pks = pk_set
+    if pks:
+        SportEvent.objects.filter(pk__in=pks).update(
+            assistants_count=count_of(sender.objects.all(), 'sportevent'))
@@ -6,6 +6,7 @@ import json
 from unittest import mock
 
 # Django
+from django.test import override_settings
 from django.urls import reverse
 
 # Django REST Framework
@@ -20,6 +21,7 @@ from gaman.users.models import User
 
 # Utils
 from gaman.utils.data import load_data
+from gaman.utils.geo import EventIndex
 
 
 class ClubEventsAPITestCase(APITestCase):
@@ -529,3 +531,120 @@ class EventModelTest(APITestCase):
         """Check that the event author is a brand."""
         self.assertEqual(self.brand_event.specify_author(), self.brand)
         self.assertEqual(self.brand_event.normalize_author(), self.sponsor)
+
+    def test_event_coordinates(self):
+        """Check that the geolocation is parsed in numeric coordinates."""
+        self.assertEqual((self.user_event.lat, self.user_event.lng), (6.26864, -75.55615))
+
+
+class EventsNearbyAPITestCase(APITestCase):
+    """Events nearby from the spatial index api test case."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+
+        self.user = User.objects.create(
+            email='test@gmail.com',
+            username='test00',
+            first_name='test00',
+            last_name='test00',
+            role='Coach',
+            password='nKSAJBBCJW_',
+            verified=True
+        )
+        self.token = Token.objects.create(user=self.user).key
+        self.today = datetime.date.today()
+
+        places = [
+            ('Atanasio Girardot', '6.26864 -75.55615', 2),
+            ('Estadio Envigado', '6.16710 -75.58236', 2),
+            ('El Campin', '4.64604 -74.07785', 2),
+            ('Old event', '6.26900 -75.55600', -10)]
+        self.events = [
+            SportEvent.objects.create(
+                user=self.user,
+                title=title,
+                start=self.today + datetime.timedelta(days=days),
+                finish=self.today + datetime.timedelta(days=days + 2),
+                geolocation=geolocation,
+                country='Colombia',
+                state='Antioquia',
+                city='Medellin',
+                place=title
+            ) for title, geolocation, days in places]
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token}')
+        self.url = reverse('sports:events-events-nearby')
+
+    @mock.patch('requests.post')
+    def test_radius(self, mock):
+        """Check that the upcoming events are found by distance, the nearest first."""
+        response = self.client.post(
+            self.url, {'lat': '6.2', 'lng': '-75.57', 'radius': '20'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [event['pk'] for event in response.data],
+            [self.events[1].pk, self.events[0].pk])
+        mock.assert_not_called()
+
+    def test_bounding_box_and_dates(self):
+        """Check the bounding box search with a date window."""
+        request_body = {
+            'south': '4', 'west': '-76', 'north': '7', 'east': '-74',
+            'start': str(self.today - datetime.timedelta(days=10))}
+        response = self.client.post(self.url, request_body)
+        self.assertEqual(len(response.data), 4)
+
+        request_body['finish'] = str(self.today)
+        response = self.client.post(self.url, request_body)
+        self.assertEqual([event['pk'] for event in response.data], [self.events[3].pk])
+
+    def test_index_refreshed(self):
+        """Check that a new event is found after it's created."""
+        request_body = {'lat': '3.45', 'lng': '-76.53'}
+        response = self.client.post(self.url, request_body)
+        self.assertEqual(response.data, [])
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            event = SportEvent.objects.create(
+                user=self.user, title='Pascual Guerrero', start=self.today,
+                finish=self.today, geolocation='3.43003 -76.54130', country='Colombia',
+                state='Valle', city='Cali', place='Pascual Guerrero')
+        # Before the commit the indexes keep the old events
+        response = self.client.post(self.url, request_body)
+        self.assertEqual(response.data, [])
+
+        with mock.patch.object(EventIndex, 'build') as build:
+            callbacks[0]()
+            response = self.client.post(self.url, request_body)
+            self.assertEqual([event['pk'] for event in response.data], [event.pk])
+
+            with self.captureOnCommitCallbacks(execute=True):
+                event.geolocation = '4.64604 -74.07785'
+                event.save(update_fields=['geolocation'])
+            response = self.client.post(self.url, request_body)
+            self.assertEqual(response.data, [])
+        # Only the changed events were loaded
+        build.assert_not_called()
+
+    def test_index_kept(self):
+        """Check that the saves of the fields out of the index keep it."""
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.events[0].title = 'Renamed'
+            self.events[0].save(update_fields=['title'])
+        self.assertEqual(callbacks, [])
+
+    @override_settings(GEOGAMAN_FALLBACK=True)
+    @mock.patch('requests.post')
+    def test_geogaman_payload(self, mock):
+        """Check that the payloads of geogaman are sent to it with the fallback enabled."""
+        mock.return_value.json.return_value = {'events_ids': [self.events[2].pk]}
+        mock.return_value.status_code = 200
+        response = self.client.post(self.url, {'zone': 'Bogota'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([event['pk'] for event in response.data], [self.events[2].pk])
+
+    def test_invalid_search(self):
+        """Check that a point or a bounding box is required."""
+        response = self.client.post(self.url, {'lat': '6.2'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
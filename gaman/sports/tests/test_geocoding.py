@@ -0,0 +1,114 @@
+"""Geocoding cache tests."""
+
+# Utilities
+import datetime
+from unittest import mock
+
+# Django
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+
+# Django REST Framework
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+# Models
+from gaman.sports.models import GeocodedPlace, SportEvent
+from gaman.users.models import User
+
+# Tasks
+from taskapp.tasks.events import evict_geocodes, geocode_events
+
+# Utils
+from gaman.utils.data import load_data
+from gaman.utils.geocoding import StubGeocoder, geocode_cache, normalize
+
+
+@override_settings(GEOCODER_BACKEND='gaman.utils.geocoding.StubGeocoder')
+class GeocodeCacheTestCase(APITestCase):
+    """Geocoding cache test case."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+        StubGeocoder.calls = 0
+
+    def test_cached_place(self):
+        """Check that a place is geocoded once whatever its case and spaces."""
+        ubication = geocode_cache.get('Atanasio Girardot,  Medellin')
+        self.assertEqual(geocode_cache.get(' atanasio girardot, MEDELLIN'), ubication)
+        self.assertEqual(StubGeocoder.calls, 1)
+        self.assertTrue(GeocodedPlace.objects.filter(
+            query=normalize('Atanasio Girardot, Medellin')).exists())
+
+    def test_expired_place(self):
+        """Check that a expired place is geocoded again."""
+        geocode_cache.get('El Campin, Bogota')
+        # It expired in the shared cache too
+        cache.clear()
+        with override_settings(GEOCODE_TTL=0):
+            geocode_cache.get('El Campin, Bogota')
+        self.assertEqual(StubGeocoder.calls, 2)
+
+    def test_get_many(self):
+        """Check that the batch geocoding resolves each distinct place once."""
+        places = ['Medellin', 'Bogota', 'medellin', 'Cali']
+        geocode_cache.get('Cali')
+        ubications = geocode_cache.get_many(places)
+        self.assertEqual(ubications['Medellin'], ubications['medellin'])
+        self.assertEqual(StubGeocoder.calls, 3)
+
+    @override_settings(GEOCODE_CACHE_SIZE=2)
+    def test_evict(self):
+        """Check that the least recently used places are evicted."""
+        for place in ['Medellin', 'Bogota', 'Cali']:
+            geocode_cache.get(place)
+        evict_geocodes()
+        self.assertEqual(
+            set(GeocodedPlace.objects.values_list('query', flat=True)), {'bogota', 'cali'})
+
+    def test_geocode_events(self):
+        """Check that the bulk imported events are geocoded."""
+        user = User.objects.create(
+            email='test@gmail.com', username='test00', first_name='test00',
+            last_name='test00', role='Coach', password='nKSAJBBCJW_', verified=True)
+        today = datetime.date.today()
+        SportEvent.objects.bulk_create([
+            SportEvent(user=user, title=f'Event {i}', start=today, finish=today,
+                       country='Colombia') for i in range(3)])
+
+        geocode_events()
+        self.assertFalse(SportEvent.objects.filter(geolocation='').exists())
+        self.assertFalse(SportEvent.objects.filter(lat__isnull=True).exists())
+        self.assertEqual(StubGeocoder.calls, 1)
+
+
+class EventGeocodingAPITestCase(APITestCase):
+    """Sport event creation with the geocoding cache api test case."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+        self.user = User.objects.create(
+            email='test@gmail.com', username='test00', first_name='test00',
+            last_name='test00', role='Coach', password='nKSAJBBCJW_', verified=True)
+        self.token = Token.objects.create(user=self.user).key
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token}')
+
+    @mock.patch('requests.get')
+    def test_repeated_place(self, mock):
+        """Check that the same place is requested to the api only once."""
+        mock.return_value.json.return_value = load_data(
+            'gaman/sports/tests/fixtures/geolocation.json')
+
+        today = datetime.date.today()
+        for title in ['First event', 'Second event']:
+            self.client.post(reverse('sports:events-list'), {
+                'title': title,
+                'start': today,
+                'finish': today,
+                'place': 'Atanasio Girardot, Medellin'})
+
+        self.assertEqual(mock.call_count, 1)
+        self.assertEqual(
+            set(SportEvent.objects.values_list('geolocation', flat=True)),
+            {'52.52896 13.41802'})
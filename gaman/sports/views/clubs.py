@@ -23,8 +23,12 @@ from gaman.sponsorships.serializers import SponsorshipModelSerializer
 from gaman.sports.serializers import ClubModelSerializer, CreateClubSerializer
 from gaman.users.serializers import FollowerSerializer
 
+# Utils
+from gaman.utils.compiled import CompiledSerializerMixin
+from gaman.utils.pagination import FeedPagination
 
-class ClubViewSet(viewsets.ModelViewSet):
+
+class ClubViewSet(CompiledSerializerMixin, viewsets.ModelViewSet):
     """
     Club Viewset.
     Handles create, detail, update and destroy club.
@@ -32,13 +36,19 @@ class ClubViewSet(viewsets.ModelViewSet):
 
     queryset = Club.objects.all().select_related('trainer', 'league')
     serializer_class = ClubModelSerializer
+    compiled_actions = ('followers',)
     lookup_field = 'slugname'
     filter_backends = (SearchFilter, OrderingFilter, DjangoFilterBackend)
     search_fields = ('slugname',)
-    ordering_fields = ('slugname',)
-    ordering = ('slugname', 'members__count')
-    filter_fields = (
-        'league__slugname', 'league__state', 'league__sport', 'city')
+    ordering_fields = ('slugname', 'members_count', 'followers_count')
+    ordering = ('slugname', 'members_count')
+    filter_fields = {
+        'league__slugname': ['exact'],
+        'league__state': ['exact'],
+        'league__sport': ['exact'],
+        'city': ['exact'],
+        'members_count': ['gte', 'lte'],
+    }
 
     def get_permissions(self):
         """Assign permissions based on action."""
@@ -60,11 +70,15 @@ class ClubViewSet(viewsets.ModelViewSet):
 
     @action(detail=True, methods=['get'])
     def followers(self, request, *args, **kwargs):
+        """List club's followers."""
         club = self.get_object()
         followers = FollowUp.objects.filter(
             club=club).select_related('follower')
-        data = FollowerSerializer(followers, many=True).data
-        return Response(data, status=status.HTTP_200_OK)
+        paginator = FeedPagination()
+        page = paginator.paginate_queryset(
+            self.prepare_queryset(followers, FollowerSerializer, paginator), request, view=self)
+        data = self.serialize(page, FollowerSerializer)
+        return paginator.get_list_response(data)
 
     @action(detail=True, methods=['post'])
     def follow(self, request, *args, **kwargs):
@@ -88,5 +102,7 @@ class ClubViewSet(viewsets.ModelViewSet):
         club = self.get_object()
         sponsorships = Sponsorship.objects.filter(
             club=club).select_related('sponsor', 'athlete', 'club', 'brand')
-        data = SponsorshipModelSerializer(sponsorships, many=True).data
+        data = SponsorshipModelSerializer(
+            self.trim_queryset(sponsorships, SponsorshipModelSerializer),
+            many=True, context=self.get_serializer_context()).data
         return Response(data, status=status.HTTP_200_OK)
@@ -26,22 +26,27 @@ from gaman.sports.models import Club, SportEvent
 # Serializers
 from gaman.sports.serializers import (AssistantModelSerializer,
                                       CreateSportEventSerializer,
+                                      EventsNearbySerializer,
                                       SportEventModelSerializer)
 
+# Utils
+from gaman.utils.compiled import CompiledListModelMixin
 
-class SportEventViewSet(viewsets.ModelViewSet):
+
+class SportEventViewSet(CompiledListModelMixin, viewsets.ModelViewSet):
     """
     Sport Event Viewset.
     Handle create, retrieve, list, update and destroy
     a sport event.
     """
 
-    queryset = SportEvent.objects.all().select_related('user', 'brand', 'club')
+    queryset = SportEvent.objects.all()
     serializer_class = SportEventModelSerializer
+    compiled_actions = ('list',)
     filter_backends = (SearchFilter, OrderingFilter, DjangoFilterBackend)
     search_fields = ('country', 'state', 'city')
-    ordering_fields = ('start',)
-    ordering = ('start',)
+    ordering_fields = ('start', 'assistants_count')
+    ordering = ('start', 'pk')
     filter_fields = ('country', 'state', 'city')
 
     def get_permissions(self):
@@ -79,12 +84,34 @@ class SportEventViewSet(viewsets.ModelViewSet):
         """List of assistants of the event."""
         event = self.get_object()
         assistants = event.assistants.all().select_related('profile')
-        data = AssistantModelSerializer(assistants, many=True).data
+        data = AssistantModelSerializer(
+            self.trim_queryset(assistants, AssistantModelSerializer),
+            many=True, context=self.get_serializer_context()).data
         return Response(data, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=['post'], url_path='events-nearby/')
     def events_nearby(self, request):
-        """Get events nearby from a geolocation."""
+        """
+        Get events nearby from a geolocation or inside a bounding box.
+        They are searched in the local spatial index, the geogaman
+        service is asked only if it's enabled as fallback, also with
+        the payloads of geogaman the index doesn't read.
+        """
+        serializer = EventsNearbySerializer(data=request.data)
+        if not serializer.is_valid() and settings.GEOGAMAN_FALLBACK:
+            return self.remote_events_nearby(request)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.search()
+        if not ids and settings.GEOGAMAN_FALLBACK:
+            return self.remote_events_nearby(request)
+
+        events = self.get_queryset().in_bulk(ids)
+        events = [events[pk] for pk in ids if pk in events]
+        data = SportEventModelSerializer(events, many=True).data
+        return Response(data, status=status.HTTP_200_OK)
+
+    def remote_events_nearby(self, request):
+        """Get events nearby from the geogaman service."""
         url = settings.GEOGAMAN_DOMAIN + 'zones/events/'
         response = requests.post(url, request.data)
         if response.status_code == 200:
@@ -96,7 +123,7 @@ class SportEventViewSet(viewsets.ModelViewSet):
             return Response(response.content, status=response.status_code)
 
 
-class SportEventClubViewSet(viewsets.ModelViewSet):
+class SportEventClubViewSet(CompiledListModelMixin, viewsets.ModelViewSet):
     """
     Sport Event Club viewset.
     Handle create, retrieve, list, update and destroy
@@ -104,6 +131,7 @@ class SportEventClubViewSet(viewsets.ModelViewSet):
     """
 
     serializer_class = SportEventModelSerializer
+    compiled_actions = ('list',)
 
     def get_permissions(self):
         """Assign permissions based on action."""
@@ -117,7 +145,7 @@ class SportEventClubViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return club events."""
-        return SportEvent.objects.filter(club=self.club).select_related('club')
+        return SportEvent.objects.filter(club=self.club)
 
     def dispatch(self, request, *args, **kwargs):
         """Verify that the club exists."""
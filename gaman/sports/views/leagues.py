@@ -16,8 +16,12 @@ from gaman.sports.models import League
 # Serializer
 from gaman.sports.serializers import LeagueModelSerializer
 
+# Utils
+from gaman.utils.sparse import SparseFieldsMixin
 
-class LeagueViewSet(mixins.ListModelMixin,
+
+class LeagueViewSet(SparseFieldsMixin,
+                    mixins.ListModelMixin,
                     mixins.RetrieveModelMixin,
                     viewsets.GenericViewSet):
     """
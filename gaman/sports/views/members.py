@@ -19,8 +19,11 @@ from gaman.sports.serializers import (CreateInvitationSerializer,
                                       ConfirmInvitationSerializer,
                                       MemberModelSerializer)
 
+# Utils
+from gaman.utils.sparse import SparseFieldsMixin
 
-class MemberViewSet(viewsets.ModelViewSet):
+
+class MemberViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """
     Member view set.
     Create, retrieve, expel or deactivate
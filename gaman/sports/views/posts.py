@@ -14,13 +14,18 @@ from gaman.sports.models import Club
 # Serializers
 from gaman.posts.serializers import PostModelSerializer
 
+# Utils
+from gaman.utils.compiled import CompiledListModelMixin
 
-class ClubPostViewSet(mixins.CreateModelMixin,
+
+class ClubPostViewSet(CompiledListModelMixin,
+                      mixins.CreateModelMixin,
                       mixins.ListModelMixin,
                       viewsets.GenericViewSet):
     """Club Post viewset."""
 
     serializer_class = PostModelSerializer
+    compiled_actions = ('list',)
 
     def get_permissions(self):
         """Assign permissions based on action."""
@@ -38,8 +43,7 @@ class ClubPostViewSet(mixins.CreateModelMixin,
 
     def get_queryset(self):
         """Filter brand's posts."""
-        return self.club.post_set.all().select_related(
-            'user', 'club').prefetch_related('pictures', 'videos')
+        return self.club.post_set.all().select_related('post')
 
     def get_serializer_context(self):
         """Add club to serializer context."""
@@ -0,0 +1,76 @@
+"""API benchmark commands."""
+
+# Utilities
+from datetime import datetime
+import json
+import subprocess
+
+# Django
+from django.core.management.base import BaseCommand, CommandError
+from django.test.runner import DiscoverRunner
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+# Utils
+from gaman.utils import benchmarks
+
+
+class Command(BaseCommand):
+    """API benchmark command."""
+
+    help = (
+        'Seed a test database with the data generators, request every router '
+        'endpoint and check the query counts, rows and latencies against a budget file')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--budget', default='benchmarks/budgets.json',
+            help='Budget file, a JSON of endpoint -> {queries, rows, p95_ms}.')
+        parser.add_argument(
+            '--output', help='Write the results as JSON to this file.')
+        parser.add_argument(
+            '--iterations', type=int, default=20,
+            help='Requests per endpoint to compute the latency percentiles.')
+        parser.add_argument(
+            '--write-budget', action='store_true',
+            help='Write the budget file from the results instead of checking it.')
+
+    @staticmethod
+    def commit() -> str:
+        """Return the current git commit, if any."""
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True).stdout.strip()
+        except OSError:
+            return ''
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        runner = DiscoverRunner(verbosity=0, interactive=False)
+        databases = runner.setup_databases()
+        try:
+            fixtures = benchmarks.seed()
+            results = benchmarks.run(fixtures, iterations=options['iterations'])
+        finally:
+            runner.teardown_databases(databases)
+            teardown_test_environment()
+
+        results.update({'commit': self.commit(), 'date': datetime.now().isoformat()})
+        output = json.dumps(results, indent=2, sort_keys=True)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output + '\n')
+        else:
+            self.stdout.write(output)
+
+        if options['write_budget']:
+            with open(options['budget'], 'w') as f:
+                json.dump(benchmarks.make_budgets(results), f, indent=2, sort_keys=True)
+                f.write('\n')
+            self.stderr.write(self.style.SUCCESS(f"Budget written to {options['budget']}."))
+            return
+
+        with open(options['budget']) as f:
+            violations = benchmarks.check_budgets(results, json.load(f))
+        if violations:
+            raise CommandError('Budget exceeded:\n' + '\n'.join(violations))
+        self.stderr.write(self.style.SUCCESS('All the endpoints are within budget.'))
@@ -0,0 +1,54 @@
+"""Database connections benchmark commands."""
+
+# Utilities
+import json
+
+# Django
+from django.core.management.base import BaseCommand
+from django.test.runner import DiscoverRunner
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+# Utils
+from gaman.utils import benchmarks
+
+
+class Command(BaseCommand):
+    """Database connections benchmark command."""
+
+    help = (
+        'Seed a test database and compare the requests/sec of an endpoint with a '
+        'database connection per request and with persistent connections')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url', help='Endpoint to request, the requester user detail by default.')
+        parser.add_argument(
+            '--requests', type=int, default=500,
+            help='Requests of each connections mode.')
+        parser.add_argument(
+            '--max-age', type=int, default=60,
+            help='CONN_MAX_AGE of the persistent connections.')
+        parser.add_argument(
+            '--output', help='Write the results as JSON to this file.')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        runner = DiscoverRunner(verbosity=0, interactive=False)
+        databases = runner.setup_databases()
+        try:
+            fixtures = benchmarks.seed()
+            results = benchmarks.connections(
+                fixtures, url=options['url'],
+                requests=options['requests'], max_age=options['max_age'])
+        finally:
+            runner.teardown_databases(databases)
+            teardown_test_environment()
+
+        output = json.dumps(results, indent=2, sort_keys=True)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output + '\n')
+        else:
+            self.stdout.write(output)
+        self.stderr.write(self.style.SUCCESS(
+            f"Persistent connections: {results['speedup']}x the requests/sec."))
@@ -0,0 +1,52 @@
+"""JSON rendering benchmark commands."""
+
+# Utilities
+import json
+
+# Django
+from django.core.management.base import BaseCommand
+from django.test.runner import DiscoverRunner
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+# Utils
+from gaman.utils import benchmarks
+
+
+class Command(BaseCommand):
+    """JSON rendering benchmark command."""
+
+    help = (
+        'Seed a test database and compare the stdlib and the fast JSON renderers '
+        'and parsers over the posts and events lists payloads')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--items', type=int, default=200, help='Posts and events of each payload.')
+        parser.add_argument(
+            '--rounds', type=int, default=50, help='Renders and parses of each payload.')
+        parser.add_argument(
+            '--output', help='Write the results as JSON to this file.')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        runner = DiscoverRunner(verbosity=0, interactive=False)
+        databases = runner.setup_databases()
+        try:
+            benchmarks.seed()
+            results = benchmarks.rendering(
+                options['items'], options['items'], options['rounds'])
+        finally:
+            runner.teardown_databases(databases)
+            teardown_test_environment()
+
+        output = json.dumps(results, indent=2, sort_keys=True)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output + '\n')
+        else:
+            self.stdout.write(output)
+        if not results['orjson']:
+            self.stderr.write(self.style.WARNING('orjson is not installed, both use the stdlib.'))
+        for name, result in results['payloads'].items():
+            self.stderr.write(self.style.SUCCESS(
+                f"{name}: {result['render_speedup']}x render, {result['parse_speedup']}x parse."))
@@ -0,0 +1,50 @@
+"""Compiled serializers benchmark commands."""
+
+# Utilities
+import json
+
+# Django
+from django.core.management.base import BaseCommand
+from django.test.runner import DiscoverRunner
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+# Utils
+from gaman.utils import benchmarks
+
+
+class Command(BaseCommand):
+    """Compiled serializers benchmark command."""
+
+    help = (
+        'Seed a test database and compare the serializers and the compiled serializers '
+        'over a page of the posts, comments, followers, following and events lists')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--items', type=int, default=100, help='Items of each page.')
+        parser.add_argument(
+            '--rounds', type=int, default=20, help='Serializations of each page.')
+        parser.add_argument(
+            '--output', help='Write the results as JSON to this file.')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        runner = DiscoverRunner(verbosity=0, interactive=False)
+        databases = runner.setup_databases()
+        try:
+            benchmarks.seed()
+            results = benchmarks.serializing(options['items'], options['rounds'])
+        finally:
+            runner.teardown_databases(databases)
+            teardown_test_environment()
+
+        output = json.dumps(results, indent=2, sort_keys=True)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output + '\n')
+        else:
+            self.stdout.write(output)
+        for name, result in results.items():
+            style = self.style.SUCCESS if result['identical'] else self.style.ERROR
+            self.stderr.write(style(
+                f"{name}: {result['speedup']}x, identical: {result['identical']}."))
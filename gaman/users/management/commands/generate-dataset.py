@@ -0,0 +1,73 @@
+"""Synthetic dataset commands."""
+
+# Utilities
+from io import StringIO
+
+# Django
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+# Models
+from gaman.posts.models import Post
+from gaman.sports.models import SportEvent
+
+# Utils
+from gaman.utils.authors import fill_authors
+from gaman.utils.datasets import DatasetGenerator, Volumes
+from gaman.utils.geo import event_index
+
+
+class Command(BaseCommand):
+    """Dataset generator command."""
+
+    help = (
+        'Generate a synthetic dataset of users, follows, brands, clubs, posts, '
+        'comments, reactions, events and sponsorships, deterministic from a seed')
+
+    def add_arguments(self, parser):
+        defaults = Volumes()
+        for name in Volumes._fields:
+            default = getattr(defaults, name)
+            parser.add_argument(
+                f'--{name}', type=type(default), default=default,
+                help=f'Default {default}.')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--skew', type=float, default=1.1,
+            help='Exponent of the power laws of followers, authors and viral posts.')
+        parser.add_argument(
+            '--workers', type=int, default=1,
+            help='Worker processes per stage, only on PostgreSQL.')
+        parser.add_argument(
+            '--part-size', type=int, default=10000,
+            help='Rows generated by a worker at a time.')
+        parser.add_argument(
+            '--no-copy', action='store_true',
+            help='Insert with bulk_create instead of PostgreSQL COPY.')
+        parser.add_argument(
+            '--no-rebuild', action='store_true',
+            help="Don't reconcile the counters and rebuild the timelines at the end.")
+
+    def handle(self, *args, **options):
+        volumes = Volumes(**{name: options[name] for name in Volumes._fields})
+        if volumes.users < 25:
+            raise CommandError('At least 25 users are needed to have every role.')
+        if volumes.posts < 1 or volumes.posts * volumes.reposts >= volumes.posts:
+            raise CommandError('At least one original post is needed.')
+
+        generator = DatasetGenerator(
+            volumes, seed=options['seed'], skew=options['skew'],
+            part_size=options['part_size'], copy=not options['no_copy'])
+        report = generator.run(workers=options['workers'], stdout=self.stdout)
+
+        # The loader skips save() and the signals
+        fill_authors(Post)
+        fill_authors(SportEvent)
+        event_index.invalidate()
+        if not options['no_rebuild']:
+            call_command('reconcile-counters', stdout=StringIO())
+            call_command('rebuild-timelines', stdout=StringIO())
+
+        for line in report.report():
+            self.stdout.write(line)
+        self.stdout.write(self.style.SUCCESS('Dataset generated successfully.'))
@@ -0,0 +1,92 @@
+"""Load test commands."""
+
+# Utilities
+import asyncio
+import json
+
+# Django
+from django.core.management.base import BaseCommand, CommandError
+
+# Utils
+from gaman.utils import loadtest
+
+
+class Command(BaseCommand):
+    """Load test command."""
+
+    help = (
+        'Run the weighted scenarios of the Postman collection with concurrent '
+        'virtual users against a running server, and report the throughput, '
+        'latency percentiles and error rate of each request')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='http://localhost:8000')
+        parser.add_argument('--collection', default='Gaman.postman_collection.json')
+        parser.add_argument(
+            '--stages', default='10s:10,1m:50,10s:0',
+            help='Ramp profile, durations and virtual users: 30s:10,2m:100,30s:0.')
+        parser.add_argument(
+            '--weights',
+            help='Scenario weights, e.g. feed=60,react=20,login=0. Scenarios: ' + ', '.join(
+                scenario.name for scenario in loadtest.SCENARIOS))
+        parser.add_argument(
+            '--think', type=float, default=0.5, help='Mean think time between scenarios.')
+        parser.add_argument(
+            '--accounts', type=int, default=1000,
+            help='Verified accounts with a token used by the virtual users.')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--output', help='Write the results as JSON to this file.')
+        parser.add_argument(
+            '--baseline', help='Results file of a previous run to compare with.')
+        parser.add_argument(
+            '--tolerance', type=float, default=0.2,
+            help='Allowed throughput and p95 regression against the baseline.')
+
+    @staticmethod
+    def scenarios(weights: str) -> list:
+        scenarios = {scenario.name: scenario for scenario in loadtest.SCENARIOS}
+        for weight in (weights or '').split(','):
+            if not weight:
+                continue
+            name, value = weight.split('=')
+            if name not in scenarios:
+                raise CommandError(f'Unknown scenario: {name}')
+            scenarios[name] = scenarios[name]._replace(weight=float(value))
+        return list(scenarios.values())
+
+    def handle(self, *args, **options):
+        try:
+            test = loadtest.LoadTest(
+                options['host'],
+                loadtest.load_collection(options['collection']),
+                loadtest.Fixtures(accounts=options['accounts'], seed=options['seed']),
+                loadtest.parse_stages(options['stages']),
+                scenarios=self.scenarios(options['weights']),
+                think=options['think'], seed=options['seed'])
+        except ValueError as e:
+            raise CommandError(e)
+        results = asyncio.run(test.run())
+
+        self.stdout.write(
+            f"{'request':<24}{'requests':>10}{'rps':>10}{'errors':>9}"
+            f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+        for name, result in results['endpoints'].items():
+            self.stdout.write(
+                f"{name:<24}{result['requests']:>10}{result['rps']:>10}"
+                f"{result['error_rate']:>9.2%}{result['p50_ms']:>10}"
+                f"{result['p95_ms']:>10}{result['p99_ms']:>10}")
+        self.stdout.write(
+            f"Total: {results['requests']} requests, {results['rps']} rps, "
+            f"{results['error_rate']:.2%} errors")
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+                f.write('\n')
+
+        if options['baseline']:
+            with open(options['baseline']) as f:
+                regressions = loadtest.compare(results, json.load(f), options['tolerance'])
+            if regressions:
+                raise CommandError('Regressions against the baseline:\n' + '\n'.join(regressions))
+            self.stderr.write(self.style.SUCCESS('No regressions against the baseline.'))
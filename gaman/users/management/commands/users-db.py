@@ -2,11 +2,6 @@
 
 # Utilities
 import random
-from django.db import IntegrityError
-import pandas as pd
-
-# Django
-from django.core.management.base import BaseCommand
 
 # Django REST Framework
 from rest_framework.authtoken.models import Token
@@ -14,6 +9,9 @@ from rest_framework.authtoken.models import Token
 # Models
 from gaman.users.models import FollowRequest, FollowUp, Profile, User
 
+# Utils
+from gaman.utils.loaders import LoaderCommand, read_csv
+
 
 SPORTS = [
     'Athletics', 'Badminton', 'Basketball', 'Handball',
@@ -27,90 +25,88 @@ SPORTS = [
 ]
 
 
-class Command(BaseCommand):
+class Command(LoaderCommand):
     """User command."""
 
     help = 'Upload users and profiles csv to database'
+    models = [User, Profile, FollowRequest, FollowUp, Token]
 
-    def handle(self, *args, **options):
-        users_data = pd.DataFrame(
-            pd.read_csv('./data/users.csv'),
+    def load(self, loader, chunksize):
+        users_data = read_csv(
+            self.path('users.csv'),
             columns=[
                 'first_name', 'last_name', 'username',
                 'email', 'password', 'phone_number',
                 'role', 'verified'
-            ]
+            ],
+            chunksize=chunksize
         )
 
-        profiles_data = pd.DataFrame(
-            pd.read_csv('./data/profiles.csv'),
+        profiles_data = read_csv(
+            self.path('profiles.csv'),
             columns=[
                 'about', 'birth_date', 'country',
                 'public', 'web_site', 'social_link'
-            ]
+            ],
+            chunksize=chunksize
         )
 
-        users_query = [
-            User(
-                first_name=user_data.first_name,
-                last_name=user_data.last_name,
-                username=user_data.username,
-                email=user_data.email,
-                password=user_data.password,
-                phone_number=user_data.phone_number,
-                role=user_data.role,
-                verified=bool(user_data.verified),
-            ) for user_data in users_data.itertuples()
-        ]
-
-        users = User.objects.bulk_create(users_query)
-
-        x, profiles_query = 0, []
-        for profile_data in profiles_data.itertuples():
-            profile_query = Profile(
-                user=users[x],
-                photo='gaman/utils/media_test/profile_photo.jpg',
-                cover_photo='gaman/utils/media_test/profile_photo.jpg',
-                about=profile_data.about,
-                birth_date=profile_data.birth_date,
-                country=profile_data.country,
-                public=profile_data.public,
-                web_site=profile_data.web_site,
-                social_link=profile_data.social_link
-            )
-            profiles_query.append(profile_query)
-            x += 1
-
-        profiles = Profile.objects.bulk_create(profiles_query)
-        for profile in profiles:
-            if profile.user.role == 'Sponsor':
-                continue
-            profile.sport = random.choice(SPORTS)
-        profiles = Profile.objects.bulk_update(profiles, ['sport'])
-
-
-        for user in users:
-            # Create follow requests
-            requests_query = [
+        # The profiles rows belong to the users rows in the same position
+        user_ids = []
+        for users_chunk, profiles_chunk in zip(users_data, profiles_data):
+            users = loader.insert([
+                User(
+                    first_name=user_data.first_name,
+                    last_name=user_data.last_name,
+                    username=user_data.username,
+                    email=user_data.email,
+                    password=user_data.password,
+                    phone_number=user_data.phone_number,
+                    role=user_data.role,
+                    verified=bool(user_data.verified),
+                ) for user_data in users_chunk.itertuples()
+            ])
+            user_ids += [user.pk for user in users]
+
+            loader.insert([
+                Profile(
+                    user=user,
+                    photo='gaman/utils/media_test/profile_photo.jpg',
+                    cover_photo='gaman/utils/media_test/profile_photo.jpg',
+                    about=profile_data.about,
+                    birth_date=profile_data.birth_date,
+                    country=profile_data.country,
+                    public=profile_data.public,
+                    web_site=profile_data.web_site,
+                    social_link=profile_data.social_link,
+                    sport='' if user.role == 'Sponsor' else random.choice(SPORTS)
+                ) for user, profile_data in zip(users, profiles_chunk.itertuples())
+            ])
+
+        # Each user follows 10 other random users, once each
+        for x in range(0, len(user_ids), chunksize):
+            requests = loader.insert([
                 FollowRequest(
-                    follower=user,
-                    followed=users[random.randint(0, 999)],
+                    follower_id=user_id,
+                    followed_id=followed_id,
                     accepted=True
-                ) for _ in range(10)
-            ]
-            requests = FollowRequest.objects.bulk_create(requests_query)
-
-            # Create Follow-Up
-            follow_query = [FollowUp(follower=user, user=i.followed) for i in requests]
-            FollowUp.objects.bulk_create(follow_query)
-
-        # Create User token
-        verified_users = User.objects.filter(verified=True)
-        for verified_user in verified_users:
-            try:
-                Token.objects.create(user=verified_user)
-            except IntegrityError:
-                pass
-
-        self.stdout.write(
-            self.style.SUCCESS('Users, Profiles, FollowUp and Follow-Requests created successfully.'))
+                ) for user_id in user_ids[x:x + chunksize]
+                for followed_id in [i for i in random.sample(user_ids, 11) if i != user_id][:10]
+            ])
+            loader.insert([
+                FollowUp(follower_id=i.follower_id, user_id=i.followed_id)
+                for i in requests
+            ])
+
+        # Create the tokens of the verified users without one
+        verified_users = User.objects.filter(
+            verified=True, auth_token__isnull=True).values_list('pk', flat=True)
+        tokens = []
+        for verified_user in verified_users.iterator(chunk_size=chunksize):
+            tokens.append(Token(user_id=verified_user, key=Token.generate_key()))
+            if len(tokens) == chunksize:
+                loader.insert(tokens)
+                tokens = []
+        loader.insert(tokens)
+
+        return 'Users, Profiles, FollowUp and Follow-Requests created successfully.'
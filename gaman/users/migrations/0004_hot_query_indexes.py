@@ -0,0 +1,45 @@
+# Generated by Django 4.0.4 on 2026-10-18 10:58
+
+from django.db import migrations, models
+from gaman.utils.migrations import AddIndexConcurrently, delete_duplicates
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('users', '0003_follow_suggestions'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='followrequest',
+            index=models.Index(condition=models.Q(('accepted', False)), fields=['followed', '-created'], name='followrequest_pending_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='user',
+            index=models.Index(condition=models.Q(('verified', True)), fields=['username'], name='user_verified_idx'),
+        ),
+        migrations.RunPython(
+            delete_duplicates('users.FollowUp', ['follower', 'user'], {'user__isnull': False}),
+            migrations.RunPython.noop, atomic=True),
+        migrations.RunPython(
+            delete_duplicates('users.FollowUp', ['follower', 'brand'], {'brand__isnull': False}),
+            migrations.RunPython.noop, atomic=True),
+        migrations.RunPython(
+            delete_duplicates('users.FollowUp', ['follower', 'club'], {'club__isnull': False}),
+            migrations.RunPython.noop, atomic=True),
+        migrations.AddConstraint(
+            model_name='followup',
+            constraint=models.UniqueConstraint(condition=models.Q(('user__isnull', False)), fields=('follower', 'user'), name='unique_follow_user'),
+        ),
+        migrations.AddConstraint(
+            model_name='followup',
+            constraint=models.UniqueConstraint(condition=models.Q(('brand__isnull', False)), fields=('follower', 'brand'), name='unique_follow_brand'),
+        ),
+        migrations.AddConstraint(
+            model_name='followup',
+            constraint=models.UniqueConstraint(condition=models.Q(('club__isnull', False)), fields=('follower', 'club'), name='unique_follow_club'),
+        ),
+    ]
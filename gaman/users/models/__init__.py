@@ -1,3 +1,4 @@
 from .follow import *
 from .profiles import *
-from .users import *
\ No newline at end of file
+from .suggestions import *
+from .users import *
@@ -4,6 +4,7 @@
 from django.db import models
 
 # Utils
+from gaman.utils.authors import AUTHOR_NAMES, author_field
 from gaman.utils.models import BaseGamanModel
 
 
@@ -24,6 +25,15 @@ class FollowRequest(BaseGamanModel):
         """Return follower and following."""
         return f'from @{self.follower} to @{self.followed}'
 
+    class Meta(BaseGamanModel.Meta):
+        """Meta options."""
+        indexes = [
+            # Pending requests of a user, newest first
+            models.Index(
+                fields=['followed', '-created'], name='followrequest_pending_idx',
+                condition=models.Q(accepted=False)),
+        ]
+
 
 class FollowUp(BaseGamanModel):
     """
@@ -41,13 +51,26 @@ class FollowUp(BaseGamanModel):
     club = models.ForeignKey('sports.Club', on_delete=models.SET_NULL, null=True)
 
     def specify_followed(self) -> str:
-        if self.user:
-            return self.user.username
-        if self.brand:
-            return self.brand.slugname
-        if self.club:
-            return self.club.slugname
+        """Return the username or slugname of the followed."""
+        field = author_field(self)
+        if field is not None:
+            return getattr(getattr(self, field), AUTHOR_NAMES[field])
 
     def __str__(self):
         """Return follower and following."""
-        return f'@{self.follower} -> @{self.specify_followed()}'
\ No newline at end of file
+        return f'@{self.follower} -> @{self.specify_followed()}'
+
+    class Meta(BaseGamanModel.Meta):
+        """Meta options."""
+        constraints = [
+            # A single follow-up of each pair, they are also the follow checks indexes
+            models.UniqueConstraint(
+                fields=['follower', 'user'], name='unique_follow_user',
+                condition=models.Q(user__isnull=False)),
+            models.UniqueConstraint(
+                fields=['follower', 'brand'], name='unique_follow_brand',
+                condition=models.Q(brand__isnull=False)),
+            models.UniqueConstraint(
+                fields=['follower', 'club'], name='unique_follow_club',
+                condition=models.Q(club__isnull=False)),
+        ]
\ No newline at end of file
@@ -43,6 +43,11 @@ class Profile(GamanModel):
     social_link = models.URLField(
         help_text='social media', max_length=200, blank=True)
 
+    # Counters
+    followers_count = models.PositiveIntegerField(default=0)
+    following_count = models.PositiveIntegerField(default=0)
+    posts_count = models.PositiveIntegerField(default=0)
+
     def is_data_completed(self) -> bool:
         """Return the status of the profile data."""
         data = [
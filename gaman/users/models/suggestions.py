@@ -0,0 +1,27 @@
+"""Follow Suggestion models."""
+
+# Django
+from django.db import models
+
+# Utils
+from gaman.utils.models import GamanModel
+
+
+class FollowSuggestion(GamanModel):
+    """
+    Follow Suggestion model.
+    Ranked users, brands and clubs to follow, they are computed
+    offline and stored per user, so they are served with one read.
+    """
+
+    user = models.OneToOneField(
+        'users.User', on_delete=models.CASCADE, related_name='follow_suggestions')
+
+    items = models.JSONField(default=list)
+
+    stale = models.BooleanField(
+        help_text='the follows of the user changed', default=False)
+
+    def __str__(self):
+        """Return username and number of suggestions."""
+        return f'@{self.user} ({len(self.items)} suggestions)'
@@ -57,3 +57,12 @@ class User(GamanModel, AbstractUser):
     def get_short_name(self):
         """Return username."""
         return self.username
+
+    class Meta(GamanModel.Meta):
+        """Meta options."""
+        indexes = [
+            # Verified users lists
+            models.Index(
+                fields=['username'], name='user_verified_idx',
+                condition=models.Q(verified=True)),
+        ]
@@ -3,8 +3,8 @@
 # Django REST Framework
 from rest_framework.permissions import BasePermission
 
-# Models
-from gaman.users.models import User, FollowUp
+# Utils
+from gaman.utils.follows import FollowGraph
 
 
 class IsProfileOwner(BasePermission):
@@ -21,6 +21,4 @@ class IsFollower(BasePermission):
         user = request.user
         if obj.public:
             return True
-
-        followers = FollowUp.objects.filter(user=obj.user, follower=user)
-        return user.profile == obj or followers.exists()
+        return obj.user_id == user.pk or FollowGraph.is_following(user, obj.user)
@@ -9,8 +9,12 @@ from rest_framework import serializers
 # Models
 from gaman.users.models import FollowRequest, FollowUp
 
+# Utils
+from gaman.utils.authors import resolve_authors
+from gaman.utils.sparse import SparseModelSerializer
 
-class FollowRequestModelSerializer(serializers.ModelSerializer):
+
+class FollowRequestModelSerializer(SparseModelSerializer):
     """
     Follow Request model serializer.
     Handles the creation follow requet.
@@ -76,7 +80,18 @@ class AcceptFollowRequestSerializer(serializers.Serializer):
             follower=follow_request.follower, user=follow_request.followed)
 
 
-class FollowingSerializer(serializers.ModelSerializer):
+class FollowingListSerializer(serializers.ListSerializer):
+    """
+    Following list serializer.
+    Loads the followed of the page with a query per type.
+    """
+
+    def to_representation(self, data):
+        data = data.all() if hasattr(data, 'all') else data
+        return super().to_representation(resolve_authors(data))
+
+
+class FollowingSerializer(SparseModelSerializer):
     """
     Following model serializer.
     Serialize the followed of a user.
@@ -89,9 +104,11 @@ class FollowingSerializer(serializers.ModelSerializer):
         model = FollowUp
         fields = ['following']
         read_only_fields = ['following']
+        compiled_sources = {'following': ['user__username', 'brand__slugname', 'club__slugname']}
+        list_serializer_class = FollowingListSerializer
 
 
-class FollowerSerializer(serializers.ModelSerializer):
+class FollowerSerializer(SparseModelSerializer):
     """
     Follower model serializer.
     Serialize users's followers.
@@ -104,3 +121,4 @@ class FollowerSerializer(serializers.ModelSerializer):
         model = FollowUp
         fields = ['follower']
         read_only_fields = ['follower']
+        compiled_sources = {'follower': ['follower__username']}
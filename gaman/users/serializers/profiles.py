@@ -1,13 +1,13 @@
 """Profile serializers."""
 
-# Django REST Framework
-from rest_framework import serializers
-
 # Models
 from gaman.users.models import Profile
 
+# Utils
+from gaman.utils.sparse import SparseModelSerializer
+
 
-class ProfileModelSerializer(serializers.ModelSerializer):
+class ProfileModelSerializer(SparseModelSerializer):
     """Profile model serializer."""
 
     class Meta:
@@ -17,11 +17,18 @@ class ProfileModelSerializer(serializers.ModelSerializer):
             'photo', 'cover_photo',
             'about', 'birth_date',
             'sport', 'country', 'public',
-            'web_site', 'social_link'
+            'web_site', 'social_link',
+            'followers_count', 'following_count',
+            'posts_count'
+        ]
+
+        read_only_fields = [
+            'followers_count', 'following_count',
+            'posts_count'
         ]
 
 
-class ProfileSumaryModelSerializer(serializers.ModelSerializer):
+class ProfileSumaryModelSerializer(SparseModelSerializer):
     """Profile sumary model serializer."""
 
     class Meta:
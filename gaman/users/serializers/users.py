@@ -19,13 +19,17 @@ from gaman.users.models import Profile, User
 # Serializers
 from .profiles import ProfileModelSerializer
 
+# Utils
+from gaman.utils.authentication import is_expired, rotate_token
+from gaman.utils.sparse import SparseModelSerializer
+
 # Taskapp
 from taskapp.tasks.users import (send_confirmation_email,
                                  send_update_email,
                                  send_restore_password_email)
 
 
-class UserModelSerializer(serializers.ModelSerializer):
+class UserModelSerializer(SparseModelSerializer):
     """User model serializer."""
 
     profile = ProfileModelSerializer(read_only=True)
@@ -125,8 +129,10 @@ class UserLoginSerializer(serializers.Serializer):
         return data
 
     def create(self, data):
-        """Generate or retrieve token."""
+        """Generate or retrieve token, an expired token is rotated."""
         token, _ = Token.objects.get_or_create(user=self.context['user'])
+        if is_expired(token.created.timestamp()):
+            return self.context['user'], rotate_token(self.context['user'])
         return self.context['user'], token.key
 
 
@@ -219,11 +225,12 @@ class RestorePasswordSerializer(serializers.Serializer):
         return data
 
     def save(self):
-        """Restore user's password."""
+        """Restore user's password and log out the user everywhere."""
         payload = self.context['payload']
         user = User.objects.get(username=payload['user'])
         user.set_password(self.validated_data['password'])
         user.save()
+        Token.objects.filter(user=user).delete()
 
 
 class UpdatePasswordSerializer(serializers.Serializer):
@@ -249,10 +256,11 @@ class UpdatePasswordSerializer(serializers.Serializer):
         return data
 
     def save(self):
-        """Update user's password."""
+        """Update user's password and return the new token, the old one stops working."""
         user = self.context['user']
         user.set_password(self.validated_data['password'])
         user.save()
+        return rotate_token(user)
 
 
 class TokenUpdateEmailSerializers(serializers.Serializer):
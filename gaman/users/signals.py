@@ -0,0 +1,81 @@
+"""Users signals."""
+
+# Django
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+# Django REST Framework
+from rest_framework.authtoken.models import Token
+
+# Models
+from gaman.sponsorships.models import Brand
+from gaman.sports.models import Club
+from gaman.users.models import FollowSuggestion, FollowUp, Profile, User
+
+# Utils
+from gaman.utils.authentication import TokenCache
+from gaman.utils.authors import remember_name
+from gaman.utils.counters import apply_delta
+from gaman.utils.follows import FollowGraph
+
+
+@receiver(pre_save, sender=User)
+@receiver(pre_save, sender=Brand)
+@receiver(pre_save, sender=Club)
+def remember_author_name(sender, instance, update_fields, *args, **kwargs):
+    """Keep the saved name of a user, brand or club, its renames update the posts and events."""
+    remember_name(instance, update_fields)
+
+
+@receiver(post_save, sender=FollowUp)
+@receiver(post_delete, sender=FollowUp)
+def invalidate_follow_graph(sender, instance, *args, **kwargs):
+    """Invalidate the cached followed of the follower."""
+    FollowGraph.invalidate(instance.follower_id)
+
+
+@receiver(post_save, sender=FollowUp)
+@receiver(post_delete, sender=FollowUp)
+def mark_stale_suggestions(sender, instance, *args, **kwargs):
+    """Mark the follow suggestions of the follower to be refreshed."""
+    FollowSuggestion.objects.filter(
+        user_id=instance.follower_id, stale=False).update(stale=True)
+
+
+def count_followup(followup: FollowUp, delta: int) -> None:
+    """Apply a delta to the followers and following counters of a follow-up."""
+    if followup.user_id:
+        apply_delta(Profile, [followup.user_id], 'followers_count', delta, lookup='user')
+    elif followup.brand_id:
+        apply_delta(Brand, [followup.brand_id], 'followers_count', delta)
+    elif followup.club_id:
+        apply_delta(Club, [followup.club_id], 'followers_count', delta)
+    apply_delta(Profile, [followup.follower_id], 'following_count', delta, lookup='user')
+
+
+@receiver(post_save, sender=FollowUp)
+def count_follow(sender, instance, created, *args, **kwargs):
+    """Increment the followers and following counters."""
+    if created:
+        count_followup(instance, 1)
+
+
+@receiver(post_delete, sender=FollowUp)
+def count_unfollow(sender, instance, *args, **kwargs):
+    """Decrement the followers and following counters."""
+    count_followup(instance, -1)
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def invalidate_token(sender, instance, *args, **kwargs):
+    """Remove the snapshot of a created, rotated or deleted (logout) token."""
+    TokenCache.invalidate(instance.key)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_tokens(sender, instance, created, update_fields, *args, **kwargs):
+    """Remove the snapshots of the user tokens, its password, email or status could change."""
+    if created or (update_fields and set(update_fields) <= {'last_login'}):
+        return
+    TokenCache.invalidate(*Token.objects.filter(user=instance).values_list('key', flat=True))
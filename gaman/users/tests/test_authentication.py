@@ -0,0 +1,105 @@
+"""Token authentication cache tests."""
+
+# Utilities
+from datetime import timedelta
+
+# Django
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+# Django REST Framework
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+# Models
+from gaman.users.models import Profile, User
+
+# Utils
+from gaman.utils.authentication import TokenCache
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    LOCAL_CACHE_TTL=60)
+class TokenCacheAPITestCase(APITestCase):
+    """Token authentication cache api test case."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+        cache.clear()
+        TokenCache.local.clear()
+
+        self.user = User.objects.create_user(
+            email='test@gmail.com',
+            username='test00',
+            first_name='test00',
+            last_name='test00',
+            role='Athlete',
+            password='nKSAJBBCJW_',
+            verified=True
+        )
+        Profile.objects.create(user=self.user)
+        self.token = Token.objects.create(user=self.user).key
+        self.url = reverse('users:users-detail', args=[self.user.username])
+
+    def get_user(self, token: str):
+        """Return the response of the user detail with a token."""
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token}')
+        return self.client.get(self.url)
+
+    def test_warm_authentication(self):
+        """Verifies that a cached token doesn't query the tokens table."""
+        self.assertEqual(self.get_user(self.token).status_code, status.HTTP_200_OK)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get_user(self.token)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse([q for q in queries if 'authtoken_token' in q['sql']])
+
+    def test_logout(self):
+        """Verifies that the token stops working after the logout."""
+        self.get_user(self.token)
+        response = self.client.post(reverse('users:users-logout'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_user(self.token).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_password_change_rotates_token(self):
+        """Verifies that a password change replaces the token."""
+        self.get_user(self.token)
+        response = self.client.put(
+            reverse('users:users-update-psswd', args=[self.user.username]), {
+                'old_password': 'nKSAJBBCJW_',
+                'password': 'aLKSJD_2389',
+                'password_confirmation': 'aLKSJD_2389'
+            })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_user(self.token).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertNotEqual(response.data['access_token'], self.token)
+        self.assertEqual(
+            self.get_user(response.data['access_token']).status_code, status.HTTP_200_OK)
+
+    def test_deactivation(self):
+        """Verifies that a deactivated user can't authenticate with a cached token."""
+        self.get_user(self.token)
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.get_user(self.token).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(AUTH_TOKEN_TTL=60)
+    def test_expiry(self):
+        """Verifies that the expired tokens are rejected and rotated at login."""
+        Token.objects.filter(key=self.token).update(
+            created=timezone.now() - timedelta(minutes=2))
+        self.assertEqual(self.get_user(self.token).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.client.credentials()
+        response = self.client.post(reverse('users:users-login'), {
+            'email': 'test@gmail.com', 'password': 'nKSAJBBCJW_'})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotEqual(response.data['access_token'], self.token)
+        self.assertEqual(
+            self.get_user(response.data['access_token']).status_code, status.HTTP_200_OK)
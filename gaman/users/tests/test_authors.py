@@ -0,0 +1,96 @@
+"""Polymorphic authors tests."""
+
+# Utilities
+from datetime import date
+
+# Django REST Framework
+from rest_framework.test import APITestCase
+
+# Models
+from gaman.posts.models import Post
+from gaman.sponsorships.models import Brand
+from gaman.sports.models import Club, SportEvent
+from gaman.users.models import FollowUp, User
+
+# Utils
+from gaman.utils.authors import fill_authors, resolve_authors
+
+
+class AuthorsTestCase(APITestCase):
+    """Polymorphic authors test case."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+        self.users = [
+            User.objects.create(
+                email=f'test{i}@gmail.com',
+                username=f'test0{i}',
+                first_name=f'test0{i}',
+                last_name=f'test0{i}',
+                role='Athlete',
+                password='nKSAJBBCJW_',
+                verified=True
+            ) for i in range(3)]
+        self.user = self.users[0]
+        self.brand = Brand.objects.create(slugname='brand', sponsor=self.users[1])
+        self.club = Club.objects.create(slugname='club', trainer=self.users[2])
+
+    def test_denormalize(self):
+        """Verifies that the author is denormalized on save."""
+        post = Post.objects.create(brand=self.brand, about='post')
+        self.assertEqual(
+            (post.author_type, post.author_pk, post.author_name),
+            ('brand', self.brand.pk, 'brand'))
+        self.assertEqual(post.normalize_author(), self.users[1])
+        self.assertTrue(post.authored_by(self.users[1]))
+
+        post.brand, post.user = None, self.user
+        post.save(update_fields=['brand', 'user'])
+        post.refresh_from_db()
+        self.assertEqual(post.author_name, self.user.username)
+        with self.assertNumQueries(0):
+            self.assertTrue(post.authored_by(self.user))
+
+        self.assertEqual(Post.objects.create(about='no author').author_name, None)
+
+    def test_rename(self):
+        """Verifies that the posts and events follow the renamed authors."""
+        post = Post.objects.create(user=self.user, about='post')
+        event = SportEvent.objects.create(
+            club=self.club, title='event', start=date.today(), finish=date.today(),
+            geolocation='6.26864 -75.55615')
+        self.user.username = 'renamed'
+        self.user.save()
+        self.club.slugname = 'renamed-club'
+        self.club.save(update_fields=['slugname'])
+        post.refresh_from_db()
+        event.refresh_from_db()
+        self.assertEqual(post.author_name, 'renamed')
+        self.assertEqual(event.author_name, 'renamed-club')
+
+        self.club.delete()
+        event.refresh_from_db()
+        self.assertEqual((event.author_type, event.author_name), ('', None))
+
+    def test_fill_authors(self):
+        """Verifies the denormalization of the bulk loaded posts."""
+        Post.objects.bulk_create([
+            Post(user=self.user), Post(brand=self.brand), Post(club=self.club), Post()])
+        self.assertEqual(fill_authors(Post), 3)
+        self.assertEqual(
+            list(Post.objects.order_by('pk').values_list('author_type', 'author_name')),
+            [('user', 'test00'), ('brand', 'brand'), ('club', 'club'), ('', None)])
+
+    def test_resolve_authors(self):
+        """Verifies that a page of authors is loaded with a query per type."""
+        for author in [{'user': self.users[1]}, {'user': self.users[2]},
+                       {'brand': self.brand}, {'club': self.club}]:
+            FollowUp.objects.create(follower=self.user, **author)
+        with self.assertNumQueries(4):
+            follows = resolve_authors(
+                FollowUp.objects.order_by('pk'), owners={'brand': 'sponsor'})
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                [follow.specify_followed() for follow in follows],
+                ['test01', 'test02', 'brand', 'club'])
+            self.assertEqual(follows[2].brand.sponsor, self.users[1])
@@ -0,0 +1,50 @@
+"""API benchmark utils tests."""
+
+# Django REST Framework
+from rest_framework.test import APITestCase
+
+# Models
+from gaman.users.models import User
+
+# Utils
+from gaman.utils.benchmarks import Recorder, check_budgets, make_budgets
+
+
+class BenchmarkTestCase(APITestCase):
+    """API benchmark utils test case."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+        for i in range(3):
+            User.objects.create(
+                email=f'test{i}@gmail.com',
+                username=f'test0{i}',
+                first_name=f'test0{i}',
+                last_name=f'test0{i}',
+                role='Athlete',
+                password='nKSAJBBCJW_',
+                verified=True
+            )
+
+    def test_recorder(self):
+        """Check that the queries and the rows fetched by them are counted."""
+        with Recorder() as recorder:
+            list(User.objects.all())
+            list(User.objects.values_list('pk', flat=True))
+            User.objects.count()
+        self.assertEqual(recorder.query_count, 3)
+        self.assertEqual(recorder.rows, 7)
+
+    def test_budgets(self):
+        """Check that the results over the budget are reported."""
+        results = {'endpoints': {
+            'posts-list': {'queries': 7, 'rows': 65, 'p95_ms': 20.0},
+            'posts-detail': {'queries': 6, 'rows': 5, 'p95_ms': 10.0}}}
+        budgets = make_budgets(results)
+        self.assertEqual(check_budgets(results, budgets), [])
+
+        results['endpoints']['posts-list']['queries'] = 30
+        results['endpoints']['users-list'] = {'queries': 4, 'rows': 42, 'p95_ms': 12.0}
+        self.assertEqual(
+            check_budgets(results, budgets),
+            ['posts-list: queries 30 > 7', 'users-list: no budget'])
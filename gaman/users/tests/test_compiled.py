@@ -0,0 +1,164 @@
+"""Compiled serializers tests."""
+
+# Utilities
+from datetime import date, timedelta
+
+# Django
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db.models import Prefetch
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+
+# Django REST Framework
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+# Models
+from gaman.posts.models import Comment, Picture, Post, PrincipalComment, Video
+from gaman.sponsorships.models import Brand
+from gaman.sports.models import Club, SportEvent
+from gaman.users.models import FollowUp, Profile, User
+
+# Serializers
+from gaman.posts.serializers import CommentModelSerializer, PostModelSerializer
+from gaman.sports.serializers import SportEventModelSerializer
+from gaman.users.serializers import FollowerSerializer, FollowingSerializer
+
+# Utils
+from gaman.utils.compiled import CompiledSerializer, compile_serializer
+from gaman.utils.sparse import SparseModelSerializer
+
+
+class CompiledSerializersTestCase(APITestCase):
+    """Compiled serializers test case."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+        self.users = [
+            User.objects.create(
+                email=f'test{i}@gmail.com',
+                username=f'test0{i}',
+                first_name=f'test0{i}',
+                last_name=f'test0{i}',
+                role='Athlete',
+                password='nKSAJBBCJW_',
+                verified=True
+            ) for i in range(3)]
+        self.user = self.users[0]
+        Profile.objects.create(user=self.user)
+        brand = Brand.objects.create(slugname='brand', sponsor=self.users[1])
+        club = Club.objects.create(slugname='club', trainer=self.users[2])
+        for author in [{'user': self.users[1]}, {'brand': brand}, {'club': club}]:
+            FollowUp.objects.create(follower=self.user, **author)
+        FollowUp.objects.create(follower=self.users[1], user=self.user)
+
+        post = Post.objects.create(user=self.user, about='post', feeling='Happy')
+        post.pictures.add(
+            Picture.objects.create(content='posts/pictures/a.jpg'),
+            Picture.objects.create(content=''))
+        post.videos.add(Video.objects.create(content='posts/videos/a.mp4'))
+        post.tag_users.add(*self.users[1:])
+        Post.objects.create(user=self.user, about='repost', post=post)
+        Post.objects.create(brand=brand, about='brand post', location='Medellin')
+        Post.objects.create(club=club, about='club post')
+        Post.objects.create(about='no author')
+
+        comment = Comment.objects.create(
+            author=self.users[1], post=post, text='comment')
+        for author in self.users * 2:
+            Comment.objects.create(author=author, post=post, text='reply', parent=comment)
+        Comment.objects.create(author=self.user, post=post, text='other comment')
+
+        today = date.today()
+        for author in [{'user': self.user}, {'brand': brand}, {'club': club}]:
+            SportEvent.objects.create(
+                title='event', photo='sports/events/a.jpg', start=today,
+                finish=today + timedelta(days=1), geolocation='6.26864 -75.55615',
+                country='Colombia', state='Antioquia', city='Medellin', place='Atanasio',
+                **author)
+        self.post = post
+        self.client.force_authenticate(self.user)
+
+    def test_parity(self):
+        """Verifies that the compiled serializers render the JSON of the serializers."""
+        context = {'request': RequestFactory().get('/'), 'include_reaction_summary': True}
+        lists = [
+            (PostModelSerializer, Post.objects.all()),
+            (CommentModelSerializer, PrincipalComment.objects.prefetch_related(
+                Prefetch('replies', queryset=Comment.objects.inlined()))),
+            (FollowerSerializer, FollowUp.objects.all()),
+            (FollowingSerializer, FollowUp.objects.all()),
+            (SportEventModelSerializer, SportEvent.objects.all()),
+        ]
+        renderer = JSONRenderer()
+        for serializer_class, queryset in lists:
+            with self.subTest(serializer=serializer_class.__name__):
+                queryset = queryset.order_by('pk')
+                expected = serializer_class(queryset, many=True, context=context).data
+                rows = compile_serializer(serializer_class).values(queryset)
+                data = CompiledSerializer(rows, serializer_class, context=context).data
+                self.assertEqual(renderer.render(data), renderer.render(expected))
+
+    def test_api(self):
+        """Verifies that the compiled lists respond the same with fewer queries."""
+        urls = [
+            '/posts/',
+            '/posts/?include=reaction_summary',
+            f'/posts/{self.post.pk}/comments/',
+            f'/profiles/{self.user.username}/posts/',
+            f'/profiles/{self.user.username}/followers/',
+            f'/profiles/{self.user.username}/following/',
+            '/events/',
+            '/clubs/club/events/',
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                with override_settings(COMPILED_SERIALIZERS=False):
+                    expected = self.client.get(url)
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.content, expected.content)
+
+        # Both read the first replies, with their authors, in a single query
+        url = f'/posts/{self.post.pk}/comments/'
+        with override_settings(COMPILED_SERIALIZERS=False):
+            with CaptureQueriesContext(connection) as expected:
+                self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(len(queries), len(expected))
+        comment = response.json()['results'][0]
+        self.assertEqual((len(comment['replies']), comment['replies_count']), (3, 6))
+
+    def test_no_list_route(self):
+        """Verifies that the viewsets without list don't get a list route."""
+        response = self.client.get('/profiles/')
+        self.assertIn(response.status_code, (404, 405))
+
+    def test_pagination(self):
+        """Verifies the next pages of the compiled keyset pages."""
+        response = self.client.get('/posts/', {'limit': 2})
+        results = response.json()['results']
+        response = self.client.get(response.json()['next'])
+        self.assertEqual(len(results) + len(response.json()['results']), 4)
+        self.assertIsNone(response.json()['next'])
+
+    def test_sparse(self):
+        """Verifies that the sparse requests use the serializers."""
+        response = self.client.get('/posts/', {'fields': 'pk,author'})
+        self.assertEqual(set(response.json()['results'][0]), {'pk', 'author'})
+
+    def test_not_compilable(self):
+        """Verifies that the fields without columns need compiled sources."""
+
+        class PostSerializer(SparseModelSerializer):
+            author = serializers.StringRelatedField(source='specify_author')
+
+            class Meta:
+                model = Post
+                fields = ['pk', 'author']
+
+        with self.assertRaises(ImproperlyConfigured):
+            compile_serializer(PostSerializer)
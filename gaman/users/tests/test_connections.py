@@ -0,0 +1,60 @@
+"""Database connections tests."""
+
+# Utilities
+from unittest import mock
+
+# Django
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+
+# Django REST Framework
+from rest_framework.authtoken.models import Token
+
+# Models
+from gaman.users.models import Profile, User
+
+# Utils
+from gaman.utils.benchmarks import throughput
+from gaman.utils.db import check_connections
+
+
+class ConnectionsTestCase(TransactionTestCase):
+    """
+    Database connections test case.
+    The connections can't be closed inside the TestCase transaction.
+    """
+
+    def test_health_checks(self):
+        """Verifies that only the broken connections are closed."""
+        connection.ensure_connection()
+        with mock.patch.object(connection, 'close') as close:
+            check_connections()
+            close.assert_not_called()
+
+            with mock.patch.object(connection, 'is_usable', return_value=False):
+                with override_settings(DATABASE_HEALTH_CHECKS=False):
+                    check_connections()
+                close.assert_not_called()
+
+                check_connections()
+                close.assert_called_once()
+
+    def test_throughput(self):
+        """Verifies that the benchmark requests through the WSGI handler."""
+        user = User.objects.create(
+            email='test@gmail.com',
+            username='test00',
+            first_name='test00',
+            last_name='test00',
+            role='Athlete',
+            password='nKSAJBBCJW_',
+            verified=True
+        )
+        Profile.objects.create(user=user)
+        token = Token.objects.create(user=user)
+        max_age = connection.settings_dict['CONN_MAX_AGE']
+
+        result = throughput(f'/users/{user.username}/', token.key, 5, 0, True)
+        self.assertEqual(result['status'], [200])
+        self.assertGreater(result['requests_per_second'], 0)
+        self.assertEqual(connection.settings_dict['CONN_MAX_AGE'], max_age)
@@ -0,0 +1,127 @@
+"""Profile, brand, club and event counters tests."""
+
+# Utilities
+from datetime import date
+from io import StringIO
+
+# Django
+from django.core.management import call_command
+from django.urls import reverse
+
+# Django REST Framework
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+# Models
+from gaman.posts.models import Post
+from gaman.sports.models import Club, Member, SportEvent
+from gaman.users.models import FollowUp, Profile, User
+
+
+class CountersAPITestCase(APITestCase):
+    """Followers, following, posts, members and assistants counters api test case."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+
+        self.users = [
+            User.objects.create(
+                email=f'test{i}@gmail.com',
+                username=f'test0{i}',
+                first_name=f'test0{i}',
+                last_name=f'test0{i}',
+                role='Athlete',
+                password='nKSAJBBCJW_',
+                verified=True
+            ) for i in range(2)]
+        self.profiles = [Profile.objects.create(user=user) for user in self.users]
+
+        self.trainer = User.objects.create(
+            email='trainer@gmail.com',
+            username='trainer',
+            first_name='trainer',
+            last_name='trainer',
+            role='Coach',
+            password='nKSAJBBCJW_',
+            verified=True
+        )
+        self.club = Club.objects.create(slugname='club-test', trainer=self.trainer)
+
+        self.token = Token.objects.create(user=self.users[0]).key
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token}')
+
+    def test_follow_counters(self):
+        """Check that follow and unfollow update the followers and following."""
+        url = reverse('users:profiles-follow', args=[self.users[1].username])
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(
+            reverse('users:profiles-detail', args=[self.users[1].username]))
+        self.assertEqual(response.data['profile']['followers_count'], 1)
+        self.profiles[0].refresh_from_db()
+        self.assertEqual(self.profiles[0].following_count, 1)
+
+        self.client.post(url)
+        self.profiles[1].refresh_from_db()
+        self.assertEqual(self.profiles[1].followers_count, 0)
+
+    def test_club_counters(self):
+        """Check the followers, members and posts of a club."""
+        FollowUp.objects.create(follower=self.users[0], club=self.club)
+        Member.objects.create(user=self.users[1], club=self.club)
+        Post.objects.create(club=self.club, about='Club post')
+
+        response = self.client.get(
+            reverse('sports:clubs-detail', args=[self.club.slugname]))
+        self.assertEqual(response.data['followers_count'], 1)
+        self.assertEqual(response.data['members_count'], 1)
+        self.assertEqual(response.data['posts_count'], 1)
+
+        Member.objects.filter(club=self.club).delete()
+        self.club.refresh_from_db()
+        self.assertEqual(self.club.members_count, 0)
+
+    def test_assistants_counter(self):
+        """Check that add and remove assistants update the counter."""
+        event = SportEvent.objects.create(
+            user=self.trainer, title='Event', start=date.today(),
+            finish=date.today(), geolocation='0,0', country='Colombia',
+            state='Antioquia', city='Medellin', place='Stadium')
+        event.assistants.add(*self.users)
+        event.refresh_from_db()
+        self.assertEqual(event.assistants_count, 2)
+
+        self.users[0].assistants.remove(event)
+        event.refresh_from_db()
+        self.assertEqual(event.assistants_count, 1)
+
+        # Clearing the events of a user recounts only those events
+        other = SportEvent.objects.create(
+            user=self.trainer, title='Other', start=date.today(),
+            finish=date.today(), geolocation='0,0', country='Colombia',
+            state='Antioquia', city='Medellin', place='Stadium')
+        other.assistants.add(self.users[0])
+        SportEvent.objects.filter(pk=other.pk).update(assistants_count=5)
+        self.users[1].assistants.clear()
+        event.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual((event.assistants_count, other.assistants_count), (0, 5))
+
+    def test_reconcile_counters(self):
+        """Check that reconcile counters rebuilds the counters in bulk."""
+        FollowUp.objects.bulk_create([
+            FollowUp(follower=self.users[0], user=self.users[1]),
+            FollowUp(follower=self.users[1], club=self.club)])
+        Post.objects.bulk_create([Post(user=self.users[1], about='Bulk post')])
+        Profile.objects.update(followers_count=0, following_count=0, posts_count=0)
+
+        call_command('reconcile-counters', stdout=StringIO())
+        self.profiles[1].refresh_from_db()
+        self.club.refresh_from_db()
+        self.assertEqual(
+            (self.profiles[1].followers_count,
+             self.profiles[1].following_count,
+             self.profiles[1].posts_count), (1, 1, 1))
+        self.assertEqual(self.club.followers_count, 1)
@@ -0,0 +1,68 @@
+"""Synthetic dataset tests."""
+
+# Utilities
+from io import StringIO
+
+# Django
+from django.core.management import call_command
+from django.db.models import Count
+from django.test import TestCase
+
+# Models
+from gaman.posts.models import Comment, Post, PostReaction
+from gaman.sponsorships.models import Sponsorship
+from gaman.sports.models import SportEvent
+from gaman.users.models import FollowUp, Profile, User
+
+
+VOLUMES = [
+    '--users', '200', '--follows', '10', '--brands', '5', '--clubs', '6',
+    '--posts', '300', '--comments', '400', '--reactions', '500',
+    '--events', '20', '--sponsorships', '10', '--part-size', '64',
+]
+
+
+class DatasetGeneratorTestCase(TestCase):
+    """Dataset generator test."""
+
+    def generate(self, *args) -> set:
+        """Generate a dataset and return its user follows, relative to the first user."""
+        call_command('generate-dataset', *VOLUMES, *args, stdout=StringIO())
+        first = User.objects.order_by('-pk')[199].pk
+        return set(
+            (follower - first, user - first) for follower, user in FollowUp.objects.filter(
+                follower__gte=first, user__isnull=False).values_list('follower', 'user'))
+
+    def test_generate_dataset(self):
+        """Verifies the volumes, the references and the skew of the dataset."""
+        self.generate()
+        self.assertEqual(User.objects.count(), 200)
+        self.assertEqual(Profile.objects.count(), 200)
+        self.assertEqual(Post.objects.count(), 300)
+        self.assertEqual(Post.objects.filter(post__isnull=False).count(), 30)
+        self.assertEqual(Comment.objects.count(), 400)
+        self.assertEqual(SportEvent.objects.filter(lat__isnull=False).count(), 20)
+        self.assertEqual(Sponsorship.objects.count(), 10)
+        self.assertTrue(PostReaction.objects.exists())
+
+        # Replies are on the post of their comment
+        for comment in Comment.objects.filter(parent__isnull=True).prefetch_related('replies'):
+            for reply in comment.replies.all():
+                self.assertEqual(reply.post_id, comment.post_id)
+
+        # A few celebrities get most of the followers
+        followers = list(User.objects.annotate(
+            total=Count('user_followed')).order_by('-total').values_list('total', flat=True))
+        self.assertGreater(followers[0], 10 * followers[len(followers) // 2])
+
+        # The counters are reconciled
+        celebrity = User.objects.order_by('-profile__followers_count').first()
+        self.assertEqual(celebrity.profile.followers_count, followers[0])
+
+    def test_deterministic(self):
+        """Verifies that a seed generates the same data."""
+        first = self.generate()
+        second = self.generate('--no-rebuild')
+        self.assertEqual(first, second)
+        third = self.generate('--no-rebuild', '--seed', '1')
+        self.assertNotEqual(first, third)
@@ -0,0 +1,95 @@
+"""Fast JSON tests."""
+
+# Utilities
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from io import BytesIO
+from unittest import mock
+import uuid
+
+# Django
+from django.utils.translation import gettext_lazy as _
+
+# Django REST Framework
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from rest_framework.utils.serializer_helpers import ReturnDict
+
+# Models
+from gaman.posts.models import Post
+from gaman.users.models import User
+
+# Utils
+from gaman.utils import fastjson
+from gaman.utils.benchmarks import rendering
+from gaman.utils.fastjson import FastJSONParser, FastJSONRenderer
+
+
+PAYLOAD = ReturnDict({
+    'created': datetime(2026, 10, 18, 10, 30, 1, 123456, tzinfo=timezone.utc),
+    'start': date(2026, 10, 18),
+    'hour': time(10, 30),
+    'rating': Decimal('4.5'),
+    'key': uuid.UUID('12345678123456781234567812345678'),
+    'role': _('Athlete'),
+    'summaries': {1: {'Like': 2}},
+    'about': 'Línea\u2028nueva 🏃',
+    'results': [None, True, 1.5, 2 ** 40],
+}, serializer=None)
+
+
+class FastJSONTestCase(APITestCase):
+    """Fast JSON test case."""
+
+    def test_renderer(self):
+        """Verifies that the fast renderer renders the bytes of the stdlib renderer."""
+        expected = JSONRenderer().render(PAYLOAD)
+        self.assertEqual(FastJSONRenderer().render(PAYLOAD), expected)
+        with mock.patch.object(fastjson, 'orjson', None):
+            self.assertEqual(FastJSONRenderer().render(PAYLOAD), expected)
+
+        indented = FastJSONRenderer().render(PAYLOAD, 'application/json; indent=4')
+        self.assertIn(b'\n    "created"', indented)
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+    def test_parser(self):
+        """Verifies the parsed data and the parse errors."""
+        parser = FastJSONParser()
+        data = '{"about": "Línea", "reactions": [1, 2.5]}'.encode()
+        self.assertEqual(parser.parse(BytesIO(data)), {'about': 'Línea', 'reactions': [1, 2.5]})
+        self.assertEqual(
+            parser.parse(BytesIO(data.decode().encode('latin-1')), None, {'encoding': 'latin-1'}),
+            {'about': 'Línea', 'reactions': [1, 2.5]})
+        for invalid in [b'{"about": ', b'{"rating": NaN}', b'\xff']:
+            with self.assertRaises(ParseError):
+                parser.parse(BytesIO(invalid))
+
+    def test_api(self):
+        """Verifies the JSON requests and responses of the API."""
+        user = User.objects.create(
+            email='test@gmail.com',
+            username='test00',
+            first_name='test00',
+            last_name='test00',
+            role='Athlete',
+            password='nKSAJBBCJW_',
+            verified=True
+        )
+        Post.objects.create(user=user, about='Línea\u2028nueva')
+        self.client.force_authenticate(user)
+        response = self.client.patch(
+            f'/users/{user.username}/', {'phone_number': '+57 3001234567'}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()['phone_number'], '+57 3001234567')
+
+        response = self.client.get('/posts/')
+        self.assertIn('Línea\\u2028nueva'.encode(), response.content)
+        self.assertEqual(response.json()['results'][0]['about'], 'Línea\u2028nueva')
+
+    def test_rendering_benchmark(self):
+        """Verifies that the benchmark payloads render the same JSON."""
+        results = rendering(posts=5, events=5, rounds=2)
+        self.assertEqual(results['orjson'], fastjson.orjson is not None)
+        for result in results['payloads'].values():
+            self.assertTrue(result['identical'])
@@ -0,0 +1,96 @@
+"""Follow graph tests."""
+
+# Utilities
+from unittest import mock
+
+# Django
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+
+# Django REST Framework
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+# Models
+from gaman.posts.models import Post
+from gaman.users.models import FollowUp, User
+
+# Utils
+from gaman.utils.follows import FollowGraph
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    LOCAL_CACHE_TTL=60)
+class FollowGraphAPITestCase(APITestCase):
+    """Follow graph api test case."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+        cache.clear()
+        FollowGraph.local.clear()
+
+        self.users = [
+            User.objects.create(
+                email=f'test{i}@gmail.com',
+                username=f'test0{i}',
+                first_name=f'test0{i}',
+                last_name=f'test0{i}',
+                role='Athlete',
+                password='nKSAJBBCJW_',
+                verified=True
+            ) for i in range(2)]
+
+        self.token = Token.objects.create(user=self.users[0]).key
+        self.post = Post.objects.create(
+            user=self.users[1], about='Private post', privacy='Private')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token}')
+
+    def test_followed_ids_cached(self):
+        """Check that the followed are read once and then served from the cache."""
+        FollowUp.objects.create(follower=self.users[0], user=self.users[1])
+        followed = FollowGraph.followed_ids(self.users[0])
+        self.assertEqual(followed.users, {self.users[1].pk})
+
+        with self.assertNumQueries(0):
+            self.assertTrue(FollowGraph.is_following(self.users[0], self.users[1]))
+
+        FollowGraph.local.clear()
+        with self.assertNumQueries(0):
+            self.assertTrue(FollowGraph.follows_author(self.users[0], self.post))
+
+    def test_invalidate_on_follow_and_unfollow(self):
+        """Check that follow and unfollow invalidate the cached followed."""
+        url = reverse('posts:posts-detail', args=[self.post.pk])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        followup = FollowUp.objects.create(follower=self.users[0], user=self.users[1])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        followup.delete()
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_unfollow_during_read(self):
+        """Check that a read that loaded the followed before an unfollow doesn't cache them."""
+        followup = FollowUp.objects.create(follower=self.users[0], user=self.users[1])
+        load = FollowGraph.load
+
+        def racing_load(user_id):
+            rows = load(user_id)
+            followup.delete()
+            return rows
+
+        with mock.patch.object(FollowGraph, 'load', side_effect=racing_load):
+            self.assertTrue(FollowGraph.is_following(self.users[0], self.users[1]))
+
+        # The next read of this or another process, past the local tier
+        FollowGraph.local.clear()
+        self.assertFalse(FollowGraph.is_following(self.users[0], self.users[1]))
+        url = reverse('posts:posts-detail', args=[self.post.pk])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,109 @@
+"""Database indexes tests."""
+
+# Django
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase
+
+# Models
+from gaman.posts.models import Comment, CommentReaction, Post, PostReaction
+from gaman.sports.models import SportEvent
+from gaman.users.models import FollowRequest, FollowUp, User
+
+
+class IndexesTestCase(TestCase):
+    """
+    Indexes test case.
+    The plans of the hot queries must use the index designed for them,
+    the SQLite index of an unconditional unique constraint is an autoindex.
+    """
+
+    def setUp(self) -> None:
+        """Test case setup."""
+        self.user = User.objects.create(
+            email='test@gmail.com',
+            username='test00',
+            first_name='test00',
+            last_name='test00',
+            role='Athlete',
+            password='nKSAJBBCJW_',
+            verified=True
+        )
+        self.post = Post.objects.create(user=self.user, about='test')
+        self.comment = Comment.objects.create(
+            author=self.user, post=self.post, text='test')
+
+    def assertUsesIndex(self, queryset, *names):
+        """Assert that the plan of the queryset uses one of the indexes."""
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                # The test tables are small enough for a sequential scan
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+            plan = queryset.explain()
+        self.assertTrue(any(name in plan for name in names), plan)
+
+    def test_posts(self):
+        """Verifies the indexes of the posts lists."""
+        posts = Post.objects.order_by('-created')
+        self.assertUsesIndex(posts.filter(user=self.user)[:20], 'post_user_created_idx')
+        self.assertUsesIndex(
+            posts.filter(user=self.user, privacy='Public')[:20], 'post_user_privacy_idx')
+        self.assertUsesIndex(posts.filter(brand=1)[:20], 'post_brand_created_idx')
+        self.assertUsesIndex(posts.filter(club=1)[:20], 'post_club_created_idx')
+
+    def test_follows(self):
+        """Verifies the indexes of the follows and the pending follow requests."""
+        follows = FollowUp.objects.filter(follower=self.user)
+        self.assertUsesIndex(follows.filter(user=2), 'unique_follow_user')
+        self.assertUsesIndex(follows.filter(brand=2), 'unique_follow_brand')
+        self.assertUsesIndex(follows.filter(club=2), 'unique_follow_club')
+        self.assertUsesIndex(
+            FollowRequest.objects.filter(followed=self.user, accepted=False)[:20],
+            'followrequest_pending_idx')
+
+    def test_reactions(self):
+        """Verifies the indexes of the reactions lists and of the user reaction."""
+        self.assertUsesIndex(
+            PostReaction.objects.filter(post=self.post, reaction='Like')[:20],
+            'postreaction_post_idx')
+        self.assertUsesIndex(
+            PostReaction.objects.filter(user=self.user, post=self.post),
+            'unique_post_reaction', 'sqlite_autoindex_posts_postreaction')
+        self.assertUsesIndex(
+            CommentReaction.objects.filter(comment=self.comment, reaction='Like')[:20],
+            'commentreaction_comment_idx')
+        self.assertUsesIndex(
+            CommentReaction.objects.filter(user=self.user, comment=self.comment),
+            'unique_comment_reaction', 'sqlite_autoindex_posts_commentreaction')
+
+    def test_comments(self):
+        """Verifies the index of the principal comments of a post."""
+        self.assertUsesIndex(
+            Comment.objects.filter(post=self.post, parent__isnull=True).order_by(
+                '-reactions', 'created')[:20],
+            'comment_principal_idx')
+
+    def test_users_and_events(self):
+        """Verifies the indexes of the verified users and the events of a place."""
+        # The username unique index also sorts the verified users
+        self.assertUsesIndex(
+            User.objects.filter(verified=True).order_by('username', 'created')[:20],
+            'user_verified_idx', 'users_user_username', 'sqlite_autoindex_users_user')
+        self.assertUsesIndex(
+            SportEvent.objects.filter(
+                country='Colombia', state='Antioquia', city='Medellín').order_by('start')[:20],
+            'event_place_start_idx')
+
+    def test_unique_constraints(self):
+        """Verifies one reaction per user and post and one follow per pair."""
+        PostReaction.objects.create(user=self.user, post=self.post, reaction='Like')
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            PostReaction.objects.create(user=self.user, post=self.post, reaction='Love')
+
+        other = User.objects.create(
+            email='test01@gmail.com', username='test01', first_name='test01',
+            last_name='test01', role='Athlete', password='nKSAJBBCJW_')
+        FollowUp.objects.create(follower=self.user, user=other)
+        FollowUp.objects.create(follower=other, user=self.user)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            FollowUp.objects.create(follower=self.user, user=other)
@@ -0,0 +1,50 @@
+"""Bulk loader tests."""
+
+# Utilities
+from io import StringIO
+
+# Django
+from django.core.management import call_command
+from django.test import TestCase
+
+# Django REST Framework
+from rest_framework.authtoken.models import Token
+
+# Models
+from gaman.posts.models import Post
+from gaman.users.models import FollowRequest, FollowUp, Profile, User
+
+# Utils
+from gaman.utils.loaders import copy_value
+
+
+class BulkLoaderTestCase(TestCase):
+    """Seed commands loader test."""
+
+    def test_copy_value(self):
+        """Verifies the COPY text format of the values."""
+        self.assertEqual(copy_value(None), r'\N')
+        self.assertEqual(copy_value('a\tb\nc\\'), 'a\\tb\\nc\\\\')
+        self.assertEqual(copy_value(3), '3')
+
+    def test_load_users_and_posts(self):
+        """Verifies that the csv files are loaded in chunks."""
+        stdout = StringIO()
+        call_command('users-db', '--chunk-size', '128', stdout=stdout)
+        self.assertIn('users.User: 1000 rows', stdout.getvalue())
+        self.assertIn('rows/s', stdout.getvalue())
+
+        verified = User.objects.filter(verified=True).count()
+        self.assertEqual(User.objects.count(), 1000)
+        self.assertEqual(Profile.objects.count(), 1000)
+        self.assertEqual(FollowRequest.objects.count(), 10000)
+        self.assertEqual(FollowUp.objects.count(), 10000)
+        self.assertEqual(Token.objects.count(), verified)
+        self.assertFalse(Profile.objects.filter(user__role='Sponsor').exclude(sport='').exists())
+
+        call_command('posts-db', '--chunk-size', '128', stdout=StringIO())
+        posts = Post.objects.count()
+        self.assertEqual(posts, min(5000, verified * 5))
+        self.assertEqual(Post.pictures.through.objects.count(), posts)
+        self.assertFalse(User.objects.filter(
+            verified=True, post__isnull=True).exists())
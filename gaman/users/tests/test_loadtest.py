@@ -0,0 +1,76 @@
+"""Load test harness tests."""
+
+# Utilities
+import asyncio
+from io import StringIO
+
+# Django
+from django.core.management import call_command
+from django.test import LiveServerTestCase, SimpleTestCase
+
+# Utils
+from gaman.utils import loadtest
+
+
+class LoadTestUtilsTestCase(SimpleTestCase):
+    """Load test utils test."""
+
+    def test_load_collection(self):
+        """Verifies that the collection urls are resolved to routes."""
+        requests = loadtest.load_collection('Gaman.postman_collection.json')
+        request = requests['List-Profile-Posts']
+        self.assertEqual(request.route, 'users:profiles-posts')
+        self.assertEqual(request.basename, 'profiles')
+        self.assertEqual(request.kwargs, ('user__username',))
+        self.assertEqual(requests['Reply-Comment'].kwargs, ('id', 'pk'))
+        self.assertEqual(requests['React-Post'].body, {'reaction': 'Love'})
+
+    def test_ramp_profile(self):
+        """Verifies the virtual users of a ramp profile."""
+        stages = loadtest.parse_stages('10s:10,1m:50,10s:0')
+        self.assertEqual(stages[1], loadtest.Stage(60, 50))
+        self.assertEqual(loadtest.target_users(stages, 5), 5)
+        self.assertEqual(loadtest.target_users(stages, 40), 30)
+        self.assertEqual(loadtest.target_users(stages, 75), 25)
+        self.assertEqual(loadtest.target_users(stages, 100), 0)
+
+    def test_compare(self):
+        """Verifies the regressions against a baseline."""
+        baseline = {'rps': 100, 'endpoints': {
+            'List-Post': {'p95_ms': 50, 'error_rate': 0},
+            'Detail-Post': {'p95_ms': 20, 'error_rate': 0}}}
+        results = {'rps': 95, 'endpoints': {
+            'List-Post': {'p95_ms': 80, 'error_rate': 0},
+            'Detail-Post': {'p95_ms': 22, 'error_rate': 0.05}}}
+        regressions = loadtest.compare(results, baseline)
+        self.assertEqual(len(regressions), 2)
+        self.assertIn('List-Post: p95', regressions[0])
+        self.assertIn('Detail-Post: error rate', regressions[1])
+
+
+class LoadTestTestCase(LiveServerTestCase):
+    """Load test against a live server."""
+
+    def test_load_test(self):
+        """Verifies that the scenarios run and report each request."""
+        call_command(
+            'generate-dataset', '--users', '100', '--posts', '200', '--comments', '200',
+            '--reactions', '200', '--events', '10', '--sponsorships', '5',
+            '--brands', '3', '--clubs', '4', stdout=StringIO())
+        # Concurrent writes lock the in-memory SQLite database of the tests
+        scenarios = [
+            scenario for scenario in loadtest.SCENARIOS
+            if scenario.name in ('login', 'feed', 'events')]
+        test = loadtest.LoadTest(
+            self.live_server_url,
+            loadtest.load_collection('Gaman.postman_collection.json'),
+            loadtest.Fixtures(accounts=10),
+            [loadtest.Stage(0.5, 3), loadtest.Stage(1, 3)],
+            scenarios=scenarios, think=0.01)
+        results = asyncio.run(test.run())
+
+        self.assertGreater(results['requests'], 0)
+        self.assertEqual(results['error_rate'], 0, results['endpoints'])
+        self.assertIn('List-Post', results['endpoints'])
+        self.assertEqual(results['endpoints']['List-Post']['statuses'], {
+            '200': results['endpoints']['List-Post']['requests']})
@@ -0,0 +1,98 @@
+"""Request metrics tests."""
+
+# Django
+from django.test import override_settings
+from django.urls import reverse
+
+# Django REST Framework
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+# Utilities
+from prometheus_client import REGISTRY
+
+# Models
+from gaman.posts.models import Post
+from gaman.users.models import Profile, User
+from rest_framework.authtoken.models import Token
+
+
+def sample(name: str, view: str) -> float:
+    """Return a metric sample of a view, 0 if it has none yet."""
+    return REGISTRY.get_sample_value(name, {'view': view, 'method': 'GET'}) or 0
+
+
+class MetricsAPITestCase(APITestCase):
+    """Request metrics test."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+        self.user = User.objects.create(
+            email='test@gmail.com',
+            username='test00',
+            first_name='test00',
+            last_name='test00',
+            role='Athlete',
+            password='nKSAJBBCJW_',
+            verified=True
+        )
+        Profile.objects.create(user=self.user)
+        self.token = Token.objects.create(user=self.user).key
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token}')
+        for i in range(3):
+            Post.objects.create(user=self.user, about=f'Post {i}')
+
+    def test_view_metrics(self):
+        """Verifies that the requests are recorded per viewset action."""
+        view = 'ProfileViewSet.posts'
+        requests = sample('gaman_request_seconds_count', view)
+        queries = sample('gaman_request_queries_sum', view)
+        serializer = sample('gaman_request_serializer_seconds_sum', view)
+        render = sample('gaman_request_render_seconds_sum', view)
+        size = sample('gaman_response_bytes_sum', view)
+
+        response = self.client.get(reverse('users:profiles-posts', args=[self.user.username]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(sample('gaman_request_seconds_count', view), requests + 1)
+        self.assertGreater(sample('gaman_request_queries_sum', view), queries)
+        self.assertGreater(sample('gaman_request_serializer_seconds_sum', view), serializer)
+        self.assertGreater(sample('gaman_request_render_seconds_sum', view), render)
+        self.assertEqual(sample('gaman_response_bytes_sum', view), size + len(response.content))
+
+    def test_serializer_metrics(self):
+        """Verifies that the serializers of get_serializer are timed."""
+        view = 'PostViewSet.retrieve'
+        serializer = sample('gaman_request_serializer_seconds_sum', view)
+        post = Post.objects.first()
+
+        response = self.client.get(reverse('posts:posts-detail', args=[post.pk]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreater(sample('gaman_request_serializer_seconds_sum', view), serializer)
+
+    @override_settings(METRICS_SLOW_REQUEST_MS=0, METRICS_TRACE_SAMPLE_RATE=1)
+    def test_slow_request_trace(self):
+        """Verifies that the slow requests are logged with their SQL."""
+        with self.assertLogs('gaman.metrics', level='WARNING') as logs:
+            self.client.get(reverse('posts:posts-list'))
+        self.assertIn('PostViewSet.list', logs.output[0])
+        self.assertIn('SELECT', logs.output[0])
+
+    def test_metrics_endpoint(self):
+        """Verifies the Prometheus export and its token."""
+        self.client.get(reverse('posts:posts-list'))
+        self.client.credentials()
+        for token in ['', 'secret']:
+            with override_settings(METRICS_TOKEN=token):
+                response = self.client.get('/metrics')
+                self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ')
+        self.assertEqual(self.client.get('/metrics').status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer secret')
+        with override_settings(METRICS_TOKEN='secret'):
+            response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(b'gaman_request_seconds_bucket{le="0.005",method="GET"', response.content)
+        self.assertIn(b'view="PostViewSet.list"', response.content)
@@ -0,0 +1,102 @@
+"""Replica router tests."""
+
+# Django
+from django.db import connections, transaction
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+# Django REST Framework
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+# Utilities
+from prometheus_client import REGISTRY
+
+# Models
+from gaman.users.models import Profile, User
+
+# Utils
+from gaman.utils.routers import ReplicaRouter, state
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    DATABASE_REPLICA_WEIGHTS={'replica': 1})
+class ReplicaRouterTestCase(TransactionTestCase):
+    """
+    Replica router test case.
+    The replica is a stand-in of the default database, it only
+    sees the committed rows, so the requests run outside a TestCase.
+    """
+
+    databases = {'default', 'replica'}
+
+    def setUp(self) -> None:
+        """Test case setup."""
+        self.user = User.objects.create(
+            email='test@gmail.com',
+            username='test00',
+            first_name='test00',
+            last_name='test00',
+            role='Athlete',
+            password='nKSAJBBCJW_',
+            verified=True
+        )
+        Profile.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=self.user).key}')
+
+    def replica_queries(self, method: str, url: str, **kwargs) -> int:
+        """Return the queries of a request that were sent to the replica."""
+        with CaptureQueriesContext(connections['replica']) as queries:
+            response = getattr(self.client, method)(url, **kwargs)
+        self.assertLess(response.status_code, 400)
+        return len(queries)
+
+    def test_safe_actions(self):
+        """Verifies that only the safe actions read from the replica."""
+        self.assertGreater(self.replica_queries('get', reverse('users:users-list')), 0)
+        url = reverse('users:profiles-followers', args=[self.user.username])
+        self.assertGreater(self.replica_queries('get', url), 0)
+        with override_settings(DATABASE_REPLICA_ACTIONS=['list']):
+            self.assertEqual(self.replica_queries('get', url), 0)
+
+    def test_replica_metrics(self):
+        """Verifies that the request metrics count the queries sent to the replica."""
+        labels = {'view': 'ProfileViewSet.followers', 'method': 'GET'}
+        queries = REGISTRY.get_sample_value('gaman_request_queries_sum', labels) or 0
+        url = reverse('users:profiles-followers', args=[self.user.username])
+        replica = self.replica_queries('get', url)
+        self.assertGreater(replica, 0)
+        self.assertGreaterEqual(
+            REGISTRY.get_sample_value('gaman_request_queries_sum', labels) - queries, replica)
+
+    def test_read_your_writes(self):
+        """Verifies that a client reads from the primary after its writes."""
+        url = reverse('users:users-detail', args=[self.user.username])
+        self.assertEqual(self.replica_queries('patch', url, data={'phone_number': '+57 3001234567'}), 0)
+        self.assertEqual(self.replica_queries('get', url), 0)
+
+        # Other clients still read from the replica
+        self.client.credentials()
+        self.client.force_authenticate(self.user)
+        self.assertGreater(self.replica_queries('get', url), 0)
+
+    def test_atomic_blocks(self):
+        """Verifies that the reads of the atomic blocks of a view and after writes go to the primary."""
+        router = ReplicaRouter()
+        state.reset()
+        state.replica = 'replica'
+        try:
+            with transaction.atomic():  # ATOMIC_REQUESTS
+                self.assertEqual(router.db_for_read(User), 'replica')
+                self.assertIsNone(router.db_for_read(Token))
+                with transaction.atomic():
+                    self.assertIsNone(router.db_for_read(User))
+                self.assertEqual(router.db_for_write(User), 'default')
+                state.wrote = True
+                self.assertIsNone(router.db_for_read(User))
+        finally:
+            state.reset()
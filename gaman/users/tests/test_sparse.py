@@ -0,0 +1,92 @@
+"""Sparse fieldsets tests."""
+
+# Django REST Framework
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+
+# Models
+from gaman.posts.models import Post
+from gaman.users.models import User
+
+# Serializers
+from gaman.posts.serializers import PostModelSerializer
+
+# Utils
+from gaman.utils.sparse import parse, trim_queryset
+
+
+class SparseFieldsTestCase(APITestCase):
+    """Sparse fieldsets test case."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+        self.user = User.objects.create(
+            email='test@gmail.com',
+            username='test00',
+            first_name='test00',
+            last_name='test00',
+            role='Athlete',
+            password='nKSAJBBCJW_',
+            verified=True
+        )
+        self.post = Post.objects.create(user=self.user, about='original')
+        self.repost = Post.objects.create(user=self.user, about='repost', post=self.post)
+        self.client.force_authenticate(self.user)
+
+    def serializer(self, query: str) -> PostModelSerializer:
+        """Return a posts serializer of a GET request with the query."""
+        request = Request(APIRequestFactory().get(f'/posts/?{query}'))
+        return PostModelSerializer(context={'request': request})
+
+    def test_parse(self):
+        """Verifies the trees of the dotted paths."""
+        self.assertEqual(
+            parse('pk, post.about,post.author,,'),
+            {'pk': {}, 'post': {'about': {}, 'author': {}}})
+
+    def test_fields(self):
+        """Verifies that the fields out of the fieldset are pruned."""
+        response = self.client.get('/posts/', {'fields': 'pk,about,post.about'})
+        self.assertEqual(response.status_code, 200)
+        repost = response.json()['results'][0]
+        self.assertEqual(set(repost), {'pk', 'about', 'post'})
+        self.assertEqual(repost['post'], {'about': 'original'})
+
+        response = self.client.get('/posts/')
+        self.assertIn('shares', response.json()['results'][0])
+
+    def test_expand(self):
+        """Verifies that the nested serializers out of expand are collapsed to primary keys."""
+        response = self.client.get('/posts/', {'fields': 'pk,post', 'expand': ''})
+        repost = response.json()['results'][0]
+        self.assertEqual(repost, {'pk': self.repost.pk, 'post': self.post.pk})
+
+        response = self.client.get('/posts/', {'fields': 'pk,post', 'expand': 'post'})
+        self.assertEqual(response.json()['results'][0]['post']['about'], 'original')
+
+    def test_trim_queryset(self):
+        """Verifies that the related lookups of the pruned fields are trimmed."""
+        posts = Post.objects.select_related('post').prefetch_related(
+            'pictures', 'tag_users', 'post__pictures')
+        trimmed = trim_queryset(posts, self.serializer('fields=pk,about,post.about'))
+        self.assertEqual(trimmed.query.select_related, {'post': {}})
+        self.assertEqual(trimmed._prefetch_related_lookups, ())
+
+        trimmed = trim_queryset(posts, self.serializer('fields=pk,post&expand='))
+        self.assertFalse(trimmed.query.select_related)
+        self.assertIs(trim_queryset(posts, self.serializer('')), posts)
+
+        with self.assertNumQueries(1):
+            list(trimmed)
+
+    def test_unsafe_methods(self):
+        """Verifies that the fieldsets only apply to the GET requests."""
+        response = self.client.patch(
+            f'/users/{self.user.username}/?fields=username',
+            {'phone_number': '+57 3001234567'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('phone_number', response.json())
+
+        response = self.client.get(f'/users/{self.user.username}/', {'fields': 'username'})
+        self.assertEqual(response.json()['username'], self.user.username)
+        self.assertNotIn('phone_number', response.json())
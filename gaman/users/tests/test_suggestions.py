@@ -0,0 +1,86 @@
+"""Follow suggestions tests."""
+
+# Django
+from django.urls import reverse
+
+# Django REST Framework
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+# Models
+from gaman.sponsorships.models import Brand
+from gaman.sports.models import Club, Member
+from gaman.users.models import FollowSuggestion, FollowUp, Profile, User
+
+# Tasks
+from taskapp.tasks.suggestions import refresh_suggestions
+
+
+class SuggestionsAPITestCase(APITestCase):
+    """Follow suggestions api test case."""
+
+    def setUp(self) -> None:
+        """Test case setup."""
+
+        self.users = [
+            User.objects.create(
+                email=f'test{i}@gmail.com',
+                username=f'test0{i}',
+                first_name=f'test0{i}',
+                last_name=f'test0{i}',
+                role='Athlete',
+                password='nKSAJBBCJW_',
+                verified=True
+            ) for i in range(5)]
+        for user in self.users:
+            Profile.objects.create(user=user, sport='Football', country='Colombia')
+
+        self.brand = Brand.objects.create(slugname='brand-test', sponsor=self.users[4])
+        self.club = Club.objects.create(slugname='club-test', trainer=self.users[4])
+
+        # users[0] follows users[1] and users[2], they follow users[3],
+        # the brand and users[2] is member of the club
+        FollowUp.objects.create(follower=self.users[0], user=self.users[1])
+        FollowUp.objects.create(follower=self.users[0], user=self.users[2])
+        for user in self.users[1:3]:
+            FollowUp.objects.create(follower=user, user=self.users[3])
+            FollowUp.objects.create(follower=user, brand=self.brand)
+        FollowUp.objects.create(follower=self.users[1], user=self.users[0])
+        Member.objects.create(user=self.users[2], club=self.club)
+
+        self.token = Token.objects.create(user=self.users[0]).key
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token}')
+        self.url = reverse('users:profiles-suggestions')
+
+    def test_suggestions(self):
+        """Check that the suggestions are ranked by mutual follows."""
+        refresh_suggestions()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        names = [item['name'] for item in response.data]
+        self.assertEqual(names, ['test03', 'brand-test', 'club-test'])
+        self.assertEqual(response.data[0]['mutual'], 2)
+        self.assertNotIn(self.users[1].username, names)
+        self.assertNotIn(self.users[0].username, names)
+
+    def test_refresh_on_follow(self):
+        """Check that a follow hides the suggestion and marks it stale."""
+        refresh_suggestions()
+        self.client.post(reverse('users:profiles-follow', args=[self.users[3].username]))
+
+        response = self.client.get(self.url)
+        self.assertNotIn('test03', [item['name'] for item in response.data])
+        self.assertTrue(FollowSuggestion.objects.get(user=self.users[0]).stale)
+
+        refresh_suggestions()
+        suggestion = FollowSuggestion.objects.get(user=self.users[0])
+        self.assertFalse(suggestion.stale)
+        self.assertNotIn('test03', [item['name'] for item in suggestion.items])
+
+    def test_without_suggestions(self):
+        """Check that a user without computed suggestions gets a empty list."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
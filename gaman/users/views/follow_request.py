@@ -16,8 +16,12 @@ from gaman.users.models import FollowRequest, User
 from gaman.users.serializers import (AcceptFollowRequestSerializer,
                                      FollowRequestModelSerializer)
 
+# Utils
+from gaman.utils.sparse import SparseFieldsMixin
 
-class FollowRequestViewSet(mixins.ListModelMixin,
+
+class FollowRequestViewSet(SparseFieldsMixin,
+                           mixins.ListModelMixin,
                            mixins.RetrieveModelMixin,
                            mixins.UpdateModelMixin,
                            mixins.DestroyModelMixin,
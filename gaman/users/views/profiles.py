@@ -14,7 +14,7 @@ from gaman.users.permissions import IsFollower, IsProfileOwner
 
 # Models
 from gaman.posts.models import Post
-from gaman.users.models import Profile, FollowRequest, FollowUp, User
+from gaman.users.models import Profile, FollowRequest, FollowSuggestion, FollowUp
 from gaman.sponsorships.models import Rating, Sponsorship
 from gaman.sports.models import Invitation
 
@@ -29,8 +29,14 @@ from gaman.users.serializers import (FollowRequestModelSerializer,
                                      ProfileModelSerializer,
                                      UserModelSerializer)
 
+# Utils
+from gaman.utils.compiled import CompiledSerializerMixin
+from gaman.utils.follows import FollowGraph
+from gaman.utils.pagination import FeedPagination
 
-class ProfileViewSet(mixins.RetrieveModelMixin,
+
+class ProfileViewSet(CompiledSerializerMixin,
+                     mixins.RetrieveModelMixin,
                      mixins.UpdateModelMixin,
                      viewsets.GenericViewSet):
     """
@@ -42,6 +48,8 @@ class ProfileViewSet(mixins.RetrieveModelMixin,
     queryset = Profile.objects.filter(
         user__verified=True).select_related('user')
     serializer_class = ProfileModelSerializer
+    pagination_class = FeedPagination
+    compiled_actions = ('posts', 'followers', 'following')
     lookup_field = 'user__username'
 
     def get_permissions(self):
@@ -62,7 +70,7 @@ class ProfileViewSet(mixins.RetrieveModelMixin,
         Add rating average if the profile is sponsor.
         """
         profile = self.get_object()
-        data = UserModelSerializer(profile.user).data
+        data = UserModelSerializer(profile.user, context=self.get_serializer_context()).data
         if profile.user.role == 'Sponsor':
             rating = Rating.objects.filter(
                 sponsorship__sponsor=profile.user).aggregate(Avg('rating'))
@@ -76,21 +84,17 @@ class ProfileViewSet(mixins.RetrieveModelMixin,
         Restric according to the user requesting and privacy of posts.
         """
         profile = self.get_object()
-        followers = User.objects.filter(
-            pk__in=[FollowUp.objects.filter(user=profile.user).values('follower__pk')])
-
-        if request.user.profile == profile or request.user in followers:
+        user = request.user
+        if profile.user_id == user.pk or FollowGraph.is_following(user, profile.user):
             conditions = {'user': profile.user}
         else:
             conditions = {'user': profile.user, 'privacy': 'Public'}
         posts = Post.objects.filter(
             **conditions
-        ).select_related(
-            'user', 'brand', 'club', 'post'
-        ).prefetch_related(
-            'pictures', 'videos', 'tag_users')
-        data = PostModelSerializer(posts, many=True).data
-        return Response(data, status=status.HTTP_200_OK)
+        ).select_related('post')
+        page = self.paginate_queryset(self.prepare_queryset(posts, PostModelSerializer))
+        data = self.serialize(page, PostModelSerializer)
+        return self.paginator.get_list_response(data)
 
     @action(detail=True)
     def followers(self, request, *args, **kwargs):
@@ -98,17 +102,18 @@ class ProfileViewSet(mixins.RetrieveModelMixin,
         profile = self.get_object()
         followers = FollowUp.objects.filter(
             user=profile.user).select_related('follower')
-        data = FollowerSerializer(followers, many=True).data
-        return Response(data, status=status.HTTP_200_OK)
+        page = self.paginate_queryset(self.prepare_queryset(followers, FollowerSerializer))
+        data = self.serialize(page, FollowerSerializer)
+        return self.paginator.get_list_response(data)
 
     @action(detail=True)
     def following(self, request, *args, **kwargs):
         """List all following."""
         profile = self.get_object()
-        following = FollowUp.objects.filter(
-            follower=profile.user).select_related('user', 'brand', 'club')
-        data = FollowingSerializer(following, many=True).data
-        return Response(data, status=status.HTTP_200_OK)
+        following = FollowUp.objects.filter(follower=profile.user)
+        page = self.paginate_queryset(self.prepare_queryset(following, FollowingSerializer))
+        data = self.serialize(page, FollowingSerializer)
+        return self.paginator.get_list_response(data)
 
     @action(detail=True, methods=['post'])
     def follow(self, request, *args, **kwargs):
@@ -150,7 +155,8 @@ class ProfileViewSet(mixins.RetrieveModelMixin,
         """List user's sponsorships."""
         profile = self.get_object()
         sponsorships = Sponsorship.objects.filter(athlete=profile.user)
-        data = SponsorshipModelSerializer(sponsorships, many=True).data
+        data = SponsorshipModelSerializer(
+            sponsorships, many=True, context=self.get_serializer_context()).data
         return Response(data, status=status.HTTP_200_OK)
 
     @action(detail=True)
@@ -159,5 +165,21 @@ class ProfileViewSet(mixins.RetrieveModelMixin,
         profile = self.get_object()
         invitations = Invitation.objects.filter(
             invited=profile.user).select_related('issued_by', 'invited', 'club')
-        data = InvitationModelSerializer(invitations, many=True).data
+        data = InvitationModelSerializer(
+            self.trim_queryset(invitations, InvitationModelSerializer),
+            many=True, context=self.get_serializer_context()).data
+        return Response(data, status=status.HTTP_200_OK)
+
+    @action(detail=False)
+    def suggestions(self, request, *args, **kwargs):
+        """
+        List the users, brands and clubs suggested to follow.
+        They are computed offline, the already followed are skipped.
+        """
+        user = request.user
+        items = FollowSuggestion.objects.filter(
+            user=user).values_list('items', flat=True).first() or []
+        followed = FollowGraph.followed_ids(user)
+        followed = {'user': followed.users, 'brand': followed.brands, 'club': followed.clubs}
+        data = [item for item in items if item['id'] not in followed[item['type']]]
         return Response(data, status=status.HTTP_200_OK)
@@ -28,14 +28,18 @@ from gaman.users.serializers import (AccountVerificationSerializer,
                                      UserModelSerializer,
                                      UserSignUpSerializer)
 
+# Utils
+from gaman.utils.sparse import SparseFieldsMixin
 
-class UserViewSet(mixins.ListModelMixin,
+
+class UserViewSet(SparseFieldsMixin,
+                  mixins.ListModelMixin,
                   mixins.RetrieveModelMixin,
                   mixins.UpdateModelMixin,
                   viewsets.GenericViewSet):
     """
     User view set.
-    Handle signup, login, account verification, refresh 
+    Handle signup, login, logout, account verification, refresh 
     token, update email, restore and update password.
     """
 
@@ -44,7 +48,7 @@ class UserViewSet(mixins.ListModelMixin,
     lookup_field = 'username'
     filter_backends = (SearchFilter, OrderingFilter, DjangoFilterBackend)
     search_fields = ('username',)
-    ordering_fields = ('username',)
+    ordering_fields = ('username', 'profile__followers_count')
     ordering = ('username', 'created')
     filter_fields = ('profile__sport', 'profile__country', 'role')
 
@@ -81,6 +85,13 @@ class UserViewSet(mixins.ListModelMixin,
             'user': UserModelSerializer(user).data, 'access_token': token}
         return Response(data, status=status.HTTP_201_CREATED)
 
+    @action(detail=False, methods=['post'])
+    def logout(self, request):
+        """User sign out, the token stops working."""
+        request.auth.delete()
+        data = {'message': 'See you soon.'}
+        return Response(data, status=status.HTTP_200_OK)
+
     @action(detail=False, methods=['post'])
     def verify(self, request):
         """Account verification."""
@@ -124,8 +135,8 @@ class UserViewSet(mixins.ListModelMixin,
         serializer = UpdatePasswordSerializer(
             data=request.data, context={'user': request.user})
         serializer.is_valid(raise_exception=True)
-        serializer.save()
-        data = {'message': 'Your password has been updated.'}
+        token = serializer.save()
+        data = {'message': 'Your password has been updated.', 'access_token': token}
         return Response(data, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=['post'])
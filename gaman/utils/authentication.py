@@ -0,0 +1,102 @@
+"""Authentication utils."""
+
+# Utilities
+import hashlib
+import pickle
+import time
+import typing as t
+
+# Django
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+
+# Django REST Framework
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+# Models
+from gaman.users.models import User
+
+# Utils
+from gaman.utils.cache import LocalCache
+
+
+class TokenCache:
+    """
+    Token authentication cache.
+
+    Keeps a snapshot of the user of each token (and the token
+    creation time, for the expiry) in the shared cache (redis) and
+    in a per-process LRU tier, so the authentication doesn't query
+    authtoken_token on the warm path. The snapshots are invalidated
+    when the token is deleted or rotated and when the user is saved
+    (logout, password or email change, deactivation).
+    """
+
+    local = LocalCache()
+
+    @staticmethod
+    def key(token: str) -> str:
+        """Return the cache key of a token, the token itself isn't written."""
+        return f'auth:{hashlib.sha256(token.encode()).hexdigest()}'
+
+    @classmethod
+    def get(cls, token: str) -> t.Optional[t.Tuple[float, User]]:
+        """Return the creation time and user of a token, or None if it doesn't exist."""
+        key = cls.key(token)
+        snapshot = cls.local.get(key)
+        if snapshot is None:
+            snapshot = cache.get(key)
+            if snapshot is None:
+                try:
+                    row = Token.objects.select_related('user').get(key=token)
+                except Token.DoesNotExist:
+                    return None
+                snapshot = pickle.dumps((row.created.timestamp(), row.user))
+                cache.set(key, snapshot, settings.AUTH_TOKEN_CACHE_TTL)
+            cls.local.set(key, snapshot)
+        # Every request gets its own user instance
+        return pickle.loads(snapshot)
+
+    @classmethod
+    def invalidate(cls, *tokens: str) -> None:
+        """Remove the snapshots of some tokens from the caches."""
+        keys = [cls.key(token) for token in tokens]
+        for key in keys:
+            cls.local.delete(key)
+        cache.delete_many(keys)
+
+
+def is_expired(created: float) -> bool:
+    """Return if a token created at a timestamp has expired."""
+    return bool(settings.AUTH_TOKEN_TTL) and created + settings.AUTH_TOKEN_TTL < time.time()
+
+
+def rotate_token(user: User) -> str:
+    """Replace the token of a user, the old one stops working everywhere."""
+    Token.objects.filter(user=user).delete()
+    return Token.objects.create(user=user).key
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication served from the token cache.
+    Tokens older than AUTH_TOKEN_TTL seconds (when it's set) are
+    rejected, the login replaces them.
+    """
+
+    def authenticate_credentials(self, key):
+        """Return the user and token of a key."""
+        snapshot = TokenCache.get(key)
+        if snapshot is None:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        created, user = snapshot
+        if is_expired(created):
+            raise exceptions.AuthenticationFailed(_('Token has expired.'))
+
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+        return (user, Token(key=key, user=user))
@@ -0,0 +1,93 @@
+"""Polymorphic authors utils."""
+
+# Utilities
+from collections import defaultdict
+
+# Django
+from django.db.models import F, OuterRef, Subquery
+
+
+# Author foreign keys, in their precedence, and the name field of their models
+AUTHOR_NAMES = {'user': 'username', 'brand': 'slugname', 'club': 'slugname'}
+
+
+def author_field(obj, fields=tuple(AUTHOR_NAMES)):
+    """Return the name of the first author foreign key set in an object, None if none is."""
+    for field in fields:
+        if getattr(obj, f'{field}_id') is not None:
+            return field
+    return None
+
+
+def resolve_authors(objects, fields=tuple(AUTHOR_NAMES), owners: dict = None) -> list:
+    """
+    Load the authors of a page of objects with a query per author type,
+    the foreign keys already loaded are kept. owners maps the types to
+    the relation of their user, e.g. {'brand': 'sponsor'}, to load them
+    in the same query.
+    """
+    objects = list(objects)
+    pending = defaultdict(list)
+    for obj in objects:
+        field = author_field(obj, fields)
+        if field is not None and not obj._meta.get_field(field).is_cached(obj):
+            pending[field].append(obj)
+    for field, authored in pending.items():
+        queryset = authored[0]._meta.get_field(field).related_model._default_manager.all()
+        if owners and field in owners:
+            queryset = queryset.select_related(owners[field])
+        authors = queryset.in_bulk({getattr(obj, f'{field}_id') for obj in authored})
+        for obj in authored:
+            setattr(obj, field, authors.get(getattr(obj, f'{field}_id')))
+    return objects
+
+
+def fill_authors(model, queryset=None) -> int:
+    """
+    Denormalize the author of the rows without it, the bulk loads
+    skip save(). Works with the historical models of the migrations.
+    """
+    queryset = model._default_manager.all() if queryset is None else queryset
+    filled = 0
+    # The rows filled by a type are out of the next ones
+    for field, name in AUTHOR_NAMES.items():
+        related = model._meta.get_field(field).related_model
+        filled += queryset.filter(**{'author_type': '', f'{field}__isnull': False}).update(
+            author_type=field,
+            author_pk=F(f'{field}_id'),
+            author_name=Subquery(
+                related._default_manager.filter(pk=OuterRef(f'{field}_id')).values(name)[:1]))
+    return filled
+
+
+def remember_name(author, update_fields=None) -> None:
+    """Keep the saved name of an author before a save, renamed() compares it."""
+    field = AUTHOR_NAMES[author._meta.model_name]
+    name = getattr(author, field)
+    if author.pk is not None and (update_fields is None or field in update_fields):
+        name = author._meta.model._default_manager.filter(
+            pk=author.pk).values_list(field, flat=True).first()
+    author._saved_name = name
+
+
+def renamed(author) -> bool:
+    """Return if the last save of an author changed its name."""
+    name = getattr(author, AUTHOR_NAMES[author._meta.model_name])
+    return author.__dict__.get('_saved_name', name) != name
+
+
+def rename_author(model, author) -> int:
+    """Update the author name of the rows of a renamed user, brand or club."""
+    field = author._meta.model_name
+    name = getattr(author, AUTHOR_NAMES[field])
+    return model._default_manager.filter(
+        **{field: author, 'author_type': field}).exclude(author_name=name).update(author_name=name)
+
+
+def release_author(model, author) -> int:
+    """Denormalize again the rows of a deleted author, their foreign key was set to null."""
+    field = author._meta.model_name
+    rows = model._default_manager.filter(author_type=field, author_pk=author.pk)
+    pks = list(rows.values_list('pk', flat=True))
+    rows.update(author_type='', author_pk=None, author_name=None)
+    return fill_authors(model, model._default_manager.filter(pk__in=pks))
@@ -0,0 +1,4 @@
+from .api import *
+from .compiled import *
+from .persistence import *
+from .renderers import *
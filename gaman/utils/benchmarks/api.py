@@ -0,0 +1,240 @@
+"""API benchmark utils."""
+
+# Utilities
+from datetime import date, timedelta
+from io import StringIO
+import random
+import re
+import time
+import numpy as np
+
+# Django
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+# Django REST Framework
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+# Models
+from gaman.posts.models import Comment, CommentReaction, Post, PostReaction
+from gaman.sponsorships.models import Brand, Rating, Sponsorship
+from gaman.sports.models import Club, League, Member, SportEvent
+from gaman.users.models import FollowRequest, User
+
+# Utils
+from gaman.utils.authors import fill_authors
+
+# Urls
+from gaman.posts.urls import router as posts_router
+from gaman.sponsorships.urls import router as sponsorships_router
+from gaman.sports.urls import router as sports_router
+from gaman.users.urls import router as users_router
+
+
+ROUTERS = {
+    'users': users_router,
+    'posts': posts_router,
+    'sponsorships': sponsorships_router,
+    'sports': sports_router,
+}
+
+
+class Recorder:
+    """Count the SQL queries and the rows fetched from their cursors in a block."""
+
+    def __init__(self):
+        self.queries = CaptureQueriesContext(connection)
+        self.rows = 0
+
+    def counted(self, fetch, many: bool = True):
+        """Return a cursor fetch method that counts the rows it returns."""
+        def wrapper(*args, **kwargs):
+            rows = fetch(*args, **kwargs)
+            if many:
+                self.rows += len(rows)
+            elif rows is not None:
+                self.rows += 1
+            return rows
+        return wrapper
+
+    def count_rows(self, execute, sql, params, many, context):
+        """Database execute wrapper that counts the rows fetched after the query."""
+        cursor = context['cursor']
+        cursor.fetchone = self.counted(cursor.cursor.fetchone, many=False)
+        cursor.fetchmany = self.counted(cursor.cursor.fetchmany)
+        cursor.fetchall = self.counted(cursor.cursor.fetchall)
+        return execute(sql, params, many, context)
+
+    def __enter__(self):
+        self.wrapper = connection.execute_wrapper(self.count_rows)
+        self.wrapper.__enter__()
+        self.queries.__enter__()
+        return self
+
+    def __exit__(self, *args):
+        self.queries.__exit__(*args)
+        self.wrapper.__exit__(*args)
+
+    @property
+    def query_count(self) -> int:
+        return len(self.queries)
+
+
+def seed(random_seed: int = 0) -> dict:
+    """
+    Load the generators data and the objects they don't create.
+    Return the url kwargs of each router basename.
+    """
+    random.seed(random_seed)
+    for command in ['users-db', 'leagues-db', 'clubs-db', 'posts-db', 'events-db']:
+        call_command(command, stdout=StringIO())
+
+    # Some generated names don't match the url patterns
+    user = User.objects.filter(
+        verified=True, role='Athlete', username__regex=r'^[a-zA-Z0-9]+$').first()
+    sponsor = User.objects.filter(verified=True, role='Sponsor').first()
+    users = list(User.objects.filter(verified=True).exclude(pk=user.pk)[:100])
+    club = Club.objects.filter(slugname__regex=r'^[a-zA-Z0-9_-]+$').first()
+    league = League.objects.first()
+    post = Post.objects.filter(user=user).first()
+    today = date.today()
+
+    brand = Brand.objects.create(slugname='benchmark-brand', sponsor=sponsor)
+    brand_posts = Post.objects.bulk_create([
+        Post(brand=brand, about=f'Brand post {i}') for i in range(50)])
+    club_posts = Post.objects.bulk_create([
+        Post(club=club, about=f'Club post {i}') for i in range(50)])
+    fill_authors(Post)
+    event_data = {
+        'start': today + timedelta(days=1), 'finish': today + timedelta(days=2),
+        'geolocation': '6.26864 -75.55615', 'country': 'Colombia',
+        'state': 'Antioquia', 'city': 'Medellin', 'place': 'Atanasio Girardot'}
+    brand_event = SportEvent.objects.create(brand=brand, title='Brand event', **event_data)
+    club_event = SportEvent.objects.create(club=club, title='Club event', **event_data)
+    club_event.assistants.add(*users)
+
+    Member.objects.bulk_create([Member(user=member, club=club) for member in users])
+    comments = Comment.objects.bulk_create([
+        Comment(author=author, post=post, text='Benchmark comment') for author in users])
+    Comment.objects.bulk_create([
+        Comment(
+            author=author, post=post, text='Benchmark reply', parent=comments[0],
+            path=comments[0].thread_path(), depth=1, position=i + 1)
+        for i, author in enumerate(users[:20])])
+    PostReaction.objects.bulk_create([
+        PostReaction(user=author, post=post, reaction='Like') for author in users])
+    CommentReaction.objects.bulk_create([
+        CommentReaction(user=author, comment=comments[0], reaction='Love') for author in users])
+
+    sponsorship = Sponsorship.objects.create(
+        sponsor=sponsor, athlete=user, brand=brand,
+        start=today, finish=today + timedelta(days=30), active=True)
+    rating = Rating.objects.create(sponsorship=sponsorship, qualifier=user, rating=4.5)
+    follow_request = FollowRequest.objects.create(follower=users[0], followed=user)
+
+    call_command('rebuild-timelines', stdout=StringIO())
+    call_command('reconcile-counters', stdout=StringIO())
+
+    return {
+        'requester': user,
+        'posts': {'pk': post.pk},
+        'comments': {'id': post.pk, 'pk': comments[0].pk},
+        'users': {'username': user.username},
+        'profiles': {'user__username': user.username},
+        'follow_requests': {'username': user.username, 'pk': follow_request.pk},
+        'brands': {'slugname': brand.slugname},
+        'sponsorships': {'pk': sponsorship.pk},
+        'ratings': {'id': sponsorship.pk, 'pk': rating.pk},
+        'brand-posts': {'slugname': brand.slugname, 'pk': brand_posts[0].pk},
+        'brand-events': {'slugname': brand.slugname, 'pk': brand_event.pk},
+        'leagues': {'slugname': league.slugname},
+        'clubs': {'slugname': club.slugname},
+        'events': {'pk': club_event.pk},
+        'members': {'slugname': club.slugname, 'user__username': users[0].username},
+        'club-events': {'slugname': club.slugname, 'pk': club_event.pk},
+        'club-posts': {'slugname': club.slugname, 'pk': club_posts[0].pk},
+    }
+
+
+def endpoints(fixtures: dict):
+    """
+    Yield the name, url and allowed methods of the router endpoints.
+    The url kwargs are taken from the fixtures of the route basename.
+    """
+    for namespace, router in ROUTERS.items():
+        for prefix, viewset, basename in router.registry:
+            for route in router.get_routes(viewset):
+                name = route.name.format(basename=basename)
+                regex = route.url.format(
+                    prefix=prefix, lookup=router.get_lookup_regex(viewset), trailing_slash='/')
+                kwargs = {
+                    group: fixtures[basename][group]
+                    for group in re.compile(regex).groupindex}
+                methods = router.get_method_map(viewset, route.mapping)
+                if methods:
+                    yield name, reverse(f'{namespace}:{name}', kwargs=kwargs), set(methods)
+
+
+def percentile(values: list, q: float) -> float:
+    """Return the q percentile of the values in milliseconds."""
+    return round(float(np.percentile(values, q)) * 1000, 2)
+
+
+def measure(client: APIClient, url: str, iterations: int) -> dict:
+    """Request a url and return its status, queries, rows and latency percentiles."""
+    client.get(url)  # Warm up
+    durations = []
+    for _ in range(iterations):
+        with Recorder() as recorder:
+            start = time.perf_counter()
+            response = client.get(url)
+            durations.append(time.perf_counter() - start)
+    return {
+        'status': response.status_code,
+        'queries': recorder.query_count,
+        'rows': recorder.rows,
+        'p50_ms': percentile(durations, 50),
+        'p95_ms': percentile(durations, 95),
+    }
+
+
+def run(fixtures: dict, iterations: int = 20) -> dict:
+    """Benchmark the GET endpoints, the other methods are listed as skipped."""
+    client = APIClient()
+    token, _ = Token.objects.get_or_create(user=fixtures['requester'])
+    client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+
+    results, skipped = {}, []
+    for name, url, methods in endpoints(fixtures):
+        if 'get' in methods:
+            results[name] = {'url': url, **measure(client, url, iterations)}
+        else:
+            skipped.append(name)
+    return {'endpoints': results, 'skipped': sorted(skipped)}
+
+
+def make_budgets(results: dict) -> dict:
+    """Return budgets from the results, with slack for the latencies."""
+    return {
+        name: {
+            'queries': result['queries'],
+            'rows': result['rows'],
+            'p95_ms': round(max(result['p95_ms'] * 3, result['p95_ms'] + 100), 2),
+        } for name, result in results['endpoints'].items()}
+
+
+def check_budgets(results: dict, budgets: dict) -> list:
+    """Return the budget violations of the results."""
+    violations = []
+    for name, result in results['endpoints'].items():
+        budget = budgets.get(name)
+        if budget is None:
+            violations.append(f'{name}: no budget')
+            continue
+        for metric, limit in budget.items():
+            if result[metric] > limit:
+                violations.append(f'{name}: {metric} {result[metric]} > {limit}')
+    return violations
@@ -0,0 +1,84 @@
+"""Compiled serializers benchmark utils."""
+
+# Django
+from django.db import connection
+from django.db.models import Prefetch
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+# Django REST Framework
+from rest_framework.renderers import JSONRenderer
+
+# Models
+from gaman.posts.models import Comment, Post, PrincipalComment
+from gaman.sports.models import SportEvent
+from gaman.users.models import FollowUp
+
+# Serializers
+from gaman.posts.serializers import CommentModelSerializer, PostModelSerializer
+from gaman.sports.serializers import SportEventModelSerializer
+from gaman.users.serializers import FollowerSerializer, FollowingSerializer
+
+# Utils
+from gaman.utils.benchmarks.renderers import timed
+from gaman.utils.compiled import CompiledSerializer, compile_serializer
+from gaman.utils.post_cache import post_cache
+
+
+def serializing(items: int = 100, rounds: int = 20) -> dict:
+    """
+    Benchmark the serializers and the compiled serializers over a page
+    of each hot list, their queries included. Both read the posts
+    cache, the posts are serialized with it cold, and also warm for
+    reference.
+    """
+    request = RequestFactory().get('/')
+    context = {'request': request}
+    lists = {
+        'posts': (PostModelSerializer, Post.objects.select_related('post')),
+        'comments': (CommentModelSerializer, PrincipalComment.objects.select_related(
+            'author').prefetch_related(Prefetch(
+                'replies', queryset=Comment.objects.inlined().select_related('author')))),
+        'followers': (FollowerSerializer, FollowUp.objects.select_related('follower')),
+        'following': (FollowingSerializer, FollowUp.objects.all()),
+        'events': (SportEventModelSerializer, SportEvent.objects.all()),
+    }
+    renderer = JSONRenderer()
+
+    results = {}
+    for name, (serializer_class, queryset) in lists.items():
+        queryset = queryset.order_by('-pk')
+        plan = compile_serializer(serializer_class)
+        pks = list(queryset.values_list('pk', flat=True)[:items])
+        setup = (lambda: post_cache.invalidate(pks)) if name == 'posts' else None
+
+        def serialized():
+            return serializer_class(queryset[:items], many=True, context=context).data
+
+        def compiled():
+            return CompiledSerializer(
+                plan.values(queryset)[:items], serializer_class, context=context).data
+
+        if setup:
+            setup()
+        with CaptureQueriesContext(connection) as serialized_queries:
+            expected = renderer.render(serialized())
+        if setup:
+            setup()
+        with CaptureQueriesContext(connection) as compiled_queries:
+            rendered = renderer.render(compiled())
+        serializer_ms = timed(serialized, rounds, setup)
+        compiled_ms = timed(compiled, rounds, setup)
+        results[name] = {
+            'items': len(pks),
+            'identical': expected == rendered,
+            'queries': {
+                'serializer': len(serialized_queries), 'compiled': len(compiled_queries)},
+            'serializer_ms': serializer_ms,
+            'compiled_ms': compiled_ms,
+            'speedup': round(serializer_ms / max(compiled_ms, 0.001), 2),
+        }
+        if name == 'posts':
+            results[name]['cached_ms'] = timed(serialized, rounds)
+            results[name]['compiled_cached_ms'] = timed(compiled, rounds)
+    return results
@@ -0,0 +1,76 @@
+"""Persistent connections benchmark utils."""
+
+# Utilities
+import time
+
+# Django
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.signals import request_started
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+
+# Django REST Framework
+from rest_framework.authtoken.models import Token
+
+# Utils
+from gaman.utils.benchmarks.api import percentile
+from gaman.utils.db import check_connections
+
+
+def throughput(url: str, token: str, requests: int, max_age: int, health_checks: bool) -> dict:
+    """
+    Request a url through the WSGI handler, closing each response like
+    gunicorn does, so the connections are closed or kept with max_age.
+    Return the requests per second and the connections opened.
+    """
+    handler = WSGIHandler()
+    factory = RequestFactory(HTTP_AUTHORIZATION=f'Token {token}')
+    opened = []
+
+    def count_connection(*args, **kwargs):
+        opened.append(1)
+
+    default_max_age = connection.settings_dict['CONN_MAX_AGE']
+    connection.settings_dict['CONN_MAX_AGE'] = max_age
+    connection.close()
+    connection_created.connect(count_connection)
+    if health_checks:
+        request_started.connect(check_connections)
+    try:
+        with override_settings(DATABASE_HEALTH_CHECKS=health_checks):
+            durations, statuses = [], set()
+            for _ in range(requests):
+                start = time.perf_counter()
+                response = handler(factory.get(url).environ, lambda *args: None)
+                response.close()
+                durations.append(time.perf_counter() - start)
+                statuses.add(response.status_code)
+    finally:
+        request_started.disconnect(check_connections)
+        connection_created.disconnect(count_connection)
+        connection.settings_dict['CONN_MAX_AGE'] = default_max_age
+    return {
+        'status': sorted(statuses),
+        'connections': len(opened),
+        'requests_per_second': round(requests / sum(durations), 1),
+        'p50_ms': percentile(durations, 50),
+        'p95_ms': percentile(durations, 95),
+    }
+
+
+def connections(fixtures: dict, url: str = None, requests: int = 500, max_age: int = 60) -> dict:
+    """Benchmark a url with a connection per request and with persistent connections."""
+    url = url or reverse('users:users-detail', args=[fixtures['requester'].username])
+    token, _ = Token.objects.get_or_create(user=fixtures['requester'])
+    modes = {
+        'per_request': (0, False),
+        'persistent': (max_age, False),
+        'persistent_health_checks': (max_age, True),
+    }
+    results = {
+        mode: throughput(url, token.key, requests, *options)
+        for mode, options in modes.items()}
+    speedup = results['persistent']['requests_per_second'] / results['per_request']['requests_per_second']
+    return {'url': url, 'modes': results, 'speedup': round(speedup, 2)}
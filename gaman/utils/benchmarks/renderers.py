@@ -0,0 +1,75 @@
+"""JSON renderers benchmark utils."""
+
+# Utilities
+from io import BytesIO
+import json
+import time
+
+# Django
+from django.test import RequestFactory
+
+# Django REST Framework
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+# Models
+from gaman.posts.models import Post
+from gaman.sports.models import SportEvent
+
+# Serializers
+from gaman.posts.serializers import PostModelSerializer
+from gaman.sports.serializers import SportEventModelSerializer
+
+# Utils
+from gaman.utils import fastjson
+from gaman.utils.benchmarks.api import percentile
+from gaman.utils.fastjson import FastJSONParser, FastJSONRenderer
+
+
+def timed(function, rounds: int, setup=None) -> float:
+    """Return the median milliseconds of a call of function, setup is called untimed before each."""
+    durations = []
+    for _ in range(rounds):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return percentile(durations, 50)
+
+
+def rendering(posts: int = 200, events: int = 200, rounds: int = 50) -> dict:
+    """
+    Benchmark the stdlib and the fast JSON renderers and parsers over
+    the posts and events lists payloads of their serializers.
+    """
+    request = RequestFactory().get('/')
+    context = {'request': request, 'include_reaction_summary': True}
+    payloads = {
+        'posts': PostModelSerializer(
+            Post.objects.select_related('post')[:posts], many=True, context=context).data,
+        'events': SportEventModelSerializer(
+            SportEvent.objects.all()[:events], many=True, context=context).data,
+    }
+    renderers = {'stdlib': JSONRenderer(), 'fast': FastJSONRenderer()}
+    parsers = {'stdlib': JSONParser(), 'fast': FastJSONParser()}
+
+    results = {}
+    for name, payload in payloads.items():
+        rendered = {key: renderer.render(payload) for key, renderer in renderers.items()}
+        render_ms = {
+            key: timed(lambda: renderer.render(payload), rounds)
+            for key, renderer in renderers.items()}
+        parse_ms = {
+            key: timed(lambda: parser.parse(BytesIO(rendered['stdlib'])), rounds)
+            for key, parser in parsers.items()}
+        results[name] = {
+            'items': len(payload),
+            'bytes': len(rendered['stdlib']),
+            'identical': json.loads(rendered['stdlib']) == json.loads(rendered['fast']),
+            'render_ms': render_ms,
+            'parse_ms': parse_ms,
+            'render_speedup': round(render_ms['stdlib'] / max(render_ms['fast'], 0.001), 2),
+            'parse_speedup': round(parse_ms['stdlib'] / max(parse_ms['fast'], 0.001), 2),
+        }
+    return {'orjson': fastjson.orjson is not None, 'payloads': results}
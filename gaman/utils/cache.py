@@ -0,0 +1,63 @@
+"""Cache utils."""
+
+# Utilities
+from collections import OrderedDict
+import threading
+import time
+import weakref
+
+# Django
+from django.conf import settings
+
+
+class LocalCache:
+    """
+    Per-process LRU cache.
+
+    It's a tier in front of the shared cache (redis) for the
+    hottest keys. Entries expire after LOCAL_CACHE_TTL seconds,
+    because the other processes can't invalidate them, set it
+    to 0 to disable the tier.
+    """
+
+    instances = weakref.WeakSet()
+
+    def __init__(self, max_size: int = None):
+        self.max_size = max_size or settings.LOCAL_CACHE_SIZE
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.instances.add(self)
+
+    def get(self, key, default=None):
+        """Return the value of a key or default if it's missing or expired."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires < time.monotonic():
+                del self.entries[key]
+                return default
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float = None) -> None:
+        """Store a value, evicting the least recently used key if it's full."""
+        ttl = settings.LOCAL_CACHE_TTL if ttl is None else ttl
+        if ttl <= 0:
+            return
+        with self.lock:
+            self.entries[key] = (time.monotonic() + ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def delete(self, key) -> None:
+        """Remove a key."""
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all the keys."""
+        with self.lock:
+            self.entries.clear()
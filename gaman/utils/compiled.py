@@ -0,0 +1,280 @@
+"""Compiled serializers utils."""
+
+# Utilities
+from functools import lru_cache
+
+# Django
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+
+# Django REST Framework
+from rest_framework import mixins, serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+# Utils
+from gaman.utils.metrics import serializing
+from gaman.utils.sparse import SparseFieldsMixin
+
+
+# Fields whose representation of a column value is the value itself
+IDENTITY = {
+    serializers.BooleanField.to_representation,
+    serializers.CharField.to_representation,
+    serializers.IntegerField.to_representation,
+    serializers.StringRelatedField.to_representation,
+}
+
+
+def model_field(model, name: str):
+    """Return the field of a model, the primary key for pk."""
+    if name == 'pk':
+        return model._meta.pk
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+
+
+def back_name(relation) -> str:
+    """Return the lookup from the related model of a many relation to its model."""
+    if relation.auto_created and not relation.concrete:
+        return relation.field.name
+    return relation.related_query_name()
+
+
+def transform(field, db_field=None):
+    """Return the function that represents the column values of a field, None for identity."""
+    if isinstance(field, serializers.FileField):
+        storage = db_field.storage
+        use_url = getattr(field, 'use_url', api_settings.UPLOADED_FILES_USE_URL)
+
+        def represent(name, request):
+            if not name:
+                return None
+            if not use_url:
+                return name
+            url = storage.url(name)
+            return request.build_absolute_uri(url) if request is not None else url
+        return represent
+
+    if type(field).to_representation in IDENTITY:
+        return None
+    if isinstance(field, serializers.ChoiceField) and all(
+            isinstance(key, str) for key in field.choices):
+        return None
+    return lambda value, request: field.to_representation(value)
+
+
+def column(lookups: list, represent):
+    """Return the reader of the first not null column of the lookups."""
+
+    def read(row, state, request):
+        for lookup in lookups:
+            value = row[lookup]
+            if value is not None:
+                return value if represent is None else represent(value, request)
+        return None
+    return read
+
+
+class Plan:
+    """
+    Read plan of a serializer.
+
+    The fields are compiled once to the values() lookups of their
+    columns and to readers that build the representation from a row.
+    The nested serializers of foreign keys read the joined columns of
+    the same row, the many relations are read with a values() query
+    per relation for all the rows, narrowed by the functions of
+    Meta.compiled_querysets.
+    """
+
+    def __init__(self, serializer, prefix: str = ''):
+        self.model = serializer.Meta.model
+        self.prefix = prefix
+        self.key = f'{prefix}pk'
+        self.lookups = {self.key: None}
+        self.readers = []
+        self.singles = []
+        self.manys = []
+        sources = getattr(serializer.Meta, 'compiled_sources', {})
+        self.querysets = getattr(serializer.Meta, 'compiled_querysets', {})
+        columns = getattr(serializer.Meta, 'compiled_columns', ())
+        self.lookups.update(dict.fromkeys(prefix + name for name in columns))
+        for name, field in serializer.fields.items():
+            if not field.write_only:
+                self.readers.append((name, self.compile(name, field, sources.get(name))))
+
+    def compile(self, name: str, field, sources: list = None):
+        """Return the reader of a field."""
+        nested = getattr(field, 'child', field)
+        if sources is not None:
+            if nested is field:
+                lookups = [self.prefix + lookup for lookup in sources]
+                self.lookups.update(dict.fromkeys(lookups))
+                return column(lookups, transform(field))
+            relation, *_ = sources[0].split('__')
+            lookups = [lookup.split('__', 1)[1] for lookup in sources]
+            return self.many(name, relation, lookups, transform(nested))
+
+        if field.source == '*' or len(field.source_attrs) != 1:
+            raise ImproperlyConfigured(
+                f'{self.model.__name__}.{name} needs compiled_sources to be compiled.')
+        source = field.source_attrs[0]
+        db_field = model_field(self.model, source)
+        if db_field is None:
+            raise ImproperlyConfigured(
+                f'{self.model.__name__}.{name} needs compiled_sources to be compiled.')
+
+        if isinstance(nested, serializers.Serializer):
+            if nested is not field:
+                return self.many(name, source, Plan(nested))
+            plan = Plan(nested, f'{self.prefix}{source}__')
+            self.singles.append(plan)
+            self.lookups.update(plan.lookups)
+            return lambda row, state, request: (
+                None if row[plan.key] is None else plan.represent(row, state, request))
+
+        if db_field.is_relation:
+            raise ImproperlyConfigured(
+                f'{self.model.__name__}.{name} needs compiled_sources to be compiled.')
+        lookup = self.prefix + source
+        self.lookups[lookup] = None
+        return column([lookup], transform(field, db_field))
+
+    def many(self, name: str, relation: str, child, represent=None):
+        """Return the reader of a many relation, child is a Plan or the lookups of a field."""
+        relation = model_field(self.model, relation)
+        index = len(self.manys)
+        narrow = self.querysets.get(name)
+        self.manys.append((relation, back_name(relation), child, represent, narrow))
+        return lambda row, state, request: state[self, index].get(row[self.key], [])
+
+    def values(self, queryset, *extra):
+        """Return the values() queryset of the rows of the plan."""
+        return queryset.prefetch_related(None).values(*dict.fromkeys([*self.lookups, *extra]))
+
+    def fetch(self, rows: list, state: dict, context: dict) -> None:
+        """Read the many relations of the rows into the state."""
+        request = context.get('request')
+        keys = {row[self.key] for row in rows} - {None}
+        for index, (relation, back, child, represent, narrow) in enumerate(self.manys):
+            groups = state[self, index] = {}
+            if not keys:
+                continue
+            queryset = relation.related_model._default_manager.filter(**{f'{back}__in': keys})
+            if narrow is not None:
+                queryset = narrow(queryset)
+            if isinstance(child, Plan):
+                related = list(child.values(queryset, back))
+                child.fetch(related, state, context)
+                for row in related:
+                    groups.setdefault(row[back], []).append(child.represent(row, state, request))
+            else:
+                read = column(child, represent)
+                for row in queryset.values(back, *child):
+                    groups.setdefault(row[back], []).append(read(row, state, request))
+        for plan in self.singles:
+            plan.fetch(rows, state, context)
+
+    def represent(self, row: dict, state: dict, request) -> dict:
+        """Return the representation of a row."""
+        return {name: read(row, state, request) for name, read in self.readers}
+
+
+@lru_cache(maxsize=None)
+def compile_serializer(serializer_class) -> Plan:
+    """Return the read plan of a serializer class, compiled once."""
+    return Plan(serializer_class(context={}))
+
+
+class CompiledSerializer(serializers.BaseSerializer):
+    """
+    Compiled read-only serializer.
+    Represents the values() rows of the plan of a model serializer,
+    the JSON is the same of the serializer without instantiating the
+    models. The serializer class can read the representations from
+    elsewhere (a cache) with a represent_compiled(rows, represent,
+    context) classmethod, and add the fields out of the plan with a
+    hydrate_compiled(rows, data, context) classmethod. Meta.compiled_columns
+    adds the columns they need to the rows.
+    """
+
+    def __init__(self, rows, serializer_class, **kwargs):
+        self.serializer_class = serializer_class
+        self.plan = compile_serializer(serializer_class)
+        super().__init__(rows, **kwargs)
+
+    def represent(self, rows: list, context: dict) -> list:
+        """Return the representations of the rows with a context."""
+        state = {}
+        self.plan.fetch(rows, state, context)
+        request = context.get('request')
+        return [self.plan.represent(row, state, request) for row in rows]
+
+    def to_representation(self, rows):
+        rows = list(rows)
+        represent = getattr(self.serializer_class, 'represent_compiled', None)
+        if represent is None:
+            data = self.represent(rows, self.context)
+        else:
+            data = represent(rows, self.represent, self.context)
+        hydrate = getattr(self.serializer_class, 'hydrate_compiled', None)
+        if hydrate is not None:
+            hydrate(rows, data, self.context)
+        return data
+
+
+class CompiledSerializerMixin(SparseFieldsMixin):
+    """
+    Compiled serializers view mixin.
+    The actions in compiled_actions read and serialize their pages
+    with the compiled serializers, unless COMPILED_SERIALIZERS is off
+    or the request has sparse fieldsets.
+    """
+
+    compiled_actions = ()
+
+    def get_compiled(self, serializer_class=None):
+        """Return the plan of the serializer of the action, None if it's not compiled."""
+        if not settings.COMPILED_SERIALIZERS or self.action not in self.compiled_actions:
+            return None
+        params = self.request.query_params
+        if 'fields' in params or 'expand' in params:
+            return None
+        return compile_serializer(serializer_class or self.get_serializer_class())
+
+    def prepare_queryset(self, queryset, serializer_class=None, paginator=None):
+        """Return the rows queryset of a compiled action, else the trimmed queryset."""
+        plan = self.get_compiled(serializer_class)
+        if plan is None:
+            return self.trim_queryset(queryset, serializer_class)
+        paginator = paginator or self.paginator
+        ordering = [name.lstrip('-') for name in getattr(paginator, 'ordering', ())]
+        return plan.values(queryset, *ordering)
+
+    def serialize(self, page, serializer_class=None):
+        """Return the representation of a page of a prepared queryset."""
+        serializer_class = serializer_class or self.get_serializer_class()
+        context = self.get_serializer_context()
+        with serializing():
+            if self.get_compiled(serializer_class) is not None:
+                return CompiledSerializer(page, serializer_class, context=context).data
+            return serializer_class(page, many=True, context=context).data
+
+
+class CompiledListModelMixin(CompiledSerializerMixin, mixins.ListModelMixin):
+    """
+    Compiled list model mixin.
+    Lists with the compiled serializer when 'list' is in compiled_actions.
+    """
+
+    def list(self, request, *args, **kwargs):
+        if self.get_compiled() is None:
+            return super().list(request, *args, **kwargs)
+        queryset = self.prepare_queryset(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.serialize(page))
+        return Response(self.serialize(queryset))
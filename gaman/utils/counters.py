@@ -0,0 +1,112 @@
+"""Counters utils."""
+
+# Utilities
+from collections import defaultdict
+from datetime import timedelta
+import uuid
+import redis
+
+# Django
+from django.apps import apps
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+
+_client = None
+
+
+def get_client() -> redis.Redis:
+    """Return the redis client of the counters buffer."""
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.COUNTERS_REDIS_URL)
+    return _client
+
+
+def is_buffered(label: str) -> bool:
+    """Return if the increments of a counter are buffered in redis."""
+    return settings.COUNTERS_BUFFER and label in settings.COUNTERS_BUFFERED
+
+
+def apply_delta(model, pks: list, field: str, delta: int, lookup: str = 'pk') -> int:
+    """
+    Apply a delta to a counter as a single UPDATE.
+    The counter never goes below zero and no other column is written.
+    """
+    value = F(field) + delta
+    if delta < 0:
+        value = Greatest(value, 0)
+    return model.objects.filter(**{f'{lookup}__in': pks}).update(**{field: value})
+
+
+def count_of(queryset, field: str, outer: str = 'pk'):
+    """Return a subquery that counts the rows of a queryset related to the outer row."""
+    rows = queryset.filter(
+        **{field: OuterRef(outer)}).order_by().values(field).annotate(total=Count('pk'))
+    return Coalesce(Subquery(rows.values('total')), 0)
+
+
+def increment(instance: models.Model, field: str, delta: int = 1) -> None:
+    """
+    Increment (or decrement) the counter of a instance.
+    The in-memory value is updated too, without reading the row again.
+    The buffered deltas are sent when the transaction commits.
+    """
+    if not delta:
+        return
+    label = f'{instance._meta.label}.{field}'
+    if is_buffered(label):
+        pk = instance.pk
+        transaction.on_commit(lambda: get_client().hincrby(f'counters:{label}', pk, delta))
+    else:
+        apply_delta(type(instance), [instance.pk], field, delta)
+    setattr(instance, field, max(getattr(instance, field) + delta, 0))
+
+
+def flush(label: str) -> int:
+    """
+    Apply the buffered deltas of a counter.
+    The deltas are grouped so a batch costs one UPDATE per distinct delta.
+    The batch is recorded in the same transaction, a flush interrupted
+    after the commit doesn't apply it again.
+    Return the number of rows updated.
+    """
+    client = get_client()
+    key = f'counters:{label}'
+    flushing = f'{key}:flushing'
+    batch_key = f'{flushing}:batch'
+
+    # A previous flush could have been interrupted
+    if not client.exists(flushing):
+        try:
+            client.rename(key, flushing)
+        except redis.ResponseError:
+            return 0  # Nothing buffered
+    client.set(batch_key, uuid.uuid4().hex, nx=True)
+    batch = client.get(batch_key).decode()
+
+    pks_by_delta = defaultdict(list)
+    for pk, delta in client.hgetall(flushing).items():
+        if int(delta):
+            pks_by_delta[int(delta)].append(int(pk))
+
+    app_label, model_name, field = label.split('.')
+    model = apps.get_model(app_label, model_name)
+    updated = 0
+    with transaction.atomic():
+        _, created = apps.get_model('posts', 'CounterFlush').objects.get_or_create(batch=batch)
+        if created:
+            for delta, pks in pks_by_delta.items():
+                updated += apply_delta(model, pks, field, delta)
+    client.delete(flushing, batch_key)
+    return updated
+
+
+def forget_flushes(age: timedelta = timedelta(days=1)) -> int:
+    """Delete the records of the flushed batches older than age."""
+    flushes = apps.get_model('posts', 'CounterFlush').objects
+    deleted, _ = flushes.filter(created__lt=timezone.now() - age).delete()
+    return deleted
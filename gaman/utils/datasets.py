@@ -0,0 +1,483 @@
+"""Synthetic dataset utils."""
+
+# Utilities
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+import math
+import multiprocessing
+import typing as t
+import numpy as np
+
+# Django
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection, connections
+from django.db.models import Max
+
+# Django REST Framework
+from rest_framework.authtoken.models import Token
+
+# Models
+from gaman.posts.models import Comment, CommentReaction, Picture, Post, PostReaction
+from gaman.sponsorships.models import Brand, Rating, Sponsorship
+from gaman.sports.models import Club, League, Member, SportEvent
+from gaman.users.models import FollowUp, Profile, User
+
+# Utils
+from gaman.utils.loaders import BulkLoader
+
+
+# Every 25 users: 2 sponsors, 2 coaches, 1 league president and 20 athletes
+ROLES = ['Sponsor'] * 2 + ['Coach'] * 2 + ['League president'] + ['Athlete'] * 20
+
+CITIES = [
+    ('Colombia', 'Antioquia', 'Medellin', 6.2442, -75.5812),
+    ('Colombia', 'Cundinamarca', 'Bogota', 4.7110, -74.0721),
+    ('Mexico', 'CDMX', 'Mexico City', 19.4326, -99.1332),
+    ('Argentina', 'Buenos Aires', 'Buenos Aires', -34.6037, -58.3816),
+    ('Brazil', 'Sao Paulo', 'Sao Paulo', -23.5505, -46.6333),
+    ('Peru', 'Lima', 'Lima', -12.0464, -77.0428),
+    ('Chile', 'Santiago', 'Santiago', -33.4489, -70.6693),
+    ('Spain', 'Madrid', 'Madrid', 40.4168, -3.7038),
+    ('Spain', 'Catalonia', 'Barcelona', 41.3874, 2.1686),
+    ('United States', 'Florida', 'Miami', 25.7617, -80.1918),
+]
+
+SPORTS = [
+    'Athletics', 'Basketball', 'Boxing', 'Cycling', 'Climbing', 'Soccer',
+    'Judo', 'Karate', 'Swimming', 'Rugby', 'Surfing', 'Tennis', 'Volleyball',
+]
+
+WORDS = (
+    'training match goal race team coach season win lost game run swim ride '
+    'club league medal record speed power strength focus today tomorrow week '
+    'morning night field track pool gym ball final cup fans great hard proud'
+).split()
+
+REACTIONS = ['Like', 'Love', 'Curious', 'Haha', 'Sad', 'Angry']
+REACTION_WEIGHTS = [0.55, 0.2, 0.07, 0.1, 0.05, 0.03]
+
+PHOTO = 'gaman/utils/media_test/profile_photo.jpg'
+
+# Password of every generated user
+PASSWORD = 'gaman-dataset'
+
+# A prime above any volume, multiplying by it permutes the indexes
+SCATTER = 2654435761
+
+
+def power_law(rng, n: int, size: int, skew: float) -> np.ndarray:
+    """
+    Draw size indexes below n with a Zipf-like distribution,
+    the index k is drawn with a probability close to (k + 1) ** -skew.
+    """
+    u = rng.random(size)
+    top = n + 1.0
+    if abs(skew - 1) < 1e-9:
+        x = top ** u
+    else:
+        x = ((top ** (1 - skew) - 1) * u + 1) ** (1 / (1 - skew))
+    return np.minimum(x.astype(np.int64) - 1, n - 1)
+
+
+def scatter(indexes: np.ndarray, n: int) -> np.ndarray:
+    """Spread the popular indexes over the whole range."""
+    return (indexes * SCATTER) % n
+
+
+def role_count(users: int, offset: int, per: int) -> int:
+    """Return the users of the role that starts at offset in ROLES."""
+    return users // len(ROLES) * per + max(0, min(per, users % len(ROLES) - offset))
+
+
+def role_index(k: np.ndarray, offset: int, per: int) -> np.ndarray:
+    """Return the user index of the k-th user of a role."""
+    return k // per * len(ROLES) + offset + k % per
+
+
+class Volumes(t.NamedTuple):
+    """Rows of the generated dataset."""
+
+    users: int = 10000
+    follows: int = 20  # Average per user
+    brands: int = 200
+    clubs: int = 300
+    posts: int = 50000
+    reposts: float = 0.1  # Of the posts
+    comments: int = 100000
+    reactions: int = 200000
+    events: int = 2000
+    sponsorships: int = 1000
+
+
+class DatasetGenerator:
+    """
+    Synthetic dataset generator.
+
+    Each stage is split in parts of part_size rows, a part is generated
+    from its own random generator seeded with (seed, stage, part), so
+    the dataset only depends on the seed and the volumes, not on the
+    workers. Primary keys are assigned from the table maximum, which
+    lets the parts point to rows of the previous stages without
+    reading them. Follows, authors, posts and comments are drawn from
+    power laws: a few celebrity accounts and viral posts get most of
+    the followers, reactions and comments.
+    """
+
+    stages = [
+        'users', 'brands', 'leagues', 'clubs', 'members', 'follows',
+        'posts', 'reposts', 'comments', 'reactions', 'events', 'sponsorships',
+    ]
+
+    def __init__(self, volumes: Volumes, seed: int = 0, skew: float = 1.1,
+                 part_size: int = 10000, copy: bool = True):
+        self.volumes = volumes
+        self.seed = seed
+        self.skew = skew
+        self.part_size = part_size
+        self.copy = copy
+        self.leagues = max(1, volumes.clubs // 20)
+        self.originals = volumes.posts - int(volumes.posts * volumes.reposts)
+        self.sponsors = role_count(volumes.users, 0, 2)
+        self.coaches = role_count(volumes.users, 2, 2)
+        self.athletes = role_count(volumes.users, 5, 20)
+        self.password = make_password(PASSWORD)
+
+    def plan(self) -> None:
+        """Read the first primary key of each table and create the pictures."""
+        models = [
+            User, Brand, League, Club, Post, Comment, SportEvent, Sponsorship]
+        self.bases = {
+            model: (model.objects.aggregate(top=Max('pk'))['top'] or 0) + 1
+            for model in models}
+        self.pictures = [
+            picture.pk for picture in Picture.objects.bulk_create(
+                [Picture(content=PHOTO) for _ in range(10)])]
+
+    def totals(self) -> dict:
+        """Return the rows each stage iterates over."""
+        volumes = self.volumes
+        return {
+            'users': volumes.users,
+            'brands': volumes.brands,
+            'leagues': self.leagues,
+            'clubs': volumes.clubs,
+            'members': volumes.clubs,
+            'follows': volumes.users,
+            'posts': self.originals,
+            'reposts': volumes.posts - self.originals,
+            'comments': volumes.comments,
+            'reactions': volumes.reactions,
+            'events': volumes.events,
+            'sponsorships': volumes.sponsorships,
+        }
+
+    def rng(self, stage: str, part: int):
+        """Return the random generator of a part."""
+        return np.random.default_rng([self.seed, self.stages.index(stage), part])
+
+    # Ids
+    def user_pks(self, indexes: np.ndarray) -> list:
+        return (indexes + self.bases[User]).tolist()
+
+    def popular_users(self, rng, size: int) -> list:
+        """Draw users, the celebrities more often."""
+        n = self.volumes.users
+        return self.user_pks(scatter(power_law(rng, n, size, self.skew), n))
+
+    def popular_posts(self, rng, size: int) -> list:
+        """Draw original posts, the viral ones more often."""
+        n = self.originals
+        return (scatter(power_law(rng, n, size, self.skew), n) + self.bases[Post]).tolist()
+
+    def random_users(self, rng, size: int) -> list:
+        return self.user_pks(rng.integers(0, self.volumes.users, size))
+
+    def text(self, rng, low: int, high: int) -> str:
+        return ' '.join(rng.choice(WORDS, rng.integers(low, high)))
+
+    # Stages
+    def run_part(self, stage: str, part: int) -> dict:
+        """Generate and load a part of a stage, return the loader stats."""
+        start = part * self.part_size
+        rows = range(start, min(start + self.part_size, self.totals()[stage]))
+        loader = BulkLoader(self.part_size, copy=self.copy)
+        getattr(self, f'load_{stage}')(self.rng(stage, part), rows, loader)
+        return loader.stats
+
+    def load_users(self, rng, rows, loader):
+        size = len(rows)
+        cities = rng.integers(0, len(CITIES), size)
+        sports = rng.integers(0, len(SPORTS), size)
+        public = rng.random(size) < 0.9
+        users, profiles, tokens = [], [], []
+        for x, i in enumerate(rows):
+            pk = self.bases[User] + i
+            role = ROLES[i % len(ROLES)]
+            verified = i % 20 != 19
+            users.append(User(
+                pk=pk, username=f'user{pk}', email=f'user{pk}@gaman.test',
+                first_name='User', last_name=str(pk), password=self.password,
+                phone_number=f'+57 {3000000000 + pk}', role=role, verified=verified))
+            profiles.append(Profile(
+                user_id=pk, photo=PHOTO, cover_photo=PHOTO,
+                about=self.text(rng, 3, 12), country=CITIES[cities[x]][0],
+                public=bool(public[x]),
+                sport='' if role == 'Sponsor' else SPORTS[sports[x]]))
+            if verified:
+                tokens.append(Token(user_id=pk, key=f'{rng.bytes(12).hex()}{pk:016x}'))
+        loader.insert(users)
+        loader.insert(profiles)
+        loader.insert(tokens)
+
+    def load_brands(self, rng, rows, loader):
+        sponsors = role_index(np.array(rows) % self.sponsors, 0, 2)
+        loader.insert([
+            Brand(
+                pk=self.bases[Brand] + i, slugname=f'brand-{self.bases[Brand] + i}',
+                sponsor_id=sponsor, about=self.text(rng, 5, 20),
+                photo=PHOTO, cover_photo=PHOTO, verified=bool(rng.random() < 0.3))
+            for i, sponsor in zip(rows, self.user_pks(sponsors))])
+
+    def load_leagues(self, rng, rows, loader):
+        loader.insert([
+            League(
+                pk=self.bases[League] + i, slugname=f'league-{self.bases[League] + i}',
+                about=self.text(rng, 5, 20), photo=PHOTO, cover_photo=PHOTO,
+                country=CITIES[i % len(CITIES)][0], state=CITIES[i % len(CITIES)][1],
+                sport=SPORTS[i % len(SPORTS)])
+            for i in rows])
+
+    def load_clubs(self, rng, rows, loader):
+        trainers = self.user_pks(role_index(np.array(rows) % self.coaches, 2, 2))
+        leagues = rng.integers(0, self.leagues, len(rows)) + self.bases[League]
+        loader.insert([
+            Club(
+                pk=self.bases[Club] + i, slugname=f'club-{self.bases[Club] + i}',
+                about=self.text(rng, 5, 20), photo=PHOTO, cover_photo=PHOTO,
+                city=CITIES[i % len(CITIES)][2], trainer_id=trainer,
+                league_id=int(league))
+            for i, trainer, league in zip(rows, trainers, leagues)])
+
+    def load_members(self, rng, rows, loader):
+        members = []
+        sizes = np.minimum(rng.pareto(1.5, len(rows)) * 5 + 3, 1000).astype(int)
+        for i, size in zip(rows, sizes):
+            for user in set(self.random_users(rng, size)):
+                members.append(Member(
+                    user_id=user, club_id=self.bases[Club] + i,
+                    active=bool(rng.random() < 0.9)))
+        loader.insert(members)
+
+    def load_follows(self, rng, rows, loader):
+        volumes = self.volumes
+        sigma = 1.0
+        degrees = rng.lognormal(math.log(volumes.follows) - sigma ** 2 / 2, sigma, len(rows))
+        degrees = np.minimum(degrees.astype(int), volumes.users - 1)
+        follows = []
+        for i, degree in zip(rows, degrees):
+            follower = self.bases[User] + i
+            for user in set(self.popular_users(rng, degree)) - {follower}:
+                follows.append(FollowUp(follower_id=follower, user_id=user))
+            # One of ten follows goes to a brand or a club
+            if volumes.brands and rng.random() < 0.1:
+                brand = scatter(power_law(rng, volumes.brands, 1, self.skew), volumes.brands)
+                follows.append(FollowUp(
+                    follower_id=follower, brand_id=int(brand[0]) + self.bases[Brand]))
+            if volumes.clubs and rng.random() < 0.1:
+                club = scatter(power_law(rng, volumes.clubs, 1, self.skew), volumes.clubs)
+                follows.append(FollowUp(
+                    follower_id=follower, club_id=int(club[0]) + self.bases[Club]))
+        loader.insert(follows)
+
+    def load_posts(self, rng, rows, loader):
+        volumes = self.volumes
+        size = len(rows)
+        authors = self.popular_users(rng, size)
+        kinds = rng.random(size)
+        posts, pictures, tags = [], [], []
+        for x, i in enumerate(rows):
+            pk = self.bases[Post] + i
+            post = Post(
+                pk=pk, about=self.text(rng, 5, 30),
+                privacy='Private' if rng.random() < 0.2 else 'Public',
+                location=CITIES[rng.integers(0, len(CITIES))][2],
+                feeling=rng.choice(Post.FEELING)[0] if rng.random() < 0.3 else '')
+            if kinds[x] < 0.1 and volumes.brands:
+                post.brand_id = self.bases[Brand] + int(rng.integers(0, volumes.brands))
+            elif kinds[x] < 0.15 and volumes.clubs:
+                post.club_id = self.bases[Club] + int(rng.integers(0, volumes.clubs))
+            else:
+                post.user_id = authors[x]
+            posts.append(post)
+            if rng.random() < 0.5:
+                for picture in rng.choice(self.pictures, rng.integers(1, 4), replace=False):
+                    pictures.append((pk, int(picture)))
+            if rng.random() < 0.2:
+                for user in set(self.random_users(rng, rng.integers(1, 4))):
+                    tags.append((pk, user))
+        loader.insert(posts)
+        loader.link(Post.pictures, pictures)
+        loader.link(Post.tag_users, tags)
+
+    def load_reposts(self, rng, rows, loader):
+        shared = self.popular_posts(rng, len(rows))
+        authors = self.random_users(rng, len(rows))
+        loader.insert([
+            Post(pk=self.bases[Post] + self.originals + i, user_id=author, post_id=post)
+            for i, author, post in zip(rows, authors, shared)])
+
+    def load_comments(self, rng, rows, loader):
+        # Seven of ten comments open a thread on a post, the others
+        # reply to a thread of the part, the hot threads more often
+        size = len(rows)
+        threads = max(1, int(size * 0.7))
+        posts = self.popular_posts(rng, threads)
+        authors = self.random_users(rng, size)
+        parents = power_law(rng, threads, size - threads, self.skew)
+        comments, positions = [], defaultdict(int)
+        for x, i in enumerate(rows):
+            comment = Comment(
+                pk=self.bases[Comment] + i, author_id=authors[x],
+                text=self.text(rng, 2, 20))
+            if x < threads:
+                comment.post_id = posts[x]
+            else:
+                parent = int(parents[x - threads])
+                positions[parent] += 1
+                comment.post_id = posts[parent]
+                comment.parent_id = self.bases[Comment] + rows.start + parent
+                comment.path, comment.depth = f'{comment.parent_id}/', 1
+                comment.position = positions[parent]
+            comments.append(comment)
+        # The replies counters are reconciled at the end
+        loader.insert(comments)
+
+    def load_reactions(self, rng, rows, loader):
+        # Four of five reactions go to posts, the others to comments
+        size = len(rows)
+        kinds = rng.choice(REACTIONS, size, p=REACTION_WEIGHTS)
+        # Each part draws its users from its own residue class, so two parts
+        # never repeat a user and post pair (unique constraints)
+        stride = min(math.ceil(self.totals()['reactions'] / self.part_size), self.volumes.users)
+        residue = (rows.start // self.part_size) % stride
+        users = self.user_pks(residue + stride * rng.integers(
+            0, math.ceil((self.volumes.users - residue) / stride), size))
+        split = int(size * 0.8) if self.volumes.comments else size
+        posts = self.popular_posts(rng, split)
+        comments = scatter(
+            power_law(rng, self.volumes.comments, size - split, self.skew),
+            self.volumes.comments) + self.bases[Comment]
+
+        seen, post_reactions, comment_reactions = set(), [], []
+        for x in range(size):
+            if x < split:
+                key = ('post', users[x], posts[x])
+                if key not in seen:
+                    post_reactions.append(PostReaction(
+                        user_id=users[x], post_id=posts[x], reaction=kinds[x]))
+            else:
+                key = ('comment', users[x], int(comments[x - split]))
+                if key not in seen:
+                    comment_reactions.append(CommentReaction(
+                        user_id=users[x], comment_id=key[2], reaction=kinds[x]))
+            seen.add(key)
+        loader.insert(post_reactions)
+        loader.insert(comment_reactions)
+
+    def load_events(self, rng, rows, loader):
+        volumes = self.volumes
+        today = date.today()
+        events, assistants = [], []
+        for i in rows:
+            pk = self.bases[SportEvent] + i
+            country, state, city, lat, lng = CITIES[rng.integers(0, len(CITIES))]
+            lat = round(float(lat + rng.normal(0, 0.3)), 5)
+            lng = round(float(lng + rng.normal(0, 0.3)), 5)
+            start = today + timedelta(days=int(rng.integers(-30, 180)))
+            event = SportEvent(
+                pk=pk, title=self.text(rng, 2, 6)[:150], description=self.text(rng, 5, 20),
+                photo=PHOTO, start=start, finish=start + timedelta(days=int(rng.integers(0, 4))),
+                geolocation=f'{lat} {lng}', lat=lat, lng=lng,
+                country=country, state=state, city=city, place=f'{city} stadium')
+            kind = rng.random()
+            if kind < 0.6 and volumes.clubs:
+                event.club_id = self.bases[Club] + int(rng.integers(0, volumes.clubs))
+            elif kind < 0.8 and volumes.brands:
+                event.brand_id = self.bases[Brand] + int(rng.integers(0, volumes.brands))
+            else:
+                event.user_id = self.random_users(rng, 1)[0]
+            events.append(event)
+            size = int(min(rng.pareto(1.2) * 10, 2000))
+            for user in set(self.popular_users(rng, size)):
+                assistants.append((pk, user))
+        loader.insert(events)
+        loader.link(SportEvent.assistants, assistants)
+
+    def load_sponsorships(self, rng, rows, loader):
+        volumes = self.volumes
+        today = date.today()
+        sponsorships, ratings = [], []
+        for i in rows:
+            pk = self.bases[Sponsorship] + i
+            brand = int(rng.integers(0, volumes.brands)) if volumes.brands else None
+            sponsor = role_index(np.array([
+                brand % self.sponsors if brand is not None
+                else rng.integers(0, self.sponsors)]), 0, 2)
+            start = today - timedelta(days=int(rng.integers(0, 365)))
+            sponsorship = Sponsorship(
+                pk=pk, sponsor_id=self.user_pks(sponsor)[0],
+                brand_id=None if brand is None else self.bases[Brand] + brand,
+                start=start, finish=start + timedelta(days=int(rng.integers(30, 730))),
+                active=bool(rng.random() < 0.7))
+            if rng.random() < 0.2 and volumes.clubs:
+                sponsorship.club_id = self.bases[Club] + int(rng.integers(0, volumes.clubs))
+            else:
+                athlete = role_index(rng.integers(0, self.athletes, 1), 5, 20)
+                sponsorship.athlete_id = self.user_pks(athlete)[0]
+            sponsorships.append(sponsorship)
+            for qualifier in set(self.random_users(rng, rng.integers(0, 4))):
+                ratings.append(Rating(
+                    sponsorship_id=pk, qualifier_id=qualifier,
+                    rating=Decimal(int(rng.integers(10, 51))) / 10,
+                    comment=self.text(rng, 0, 10)))
+        loader.insert(sponsorships)
+        loader.insert(ratings)
+
+    def run(self, workers: int = 1, stdout=None) -> BulkLoader:
+        """Generate every stage, return a loader with the merged stats."""
+        if connection.vendor != 'postgresql':
+            workers = 1  # Only PostgreSQL takes concurrent writers
+        self.plan()
+        report = BulkLoader(self.part_size)
+        for stage, total in self.totals().items():
+            parts = [(stage, part) for part in range(math.ceil(total / self.part_size))]
+            if workers > 1 and len(parts) > 1:
+                # The forked workers open their own connections
+                connections.close_all()
+                with multiprocessing.get_context('fork').Pool(workers) as pool:
+                    results = pool.starmap(self.run_part, parts)
+            else:
+                results = [self.run_part(*part) for part in parts]
+
+            for stats in results:
+                for label, (rows, seconds) in stats.items():
+                    total_rows, total_seconds = report.stats.get(label, (0, 0.0))
+                    report.stats[label] = (total_rows + rows, total_seconds + seconds)
+            if stdout:
+                stdout.write(f'{stage}: {len(parts)} parts')
+
+        self.reset_sequences()
+        return report
+
+    @staticmethod
+    def reset_sequences() -> None:
+        """Move the sequences past the assigned primary keys."""
+        models = [
+            User, Profile, Token, Brand, League, Club, Member, FollowUp, Post,
+            Comment, PostReaction, CommentReaction, SportEvent, Sponsorship, Rating]
+        statements = connection.ops.sequence_reset_sql(no_style(), models)
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
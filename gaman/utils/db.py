@@ -0,0 +1,20 @@
+"""Database connections utils."""
+
+# Django
+from django.conf import settings
+from django.db import connections
+
+
+def check_connections(**kwargs) -> None:
+    """
+    Close the persistent connections that stopped working, e.g. after
+    a database or PgBouncer restart, so the request (or task) opens a
+    new one instead of failing on its first query. It's connected to
+    the start of the requests and the Celery tasks.
+    """
+    if not settings.DATABASE_HEALTH_CHECKS:
+        return
+    for connection in connections.all():
+        if connection.connection is not None and not connection.in_atomic_block:
+            if not connection.is_usable():
+                connection.close()
@@ -0,0 +1,64 @@
+"""Fast JSON utils."""
+
+# Django
+from django.conf import settings
+
+# Django REST Framework
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # The stdlib renderer and parser are used
+    orjson = None
+
+
+# Datetimes, Decimals and lazy strings are encoded like the stdlib renderer
+OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson else 0
+ENCODER = JSONEncoder()
+
+
+def dumps(data) -> bytes:
+    """Encode data as UTF-8 JSON, with orjson when it's installed."""
+    if orjson is None:
+        return JSONRenderer().render(data)
+    ret = orjson.dumps(data, default=ENCODER.default, option=OPTIONS)
+    # Escaped by the stdlib renderer, they end the lines of javascript
+    if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+        ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+    return ret
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Fast JSON renderer.
+    Renders with orjson the same JSON of the stdlib renderer. The
+    indented responses (browsable API, ?indent) use the stdlib.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or self.get_indent(
+                accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
+
+
+class FastJSONParser(JSONParser):
+    """Fast JSON parser, parses with orjson when it's installed."""
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+        encoding = (parser_context or {}).get('encoding', settings.DEFAULT_CHARSET)
+        try:
+            data = stream.read()
+            if encoding.lower().replace('-', '') != 'utf8':
+                data = data.decode(encoding)
+            # NaN and Infinity are rejected, like the strict stdlib parser
+            return orjson.loads(data)
+        except ValueError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
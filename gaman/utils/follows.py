@@ -0,0 +1,123 @@
+"""Follow graph utils."""
+
+# Utilities
+from array import array
+import typing as t
+import uuid
+
+# Django
+from django.core.cache import cache
+from django.db import transaction
+
+# Models
+from gaman.sponsorships.models import Brand
+from gaman.sports.models import Club
+from gaman.users.models import FollowUp, User
+
+# Utils
+from gaman.utils.cache import LocalCache
+
+
+class Followed(t.NamedTuple):
+    """Ids of the users, brands and clubs followed by a user."""
+
+    users: frozenset
+    brands: frozenset
+    clubs: frozenset
+
+
+class FollowGraph:
+    """
+    Follow graph.
+
+    Keeps the followed users, brands and clubs of each user as
+    compact integer sets in the shared cache (redis) and in a
+    per-process LRU tier, so the follow checks of permissions
+    and feeds don't query FollowUp on the warm path.
+    The shared sets are stored under a version of the user, changed
+    when a FollowUp is created or deleted, so a reader that loaded
+    the rows before the change can't cache them for the new version.
+    """
+
+    local = LocalCache()
+
+    @staticmethod
+    def key(user_id: int) -> str:
+        """Return the cache key of a user's followed."""
+        return f'follows:{user_id}'
+
+    @classmethod
+    def version(cls, user_id: int) -> str:
+        """Return the version of a user's followed in the shared cache."""
+        key = cls.key(user_id) + ':version'
+        version = cache.get(key)
+        if version is None:
+            version = uuid.uuid4().hex
+            if not cache.add(key, version):
+                version = cache.get(key, version)
+        return version
+
+    @staticmethod
+    def load(user_id: int) -> tuple:
+        """Return the packed ids of the users, brands and clubs followed by a user."""
+        rows = FollowUp.objects.filter(
+            follower_id=user_id).values_list('user_id', 'brand_id', 'club_id')
+        columns = zip(*rows) if rows else ((), (), ())
+        return tuple(
+            array('q', sorted({pk for pk in column if pk})).tobytes() for column in columns)
+
+    @classmethod
+    def followed_ids(cls, user: t.Union[User, int]) -> Followed:
+        """Return the ids of the users, brands and clubs followed by a user."""
+        user_id = getattr(user, 'pk', user)
+        key = cls.key(user_id)
+
+        followed = cls.local.get(key)
+        if followed is not None:
+            return followed
+
+        versioned = f'{key}:{cls.version(user_id)}'
+        packed = cache.get(versioned)
+        if packed is None:
+            packed = cls.load(user_id)
+            cache.set(versioned, packed)
+
+        followed = Followed(*(frozenset(array('q', blob)) for blob in packed))
+        cls.local.set(key, followed)
+        return followed
+
+    @classmethod
+    def is_following(cls, user: t.Union[User, int], target: t.Union[User, Brand, Club]) -> bool:
+        """Return if a user follows a user, brand or club."""
+        followed = cls.followed_ids(user)
+        if isinstance(target, Brand):
+            return target.pk in followed.brands
+        if isinstance(target, Club):
+            return target.pk in followed.clubs
+        return target.pk in followed.users
+
+    @classmethod
+    def follows_author(cls, user: t.Union[User, int], obj) -> bool:
+        """Return if a user follows the author (user, brand or club) of a post or event."""
+        followed = cls.followed_ids(user)
+        return (
+            obj.user_id in followed.users or
+            obj.brand_id in followed.brands or
+            obj.club_id in followed.clubs)
+
+    @classmethod
+    def invalidate(cls, user_id: int) -> None:
+        """
+        Change the version of a user's followed, now and when the
+        transaction commits, the readers of the uncommitted version
+        could cache the old rows. The other processes keep their
+        local tier up to LOCAL_CACHE_TTL.
+        """
+        key = cls.key(user_id)
+
+        def change():
+            cls.local.delete(key)
+            cache.set(key + ':version', uuid.uuid4().hex)
+
+        change()
+        transaction.on_commit(change)
@@ -0,0 +1,210 @@
+"""Geospatial utils."""
+
+# Utilities
+from datetime import date
+import threading
+import time
+import typing as t
+import uuid
+import numpy as np
+
+# Django
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# Models
+from gaman.sports.models import SportEvent
+
+
+EARTH_RADIUS = 6371.0088  # km
+
+# The columns of the index, the saves of other fields keep it
+INDEXED_FIELDS = {'lat', 'lng', 'start', 'finish'}
+
+# A process further behind than this rebuilds its index
+MAX_CHANGES = 1000
+CHANGES_TTL = 60 * 60
+
+
+class Events(t.NamedTuple):
+    """Arrays of the indexed events, sorted by latitude."""
+
+    ids: np.ndarray
+    lats: np.ndarray
+    lngs: np.ndarray
+    starts: np.ndarray
+    finishes: np.ndarray
+
+    @classmethod
+    def from_rows(cls, rows: list) -> 'Events':
+        """Return the events of (pk, lat, lng, start, finish) rows sorted by latitude."""
+        return cls(
+            ids=np.array([row[0] for row in rows], dtype=np.int64),
+            lats=np.array([row[1] for row in rows], dtype=np.float64),
+            lngs=np.array([row[2] for row in rows], dtype=np.float64),
+            starts=np.array([row[3].toordinal() for row in rows], dtype=np.int32),
+            finishes=np.array([row[4].toordinal() for row in rows], dtype=np.int32))
+
+    def replace(self, pks: list, rows: list) -> 'Events':
+        """Return the events with the pks replaced by the rows, the pks without row are removed."""
+        keep = ~np.isin(self.ids, pks)
+        added = self.from_rows(rows)
+        columns = [np.concatenate([column[keep], new]) for column, new in zip(self, added)]
+        order = np.argsort(columns[1], kind='stable')
+        return Events(*(column[order] for column in columns))
+
+    def band(self, south: float, north: float) -> slice:
+        """Return the rows between two latitudes."""
+        return slice(
+            int(np.searchsorted(self.lats, south, side='left')),
+            int(np.searchsorted(self.lats, north, side='right')))
+
+    def window(self, rows: slice, start: date = None, finish: date = None):
+        """Return the mask of the events of the rows that overlap the dates."""
+        mask = np.ones(rows.stop - rows.start, dtype=bool)
+        if start:
+            mask &= self.finishes[rows] >= start.toordinal()
+        if finish:
+            mask &= self.starts[rows] <= finish.toordinal()
+        return mask
+
+
+class EventIndex:
+    """
+    In-process spatial index of the sport events.
+
+    Coordinates and dates are kept in NumPy arrays sorted by
+    latitude, a query takes the latitude band with a binary search
+    and filters longitude, distance and dates vectorized.
+    The committed event writes are logged in the shared cache under
+    an increasing version, each process checks it at most every
+    EVENTS_INDEX_TTL seconds and reloads only the changed events.
+    A process that missed changes, or after invalidate(), rebuilds
+    its whole index.
+    """
+
+    generation_key = 'events:index:generation'
+    version_key = 'events:index:version'
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.events = None
+        self.generation = None
+        self.version = None
+        self.checked = 0.0
+
+    @staticmethod
+    def change_key(version: int) -> str:
+        """Return the cache key of the events changed in a version."""
+        return f'events:index:change:{version}'
+
+    @staticmethod
+    def rows(queryset) -> list:
+        """Return the indexed columns of the located events of a queryset."""
+        return list(queryset.filter(lat__isnull=False).order_by('lat').values_list(
+            'pk', 'lat', 'lng', 'start', 'finish'))
+
+    def build(self) -> Events:
+        """Load the coordinates and dates of the events."""
+        return Events.from_rows(self.rows(SportEvent.objects.all()))
+
+    def update(self, version: int) -> bool:
+        """Reload the events changed since the indexed version, False if some change is missing."""
+        if not 0 <= version - self.version <= MAX_CHANGES:
+            return False
+        keys = [self.change_key(n) for n in range(self.version + 1, version + 1)]
+        changes = cache.get_many(keys)
+        if len(changes) < len(keys):
+            return False
+        pks = sorted({pk for change in changes.values() for pk in change})
+        if pks:
+            self.events = self.events.replace(
+                pks, self.rows(SportEvent.objects.filter(pk__in=pks)))
+        return True
+
+    def refresh(self) -> Events:
+        """Return the indexed events, updating them if they changed."""
+        now = time.monotonic()
+        with self.lock:
+            if self.events is not None and now - self.checked < settings.EVENTS_INDEX_TTL:
+                return self.events
+            self.checked = now
+            state = cache.get_many([self.generation_key, self.version_key])
+            generation = state.get(self.generation_key)
+            if generation is None:
+                generation = uuid.uuid4().hex
+                cache.add(self.generation_key, generation, None)
+                generation = cache.get(self.generation_key, generation)
+            version = state.get(self.version_key)
+            if version is None:
+                cache.add(self.version_key, 0, None)
+                version = cache.get(self.version_key, 0)
+            if (self.events is None or generation != self.generation or
+                    not self.update(version)):
+                # The changes logged after the version are reloaded, again if they are built
+                self.events = self.build()
+                self.generation = generation
+            self.version = version
+            return self.events
+
+    def publish(self, pks: list) -> None:
+        """Log the committed changes of the events for every process."""
+        try:
+            version = cache.incr(self.version_key)
+        except ValueError:
+            cache.add(self.version_key, 0, None)
+            version = cache.incr(self.version_key)
+        cache.set(self.change_key(version), pks, CHANGES_TTL)
+        with self.lock:
+            # This process reads its own writes
+            self.checked = 0.0
+
+    def changed(self, pks) -> None:
+        """
+        Update the events in every index when the transaction commits,
+        a process that reads them before would keep the old rows.
+        """
+        pks = list(pks)
+        transaction.on_commit(lambda: self.publish(pks))
+
+    def invalidate(self) -> None:
+        """Force the rebuild of the index in every process, e.g. after a bulk load."""
+        with self.lock:
+            self.events = None
+        cache.set(self.generation_key, uuid.uuid4().hex, None)
+
+    def bbox(self, south: float, west: float, north: float, east: float,
+             start: date = None, finish: date = None) -> list:
+        """Return the ids of the events inside a bounding box."""
+        events = self.refresh()
+        rows = events.band(south, north)
+        lngs = events.lngs[rows]
+        if west <= east:
+            mask = (lngs >= west) & (lngs <= east)
+        else:
+            # The box crosses the antimeridian
+            mask = (lngs >= west) | (lngs <= east)
+        mask &= events.window(rows, start, finish)
+        return events.ids[rows][mask].tolist()
+
+    def radius(self, lat: float, lng: float, km: float,
+               start: date = None, finish: date = None) -> list:
+        """Return the ids of the events within km of a point, the nearest first."""
+        events = self.refresh()
+        delta = np.degrees(km / EARTH_RADIUS)
+        rows = events.band(lat - delta, lat + delta)
+
+        lat1, lng1 = np.radians(lat), np.radians(lng)
+        lats, lngs = np.radians(events.lats[rows]), np.radians(events.lngs[rows])
+        a = (
+            np.sin((lats - lat1) / 2) ** 2 +
+            np.cos(lat1) * np.cos(lats) * np.sin((lngs - lng1) / 2) ** 2)
+        distances = 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+        mask = (distances <= km) & events.window(rows, start, finish)
+        order = np.argsort(distances[mask], kind='stable')
+        return events.ids[rows][mask][order].tolist()
+
+
+event_index = EventIndex()
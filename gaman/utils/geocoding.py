@@ -0,0 +1,209 @@
+"""Geocoding utils."""
+
+# Utilities
+from datetime import timedelta
+import hashlib
+import threading
+import time
+import unicodedata
+import requests
+
+# Django
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+# Models
+from gaman.sports.models import GeocodedPlace
+
+
+def normalize(place: str) -> str:
+    """Return the place name in its cache form."""
+    place = unicodedata.normalize('NFKC', place).casefold()
+    return ' '.join(place.split())[:180]
+
+
+class HereGeocoder:
+    """HERE geocoding api backend."""
+
+    def geocode(self, place: str) -> dict:
+        """
+        Determine country, state, city and
+        geocodification (lat-lng) from a place name.
+        """
+        params = {'q': place, 'apiKey': settings.API_MAPS_KEY}
+        response = requests.get(
+            settings.API_MAPS_URL, params=params, timeout=settings.API_MAPS_TIMEOUT)
+        response = response.json()['items'][0]
+        lat = response['position']['lat']
+        lng = response['position']['lng']
+        return {
+            'country': response['address']['countryName'],
+            'state': response['address']['county'],
+            'city': response['address']['city'],
+            'place': response['title'],
+            'geolocation': f'{lat} {lng}'
+        }
+
+
+class StubGeocoder:
+    """
+    Local geocoding backend.
+    Resolve every place to a stable fake ubication, for
+    tests and development without the HERE api.
+    """
+
+    calls = 0
+
+    def geocode(self, place: str) -> dict:
+        """Return a fake ubication derived from the place name."""
+        StubGeocoder.calls += 1
+        digest = hashlib.sha1(normalize(place).encode()).digest()
+        lat = round(int.from_bytes(digest[:4], 'big') / 2 ** 32 * 180 - 90, 5)
+        lng = round(int.from_bytes(digest[4:8], 'big') / 2 ** 32 * 360 - 180, 5)
+        return {
+            'country': 'Stubland', 'state': 'Stub',
+            'city': 'Stub City', 'place': place,
+            'geolocation': f'{lat} {lng}'
+        }
+
+
+class GeocodeCache:
+    """
+    Geocoding cache.
+
+    A place is resolved from the shared cache (redis), then from the
+    GeocodedPlace table and at last from the geocoding backend.
+    Entries expire after GEOCODE_TTL seconds and the least recently
+    used rows are evicted beyond GEOCODE_CACHE_SIZE.
+    Concurrent lookups of the same place are coalesced: a single
+    thread of the processes asks the backend and the others wait
+    for its result.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.inflight = {}
+
+    @staticmethod
+    def key(query: str) -> str:
+        """Return the cache key of a normalized place."""
+        return 'geocode:' + hashlib.sha1(query.encode()).hexdigest()
+
+    @staticmethod
+    def backend():
+        """Return the configured geocoding backend."""
+        return import_string(settings.GEOCODER_BACKEND)()
+
+    @staticmethod
+    def expiration():
+        """Return the oldest valid resolution datetime."""
+        return timezone.now() - timedelta(seconds=settings.GEOCODE_TTL)
+
+    def cached(self, query: str) -> dict:
+        """Return the cached ubication of a place or None."""
+        key = self.key(query)
+        ubication = cache.get(key)
+        if ubication is not None:
+            return ubication
+
+        row = GeocodedPlace.objects.filter(
+            query=query, updated__gte=self.expiration()).first()
+        if row is None:
+            return None
+
+        # Touch the row at most once a day, reads don't need a write each
+        now = timezone.now()
+        if row.last_used < now - timedelta(days=1):
+            GeocodedPlace.objects.filter(pk=row.pk).update(last_used=now)
+        ubication = row.ubication()
+        cache.set(key, ubication, settings.GEOCODE_TTL)
+        return ubication
+
+    def store(self, query: str, ubication: dict) -> None:
+        """Save a resolved place in the table and the shared cache."""
+        try:
+            with transaction.atomic():
+                GeocodedPlace.objects.update_or_create(
+                    query=query, defaults={**ubication, 'last_used': timezone.now()})
+        except IntegrityError:
+            pass  # Stored by a concurrent lookup
+        cache.set(self.key(query), ubication, settings.GEOCODE_TTL)
+
+    def resolve(self, place: str, query: str) -> dict:
+        """Ask the backend, or wait for the process that is already asking."""
+        lock_key = self.key(query) + ':lock'
+        if not cache.add(lock_key, 1, settings.GEOCODE_WAIT):
+            deadline = time.monotonic() + settings.GEOCODE_WAIT
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                ubication = cache.get(self.key(query))
+                if ubication is not None:
+                    return ubication
+        try:
+            ubication = self.backend().geocode(place)
+            self.store(query, ubication)
+            return ubication
+        finally:
+            cache.delete(lock_key)
+
+    def get(self, place: str) -> dict:
+        """Return the ubication of a place."""
+        query = normalize(place)
+        ubication = self.cached(query)
+        if ubication is not None:
+            return ubication
+
+        with self.lock:
+            event = self.inflight.get(query)
+            leader = event is None
+            if leader:
+                event = self.inflight[query] = threading.Event()
+
+        if not leader:
+            event.wait(settings.GEOCODE_WAIT)
+            ubication = self.cached(query)
+            if ubication is not None:
+                return ubication
+            return self.resolve(place, query)
+
+        try:
+            return self.resolve(place, query)
+        finally:
+            with self.lock:
+                del self.inflight[query]
+            event.set()
+
+    def get_many(self, places: list) -> dict:
+        """Return the ubication of each place, the cached are read in one query."""
+        queries = {}
+        for place in places:
+            queries.setdefault(normalize(place), place)
+
+        ubications = {}
+        rows = GeocodedPlace.objects.filter(
+            query__in=list(queries), updated__gte=self.expiration())
+        for row in rows:
+            ubications[row.query] = row.ubication()
+        for query, place in queries.items():
+            if query not in ubications:
+                ubications[query] = self.get(place)
+        return {place: ubications[normalize(place)] for place in places}
+
+    @staticmethod
+    def evict() -> int:
+        """Delete the expired places and the least recently used beyond the size."""
+        deleted, _ = GeocodedPlace.objects.filter(
+            updated__lt=GeocodeCache.expiration()).delete()
+        oldest = GeocodedPlace.objects.order_by('-last_used').values_list(
+            'last_used', flat=True)[settings.GEOCODE_CACHE_SIZE:settings.GEOCODE_CACHE_SIZE + 1]
+        oldest = list(oldest)
+        if oldest:
+            lru, _ = GeocodedPlace.objects.filter(last_used__lte=oldest[0]).delete()
+            deleted += lru
+        return deleted
+
+
+geocode_cache = GeocodeCache()
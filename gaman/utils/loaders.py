@@ -0,0 +1,183 @@
+"""Bulk loading utils."""
+
+# Utilities
+from contextlib import contextmanager
+from io import StringIO
+import os
+import time
+import pandas as pd
+
+# Django
+from django.core.management.base import BaseCommand
+from django.db import connection, models
+
+
+def read_csv(path: str, columns: list, chunksize: int):
+    """Yield the columns of a csv file in chunks of rows."""
+    yield from pd.read_csv(path, usecols=columns, chunksize=chunksize)
+
+
+def copy_value(value) -> str:
+    """Return a value in the PostgreSQL COPY text format."""
+    if value is None:
+        return r'\N'
+    return (
+        str(value).replace('\\', '\\\\').replace('\t', '\\t')
+        .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+class BulkLoader:
+    """
+    Streaming bulk loader.
+
+    Objects are inserted in batches with PostgreSQL COPY, their
+    primary keys are taken from the table sequence beforehand so
+    related rows can point to them. On other databases, or without
+    copy, it falls back to bulk_create. Signals and save() are not
+    called, like with bulk_create. The rows and time of each model
+    are kept for the report.
+    """
+
+    def __init__(self, batch_size: int = 10000, copy: bool = True):
+        self.batch_size = batch_size
+        self.copy = copy and connection.vendor == 'postgresql'
+        self.stats = {}
+        self.start = time.perf_counter()
+
+    def allocate_ids(self, model, count: int) -> list:
+        """Reserve count primary keys of the model table."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT nextval(pg_get_serial_sequence(%s, %s)) FROM generate_series(1, %s)',
+                [model._meta.db_table, model._meta.pk.column, count])
+            return [row[0] for row in cursor.fetchall()]
+
+    def copy_objects(self, model, objs: list) -> None:
+        """Insert the objects of a model with COPY."""
+        pk = model._meta.pk
+        missing = [obj for obj in objs if obj.pk is None]
+        if missing and isinstance(pk, models.AutoField):
+            for obj, pk_value in zip(missing, self.allocate_ids(model, len(missing))):
+                obj.pk = pk_value
+
+        fields = model._meta.concrete_fields
+        buffer = StringIO()
+        for obj in objs:
+            buffer.write('\t'.join(
+                copy_value(field.get_db_prep_save(field.pre_save(obj, True), connection))
+                for field in fields))
+            buffer.write('\n')
+        buffer.seek(0)
+
+        columns = ', '.join(connection.ops.quote_name(field.column) for field in fields)
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                f'COPY {connection.ops.quote_name(model._meta.db_table)} ({columns}) FROM STDIN',
+                buffer)
+
+    def insert(self, objs: list) -> list:
+        """Insert objects of the same model and return them with their pk."""
+        if not objs:
+            return objs
+        model = type(objs[0])
+        start = time.perf_counter()
+        for i in range(0, len(objs), self.batch_size):
+            batch = objs[i:i + self.batch_size]
+            if self.copy:
+                self.copy_objects(model, batch)
+            else:
+                model.objects.bulk_create(batch)
+
+        rows, seconds = self.stats.get(model._meta.label, (0, 0.0))
+        self.stats[model._meta.label] = (
+            rows + len(objs), seconds + time.perf_counter() - start)
+        return objs
+
+    def link(self, descriptor, pairs) -> list:
+        """Insert (source pk, target pk) pairs in the through table of a M2M."""
+        field = descriptor.field
+        through = descriptor.through
+        source, target = field.m2m_column_name(), field.m2m_reverse_name()
+        return self.insert([
+            through(**{source: source_id, target: target_id})
+            for source_id, target_id in pairs])
+
+    @contextmanager
+    def without_indexes(self, *models):
+        """
+        Drop the indexes of the tables that don't back a constraint
+        and create them again at the end. Only on PostgreSQL.
+        """
+        if connection.vendor != 'postgresql':
+            yield
+            return
+
+        tables = [model._meta.db_table for model in models]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT i.indexname, i.indexdef FROM pg_indexes i '
+                'WHERE i.schemaname = current_schema() AND i.tablename = ANY(%s) '
+                'AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conname = i.indexname)',
+                [tables])
+            indexes = cursor.fetchall()
+            for name, _ in indexes:
+                cursor.execute(f'DROP INDEX IF EXISTS {connection.ops.quote_name(name)}')
+        try:
+            yield
+        finally:
+            with connection.cursor() as cursor:
+                for _, definition in indexes:
+                    cursor.execute(definition)
+                for table in tables:
+                    cursor.execute(f'ANALYZE {connection.ops.quote_name(table)}')
+
+    def report(self) -> list:
+        """Return the rows and rows per second of each model."""
+        lines = [
+            f'{label}: {rows} rows in {seconds:.2f}s ({rows / max(seconds, 1e-6):.0f} rows/s)'
+            for label, (rows, seconds) in self.stats.items()]
+        lines.append(f'Total: {time.perf_counter() - self.start:.2f}s')
+        return lines
+
+
+class LoaderCommand(BaseCommand):
+    """
+    Base command of the csv loaders.
+    Subclasses set the models they fill and implement load().
+    """
+
+    models = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--data-dir', default='./data', help='Directory of the csv files.')
+        parser.add_argument(
+            '--chunk-size', type=int, default=10000,
+            help='Rows read and inserted at a time.')
+        parser.add_argument(
+            '--no-copy', action='store_true',
+            help='Insert with bulk_create instead of PostgreSQL COPY.')
+        parser.add_argument(
+            '--drop-indexes', action='store_true',
+            help='Drop the indexes of the loaded tables and create them at the end.')
+
+    def path(self, name: str) -> str:
+        """Return the path of a csv file."""
+        return os.path.join(self.options['data_dir'], name)
+
+    def handle(self, *args, **options):
+        self.options = options
+        loader = BulkLoader(options['chunk_size'], copy=not options['no_copy'])
+        if options['drop_indexes']:
+            with loader.without_indexes(*self.models):
+                message = self.load(loader, options['chunk_size'])
+        else:
+            message = self.load(loader, options['chunk_size'])
+
+        for line in loader.report():
+            self.stdout.write(line)
+        self.stdout.write(self.style.SUCCESS(message))
+
+    def load(self, loader: BulkLoader, chunksize: int) -> str:
+        """Load the data and return the success message."""
+        raise NotImplementedError
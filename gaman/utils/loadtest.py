@@ -0,0 +1,396 @@
+"""Load testing utils."""
+
+# Utilities
+import asyncio
+from collections import Counter, defaultdict
+import json
+import random
+import re
+import time
+import typing as t
+from urllib.parse import urlsplit
+import httpx
+import numpy as np
+
+# Django
+from django.urls import Resolver404, resolve, reverse
+
+# Django REST Framework
+from rest_framework.authtoken.models import Token
+
+# Models
+from gaman.posts.models import Comment, Post
+from gaman.sponsorships.models import Brand
+from gaman.sports.models import Club, League, SportEvent
+from gaman.users.models import User
+
+# Utils
+from gaman.utils.benchmarks import ROUTERS, percentile
+from gaman.utils.datasets import PASSWORD, power_law
+
+
+# Viewset -> router basename
+BASENAMES = {
+    viewset: basename
+    for router in ROUTERS.values() for _, viewset, basename in router.registry}
+
+
+class Request(t.NamedTuple):
+    """A request of the collection, its url as a route and kwargs names."""
+
+    name: str
+    method: str
+    route: str
+    basename: str
+    kwargs: tuple
+    body: dict
+
+
+class Step(t.NamedTuple):
+    """A request of a scenario, pages follows the next links of a list."""
+
+    request: str
+    pages: int = 1
+    body: t.Callable = None
+
+
+class Scenario(t.NamedTuple):
+    """Steps a virtual user runs in order, picked by weight."""
+
+    name: str
+    weight: float
+    steps: list
+
+
+class Stage(t.NamedTuple):
+    """Ramp the virtual users linearly to a target during a duration."""
+
+    duration: float
+    users: int
+
+
+# Routes the collection doesn't have
+EXTRA_REQUESTS = [
+    Request('List-Events', 'GET', 'sports:events-list', 'events', (), {}),
+    Request('Detail-Event', 'GET', 'sports:events-detail', 'events', ('pk',), {}),
+    Request(
+        'Events-Nearby', 'POST', 'sports:events-events-nearby', 'events', (),
+        {'lat': 6.2442, 'lng': -75.5812, 'radius': 50}),
+]
+
+SCENARIOS = [
+    Scenario('login', 5, [
+        Step('Login-User', body=lambda account, rng: {
+            'email': account['email'], 'password': PASSWORD})]),
+    Scenario('feed', 40, [
+        Step('List-Post', pages=3), Step('Detail-Post'), Step('List-comments')]),
+    Scenario('react', 20, [
+        Step('Detail-Post'),
+        Step('React-Post', body=lambda account, rng: {
+            'reaction': rng.choice(['Like', 'Love', 'Haha', 'Curious', 'Sad', 'Angry'])}),
+        Step('Reactions-Post')]),
+    Scenario('comment', 10, [
+        Step('List-comments'), Step('Create-Comment'),
+        Step('Comment-Replies'), Step('Reply-Comment')]),
+    Scenario('follow', 10, [
+        Step('Detail-Profile'), Step('List-Profile-Posts'), Step('Follow-Profile')]),
+    Scenario('events', 15, [
+        Step('List-Events', pages=2), Step('Detail-Event'), Step('Events-Nearby')]),
+]
+
+
+def request_body(request: dict) -> dict:
+    """Return the JSON or form text fields of a collection request."""
+    body = request.get('body') or {}
+    if body.get('mode') == 'raw':
+        try:
+            data = json.loads(body.get('raw') or '{}')
+        except ValueError:
+            return {}
+        return data if isinstance(data, dict) else {}
+    if body.get('mode') in ('formdata', 'urlencoded'):
+        return {
+            field['key']: field.get('value', '') for field in body[body['mode']]
+            if field.get('type', 'text') == 'text' and not field.get('disabled')}
+    return {}
+
+
+def load_collection(path: str) -> dict:
+    """
+    Return the requests of a Postman collection by name.
+    Their urls are resolved to routes, the path values are
+    replaced by the fixtures of each virtual user.
+    """
+    with open(path) as f:
+        items = json.load(f)['item']
+
+    requests = {request.name: request for request in EXTRA_REQUESTS}
+    while items:
+        item = items.pop(0)
+        if 'item' in item:
+            items += item['item']
+            continue
+        url = item['request']['url']
+        url = url['raw'] if isinstance(url, dict) else url
+        try:
+            match = resolve(urlsplit(url.replace('{{host}}', 'http://host')).path)
+        except Resolver404:
+            continue
+        requests[item['name']] = Request(
+            item['name'], item['request']['method'],
+            f'{match.namespace}:{match.url_name}',
+            BASENAMES.get(getattr(match.func, 'cls', None)),
+            tuple(match.kwargs), request_body(item['request']))
+    return requests
+
+
+class Fixtures:
+    """
+    Accounts and objects requested by the virtual users. The most
+    followed, reacted and attended objects are requested more often,
+    only public posts are requested.
+    """
+
+    def __init__(self, accounts: int = 1000, size: int = 10000,
+                 skew: float = 1.1, seed: int = 0):
+        self.rng = np.random.default_rng(seed)
+        self.skew = skew
+        self.accounts = [
+            {'token': key, 'username': username, 'email': email}
+            for key, username, email in Token.objects.filter(
+                user__verified=True, user__username__regex=r'^[a-zA-Z0-9]+$'
+            ).order_by('user').values_list('key', 'user__username', 'user__email')[:accounts]]
+
+        slug = r'^[a-zA-Z0-9_-]+$'
+        self.items = {
+            'users': list(User.objects.filter(
+                verified=True, username__regex=r'^[a-zA-Z0-9]+$'
+            ).order_by('-profile__followers_count').values_list('username', flat=True)[:size]),
+            'posts': list(Post.objects.filter(privacy='Public').order_by(
+                '-reactions').values_list('pk', flat=True)[:size]),
+            'comments': list(Comment.objects.filter(post__privacy='Public').order_by(
+                '-reactions').values_list('post_id', 'pk')[:size]),
+            'brands': list(Brand.objects.filter(slugname__regex=slug).order_by(
+                '-followers_count').values_list('slugname', flat=True)[:size]),
+            'clubs': list(Club.objects.filter(slugname__regex=slug).order_by(
+                '-followers_count').values_list('slugname', flat=True)[:size]),
+            'leagues': list(League.objects.filter(slugname__regex=slug).values_list(
+                'slugname', flat=True)[:size]),
+            'events': list(SportEvent.objects.order_by(
+                '-assistants_count').values_list('pk', flat=True)[:size]),
+        }
+        if not self.accounts:
+            raise ValueError('There are no verified accounts with a token.')
+
+    def pick(self, name: str):
+        items = self.items[name]
+        if not items:
+            raise ValueError(f'There are no {name} to request.')
+        return items[int(power_law(self.rng, len(items), 1, self.skew)[0])]
+
+    def kwargs(self, basename: str) -> dict:
+        """Return the url kwargs of a route basename."""
+        if basename in ('users', 'profiles'):
+            lookup = 'username' if basename == 'users' else 'user__username'
+            return {lookup: self.pick('users')}
+        if basename == 'comments':
+            post, comment = self.pick('comments')
+            return {'id': post, 'pk': comment}
+        if basename in ('brands', 'clubs', 'leagues'):
+            return {'slugname': self.pick(basename)}
+        if basename in ('posts', 'events'):
+            return {'pk': self.pick(basename)}
+        return {}
+
+
+def parse_stages(text: str) -> list:
+    """Parse a ramp profile like '30s:10,2m:100,30s:0'."""
+    stages = []
+    for stage in text.split(','):
+        duration, users = stage.split(':')
+        value = re.fullmatch(r'(\d+(?:\.\d+)?)(s|m)?', duration.strip())
+        if value is None:
+            raise ValueError(f'Invalid stage duration: {duration}')
+        seconds = float(value.group(1)) * (60 if value.group(2) == 'm' else 1)
+        stages.append(Stage(seconds, int(users)))
+    return stages
+
+
+def target_users(stages: list, elapsed: float) -> int:
+    """Return the virtual users of the ramp profile at a time."""
+    previous = 0
+    for stage in stages:
+        if elapsed < stage.duration:
+            return round(previous + (stage.users - previous) * elapsed / stage.duration)
+        elapsed -= stage.duration
+        previous = stage.users
+    return previous
+
+
+class Results:
+    """Latencies and errors of the requests by name."""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = Counter()
+        self.statuses = defaultdict(Counter)
+
+    def add(self, name: str, seconds: float, status) -> None:
+        self.latencies[name].append(seconds)
+        self.statuses[name][str(status)] += 1
+        if not isinstance(status, int) or status >= 400:
+            self.errors[name] += 1
+
+    def summary(self, duration: float) -> dict:
+        """Return the throughput, latency percentiles and error rate of each request."""
+        endpoints = {}
+        for name, latencies in sorted(self.latencies.items()):
+            endpoints[name] = {
+                'requests': len(latencies),
+                'rps': round(len(latencies) / duration, 2),
+                'error_rate': round(self.errors[name] / len(latencies), 4),
+                'statuses': dict(self.statuses[name]),
+                'p50_ms': percentile(latencies, 50),
+                'p95_ms': percentile(latencies, 95),
+                'p99_ms': percentile(latencies, 99),
+            }
+        total = sum(len(latencies) for latencies in self.latencies.values())
+        return {
+            'duration': round(duration, 2),
+            'requests': total,
+            'rps': round(total / duration, 2),
+            'error_rate': round(sum(self.errors.values()) / max(total, 1), 4),
+            'endpoints': endpoints,
+        }
+
+
+class LoadTest:
+    """
+    HTTP load test.
+
+    Virtual users are asyncio tasks sharing a connection pool, each
+    one picks a scenario by weight, runs its steps with its own
+    fixtures and waits a think time. The running virtual users
+    follow the ramp profile.
+    """
+
+    def __init__(self, host: str, requests: dict, fixtures: Fixtures, stages: list,
+                 scenarios: list = SCENARIOS, think: float = 0.5,
+                 timeout: float = 10.0, seed: int = 0):
+        missing = [
+            step.request for scenario in scenarios for step in scenario.steps
+            if step.request not in requests]
+        if missing:
+            raise ValueError(f"Unknown requests: {', '.join(missing)}")
+        for scenario in scenarios:
+            for step in scenario.steps:
+                if scenario.weight > 0 and requests[step.request].kwargs:
+                    fixtures.kwargs(requests[step.request].basename)  # Fail early
+        self.host = host.rstrip('/')
+        self.requests = requests
+        self.fixtures = fixtures
+        self.stages = stages
+        self.scenarios = [scenario for scenario in scenarios if scenario.weight > 0]
+        self.think = think
+        self.timeout = timeout
+        self.seed = seed
+        self.results = Results()
+
+    async def send(self, client, name: str, method: str, url: str,
+                   headers: dict, body: dict = None):
+        """Send a request and record its latency and status."""
+        start = time.perf_counter()
+        try:
+            response = await client.request(
+                method, url, headers=headers, json=body if method != 'GET' else None)
+        except httpx.HTTPError as e:
+            self.results.add(name, time.perf_counter() - start, type(e).__name__)
+            return None
+        self.results.add(name, time.perf_counter() - start, response.status_code)
+        return response
+
+    async def run_scenario(self, client, scenario: Scenario, account: dict, rng) -> None:
+        """Run the steps of a scenario, the path values are shared by the steps."""
+        context = {}
+        for step in scenario.steps:
+            request = self.requests[step.request]
+            kwargs = {}
+            if request.kwargs:
+                if request.basename not in context:
+                    context[request.basename] = self.fixtures.kwargs(request.basename)
+                kwargs = {name: context[request.basename][name] for name in request.kwargs}
+            url = self.host + reverse(request.route, kwargs=kwargs)
+            body = step.body(account, rng) if step.body else request.body
+            headers = {}
+            if request.route != 'users:users-login':
+                headers['Authorization'] = f"Token {account['token']}"
+
+            for _ in range(step.pages):
+                response = await self.send(
+                    client, request.name, request.method, url, headers, body)
+                if response is None or response.status_code != 200:
+                    break
+                try:
+                    url = response.json().get('next')
+                except (ValueError, AttributeError):
+                    url = None
+                if not url:
+                    break
+
+    async def virtual_user(self, client, index: int, stop: asyncio.Event) -> None:
+        rng = random.Random(self.seed * 100003 + index)
+        account = self.fixtures.accounts[index % len(self.fixtures.accounts)]
+        weights = [scenario.weight for scenario in self.scenarios]
+        while not stop.is_set():
+            scenario = rng.choices(self.scenarios, weights)[0]
+            await self.run_scenario(client, scenario, account, rng)
+            if self.think:
+                await asyncio.sleep(rng.expovariate(1 / self.think))
+
+    async def run(self) -> dict:
+        """Run the ramp profile and return the results summary."""
+        duration = sum(stage.duration for stage in self.stages)
+        limits = httpx.Limits(max_connections=max(stage.users for stage in self.stages) or 1)
+        users, tasks = [], []
+        async with httpx.AsyncClient(timeout=self.timeout, limits=limits) as client:
+            start = time.perf_counter()
+            while (elapsed := time.perf_counter() - start) < duration:
+                target = target_users(self.stages, elapsed)
+                while len(users) < target:
+                    stop = asyncio.Event()
+                    task = asyncio.create_task(self.virtual_user(client, len(users), stop))
+                    users.append((task, stop))
+                    tasks.append(task)
+                while len(users) > target:
+                    # Leaves after its current scenario
+                    users.pop()[1].set()
+                await asyncio.sleep(0.1)
+
+            # Let the virtual users finish their scenario
+            for _, stop in users:
+                stop.set()
+            if tasks:
+                await asyncio.wait(tasks, timeout=self.timeout)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            elapsed = time.perf_counter() - start
+        return self.results.summary(elapsed)
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 0.2) -> list:
+    """Return the regressions of the results against a baseline."""
+    regressions = []
+    if results['rps'] < baseline['rps'] * (1 - tolerance):
+        regressions.append(f"throughput {results['rps']} < {baseline['rps']} rps")
+    for name, result in results['endpoints'].items():
+        base = baseline['endpoints'].get(name)
+        if base is None:
+            continue
+        limit = max(base['p95_ms'] * (1 + tolerance), base['p95_ms'] + 5)
+        if result['p95_ms'] > limit:
+            regressions.append(f"{name}: p95 {result['p95_ms']}ms > {base['p95_ms']}ms")
+        if result['error_rate'] > base['error_rate'] + 0.01:
+            regressions.append(
+                f"{name}: error rate {result['error_rate']} > {base['error_rate']}")
+    return regressions
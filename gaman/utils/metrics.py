@@ -0,0 +1,210 @@
+"""Request metrics utils."""
+
+# Utilities
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+import logging
+import os
+import random
+import threading
+import time
+
+from prometheus_client import (CONTENT_TYPE_LATEST, CollectorRegistry,
+                               Histogram, REGISTRY, generate_latest, multiprocess)
+
+# Django
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse, HttpResponseForbidden
+
+
+logger = logging.getLogger('gaman.metrics')
+
+LABELS = ['view', 'method']
+
+REQUEST_TIME = Histogram(
+    'gaman_request_seconds', 'Wall time of the requests.', LABELS)
+DB_TIME = Histogram(
+    'gaman_request_db_seconds', 'Time spent in SQL queries per request.', LABELS)
+SERIALIZER_TIME = Histogram(
+    'gaman_request_serializer_seconds',
+    'Time spent building the serializers data per request.', LABELS)
+RENDER_TIME = Histogram(
+    'gaman_request_render_seconds', 'Time spent rendering the response per request.', LABELS)
+QUERIES = Histogram(
+    'gaman_request_queries', 'SQL queries per request.', LABELS,
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500))
+DUPLICATE_QUERIES = Histogram(
+    'gaman_request_duplicate_queries',
+    'SQL queries per request that repeat a previous statement (N+1).', LABELS,
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200))
+RESPONSE_SIZE = Histogram(
+    'gaman_response_bytes', 'Size of the responses.', LABELS,
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576))
+
+
+class RequestStats(threading.local):
+    """Stats of the request handled by the current thread."""
+
+    def reset(self) -> None:
+        self.active = True
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.render_time = 0.0
+        self.serializing = 0
+        self.queries = []
+
+
+stats = RequestStats()
+
+
+def record_query(execute, sql, params, many, context):
+    """Database execute wrapper that times each query."""
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - start
+        if getattr(stats, 'active', False):
+            stats.db_time += duration
+            stats.queries.append((sql, duration))
+
+
+@contextmanager
+def serializing():
+    """Add the time of the block to the serializer time, the nested blocks count once."""
+    if not getattr(stats, 'active', False):
+        yield
+        return
+    stats.serializing += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.serializing -= 1
+        if not stats.serializing:
+            stats.serializer_time += time.perf_counter() - start
+
+
+class TimedDataMixin:
+    """Serializer mixin that times the building of its data."""
+
+    @property
+    def data(self):
+        with serializing():
+            return super().data
+
+
+@lru_cache(maxsize=None)
+def timed(serializer_class):
+    """Return the subclass of a serializer class that times its data."""
+    return type(serializer_class.__name__, (TimedDataMixin, serializer_class), {
+        '__module__': serializer_class.__module__})
+
+
+class SerializerMetricsMixin:
+    """View mixin that times the data of the serializers of get_serializer."""
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        serializer.__class__ = timed(type(serializer))
+        return serializer
+
+
+def view_name(view_func, method: str) -> str:
+    """Return the viewset and action, or the function name, of a view."""
+    cls = getattr(view_func, 'cls', None)
+    if cls is None:
+        return getattr(view_func, '__name__', 'unknown')
+    action = (getattr(view_func, 'actions', None) or {}).get(method.lower(), method.lower())
+    return f'{cls.__name__}.{action}'
+
+
+class MetricsMiddleware:
+    """
+    Request metrics middleware.
+
+    Records per view and action the wall time, SQL time, query
+    count, repeated queries, serializer time (of the views with
+    SerializerMetricsMixin), render time and response size as
+    Prometheus histograms. Requests slower than METRICS_SLOW_REQUEST_MS
+    are logged, with their SQL, for a METRICS_TRACE_SAMPLE_RATE sample.
+    The queries of every database are timed with an execute wrapper,
+    so it works with DEBUG off.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        stats.reset()
+        request.metrics_view = 'unresolved'
+        start = time.perf_counter()
+        try:
+            with ExitStack() as wrappers:
+                for alias in settings.DATABASES:
+                    wrappers.enter_context(connections[alias].execute_wrapper(record_query))
+                response = self.get_response(request)
+        finally:
+            stats.active = False
+        duration = time.perf_counter() - start
+
+        labels = (request.metrics_view, request.method)
+        statements = Counter(sql for sql, _ in stats.queries)
+        duplicates = sum(count - 1 for count in statements.values())
+        REQUEST_TIME.labels(*labels).observe(duration)
+        DB_TIME.labels(*labels).observe(stats.db_time)
+        SERIALIZER_TIME.labels(*labels).observe(stats.serializer_time)
+        RENDER_TIME.labels(*labels).observe(stats.render_time)
+        QUERIES.labels(*labels).observe(len(stats.queries))
+        DUPLICATE_QUERIES.labels(*labels).observe(duplicates)
+        if not response.streaming:
+            RESPONSE_SIZE.labels(*labels).observe(len(response.content))
+
+        if (duration * 1000 >= settings.METRICS_SLOW_REQUEST_MS and
+                random.random() < settings.METRICS_TRACE_SAMPLE_RATE):
+            self.log_trace(request, response, duration, statements)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.metrics_view = view_name(view_func, request.method)
+
+    def process_template_response(self, request, response):
+        """Time the rendering of the response, it runs after this hook."""
+        start = time.perf_counter()
+
+        def rendered(response):
+            stats.render_time += time.perf_counter() - start
+
+        response.add_post_render_callback(rendered)
+        return response
+
+    @staticmethod
+    def log_trace(request, response, duration: float, statements: Counter) -> None:
+        """Log a slow request with its slowest and repeated queries."""
+        slowest = sorted(stats.queries, key=lambda query: query[1], reverse=True)[:10]
+        logger.warning(
+            'Slow request %s %s (%s) %s: %.1fms, %d queries in %.1fms, '
+            'serialized in %.1fms, rendered in %.1fms\n'
+            'Slowest queries:\n%s\nRepeated queries:\n%s',
+            request.method, request.path, request.metrics_view, response.status_code,
+            duration * 1000, len(stats.queries), stats.db_time * 1000,
+            stats.serializer_time * 1000, stats.render_time * 1000,
+            '\n'.join(f'  {seconds * 1000:.1f}ms {sql}' for sql, seconds in slowest),
+            '\n'.join(
+                f'  x{count} {sql}' for sql, count in statements.most_common(5) if count > 1))
+
+
+def metrics(request):
+    """Prometheus metrics endpoint, denied while METRICS_TOKEN is unset."""
+    token = settings.METRICS_TOKEN
+    if not token or request.headers.get('Authorization') != f'Bearer {token}':
+        return HttpResponseForbidden()
+
+    registry = REGISTRY
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        # Aggregate the gunicorn workers
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,39 @@
+"""Migrations utils."""
+
+# Django
+from django.db import migrations, models
+
+
+class AddIndexConcurrently(migrations.AddIndex):
+    """
+    Add an index without locking the table writes on PostgreSQL,
+    the migration must be non-atomic. Other databases use AddIndex.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'postgresql':
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.add_index(model, self.index, concurrently=True)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'postgresql':
+            return super().database_backwards(app_label, schema_editor, from_state, to_state)
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.remove_index(model, self.index, concurrently=True)
+
+
+def delete_duplicates(model: str, fields: list, condition: dict = None):
+    """Return a RunPython function that keeps the oldest row of each duplicated fields."""
+
+    def delete(apps, schema_editor):
+        Model = apps.get_model(*model.split('.'))
+        rows = Model.objects.filter(**(condition or {})).order_by()
+        duplicated = rows.values(*fields).annotate(
+            first=models.Min('pk'), total=models.Count('pk')).filter(total__gt=1)
+        for row in duplicated.iterator():
+            rows.filter(**{field: row[field] for field in fields}).exclude(pk=row['first']).delete()
+
+    return delete
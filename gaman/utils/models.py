@@ -3,6 +3,9 @@
 # Django
 from django.db import models
 
+# Utils
+from gaman.utils.authors import AUTHOR_NAMES, author_field
+
 
 class BaseGamanModel(models.Model):
     """
@@ -96,3 +99,66 @@ class BaseDataModel(models.Model):
     class Meta:
         """Meta option."""
         abstract = True
+
+
+class AuthoredModel(models.Model):
+    """
+    Authored model.
+
+    AuthoredModel acts as an abstract class for the models whose
+    author is a user, brand or club foreign key. Extend your models
+    of this class to denormalize the author in the fields:
+        + author_type (CharField): Store the author foreign key.
+        + author_pk (PositiveBigIntegerField): Store the author primary key.
+        + author_name (CharField): Store the username or slugname of the author.
+    """
+
+    # Author type choices
+    AUTHOR_TYPES = [('user', 'user'), ('brand', 'brand'), ('club', 'club')]
+
+    # Relation of the user behind each author type
+    AUTHOR_OWNERS = {'brand': 'sponsor', 'club': 'trainer'}
+
+    author_type = models.CharField(max_length=5, choices=AUTHOR_TYPES, blank=True)
+    author_pk = models.PositiveBigIntegerField(null=True, blank=True)
+    author_name = models.CharField(max_length=150, null=True, blank=True)
+
+    def specify_author(self):
+        """Specify if author is a user, brand or club."""
+        field = author_field(self)
+        return getattr(self, field) if field is not None else None
+
+    def normalize_author(self):
+        """Transform the author in user."""
+        author = self.specify_author()
+        owner = self.AUTHOR_OWNERS.get(author_field(self))
+        return getattr(author, owner) if owner is not None else author
+
+    def authored_by(self, user) -> bool:
+        """Return True if the user is the author or its owner, without queries for users."""
+        if author_field(self) == 'user':
+            return user.pk == self.user_id
+        return user == self.normalize_author()
+
+    def set_author(self) -> None:
+        """Denormalize the author foreign key."""
+        field = author_field(self)
+        if field is None:
+            self.author_type, self.author_pk, self.author_name = '', None, None
+            return
+        pk = getattr(self, f'{field}_id')
+        if (field, pk) != (self.author_type, self.author_pk) or self.author_name is None:
+            self.author_type, self.author_pk = field, pk
+            self.author_name = getattr(getattr(self, field), AUTHOR_NAMES[field])
+
+    def save(self, *args, **kwargs):
+        """Keep the denormalized author in sync with the foreign keys."""
+        self.set_author()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and not {*AUTHOR_NAMES}.isdisjoint(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'author_type', 'author_pk', 'author_name'}
+        return super().save(*args, **kwargs)
+
+    class Meta:
+        """Meta option."""
+        abstract = True
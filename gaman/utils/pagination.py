@@ -0,0 +1,149 @@
+"""Pagination utils."""
+
+# Utilities
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as DecodeError
+
+# Django
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+# Django REST Framework
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination.
+
+    Pages are sliced with a `(created, pk)` seek predicate instead
+    of an OFFSET, so each page costs O(page size) no matter how deep
+    it is, and rows inserted while scrolling don't shift the pages.
+    Requests with an `offset` query param are paginated with
+    LimitOffsetPagination for clients that need it. The lists that
+    were plain arrays keep their shape, with the links in a Link
+    header (get_list_response).
+    """
+
+    ordering = ('-created', '-pk')
+    page_size = api_settings.PAGE_SIZE
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'limit'
+    offset_query_param = 'offset'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return a page of the queryset."""
+        self.request = request
+        self.offset_paginator = None
+        if self.offset_query_param in request.query_params:
+            self.offset_paginator = LimitOffsetPagination()
+            return self.offset_paginator.paginate_queryset(queryset, request, view)
+
+        self.page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self.ordering)
+
+        cursor = self.decode_cursor(request)
+        if cursor:
+            queryset = queryset.filter(self.seek(*cursor))
+
+        page = list(queryset[:self.page_size + 1])
+        self.has_next = len(page) > self.page_size
+        self.page = page[:self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data, key: str = 'results', **extra):
+        """Return the page in key with the link to the next one."""
+        if self.offset_paginator:
+            response = self.offset_paginator.get_paginated_response(data)
+            response.data.update(extra)
+            response.data[key] = response.data.pop('results')
+            return response
+        return Response({**extra, 'next': self.get_next_link(), key: data})
+
+    def get_list_response(self, data):
+        """Return the page as an array, with its links in a Link header."""
+        if self.offset_paginator:
+            links = {
+                'next': self.offset_paginator.get_next_link(),
+                'prev': self.offset_paginator.get_previous_link()}
+        else:
+            links = {'next': self.get_next_link()}
+        response = Response(data)
+        header = ', '.join(f'<{url}>; rel="{rel}"' for rel, url in links.items() if url)
+        if header:
+            response['Link'] = header
+        return response
+
+    def get_page_size(self, request) -> int:
+        """Return the page size requested, bounded by max_page_size."""
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def get_next_link(self):
+        """Return the link to the next page."""
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        field = self.ordering[0].lstrip('-')
+        # The pages of the compiled serializers are values() rows
+        if isinstance(last, dict):
+            value, pk = last[field], last['pk']
+        else:
+            value, pk = getattr(last, field), last.pk
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(value, pk))
+
+    def seek(self, value, pk) -> Q:
+        """Return the predicate of the rows after the cursor, each key sorted in its direction."""
+        field, tiebreak = self.ordering
+        operator = 'lt' if field.startswith('-') else 'gt'
+        tiebreak_operator = 'lt' if tiebreak.startswith('-') else 'gt'
+        field = field.lstrip('-')
+        return (
+            Q(**{f'{field}__{operator}': value}) |
+            Q(**{field: value, f'pk__{tiebreak_operator}': pk}))
+
+    def encode_cursor(self, value, pk) -> str:
+        """Encode the position of a row."""
+        value = value.isoformat() if hasattr(value, 'isoformat') else value
+        position = f'{value}|{pk}'
+        return urlsafe_b64encode(position.encode('ascii')).decode('ascii')
+
+    def decode_cursor(self, request):
+        """Decode the cursor of the request, return None if there isn't."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            value, pk = urlsafe_b64decode(encoded.encode('ascii')).decode('ascii').split('|')
+            value, pk = parse_datetime(value), int(pk)
+        except (DecodeError, UnicodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if value is None:
+            raise NotFound(self.invalid_cursor_message)
+        return value, pk
+
+
+class FeedPagination(KeysetPagination):
+    """Newest first pagination for feeds and lists."""
+
+    ordering = ('-created', '-pk')
+
+
+class ThreadPagination(KeysetPagination):
+    """
+    Oldest first pagination for the comments and their threads.
+    The cursor needs an immutable key, the comments are listed most
+    reacted first only with offset pagination.
+    """
+
+    ordering = ('created', 'pk')
@@ -0,0 +1,247 @@
+"""Time partitioned tables utils."""
+
+# Utilities
+import re
+from datetime import datetime, timezone as tz
+
+# Django
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+
+BOUNDS = re.compile(r"FROM \((MINVALUE|'[^']+')\) TO \((MAXVALUE|'[^']+')\)")
+
+
+class PartitionError(Exception):
+    """The table can't be partitioned or maintained."""
+
+
+def add_months(date: datetime, months: int) -> datetime:
+    """Return the start (UTC) of the month months after the month of date."""
+    index = date.year * 12 + date.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=tz.utc)
+
+
+def bounds(expression: str) -> tuple:
+    """Return the start and end of a range partition bound, None if unbounded."""
+    return tuple(
+        None if value.endswith('VALUE') else parse_datetime(value.strip("'"))
+        for value in BOUNDS.search(expression).groups())
+
+
+class PartitionedTable:
+    """
+    Partitioned table.
+
+    A PostgreSQL table partitioned by range of created, a partition per
+    month. The table is converted in place: its rows become the history
+    partition and its constraints and indexes are created again on the
+    partitioned table, the primary key including created. The unique
+    constraints without created are kept in a keys table filled by a
+    trigger, the partitions can't check them. The tables referenced by foreign keys (posts, comments) can't be
+    converted, PostgreSQL needs the partition key in the referenced key.
+    """
+
+    def __init__(self, table: str, using: str = DEFAULT_DB_ALIAS):
+        self.table = table
+        self.connection = connections[using]
+        if self.connection.vendor != 'postgresql':
+            raise PartitionError('The partitioned tables need PostgreSQL.')
+
+    def execute(self, sql: str, params: list = None) -> list:
+        with self.connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall() if cursor.description else []
+
+    def quote(self, name: str) -> str:
+        return self.connection.ops.quote_name(name)
+
+    def is_partitioned(self) -> bool:
+        return bool(self.execute(
+            'SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass', [self.table]))
+
+    def references(self) -> list:
+        """Return the foreign keys of other tables to the table."""
+        return [row[0] for row in self.execute(
+            "SELECT conrelid::regclass::text || '.' || conname FROM pg_constraint "
+            "WHERE contype = 'f' AND confrelid = %s::regclass", [self.table])]
+
+    def unique_keys(self) -> list:
+        """Return the keys tables of the unique constraints and their columns."""
+        tables = [row[0] for row in self.execute(
+            'SELECT tgname FROM pg_trigger WHERE tgrelid = %s::regclass AND tgname LIKE %s',
+            [self.table, '%\\_keys'])]
+        return [(keys, [row[0] for row in self.execute(
+            'SELECT attname::text FROM pg_attribute WHERE attrelid = %s::regclass '
+            'AND attnum > 0 AND NOT attisdropped ORDER BY attnum', [self.quote(keys)])])
+            for keys in tables]
+
+    def keep_unique(self, name: str, columns: list) -> None:
+        """
+        Keep a unique constraint without created in the name_keys table.
+        A trigger adds the keys of the inserted and updated rows, so a
+        duplicate fails with the constraint name, and removes the keys
+        of the deleted rows. The keys with nulls are not unique.
+        """
+        table, keys = self.quote(self.table), self.quote(f'{name}_keys')
+        columns = [self.quote(column) for column in columns]
+        names = ', '.join(columns)
+        old = ' AND '.join(f'{column} = OLD.{column}' for column in columns)
+        new = ' AND '.join(f'NEW.{column} IS NOT NULL' for column in columns)
+        values = ', '.join(f'NEW.{column}' for column in columns)
+        self.execute(
+            f'CREATE TABLE {keys} AS SELECT {names} FROM {table} WHERE '
+            + ' AND '.join(f'{column} IS NOT NULL' for column in columns))
+        self.execute(f'ALTER TABLE {keys} ADD CONSTRAINT {self.quote(name)} UNIQUE ({names})')
+        self.execute(
+            f'CREATE FUNCTION {keys}() RETURNS trigger LANGUAGE plpgsql AS $$ BEGIN '
+            f"IF TG_OP <> 'INSERT' THEN DELETE FROM {keys} WHERE {old}; END IF; "
+            f"IF TG_OP <> 'DELETE' AND {new} THEN "
+            f'INSERT INTO {keys} ({names}) VALUES ({values}); END IF; '
+            'RETURN NULL; END $$')
+        self.execute(
+            f'CREATE TRIGGER {keys} AFTER INSERT OR UPDATE OF {names} OR DELETE ON {table} '
+            f'FOR EACH ROW EXECUTE FUNCTION {keys}()')
+
+    def partitions(self) -> list:
+        """Return the (name, start, end) of the partitions, sorted by start."""
+        rows = self.execute(
+            'SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) FROM pg_inherits i '
+            'JOIN pg_class c ON c.oid = i.inhrelid WHERE i.inhparent = %s::regclass',
+            [self.table])
+        partitions = [(name, *bounds(expression)) for name, expression in rows]
+        return sorted(partitions, key=lambda p: p[1] or datetime.min.replace(tzinfo=tz.utc))
+
+    def convert(self, months: int, now: datetime = None) -> None:
+        """Partition the table, its rows go to the history partition."""
+        if self.is_partitioned():
+            raise PartitionError(f'{self.table} is already partitioned.')
+        references = self.references()
+        if references:
+            raise PartitionError(
+                f'{self.table} is referenced by {", ".join(references)}, '
+                'a foreign key to a partitioned table needs the partition key.')
+
+        now = now or timezone.now()
+        table, history = self.quote(self.table), self.quote(f'{self.table}_history')
+        with transaction.atomic(using=self.connection.alias):
+            self.execute(f'LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE')
+            # The pending deferred checks of the transaction block the ALTER TABLE
+            self.connection.check_constraints()
+            constraints = self.execute(
+                'SELECT conname, contype, pg_get_constraintdef(oid), ARRAY(SELECT attname::text '
+                'FROM pg_attribute WHERE attrelid = conrelid AND attnum = ANY(conkey) '
+                'ORDER BY array_position(conkey, attnum)) FROM pg_constraint '
+                "WHERE conrelid = %s::regclass AND contype IN ('p', 'u', 'f')", [self.table])
+            indexes = self.execute(
+                'SELECT c.relname, pg_get_indexdef(c.oid) FROM pg_index i '
+                'JOIN pg_class c ON c.oid = i.indexrelid WHERE i.indrelid = %s::regclass '
+                'AND NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conindid = i.indexrelid '
+                "AND contype IN ('p', 'u'))", [self.table])
+            if any(' UNIQUE ' in definition for _, definition in indexes):
+                raise PartitionError(
+                    f'{self.table} has unique indexes, they must include created.')
+            sequences = self.execute(
+                'SELECT attname, pg_get_serial_sequence(%s, attname) FROM pg_attribute '
+                'WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped',
+                [self.table, self.table])
+
+            # The names are free for the partitioned table
+            for name, _, _, _ in constraints:
+                self.execute(f'ALTER TABLE {table} DROP CONSTRAINT {self.quote(name)}')
+            for name, _ in indexes:
+                self.execute(f'DROP INDEX {self.quote(name)}')
+            self.execute(f'ALTER TABLE {table} RENAME TO {history}')
+            self.execute(
+                f'CREATE TABLE {table} (LIKE {history} INCLUDING DEFAULTS INCLUDING '
+                'CONSTRAINTS INCLUDING STORAGE) PARTITION BY RANGE (created)')
+            for column, sequence in sequences:
+                if sequence:
+                    self.execute(f'ALTER SEQUENCE {sequence} OWNED BY {table}.{self.quote(column)}')
+
+            start = add_months(now, 0)
+            self.execute(
+                f'ALTER TABLE {table} ATTACH PARTITION {history} '
+                'FOR VALUES FROM (MINVALUE) TO (%s)', [start])
+            for name, kind, definition, columns in constraints:
+                if kind == 'u' and 'created' not in columns:
+                    self.keep_unique(name, columns)
+                    continue
+                if kind == 'p' and 'created' not in columns:
+                    definition = definition.replace(')', ', created)', 1)
+                self.execute(f'ALTER TABLE {table} ADD CONSTRAINT {self.quote(name)} {definition}')
+            for _, definition in indexes:
+                self.execute(definition)
+            self.ensure(months, now)
+
+    def ensure(self, months: int, now: datetime = None) -> list:
+        """Create the missing partitions up to months ahead, return their names."""
+        now = now or timezone.now()
+        partitions = self.partitions()
+        # From the end of the last partition, filling the missed months
+        month = partitions[-1][2] if partitions else add_months(now, 0)
+        created = []
+        while month <= add_months(now, months):
+            name = f'{self.table}_p{month:%Y%m}'
+            self.execute(
+                f'CREATE TABLE {self.quote(name)} PARTITION OF {self.quote(self.table)} '
+                'FOR VALUES FROM (%s) TO (%s)', [month, add_months(month, 1)])
+            created.append(name)
+            month = add_months(month, 1)
+        return created
+
+    def archive(self, months: int, now: datetime = None) -> list:
+        """
+        Detach the partitions older than months and move them to the
+        archive schema, return their names. The archived rows keep no
+        foreign keys, so they don't block the deletes of their posts, and
+        their unique keys are released.
+        """
+        schema = self.quote(settings.PARTITION_ARCHIVE_SCHEMA)
+        end = add_months(now or timezone.now(), -months)
+        unique_keys = self.unique_keys()
+        archived = []
+        for name, _, partition_end in self.partitions():
+            if partition_end > end:
+                break
+            with transaction.atomic(using=self.connection.alias):
+                self.connection.check_constraints()
+                self.execute(f'CREATE SCHEMA IF NOT EXISTS {schema}')
+                for keys, columns in unique_keys:
+                    self.execute(
+                        f'DELETE FROM {self.quote(keys)} k USING {self.quote(name)} p WHERE '
+                        + ' AND '.join(
+                            f'k.{self.quote(column)} = p.{self.quote(column)}'
+                            for column in columns))
+                self.execute(
+                    f'ALTER TABLE {self.quote(self.table)} DETACH PARTITION {self.quote(name)}')
+                for constraint, in self.execute(
+                        'SELECT conname FROM pg_constraint '
+                        "WHERE conrelid = %s::regclass AND contype = 'f'", [name]):
+                    self.execute(
+                        f'ALTER TABLE {self.quote(name)} DROP CONSTRAINT {self.quote(constraint)}')
+                self.execute(f'ALTER TABLE {self.quote(name)} SET SCHEMA {schema}')
+            archived.append(name)
+        return archived
+
+
+def maintain(tables: list = None, months: int = None, retention: int = None) -> dict:
+    """
+    Create the partitions of the next months of the partitioned tables
+    and archive the ones older than the retention (0 keeps them all).
+    The tables that are not partitioned yet are skipped.
+    """
+    tables = settings.PARTITIONED_TABLES if tables is None else tables
+    months = settings.PARTITION_MONTHS_AHEAD if months is None else months
+    retention = settings.PARTITION_RETENTION_MONTHS if retention is None else retention
+    result = {'created': [], 'archived': [], 'skipped': []}
+    for table in map(PartitionedTable, tables):
+        if not table.is_partitioned():
+            result['skipped'].append(table.table)
+            continue
+        result['created'] += table.ensure(months)
+        if retention:
+            result['archived'] += table.archive(retention)
+    return result
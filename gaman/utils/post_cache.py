@@ -0,0 +1,145 @@
+"""Serialized posts cache utils."""
+
+# Utilities
+from datetime import datetime
+import time
+import typing as t
+
+# Django
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# Models
+from gaman.posts.models import Post
+
+# Utils
+from gaman.utils.cache import LocalCache
+
+
+# Change it when the post representation changes
+VERSION = 1
+
+COUNTERS = ('reactions', 'comments', 'shares')
+
+
+class PostCache:
+    """
+    Serialized posts cache.
+
+    Keeps the representation of each post in the shared cache (redis)
+    and in a per-process LRU tier, stamped with the post updated date
+    so edits are never served stale. Counters change too often to be
+    cached, they are copied from the post rows. Signals invalidate the
+    posts on media, tags, reposted post and author name changes.
+    A page is read with one multi-get, the misses are serialized in a
+    batch. A single process serializes a missing post, the others wait
+    up to POST_CACHE_WAIT for it (viral posts).
+    """
+
+    local = LocalCache()
+
+    @staticmethod
+    def key(pk: int) -> str:
+        """Return the cache key of a post."""
+        return f'post:{VERSION}:{pk}'
+
+    @staticmethod
+    def stamp(updated: datetime) -> str:
+        """Return the stamp of a post from its updated date, it changes on every save."""
+        return updated.isoformat()
+
+    def cached(self, stamps: dict) -> dict:
+        """Return the cached representations with the same stamp."""
+        found, remote = {}, []
+        for pk, stamp in stamps.items():
+            entry = self.local.get(self.key(pk))
+            if entry is not None and entry[0] == stamp:
+                found[pk] = entry[1]
+            else:
+                remote.append(pk)
+        if remote:
+            entries = cache.get_many([self.key(pk) for pk in remote])
+            for pk in remote:
+                entry = entries.get(self.key(pk))
+                if entry is not None and entry[0] == stamps[pk]:
+                    found[pk] = entry[1]
+                    self.local.set(self.key(pk), entry)
+        return found
+
+    def store(self, entries: dict) -> None:
+        """Cache the (stamp, representation) of the posts."""
+        entries = {self.key(pk): entry for pk, entry in entries.items()}
+        cache.set_many(entries, settings.POST_CACHE_TTL)
+        for key, entry in entries.items():
+            self.local.set(key, entry)
+
+    def get_many(self, stamps: dict, serialize: t.Callable) -> dict:
+        """
+        Return the representations of the posts by pk, from their stamps by pk.
+        serialize(pks) returns the (stamp, representation) of the missing.
+        """
+        found = self.cached(stamps)
+        missing = [pk for pk in stamps if pk not in found]
+        if not missing:
+            return found
+
+        # Serialize the posts nobody else is serializing
+        locks = {pk: self.key(pk) + ':lock' for pk in missing}
+        owned = [pk for pk in missing if cache.add(locks[pk], 1, settings.POST_CACHE_WAIT)]
+        try:
+            if owned:
+                entries = serialize(owned)
+                self.store(entries)
+                found.update({pk: entry[1] for pk, entry in entries.items()})
+        finally:
+            cache.delete_many([locks[pk] for pk in owned])
+
+        # Wait for the others, then serialize what didn't arrive
+        waiting = {pk: stamps[pk] for pk in missing if pk not in found}
+        deadline = time.monotonic() + settings.POST_CACHE_WAIT
+        while waiting and time.monotonic() < deadline:
+            time.sleep(0.01)
+            arrived = self.cached(waiting)
+            found.update(arrived)
+            waiting = {pk: stamp for pk, stamp in waiting.items() if pk not in arrived}
+        if waiting:
+            entries = serialize(list(waiting))
+            self.store(entries)
+            found.update({pk: entry[1] for pk, entry in entries.items()})
+        return found
+
+    def invalidate(self, pks) -> None:
+        """
+        Remove the posts and their reposts from the caches, now and
+        when the transaction commits, the readers of the uncommitted
+        rows could cache them again with the same stamp. The other
+        processes keep their local tier up to LOCAL_CACHE_TTL.
+        """
+        pks = set(pks)
+        if not pks:
+            return
+        pks |= set(Post.objects.filter(post__in=pks).values_list('pk', flat=True))
+        keys = [self.key(pk) for pk in pks]
+
+        def delete():
+            for key in keys:
+                self.local.delete(key)
+            cache.delete_many(keys)
+
+        delete()
+        transaction.on_commit(delete)
+
+    def invalidate_where(self, *args, **kwargs) -> None:
+        """Remove the posts matching a filter, e.g. the posts of a renamed author."""
+        posts = Post.objects.filter(*args, **kwargs).values_list('pk', flat=True).distinct()
+        chunk = []
+        for pk in posts.iterator(chunk_size=1000):
+            chunk.append(pk)
+            if len(chunk) == 1000:
+                self.invalidate(chunk)
+                chunk = []
+        self.invalidate(chunk)
+
+
+post_cache = PostCache()
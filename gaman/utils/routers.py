@@ -0,0 +1,119 @@
+"""Database routers."""
+
+# Utilities
+from contextlib import ExitStack
+import hashlib
+import random
+import threading
+
+# Django
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+# Always read from the primary, e.g. a token is used right after the login
+PRIMARY_MODELS = {'authtoken.token'}
+
+
+class RoutingState(threading.local):
+    """Replica routing state of the request served by the current thread."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self, client: str = None) -> None:
+        self.client = client
+        self.replica = None
+        self.depth = 0
+        self.wrote = False
+
+
+state = RoutingState()
+
+
+def track_writes(execute, sql, params, many, context):
+    """Execute wrapper that flags the writes of the request."""
+    if sql.lstrip()[:6].upper() in ('INSERT', 'UPDATE', 'DELETE'):
+        state.wrote = True
+    return execute(sql, params, many, context)
+
+
+def pin_key(client: str) -> str:
+    """Return the cache key of a client pinned to the primary."""
+    return f'replica:pin:{client}'
+
+
+class ReplicaMiddleware:
+    """
+    Replica middleware.
+
+    Allows the replica reads in the safe actions (DATABASE_REPLICA_ACTIONS)
+    and pins a client (its Authorization header) to the primary for
+    DATABASE_REPLICA_PIN seconds after a request with writes, so it
+    reads its own writes even with replication lag.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        header = request.META.get('HTTP_AUTHORIZATION')
+        state.reset(hashlib.sha256(header.encode()).hexdigest() if header else None)
+        try:
+            with ExitStack() as wrappers:
+                for alias in settings.DATABASES:
+                    wrappers.enter_context(connections[alias].execute_wrapper(track_writes))
+                response = self.get_response(request)
+        finally:
+            wrote, client = state.wrote, state.client
+            state.reset()
+        if wrote and client and settings.DATABASE_REPLICA_WEIGHTS:
+            cache.set(pin_key(client), 1, settings.DATABASE_REPLICA_PIN)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """Pick the replica of a safe action, the view runs in the ATOMIC_REQUESTS block."""
+        if not settings.DATABASE_REPLICA_WEIGHTS or request.method not in ('GET', 'HEAD'):
+            return None
+        actions = getattr(view_func, 'actions', None) or {}
+        if actions.get('get') not in settings.DATABASE_REPLICA_ACTIONS:
+            return None
+        if state.client and cache.get(pin_key(state.client)):
+            return None
+
+        aliases, weights = zip(*settings.DATABASE_REPLICA_WEIGHTS.items())
+        state.replica = random.choices(aliases, weights)[0]
+        primary = connections[DEFAULT_DB_ALIAS]
+        state.depth = len(primary.savepoint_ids) + primary.in_atomic_block
+        return None
+
+
+class ReplicaRouter:
+    """
+    Replica router.
+
+    Sends the reads of the requests allowed by the replica middleware
+    to the replica picked for the request (weighted). The reads go to
+    the primary after the first write of the request and inside the
+    atomic blocks opened by the view. Requests without the middleware,
+    tasks and commands always use the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        if state.replica is None or state.wrote or model._meta.label_lower in PRIMARY_MODELS:
+            return None
+        if len(connections[DEFAULT_DB_ALIAS].savepoint_ids) > state.depth:
+            return None
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """The replicas have the same rows of the primary."""
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """The replicas get the migrations through the replication."""
+        return db == DEFAULT_DB_ALIAS
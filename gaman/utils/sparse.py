@@ -0,0 +1,184 @@
+"""Sparse fieldsets utils."""
+
+# Django
+from django.core.exceptions import FieldDoesNotExist
+
+# Django REST Framework
+from rest_framework import serializers
+
+# Utils
+from gaman.utils.metrics import SerializerMetricsMixin
+
+
+def parse(value: str) -> dict:
+    """Return the tree of comma separated dotted paths, e.g. pk,post.about."""
+    tree = {}
+    for path in value.split(','):
+        node = tree
+        for name in filter(None, path.strip().split('.')):
+            node = node.setdefault(name, {})
+    return tree
+
+
+def nested_serializer(field):
+    """Return the nested serializer of a field, or None."""
+    nested = getattr(field, 'child', field)
+    return nested if isinstance(nested, serializers.Serializer) else None
+
+
+def collapse(field):
+    """Return a primary keys field in place of a nested serializer."""
+    many = isinstance(field, serializers.ListSerializer)
+    collapsed = serializers.PrimaryKeyRelatedField(read_only=True, many=many, source=field.source)
+    collapsed.collapsed = True
+    return collapsed
+
+
+def covers(paths: set, lookup: str) -> bool:
+    """Return if the lookup is one of the paths or it's on the way to one of them."""
+    return any(path == lookup or path.startswith(f'{lookup}__') for path in paths)
+
+
+def relation(model, name: str):
+    """Return the relation field of a model, or None."""
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+    return field if field.is_relation else None
+
+
+def related_paths(serializer, prefix: str = '') -> set:
+    """Return the lookups of the relations read by the fields of a serializer."""
+    serializer = getattr(serializer, 'child', serializer)
+    model = serializer.Meta.model
+    related = getattr(serializer.Meta, 'sparse_related', {})
+    paths = set()
+    for name, field in serializer.fields.items():
+        paths.update(prefix + path for path in related.get(name, []))
+        if field.source == '*':
+            nested = nested_serializer(field)
+            if nested is not None:
+                paths |= related_paths(nested, prefix)
+            continue
+        field_relation = relation(model, field.source_attrs[0])
+        if field_relation is None:
+            continue
+        path = prefix + field.source_attrs[0]
+        nested = nested_serializer(field)
+        if nested is not None and len(field.source_attrs) == 1:
+            paths.add(path)
+            paths |= related_paths(nested, f'{path}__')
+        elif not getattr(field, 'collapsed', False) or not field_relation.concrete:
+            # A collapsed foreign key reads its key from its column
+            paths.add(path)
+    return paths
+
+
+def trim_queryset(queryset, serializer):
+    """
+    Return the queryset without the select_related and prefetch_related
+    lookups of the fields pruned or collapsed in the serializer. The
+    lookups unknown to the serializer are kept.
+    """
+    child = getattr(serializer, 'child', serializer)
+    if getattr(child, 'get_sparse', lambda: None)() is None:
+        return queryset
+    needed = related_paths(child)
+    known = related_paths(type(child)(context={}))
+
+    def keep(lookup):
+        return covers(needed, lookup) or not covers(known, lookup)
+
+    select = queryset.query.select_related
+    if isinstance(select, dict):
+        lookups, nodes = [], [('', select)]
+        while nodes:
+            prefix, tree = nodes.pop()
+            for name, subtree in tree.items():
+                lookups.append(prefix + name)
+                nodes.append((f'{prefix}{name}__', subtree))
+        queryset = queryset.select_related(None)
+        kept = [lookup for lookup in lookups if keep(lookup)]
+        if kept:
+            queryset = queryset.select_related(*kept)
+
+    prefetch = queryset._prefetch_related_lookups
+    if prefetch:
+        queryset = queryset.prefetch_related(None).prefetch_related(*[
+            lookup for lookup in prefetch
+            if keep(getattr(lookup, 'prefetch_through', lookup))])
+    return queryset
+
+
+class SparseModelSerializer(serializers.ModelSerializer):
+    """
+    Sparse model serializer.
+
+    Handles the sparse fieldsets (?fields=pk,about,post.about) and the
+    expansion controls (?expand=post) of the GET requests. The fields
+    out of fields are pruned before the representation, and when expand
+    is given the nested serializers out of it are collapsed to their
+    primary keys. Meta.sparse_related maps the fields that read
+    relations through methods, e.g. {'author': ['user', 'brand', 'club']}.
+    """
+
+    def get_sparse(self):
+        """Return the (fields, expand) trees of the serializer, None if it's not sparse."""
+        if hasattr(self, '_sparse'):
+            return self._sparse
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        request = self.context.get('request')
+        if parent is not None or request is None or request.method not in ('GET', 'HEAD'):
+            return None
+        params = getattr(request, 'query_params', request.GET)
+        if 'fields' not in params and 'expand' not in params:
+            return None
+        return (
+            parse(params['fields']) if 'fields' in params else None,
+            parse(params['expand']) if 'expand' in params else None)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        sparse = self.get_sparse()
+        if sparse is None:
+            return fields
+        only, expand = sparse
+        for name in list(fields):
+            if only is not None and name not in only:
+                del fields[name]
+                continue
+            nested = nested_serializer(fields[name])
+            if nested is None or not isinstance(nested, SparseModelSerializer):
+                continue
+            if expand is not None and name not in expand and fields[name].source != '*':
+                fields[name] = collapse(fields[name])
+            else:
+                nested._sparse = (
+                    only[name] or None if only is not None else None,
+                    expand[name] if expand is not None else None)
+        return fields
+
+
+class SparseFieldsMixin(SerializerMetricsMixin):
+    """
+    Sparse fields view mixin.
+    Trims the related lookups of the fields that the request prunes or
+    collapses from the querysets of list and retrieve, the actions
+    with other serializers trim their querysets with trim_queryset.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action in ('list', 'retrieve'):
+            queryset = self.trim_queryset(queryset)
+        return queryset
+
+    def trim_queryset(self, queryset, serializer_class=None):
+        """Trim a queryset for the serializer (the view's by default) of the request."""
+        serializer_class = serializer_class or self.get_serializer_class()
+        if not issubclass(serializer_class, SparseModelSerializer):
+            return queryset
+        return trim_queryset(queryset, serializer_class(context=self.get_serializer_context()))
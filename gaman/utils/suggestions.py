@@ -0,0 +1,219 @@
+"""Follow suggestions utils."""
+
+# Utilities
+import pandas as pd
+
+# Django
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+
+# Models
+from gaman.sponsorships.models import Brand
+from gaman.sports.models import Club, Member
+from gaman.users.models import FollowSuggestion, FollowUp, Profile
+
+
+def frame(queryset, columns: list) -> pd.DataFrame:
+    """Return the values of a queryset as a data frame."""
+    rows = queryset.order_by().values_list(*columns).iterator(chunk_size=10000)
+    return pd.DataFrame.from_records(list(rows), columns=columns)
+
+
+def chunks(values, size: int = 10000):
+    """Split values in lists of size elements."""
+    values = list(values)
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+class SuggestionEngine:
+    """
+    Follow suggestion engine.
+
+    Candidates are the users, brands and clubs followed by the
+    followed of a user (two-hop traversal of the follow graph)
+    and the members of their clubs. They are ranked by mutual
+    follows, club membership overlap and shared sport and country.
+    The traversal is a vectorized join over the FollowUp edges of
+    a batch of users, it doesn't load the whole graph.
+    """
+
+    MUTUAL_WEIGHT = 3.0
+    CLUB_WEIGHT = 2.0
+    SPORT_WEIGHT = 1.0
+    COUNTRY_WEIGHT = 1.0
+
+    def __init__(self, size: int = None):
+        self.size = size or settings.SUGGESTIONS_SIZE
+
+    def two_hop(self, user_ids: list):
+        """Return the follows of the users and the follows of their followed."""
+        follows = frame(
+            FollowUp.objects.filter(follower__in=user_ids),
+            ['follower_id', 'user_id', 'brand_id', 'club_id'])
+        followed = FollowUp.objects.filter(
+            follower__in=user_ids, user__isnull=False).values('user')
+        second = frame(
+            FollowUp.objects.filter(follower__in=followed),
+            ['follower_id', 'user_id', 'brand_id', 'club_id'])
+
+        first = follows.dropna(subset=['user_id'])[['follower_id', 'user_id']]
+        first = first.rename(columns={'follower_id': 'owner', 'user_id': 'mid'})
+        hops = first.merge(second, left_on='mid', right_on='follower_id')
+        return follows, first, hops
+
+    @staticmethod
+    def mutuals(hops: pd.DataFrame, column: str) -> pd.DataFrame:
+        """Count the followed of the owner that follow each candidate."""
+        pairs = hops.dropna(subset=[column])[['owner', 'mid', column]].drop_duplicates()
+        pairs = pairs.rename(columns={column: 'candidate'})
+        return pairs.groupby(['owner', 'candidate']).size().rename('mutual').reset_index()
+
+    @staticmethod
+    def exclude_followed(candidates: pd.DataFrame, follows: pd.DataFrame, column: str):
+        """Remove the candidates already followed by the owner."""
+        followed = follows.dropna(subset=[column])[['follower_id', column]]
+        followed = followed.rename(columns={'follower_id': 'owner', column: 'candidate'})
+        candidates = candidates.merge(
+            followed.drop_duplicates(), how='left', indicator=True)
+        return candidates[candidates['_merge'] == 'left_only'].drop(columns='_merge')
+
+    def user_candidates(self, user_ids, follows, hops) -> pd.DataFrame:
+        """Return the user candidates with their score."""
+        mutual = self.mutuals(hops, 'user_id')
+
+        # Members of the same clubs
+        clubs = frame(Member.objects.filter(user__in=user_ids), ['user_id', 'club_id'])
+        members = frame(
+            Member.objects.filter(club__in=Member.objects.filter(
+                user__in=user_ids).values('club')), ['user_id', 'club_id'])
+        shared = clubs.rename(columns={'user_id': 'owner'}).merge(members, on='club_id')
+        shared = shared.groupby(['owner', 'user_id']).size().rename('clubs').reset_index()
+        shared = shared.rename(columns={'user_id': 'candidate'})
+
+        candidates = mutual.merge(shared, how='outer', on=['owner', 'candidate'])
+        candidates = candidates[candidates['owner'] != candidates['candidate']]
+        candidates = self.exclude_followed(candidates, follows, 'user_id')
+        if candidates.empty:
+            return candidates
+
+        profiles = pd.concat([
+            frame(
+                Profile.objects.filter(user__in=pks, user__verified=True),
+                ['user_id', 'user__username', 'sport', 'country'])
+            for pks in chunks(pd.concat([candidates['owner'], candidates['candidate']]).unique())])
+        owners = profiles.rename(columns={
+            'user_id': 'owner', 'sport': 'owner_sport', 'country': 'owner_country'})
+        candidates = candidates.merge(
+            owners[['owner', 'owner_sport', 'owner_country']], on='owner', how='left')
+        candidates = candidates.merge(
+            profiles.rename(columns={'user_id': 'candidate', 'user__username': 'name'}),
+            on='candidate')
+
+        same_sport = (candidates['sport'] != '') & (candidates['sport'] == candidates['owner_sport'])
+        same_country = (candidates['country'] != '') & (
+            candidates['country'] == candidates['owner_country'])
+        candidates = candidates.fillna({'mutual': 0, 'clubs': 0})
+        candidates['score'] = (
+            candidates['mutual'] * self.MUTUAL_WEIGHT +
+            candidates['clubs'] * self.CLUB_WEIGHT +
+            same_sport * self.SPORT_WEIGHT +
+            same_country * self.COUNTRY_WEIGHT)
+        candidates['type'] = 'user'
+        return candidates
+
+    def brand_candidates(self, follows, hops) -> pd.DataFrame:
+        """Return the brand candidates with their score."""
+        candidates = self.exclude_followed(self.mutuals(hops, 'brand_id'), follows, 'brand_id')
+        if candidates.empty:
+            return candidates
+        brands = frame(
+            Brand.objects.filter(pk__in=candidates['candidate'].unique().tolist()),
+            ['pk', 'slugname'])
+        candidates = candidates.merge(
+            brands.rename(columns={'pk': 'candidate', 'slugname': 'name'}), on='candidate')
+        candidates['score'] = candidates['mutual'] * self.MUTUAL_WEIGHT
+        candidates['type'] = 'brand'
+        return candidates
+
+    def club_candidates(self, user_ids, follows, first, hops) -> pd.DataFrame:
+        """Return the club candidates with their score."""
+        mutual = self.mutuals(hops, 'club_id')
+
+        # Followed that are members of the club
+        followed = FollowUp.objects.filter(
+            follower__in=user_ids, user__isnull=False).values('user')
+        members = frame(Member.objects.filter(user__in=followed), ['user_id', 'club_id'])
+        overlap = first.merge(members, left_on='mid', right_on='user_id')
+        overlap = overlap.groupby(['owner', 'club_id'])['mid'].nunique().rename('clubs')
+        overlap = overlap.reset_index().rename(columns={'club_id': 'candidate'})
+
+        candidates = mutual.merge(overlap, how='outer', on=['owner', 'candidate'])
+        candidates = self.exclude_followed(candidates, follows, 'club_id')
+        if candidates.empty:
+            return candidates
+        clubs = frame(
+            Club.objects.filter(pk__in=candidates['candidate'].unique().tolist()),
+            ['pk', 'slugname'])
+        candidates = candidates.merge(
+            clubs.rename(columns={'pk': 'candidate', 'slugname': 'name'}), on='candidate')
+        candidates = candidates.fillna({'mutual': 0, 'clubs': 0})
+        candidates['score'] = (
+            candidates['mutual'] * self.MUTUAL_WEIGHT +
+            candidates['clubs'] * self.CLUB_WEIGHT)
+        candidates['type'] = 'club'
+        return candidates
+
+    def compute(self, user_ids: list) -> dict:
+        """Return the ranked suggestions of each user."""
+        follows, first, hops = self.two_hop(user_ids)
+        candidates = [
+            self.user_candidates(user_ids, follows, hops),
+            self.brand_candidates(follows, hops),
+            self.club_candidates(user_ids, follows, first, hops)]
+        candidates = [c for c in candidates if not c.empty]
+
+        suggestions = {pk: [] for pk in user_ids}
+        if not candidates:
+            return suggestions
+
+        ranked = pd.concat(candidates).fillna({'mutual': 0})
+        ranked = ranked.sort_values(['owner', 'score'], ascending=[True, False])
+        ranked = ranked.groupby('owner').head(self.size)
+        for row in ranked.itertuples(index=False):
+            suggestions[int(row.owner)].append({
+                'type': row.type,
+                'id': int(row.candidate),
+                'name': row.name,
+                'mutual': int(row.mutual),
+                'score': float(row.score)})
+        return suggestions
+
+    def refresh(self, user_ids: list) -> int:
+        """Compute and store the suggestions of the users."""
+        suggestions = self.compute(user_ids)
+        with transaction.atomic():
+            FollowSuggestion.objects.filter(user__in=user_ids).delete()
+            FollowSuggestion.objects.bulk_create([
+                FollowSuggestion(user_id=pk, items=items)
+                for pk, items in suggestions.items()])
+        return len(suggestions)
+
+    @staticmethod
+    def pending(full: bool = False):
+        """Return the ids of the users whose suggestions have to be refreshed."""
+        if full:
+            users = FollowUp.objects.values('follower')
+        else:
+            users = FollowUp.objects.filter(
+                Q(follower__follow_suggestions__isnull=True) |
+                Q(follower__follow_suggestions__stale=True)).values('follower')
+        return users.order_by('follower').distinct().values_list('follower', flat=True)
+
+    def refresh_pending(self, full: bool = False) -> int:
+        """Refresh the suggestions of the pending users in batches."""
+        refreshed = 0
+        for user_ids in chunks(self.pending(full).iterator(), settings.SUGGESTIONS_BATCH):
+            refreshed += self.refresh(user_ids)
+        return refreshed
@@ -0,0 +1,63 @@
+"""Test runner utils."""
+
+# Utilities
+import shutil
+from unittest import TextTestResult
+
+# Django
+from django.conf import settings
+from django.core.cache import cache
+from django.test.runner import (DiscoverRunner, ParallelTestSuite,
+                                RemoteTestResult, RemoteTestRunner)
+
+# Utils
+from gaman.utils.cache import LocalCache
+from gaman.utils.geo import event_index
+
+
+def clear_caches() -> None:
+    """Clear the shared cache, the local tiers and the events index."""
+    cache.clear()
+    for local in list(LocalCache.instances):
+        local.clear()
+    event_index.invalidate()
+
+
+class ClearCachesMixin:
+    """
+    Clears the caches before the setUp of each test, the test
+    databases reuse the primary keys between the test cases.
+    """
+
+    def startTest(self, test):
+        clear_caches()
+        super().startTest(test)
+
+
+class RemoteClearCachesResult(ClearCachesMixin, RemoteTestResult):
+    pass
+
+
+class RemoteClearCachesRunner(RemoteTestRunner):
+    resultclass = RemoteClearCachesResult
+
+
+class ParallelClearCachesSuite(ParallelTestSuite):
+    runner_class = RemoteClearCachesRunner
+
+
+class TestRunner(DiscoverRunner):
+    """
+    Test runner that clears the caches before each test, also in
+    --parallel, and removes the uploads of the run.
+    """
+
+    parallel_test_suite = ParallelClearCachesSuite
+
+    def get_resultclass(self):
+        resultclass = super().get_resultclass() or TextTestResult
+        return type(resultclass.__name__, (ClearCachesMixin, resultclass), {})
+
+    def teardown_test_environment(self, **kwargs):
+        super().teardown_test_environment(**kwargs)
+        shutil.rmtree(settings.MEDIA_ROOT, ignore_errors=True)
@@ -0,0 +1,146 @@
+"""Home timeline utils."""
+
+# Utilities
+import random
+
+# Django
+from django.conf import settings
+from django.db.models import Q
+
+# Models
+from gaman.posts.models import Post, TimelineEntry
+from gaman.sponsorships.models import Brand
+from gaman.sports.models import Club
+from gaman.users.models import FollowUp, Profile, User
+
+# Utils
+from gaman.utils.follows import FollowGraph
+
+
+class HomeTimeline:
+    """
+    Materialized home timeline.
+
+    Posts are written to the timeline of each follower of
+    the author when they are created (fan-out on write).
+    Authors with more followers than TIMELINE_FANOUT_LIMIT
+    are not fanned out, their posts are merged when the
+    timeline is read (fan-out on read). A timeline is trimmed
+    to TIMELINE_SIZE about every TIMELINE_TRIM_EVERY posts
+    written to it.
+    """
+
+    # The counters of the followers of each author type
+    AUTHORS = {
+        'user_id': (Profile, 'user'),
+        'brand_id': (Brand, 'pk'),
+        'club_id': (Club, 'pk'),
+    }
+
+    @staticmethod
+    def author_lookup(obj) -> dict:
+        """Return the author lookup of a post or the followed of a follow-up."""
+        for field in ('user_id', 'brand_id', 'club_id'):
+            value = getattr(obj, field)
+            if value:
+                return {field: value}
+        return {}
+
+    @classmethod
+    def high_follower(cls, field: str, ids) -> list:
+        """Return the authors of a type (user_id, brand_id...) served on read."""
+        if not ids:
+            return []
+        model, key = cls.AUTHORS[field]
+        return list(model.objects.filter(**{
+            f'{key}__in': ids, 'followers_count__gt': settings.TIMELINE_FANOUT_LIMIT,
+        }).values_list(key, flat=True))
+
+    @classmethod
+    def fan_out(cls, post: Post) -> int:
+        """
+        Write the post in the timelines of the author followers.
+        Return the number of timelines written.
+        """
+        lookup = cls.author_lookup(post)
+        if not lookup:
+            return 0
+
+        owners = []
+        if post.user_id:
+            owners.append(post.user_id)
+
+        [(field, author)] = lookup.items()
+        if not cls.high_follower(field, [author]):
+            owners += list(FollowUp.objects.filter(
+                **lookup).values_list('follower_id', flat=True))
+            fanned_out = True
+        else:
+            # High-follower author, is served on read
+            fanned_out = False
+
+        owners = set(owners)
+        TimelineEntry.objects.bulk_create(
+            [TimelineEntry(owner_id=owner, post=post) for owner in owners],
+            batch_size=1000, ignore_conflicts=True)
+        for owner in owners:
+            if random.random() * settings.TIMELINE_TRIM_EVERY < 1:
+                cls.trim(owner)
+
+        if fanned_out:
+            Post.objects.filter(pk=post.pk).update(fanned_out=True)
+            post.fanned_out = True
+        return len(owners)
+
+    @classmethod
+    def backfill(cls, followup: FollowUp) -> None:
+        """Write the latest posts of the followed in the follower timeline."""
+        lookup = cls.author_lookup(followup)
+        if not lookup:
+            return
+        posts = Post.objects.filter(
+            **lookup, fanned_out=True
+        ).order_by('-pk').values_list('pk', flat=True)[:settings.TIMELINE_BACKFILL]
+        TimelineEntry.objects.bulk_create(
+            [TimelineEntry(owner_id=followup.follower_id, post_id=pk) for pk in posts],
+            ignore_conflicts=True)
+
+    @classmethod
+    def prune(cls, followup: FollowUp) -> None:
+        """Remove the posts of the unfollowed from the follower timeline."""
+        lookup = cls.author_lookup(followup)
+        if not lookup:
+            return
+        lookup = {f'post__{field}': value for field, value in lookup.items()}
+        TimelineEntry.objects.filter(
+            owner_id=followup.follower_id, **lookup).delete()
+
+    @classmethod
+    def trim(cls, user_id: int, size: int = None) -> int:
+        """Keep only the newest entries of the user timeline."""
+        size = size or settings.TIMELINE_SIZE
+        oldest = TimelineEntry.objects.filter(
+            owner_id=user_id).order_by('-post_id').values_list('post', flat=True)[size:size + 1]
+        oldest = list(oldest)
+        if not oldest:
+            return 0
+        deleted, _ = TimelineEntry.objects.filter(
+            owner_id=user_id, post__lte=oldest[0]).delete()
+        return deleted
+
+    @classmethod
+    def posts(cls, user: User):
+        """
+        Return the home timeline posts of a user, the entries and
+        the posts not fanned out of the followed high-follower authors.
+        """
+        entries = TimelineEntry.objects.filter(owner=user).values('post')
+        followed = FollowGraph.followed_ids(user)
+        on_read = Q()
+        for field, ids in zip(cls.AUTHORS, followed):
+            authors = cls.high_follower(field, ids)
+            if authors:
+                on_read |= Q(**{f'{field}__in': authors})
+        if not on_read:
+            return Post.objects.filter(pk__in=entries)
+        return Post.objects.filter(Q(pk__in=entries) | Q(fanned_out=False) & on_read)
@@ -7,6 +7,10 @@ import os
 
 # Celery
 from celery import Celery
+from celery.signals import task_prerun
+
+# Utils
+from gaman.utils.db import check_connections
 
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.local')
@@ -16,6 +20,9 @@ app = Celery('taskapp', include=['taskapp.tasks'])
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
 
+# Health checks of the persistent database connections
+task_prerun.connect(check_connections)
+
 
 if __name__ == '__main__':
     app.start()
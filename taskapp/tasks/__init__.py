@@ -1,2 +1,5 @@
 from .users import *
-from .events import *
\ No newline at end of file
+from .events import *
+from .counters import *
+from .suggestions import *
+from .partitions import *
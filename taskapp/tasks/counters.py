@@ -0,0 +1,22 @@
+"""Counters tasks."""
+
+from __future__ import absolute_import, unicode_literals
+
+# Django
+from django.conf import settings
+
+# Celery
+from taskapp.celery import app
+
+# Utils
+from gaman.utils.counters import flush, forget_flushes
+
+
+@app.task(bind=True)
+def flush_counters(self):
+    """Apply the counters deltas buffered in redis."""
+    if not settings.COUNTERS_BUFFER:
+        return 'Disabled'
+    updated = sum(flush(label) for label in settings.COUNTERS_BUFFERED)
+    forget_flushes()
+    return f'{updated} rows updated'
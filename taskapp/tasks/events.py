@@ -14,6 +14,10 @@ from taskapp.celery import app
 # Models
 from gaman.sports.models import SportEvent
 
+# Utils
+from gaman.utils.geo import event_index
+from gaman.utils.geocoding import geocode_cache
+
 
 @app.task(bind=True)
 def delete_sport_event(self, pk: int, geolocation: str):
@@ -28,3 +32,35 @@ def delete_sport_event(self, pk: int, geolocation: str):
         return 'Success' if response.status_code == 200 else 'Unsuccess'
     except:
         return 'Unsuccess'
+
+
+@app.task(bind=True)
+def geocode_events(self, pks: list = None):
+    """
+    Geocode the sport events without geolocation, for bulk imports.
+    The place, or the country if there is no place, is resolved once
+    for all the events that share it.
+    """
+    events = SportEvent.objects.filter(geolocation='')
+    if pks is not None:
+        events = events.filter(pk__in=pks)
+    events = list(events.only('pk', 'place', 'country'))
+
+    ubications = geocode_cache.get_many(
+        [event.place or event.country for event in events])
+    for event in events:
+        for field, value in ubications[event.place or event.country].items():
+            setattr(event, field, value)
+        event.lat, event.lng = event.coordinates()
+
+    SportEvent.objects.bulk_update(
+        events, ['place', 'country', 'state', 'city', 'geolocation', 'lat', 'lng'],
+        batch_size=1000)
+    event_index.invalidate()
+    return f'{len(events)} events geocoded'
+
+
+@app.task(bind=True)
+def evict_geocodes(self):
+    """Delete the expired and least recently used geocoded places."""
+    return f'{geocode_cache.evict()} places evicted'
@@ -0,0 +1,21 @@
+"""Partitioned tables tasks."""
+
+from __future__ import absolute_import, unicode_literals
+
+# Django
+from django.conf import settings
+
+# Celery
+from taskapp.celery import app
+
+# Utils
+from gaman.utils.partitions import maintain
+
+
+@app.task(bind=True)
+def maintain_partitions(self):
+    """Create the partitions of the next months and archive the old ones."""
+    if not settings.PARTITIONED_TABLES:
+        return 'Disabled'
+    result = maintain()
+    return f"{len(result['created'])} partitions created, {len(result['archived'])} archived"
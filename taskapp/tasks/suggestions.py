@@ -0,0 +1,19 @@
+"""Follow suggestions tasks."""
+
+from __future__ import absolute_import, unicode_literals
+
+# Celery
+from taskapp.celery import app
+
+# Utils
+from gaman.utils.suggestions import SuggestionEngine
+
+
+@app.task(bind=True)
+def refresh_suggestions(self, full: bool = False):
+    """
+    Refresh the follow suggestions of the users whose follows changed,
+    or of every user if full.
+    """
+    refreshed = SuggestionEngine().refresh_pending(full=full)
+    return f'{refreshed} users refreshed'